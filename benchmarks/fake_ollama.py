@@ -0,0 +1,84 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Thread
+from time import sleep
+import json
+
+## ========================= Class `FakeOllamaHandler()` ========================= ##
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    '''The class is defined for answer requests as a stand-in Ollama server.'''
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    wbufsize = -1
+    model = 'fake-model'
+    tokens = ['Evening', ',', ' how', ' can', ' I', ' help', ' you', '?']
+    delay = 0.0
+
+    def log_message(self,format:str,*args) -> None:
+        '''The method is defined for silence request logging.'''
+        pass
+
+    def _reply(self,content:dict) -> None:
+        '''The method is defined for send JSON response with keep-alive support.
+        Args:
+            content: A dictionary indicate the response content.
+        '''
+        body = json.dumps(content).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type','application/json')
+        self.send_header('Content-Length',str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self,chat:bool) -> None:
+        '''The method is defined for send NDJSON response in chunked encoding.
+        Args:
+            chat: A boolean indicate whether answering chat request.
+        '''
+        self.send_response(200)
+        self.send_header('Content-Type','application/x-ndjson')
+        self.send_header('Transfer-Encoding','chunked')
+        self.end_headers()
+        for index, token in enumerate(self.tokens + ['']):
+            sleep(self.delay)
+            done = index == len(self.tokens)
+            if chat:
+                content = {'message': {'role': 'assistant', 'content': token},
+                           'done': done}
+            else:
+                content = {'response': token, 'done': done}
+            line = json.dumps(content).encode('utf-8') + b'\n'
+            self.wfile.write(f'{len(line):x}\r\n'.encode() + line + b'\r\n')
+            self.wfile.flush()
+        self.wfile.write(b'0\r\n\r\n')
+
+    def do_GET(self) -> None:
+        '''The method is defined for answer model list probe.'''
+        self._reply({'models': [{'name': self.model}]})
+
+    def do_POST(self) -> None:
+        '''The method is defined for answer generate and chat requests.'''
+        length = int(self.headers.get('Content-Length',0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+        if body.get('stream'):
+            self._stream(self.path.endswith('chat'))
+        elif self.path.endswith('chat'):
+            sleep(self.delay * len(self.tokens))
+            self._reply({'message': {'role': 'assistant',
+                                     'content': ''.join(self.tokens)},
+                         'done': True})
+        else:
+            sleep(self.delay * len(self.tokens))
+            self._reply({'response': ''.join(self.tokens), 'done': True})
+
+## ========================== Function `start_server()` ========================== ##
+def start_server() -> tuple:
+    '''The function is defined for start stand-in Ollama server in background.
+    Returns:
+        server: A ThreadingHTTPServer instance indicate the running server.
+        url: A string indicate the url before specific interface.
+    '''
+    server = ThreadingHTTPServer(('127.0.0.1',0),FakeOllamaHandler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever,daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/api/'
+    return server, url
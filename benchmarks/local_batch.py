@@ -0,0 +1,39 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from llyra.backends import Local
+
+PROMPT = 'Write a short paragraph about the number {}.'
+TOKENS = 64
+CALLS = 4
+USERS = (1,2,4,8)
+SLOTS = (0,8)
+
+# Load local backend from config file given as argument, or default config
+backend = Local(sys.argv[1] if len(sys.argv) > 1 else None)
+backend.strategy.call.max_tokens = TOKENS
+backend.strategy.call.stop = []
+
+def user(index:int) -> int:
+    tokens = 0
+    for call in range(CALLS):
+        output = backend.call(PROMPT.format(index * CALLS + call))
+        tokens += backend._count(output)
+    return tokens
+
+# Measure aggregate generation rate of concurrent users,
+# each sending single calls back-to-back,
+# with calls served one at a time and generated together in a batch
+print('slots  users      wall     tokens/s')
+for slots in SLOTS:
+    backend.unload()
+    backend.config.batch.slots = slots
+    backend.load()
+    backend.warmup()
+    for users in USERS:
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=users) as executor:
+            tokens = sum(executor.map(user,range(users)))
+        wall = perf_counter() - start
+        print(f'{slots:5d} {users:6d} {wall:8.2f}s {tokens / wall:11.1f}')
@@ -0,0 +1,39 @@
+import sys
+from itertools import product
+from time import perf_counter
+
+from llyra.backends import Local
+
+PROMPT = 'Summarize the history of the printing press in a few sentences. ' * 8
+THREADS = (0,4,8)
+BATCHES = (128,512)
+KV_TYPES = (('',False),('q8_0',True))
+
+# Load local backend from config file given as argument, or default config
+backend = Local(sys.argv[1] if len(sys.argv) > 1 else None)
+
+def measure() -> tuple:
+    start = perf_counter()
+    stream = backend.stream_call(PROMPT)
+    next(stream,None)
+    first = perf_counter() - start
+    pieces = 1
+    for _ in stream:
+        pieces += 1
+    total = perf_counter() - start
+    return first, pieces / (total - first) if total > first else 0.0
+
+# Measure time to first token, dominated by prompt processing,
+# and generation rate of each engine setting after loading the model with it
+print('threads  batch  kv      load        ttft      pieces/s')
+for threads, batch, (kv, flash) in product(THREADS,BATCHES,KV_TYPES):
+    engine = {'n_threads': threads,'n_threads_batch': threads,
+              'n_batch': batch,'n_ubatch': batch,
+              'type_k': kv,'type_v': kv,'flash_attn': flash}
+    start = perf_counter()
+    backend.reconfigure('',None,None,engine)
+    backend.load()
+    load = perf_counter() - start
+    backend.warmup()
+    first, rate = measure()
+    print(f'{threads:7d} {batch:6d}  {kv or "f16":5s} {load:7.2f}s {first*1e3:9.1f}ms {rate:10.1f}')
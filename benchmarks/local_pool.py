@@ -0,0 +1,55 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from llyra.backends import LocalPool
+
+PROMPT = 'Write a short paragraph about the number {}.'
+TOKENS = 64
+CALLS = 4
+USERS = (1,2,4,8)
+WORKERS = (1,2,4)
+
+def memory(pid:int) -> tuple:
+    # Read anonymous and file-backed resident memory of a process in MiB,
+    # where file-backed pages of the mapped model are shared between workers
+    fields = {}
+    with open(f'/proc/{pid}/status') as file:
+        for line in file:
+            key, _, value = line.partition(':')
+            fields[key] = value
+    return tuple(int(fields.get(key,'0 kB').split()[0]) / 1024
+                 for key in ('RssAnon','RssFile'))
+
+def user(index:int) -> int:
+    tokens = 0
+    for call in range(CALLS):
+        output = backend.call(PROMPT.format(index * CALLS + call))
+        tokens += backend._count(output)
+    return tokens
+
+if __name__ == '__main__':
+    # Load worker pool from config file given as argument, or default config
+    backend = LocalPool(sys.argv[1] if len(sys.argv) > 1 else None)
+    backend.strategy.call.max_tokens = TOKENS
+    backend.strategy.call.stop = []
+    # Measure aggregate generation rate of concurrent users against workers,
+    # and resident memory of all workers after the runs
+    print('workers  users      wall     tokens/s    anon MiB    file MiB')
+    for workers in WORKERS:
+        backend.unload()
+        backend.config.pool.workers = workers
+        backend.load()
+        backend.warmup()
+        for users in USERS:
+            start = perf_counter()
+            with ThreadPoolExecutor(max_workers=users) as executor:
+                tokens = sum(executor.map(user,range(users)))
+            wall = perf_counter() - start
+            # Sum private memory of workers, and count the shared model once
+            usage = [memory(worker.process.pid) for worker in backend._workers if worker]
+            anon = sum(private for private, _ in usage)
+            file = max(shared for _, shared in usage)
+            print(f'{workers:7d} {users:6d} {wall:8.2f}s {tokens / wall:11.1f}'
+                  f' {anon:11.1f} {file:11.1f}')
+    backend.unload()
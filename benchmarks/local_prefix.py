@@ -0,0 +1,31 @@
+import sys
+from time import perf_counter
+
+from llyra.backends import Local
+
+TURNS = 12
+
+# Load local backend from config file given as argument, or default config
+backend = Local(sys.argv[1] if len(sys.argv) > 1 else None)
+backend.strategy.chat.stop = ['\n']
+
+def first_token(message:str,session:str) -> float:
+    start = perf_counter()
+    stream = backend.stream_chat(message,True,session)
+    next(stream,None)
+    latency = perf_counter() - start
+    for _ in stream:
+        pass
+    return latency
+
+# Measure time to first token of two interleaved chat sessions as they grow,
+# which is dominated by prefill of the prompt part not kept in model state
+for states in (0,4):
+    backend.config.cache.states = states
+    print(f'saved session states {states}')
+    print('turn   session-a   session-b')
+    for turn in range(TURNS):
+        message = f'Turn {turn}: tell me one more fact about the number {turn}.'
+        a = first_token(message,f'a-{states}')
+        b = first_token(message,f'b-{states}')
+        print(f'{turn:4d} {a*1e3:9.1f}ms {b*1e3:9.1f}ms')
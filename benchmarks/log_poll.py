@@ -0,0 +1,35 @@
+from time import perf_counter
+from statistics import median
+from copy import deepcopy
+
+from llyra.components import Log
+from llyra.components.logs.utils import convert2readable_log
+from llyra.components.utils import Role
+
+POLLS = 200
+role = Role('system','user','assistant')
+
+def poll_all(log:Log) -> list:
+    # Poll the way `get(-1)` did before paging, deep copying every record
+    return [convert2readable_log(deepcopy(section)) for section in log._history]
+
+def measure(poll) -> float:
+    latencies = []
+    for _ in range(POLLS):
+        start = perf_counter()
+        poll()
+        latencies.append(perf_counter() - start)
+    return median(latencies)
+
+# Measure cost of polling the latest records as history grows
+print('records   poll all     latest 50    since last')
+log = Log()
+for size in (1000,10000,100000):
+    while log.id < size:
+        log.chat('model','This is for test.',role,
+                 'Hello, there!','Greeting, how can I assist you today?',0.6,False)
+    since = log._history[-50].create_at
+    everything = measure(lambda: poll_all(log)) if size <= 10000 else float('nan')
+    latest = measure(lambda: log.get(-1,offset=log.id - 50,limit=50))
+    recent = measure(lambda: log.get(-1,since=since,limit=50))
+    print(f'{size:7d} {everything*1e3:9.2f}ms {latest*1e3:9.3f}ms {recent*1e3:9.3f}ms')
@@ -0,0 +1,26 @@
+from time import perf_counter
+from statistics import median
+import gc
+
+from llyra.components import Prompt
+from llyra.components.utils import Role
+
+TURNS = 10000
+WINDOW = 1000
+role = Role('system','user','assistant')
+
+# Measure cost of each chat iteration as iteration history grows
+prompt = Prompt()
+costs = []
+gc.disable()
+try:
+    for _ in range(TURNS):
+        start = perf_counter()
+        prompt.chat(role=role,content='Hello!',addition='This is for test.')
+        prompt.iterate(role,'Hello!','Greeting!',True)
+        costs.append(perf_counter() - start)
+finally:
+    gc.enable()
+print('turns     median cost')
+for end in range(WINDOW,TURNS + 1,WINDOW * 3):
+    print(f'{end:5d} {median(costs[end - WINDOW:end])*1e6:12.2f}us')
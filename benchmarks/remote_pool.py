@@ -0,0 +1,33 @@
+from time import perf_counter
+from statistics import mean, median
+import requests
+
+from llyra.backends.remotes.backends import Ollama
+from fake_ollama import start_server
+
+ROUNDS = 2000
+
+server, url = start_server()
+body = {'model': 'fake-model', 'prompt': 'Evening!', 'stream': False}
+
+# Measure bare requests, one new connection per inference
+latencies = []
+for _ in range(ROUNDS):
+    start = perf_counter()
+    requests.post(url=url+'generate',json=body).json()
+    latencies.append(perf_counter() - start)
+print(f'bare requests  mean {mean(latencies)*1e6:8.1f}us  '
+      f'median {median(latencies)*1e6:8.1f}us')
+
+# Measure pooled session owned by the backend
+backend = Ollama(url=url,model='fake-model')
+latencies = []
+for _ in range(ROUNDS):
+    start = perf_counter()
+    backend.call('Evening!',[],0)
+    latencies.append(perf_counter() - start)
+print(f'pooled session mean {mean(latencies)*1e6:8.1f}us  '
+      f'median {median(latencies)*1e6:8.1f}us')
+
+backend.close()
+server.shutdown()
@@ -0,0 +1,33 @@
+from time import perf_counter
+from statistics import mean
+
+from llyra.backends.remotes.backends import Ollama
+from fake_ollama import FakeOllamaHandler, start_server
+
+ROUNDS = 20
+
+FakeOllamaHandler.delay = 0.02
+server, url = start_server()
+backend = Ollama(url=url,model='fake-model')
+
+# Measure time to first token of blocking inference
+latencies = []
+for _ in range(ROUNDS):
+    start = perf_counter()
+    backend.call('Evening!',[],0)
+    latencies.append(perf_counter() - start)
+print(f'blocking  first token {mean(latencies)*1e3:8.1f}ms')
+
+# Measure time to first token of streaming inference
+latencies = []
+for _ in range(ROUNDS):
+    start = perf_counter()
+    stream = backend.stream_call('Evening!',[],0)
+    next(stream)
+    latencies.append(perf_counter() - start)
+    for _ in stream:
+        pass
+print(f'streaming first token {mean(latencies)*1e3:8.1f}ms')
+
+backend.close()
+server.shutdown()
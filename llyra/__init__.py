@@ -1 +1 @@
-from .main import Llyra
\ No newline at end of file
+from .main import Llyra, AsyncLlyra
\ No newline at end of file
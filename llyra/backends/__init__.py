@@ -1,2 +1,2 @@
-from .locals import Local
-from .remotes import Remote
\ No newline at end of file
+from .locals import Local, AsyncLocal, LocalPool
+from .remotes import Remote, AsyncRemote
\ No newline at end of file
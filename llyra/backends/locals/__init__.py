@@ -1 +1,3 @@
-from .definition import Local
\ No newline at end of file
+from .definition import Local
+from .asynchronous import AsyncLocal
+from .pool import LocalPool
\ No newline at end of file
@@ -0,0 +1,203 @@
+from .definition import Local
+from ...errors.locals import LocalQueueFullError
+from functools import partial
+from pathlib import Path
+import asyncio
+
+class AsyncLocal(Local):
+    '''The class is defined for fulfill local LLM call asynchronously,
+    with requests to the single model instance queued in the scheduler.'''
+    ## ============================= Inference Methods ============================= ##
+    async def call(self,message:str,priority:int=0,model:str=None) -> str:
+        '''The method is defined for fulfill single LLM call.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            A string indicate the output content from model inference.
+        '''
+        # Generate together with other calls without waiting for the model
+        if self.config.batch.slots:
+            return await self._offload(self._call,message,priority,model)
+        return await self._schedule(self._call,message,0,model,priority=priority)
+
+    async def chat(self,message:str,keep:bool,session:str=None,
+                   priority:int=0,model:str=None) -> str:
+        '''The method is defined for fulfill iterative chat inference.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            response: A string indicate the output content from model inference.
+        '''
+        return await self._schedule(self._chat,message,keep,session,model,
+                                    priority=priority)
+
+    ## ========================== Batch Inference Method ========================== ##
+    async def call_many(self,messages:list,concurrency:int,progress=None,
+                        priority:int=0,model:str=None) -> list:
+        '''The method is defined for fulfill batch of single LLM calls
+        each queued as its own request for the single local model,
+        or together on the batcher with continuous batching.
+        Args:
+            messages: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum inferences in flight
+                with continuous batching, or the maximum calls waiting in the queue
+                at once otherwise, since local model infers one input at a time.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            results: A list indicate the output content of each input in order,
+                or the exception raised by the inference of the input.
+        '''
+        if self.config.batch.slots:
+            return await self._offload(self._call_batched,messages,concurrency,
+                                       progress,priority,model)
+        results = [None] * len(messages)
+        finished = 0
+        limit = asyncio.Semaphore(max(1,concurrency))
+        # Define queueing a single call with bounded calls waiting at once
+        async def call(index:int,message:str) -> None:
+            nonlocal finished
+            async with limit:
+                try:
+                    results[index] = await self._schedule(self._call,message,0,model,
+                                                          priority=priority)
+                except Exception as error:
+                    results[index] = error
+            finished += 1
+            if progress:
+                progress(finished,len(messages))
+        await asyncio.gather(*(call(index,message)
+                               for index, message in enumerate(messages)))
+        # Return model responses in input order
+        return results
+
+    ## ========================== Stream Inference Methods ========================== ##
+    async def stream_call(self,message:str,priority:int=0,model:str=None):
+        '''The method is defined for fulfill single LLM call in streaming.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        async for piece in self._iterate(super().stream_call(message,priority,model)):
+            yield piece
+
+    async def stream_chat(self,message:str,keep:bool,session:str=None,
+                          priority:int=0,model:str=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        async for piece in self._iterate(
+                super().stream_chat(message,keep,session,priority,model)):
+            yield piece
+
+    ## ========================== Internal Stream Method ========================== ##
+    async def _iterate(self,stream):
+        '''The method is defined for pull pieces of a blocking stream
+        in executor without blocking the event loop.
+        Args:
+            stream: A generator indicate the blocking stream of response pieces.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        loop = asyncio.get_running_loop()
+        end = object()
+        try:
+            while True:
+                piece = await loop.run_in_executor(None,next,stream,end)
+                if piece is end:
+                    break
+                yield piece
+        finally:
+            stream.close()
+
+    ## ========================== Internal Schedule Methods ========================== ##
+    async def _schedule(self,function,*args,priority:int=0):
+        '''The method is defined for queue a request without blocking the event loop,
+        and wait for its result.
+        Args:
+            function: A callable indicate the request.
+            args: Positional arguments indicate the arguments of the request.
+            priority: A integer indicate the priority of the request.
+        Returns:
+            A value indicate the result of the request.
+        '''
+        try:
+            future = self._scheduler.submit(function,*args,priority=priority,block=False)
+        except LocalQueueFullError:
+            # Wait for a free place in executor when the scheduler blocks
+            if not self._scheduler.block:
+                raise
+            loop = asyncio.get_running_loop()
+            future = await loop.run_in_executor(None,partial(self._scheduler.submit,
+                                                             function,*args,
+                                                             priority=priority))
+        return await asyncio.wrap_future(future)
+
+    async def _offload(self,function,*args):
+        '''The method is defined for run a request generated on the batcher
+        in executor without blocking the event loop.
+        Args:
+            function: A callable indicate the request.
+            args: Positional arguments indicate the arguments of the request.
+        Returns:
+            A value indicate the result of the request.
+        '''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None,partial(function,*args))
+
+    ## ============================= Lifecycle Methods ============================= ##
+    async def load(self,model:str=None) -> None:
+        '''The method is defined for load a model without blocking the event loop.'''
+        await self._schedule(self._load,self._resolve(model))
+
+    async def unload(self,model:str=None) -> None:
+        '''The method is defined for unload a model and release its memory,
+        or all models by set `model` to `None`.'''
+        name = self._resolve(model) if model != None else None
+        await self._schedule(self._unload,name)
+
+    async def reconfigure(self,format:str,gpu:bool,ram:bool,
+                          engine:dict=None,reload:bool=True) -> bool:
+        '''The method is defined for update config parameters of model loading,
+        and load the model again without blocking the event loop.'''
+        return await self._schedule(self._reconfigure,format,gpu,ram,engine,reload)
+
+    async def warmup(self,model:str=None) -> None:
+        '''The method is defined for warm up a model without blocking the event loop.'''
+        await self._schedule(self._warmup,self._resolve(model))
+
+    ## ============================== Release Method ============================== ##
+    async def close(self) -> None:
+        '''The method is defined for persist buffered log records and spans of the backend.'''
+        self.log.close()
+        self.tracer.close()
+        if self.cache != None:
+            self.cache.close()
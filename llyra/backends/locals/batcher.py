@@ -0,0 +1,427 @@
+from llama_cpp import Llama
+from ...errors.locals import LocalQueueFullError, LocalContextExceededError, LocalDecodeError, LocalBatcherClosedError
+from codecs import getincrementaldecoder
+from concurrent.futures import Future
+from itertools import count
+from queue import PriorityQueue, SimpleQueue, Empty, Full
+from threading import Thread, Lock
+import llama_cpp
+
+# Default generation length of llama-cpp completion without `max_tokens`
+MAX_TOKENS = 16
+
+# Sampling parameters of llama-cpp completion by default
+TOP_K = 40
+TOP_P = 0.95
+MIN_P = 0.05
+
+class Generation:
+    '''The class is defined for hold the state of a request
+    generated in a sequence of the batch.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,tokens:list,stop:list,temperature:float,
+                 max_tokens:int,stream:bool) -> None:
+        '''The method is defined for initialize Generation class object.
+        Args:
+            tokens: A list indicate the tokens of the prompt.
+            stop: A list of strings indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            stream: A boolean indicate whether pass pieces of the response
+                as they are generated.
+        '''
+        # Get request attributes
+        self.tokens = tokens
+        self.stop = stop
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        # Initialize result attributes,
+        # which are the hand-over queue of pieces and the final response
+        self.pieces:SimpleQueue = SimpleQueue() if stream else None
+        self.future = Future()
+        # Initialize sequence state attributes,
+        # which are sequence identity, sampler, evaluated prompt tokens,
+        # position of next token, next token to feed and its logits index in batch
+        self.seq:int = None
+        self.sampler = None
+        self.evaluated = 0
+        self.position = 0
+        self.next:int = None
+        self.index = -1
+        # Initialize output attributes
+        self.generated = 0
+        self.text = ''
+        self.sent = 0
+        self.decoder = getincrementaldecoder('utf-8')(errors='ignore')
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        '''The method is defined for stop generation once the caller stops reading.'''
+        self.cancelled = True
+
+class Batcher:
+    '''The class is defined for generate concurrent requests together,
+    each in its own sequence of one llama.cpp context sharing the loaded model,
+    with requests admitted as soon as a sequence is free.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,model:Llama,slots:int,context:int=0,policy:str='fifo',
+                 queue:int=64,block:bool=True,timeout:float=0) -> None:
+        '''The method is defined for initialize Batcher class object.
+        Args:
+            model: A Llama instance indicate the loaded model.
+            slots: A integer indicate the maximum requests generated together.
+            context: A integer indicate the tokens of the batch context
+                shared by all sequences, and give each sequence
+                the context of the model by set it to 0.
+            policy: A string indicate the order queued requests are admitted in,
+                `fifo` for arrival order,
+                or `priority` for higher priority first and arrival order among equals.
+            queue: A integer indicate the maximum requests waiting for a sequence,
+                and queue them unlimited by set it to 0.
+            block: A boolean indicate whether wait for a free place in full queue,
+                or raise at once.
+            timeout: A float indicate the seconds waiting for a free place in full queue,
+                and wait for ever by set it to 0.
+        '''
+        # Get batch attributes
+        self.model = model
+        self.slots = slots
+        self.context = context if context else model.n_ctx() * slots
+        self.limit = self.context // slots
+        self.capacity = max(model.context_params.n_batch,slots)
+        # Get queue attributes
+        self.policy = policy
+        self.queue = queue
+        self.block = block
+        self.timeout = timeout
+        # Create batch context with a sequence per slot from the model context parameters
+        params = llama_cpp.llama_context_params.from_buffer_copy(model.context_params)
+        params.n_ctx = self.context
+        params.n_batch = self.capacity
+        params.n_seq_max = slots
+        self._ctx = llama_cpp.llama_new_context_with_model(model.model,params)
+        self._batch = llama_cpp.llama_batch_init(self.capacity,0,1)
+        # Initialize sequence attributes,
+        # which are free sequence identities and generating requests
+        self._seqs:list = list(range(slots))
+        self._active:list = []
+        # Initialize request queue ordered by rank and arrival
+        self._requests:PriorityQueue = PriorityQueue(queue)
+        self._order = count()
+        self._lock = Lock()
+        self._closed = False
+        self._draining = False
+        # Start worker thread decoding the batch
+        self._worker = Thread(target=self._run,daemon=True)
+        self._worker.start()
+
+    ## ============================== Submit Methods ============================== ##
+    def submit(self,prompt:str,stop:str|list,temperature:float,max_tokens:int=0,
+               priority:int=0,stream:bool=False) -> Generation:
+        '''The method is defined for queue a request for a free sequence.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation,
+                and keep the default limit of llama-cpp by set it to 0.
+            priority: A integer indicate the priority of the request,
+                which is ignored with `fifo` policy.
+            stream: A boolean indicate whether pass pieces of the response
+                as they are generated.
+        Returns:
+            generation: A Generation instance indicate the queued request.
+        '''
+        # Tokenize the prompt as llama-cpp completion does
+        tokens = self.model.tokenize(prompt.encode('utf-8'),special=True)
+        if len(tokens) >= self.limit:
+            raise LocalContextExceededError(len(tokens),self.limit)
+        stop = [stop] if isinstance(stop,str) else list(stop or [])
+        generation = Generation(tokens,[sequence for sequence in stop if sequence],
+                                temperature,max_tokens if max_tokens else MAX_TOKENS,
+                                stream)
+        # Queue the request or raise when the queue stays full
+        rank = -priority if self.policy == 'priority' else 0
+        with self._lock:
+            if self._closed:
+                raise LocalBatcherClosedError()
+            try:
+                self._requests.put((rank,next(self._order),generation),
+                                   self.block,self.timeout if self.timeout else None)
+            except Full:
+                raise LocalQueueFullError(self.queue)
+        return generation
+
+    def complete(self,prompt:str,stop:str|list,temperature:float,max_tokens:int=0,
+                 priority:int=0) -> dict:
+        '''The method is defined for generate the response of a prompt.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            priority: A integer indicate the priority of the request.
+        Returns:
+            A dictionary indicate the response in llama-cpp completion format.
+        '''
+        return self.submit(prompt,stop,temperature,max_tokens,priority).future.result()
+
+    def stream(self,prompt:str,stop:str|list,temperature:float,max_tokens:int=0,
+               priority:int=0):
+        '''The method is defined for generate the response of a prompt in streaming.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            priority: A integer indicate the priority of the request.
+        Yields:
+            A dictionary indicate the response chunk in llama-cpp completion format.
+        '''
+        generation = self.submit(prompt,stop,temperature,max_tokens,priority,stream=True)
+        try:
+            # Pass pieces until the sequence is finished
+            while True:
+                piece = generation.pieces.get()
+                if piece == None:
+                    break
+                yield {'choices': [{'text': piece,'finish_reason': None}]}
+            response = generation.future.result()
+            yield {'choices': [{'text': '',
+                                'finish_reason': response['choices'][0]['finish_reason']}],
+                   'usage': response['usage']}
+        finally:
+            generation.cancel()
+
+    @property
+    def pending(self) -> int:
+        '''The property is defined for count requests waiting for a sequence.
+        Returns:
+            A integer indicate the number of waiting requests.
+        '''
+        return self._requests.qsize()
+
+    ## ============================== Worker Methods ============================== ##
+    def _run(self) -> None:
+        '''The method is defined for decode the batch step by step,
+        admitting queued requests between steps.'''
+        while True:
+            self._admit()
+            if not self._active:
+                if self._draining:
+                    return
+                continue
+            self._step()
+
+    def _admit(self) -> None:
+        '''The method is defined for move queued requests into free sequences,
+        and wait for a request when no sequence is generating.'''
+        while self._seqs and not self._draining:
+            try:
+                _, _, generation = self._requests.get(not self._active)
+            except Empty:
+                return
+            # Stop admitting once the batcher is closing
+            if generation == None:
+                self._draining = True
+                return
+            # Drop the request whose caller stopped reading while it was queued
+            if generation.cancelled:
+                generation.future.cancel()
+                if generation.pieces != None:
+                    generation.pieces.put(None)
+                continue
+            generation.future.set_running_or_notify_cancel()
+            generation.seq = self._seqs.pop()
+            generation.sampler = self._sampler(generation.temperature)
+            self._active.append(generation)
+
+    def _step(self) -> None:
+        '''The method is defined for decode one step of the batch,
+        which feeds a sampled token of each generating sequence
+        and fills the rest of the batch with prompt tokens of admitted sequences.'''
+        # Finish sequences whose callers stopped reading
+        for generation in [generation for generation in self._active
+                           if generation.cancelled]:
+            self._finish(generation,'stop')
+        n = 0
+        # Feed sampled token of each generating sequence
+        for generation in self._active:
+            generation.index = -1
+            if generation.evaluated == len(generation.tokens):
+                self._add(n,generation.next,generation.position,generation.seq,True)
+                generation.index = n
+                generation.position += 1
+                n += 1
+        # Feed prompt tokens of admitted sequences into the rest of the batch
+        for generation in self._active:
+            while generation.evaluated < len(generation.tokens) and n < self.capacity:
+                last = generation.evaluated == len(generation.tokens) - 1
+                self._add(n,generation.tokens[generation.evaluated],
+                          generation.evaluated,generation.seq,last)
+                if last:
+                    generation.index = n
+                generation.evaluated += 1
+                generation.position = generation.evaluated
+                n += 1
+        if n == 0:
+            return
+        # Decode the batch and fail generating sequences when it fails
+        self._batch.n_tokens = n
+        code = llama_cpp.llama_decode(self._ctx,self._batch)
+        if code != 0:
+            for generation in list(self._active):
+                self._finish(generation,None,LocalDecodeError(code))
+            return
+        # Sample next token of each sequence with logits in the batch
+        for generation in list(self._active):
+            if generation.index >= 0:
+                token = llama_cpp.llama_sampler_sample(generation.sampler,self._ctx,
+                                                       generation.index)
+                self._accept(generation,token)
+
+    def _add(self,index:int,token:int,position:int,seq:int,logits:bool) -> None:
+        '''The method is defined for put a token of a sequence into the batch.
+        Args:
+            index: A integer indicate the index of the token in the batch.
+            token: A integer indicate the token.
+            position: A integer indicate the position of the token in its sequence.
+            seq: A integer indicate the identity of the sequence.
+            logits: A boolean indicate whether compute logits of the token.
+        '''
+        self._batch.token[index] = token
+        self._batch.pos[index] = position
+        self._batch.n_seq_id[index] = 1
+        self._batch.seq_id[index][0] = seq
+        self._batch.logits[index] = logits
+
+    def _accept(self,generation:Generation,token:int) -> None:
+        '''The method is defined for append a sampled token to its sequence,
+        and finish the sequence on end of generation, stop sequence or length limit.
+        Args:
+            generation: A Generation instance indicate the request of the sequence.
+            token: A integer indicate the sampled token.
+        '''
+        # Discriminate whether the model ends generation
+        if self._ended(token):
+            self._finish(generation,'stop')
+            return
+        generation.generated += 1
+        generation.text += generation.decoder.decode(self.model.detokenize([token]))
+        # Discriminate whether the response reaches a stop sequence
+        positions = [generation.text.find(sequence) for sequence in generation.stop]
+        positions = [position for position in positions if position >= 0]
+        if positions:
+            generation.text = generation.text[:min(positions)]
+            self._finish(generation,'stop')
+            return
+        # Discriminate whether the response reaches length limit
+        if (generation.generated >= generation.max_tokens
+                or generation.position + 1 >= self.limit):
+            self._finish(generation,'length')
+            return
+        generation.next = token
+        # Pass the piece which can't be the start of a stop sequence
+        if generation.pieces != None:
+            safe = len(generation.text) - self._hold(generation)
+            if safe > generation.sent:
+                generation.pieces.put(generation.text[generation.sent:safe])
+                generation.sent = safe
+
+    def _hold(self,generation:Generation) -> int:
+        '''The method is defined for measure the tail of the response
+        which may be the start of a stop sequence.
+        Args:
+            generation: A Generation instance indicate the request of the sequence.
+        Returns:
+            A integer indicate the number of characters held back.
+        '''
+        held = 0
+        for sequence in generation.stop:
+            for size in range(min(len(sequence) - 1,len(generation.text)),held,-1):
+                if generation.text.endswith(sequence[:size]):
+                    held = size
+                    break
+        return held
+
+    def _finish(self,generation:Generation,reason:str|None,error:Exception=None) -> None:
+        '''The method is defined for free the sequence of a request and settle its result.
+        Args:
+            generation: A Generation instance indicate the request of the sequence.
+            reason: A string indicate why generation is finished.
+            error: A Exception instance indicate why generation is failed.
+        '''
+        # Free the sequence and its sampler
+        self._active.remove(generation)
+        self._forget(generation.seq)
+        self._seqs.append(generation.seq)
+        llama_cpp.llama_sampler_free(generation.sampler)
+        # Settle the result of the request
+        if error != None:
+            generation.future.set_exception(error)
+        else:
+            if generation.pieces != None and len(generation.text) > generation.sent:
+                generation.pieces.put(generation.text[generation.sent:])
+            prompt = len(generation.tokens)
+            generation.future.set_result({
+                'choices': [{'text': generation.text,'finish_reason': reason}],
+                'usage': {'prompt_tokens': prompt,
+                          'completion_tokens': generation.generated,
+                          'total_tokens': prompt + generation.generated}})
+        if generation.pieces != None:
+            generation.pieces.put(None)
+
+    ## ============================== llama.cpp Methods ============================== ##
+    def _sampler(self,temperature:float):
+        '''The method is defined for make sampler chain of a sequence,
+        which samples as llama-cpp completion does by default.
+        Args:
+            temperature: A float indicate the model inference temperature.
+        Returns:
+            A pointer indicate the llama.cpp sampler chain.
+        '''
+        sampler = llama_cpp.llama_sampler_chain_init(
+            llama_cpp.llama_sampler_chain_default_params())
+        if temperature > 0:
+            llama_cpp.llama_sampler_chain_add(sampler,llama_cpp.llama_sampler_init_top_k(TOP_K))
+            llama_cpp.llama_sampler_chain_add(sampler,llama_cpp.llama_sampler_init_top_p(TOP_P,1))
+            llama_cpp.llama_sampler_chain_add(sampler,llama_cpp.llama_sampler_init_min_p(MIN_P,1))
+            llama_cpp.llama_sampler_chain_add(sampler,llama_cpp.llama_sampler_init_temp(temperature))
+            llama_cpp.llama_sampler_chain_add(sampler,
+                llama_cpp.llama_sampler_init_dist(llama_cpp.LLAMA_DEFAULT_SEED))
+        else:
+            llama_cpp.llama_sampler_chain_add(sampler,llama_cpp.llama_sampler_init_greedy())
+        return sampler
+
+    def _ended(self,token:int) -> bool:
+        '''The method is defined for discriminate whether a token ends generation.
+        Args:
+            token: A integer indicate the sampled token.
+        Returns:
+            A boolean indicate whether the token is an end of generation token.
+        '''
+        return bool(llama_cpp.llama_token_is_eog(self.model.model,token))
+
+    def _forget(self,seq:int) -> None:
+        '''The method is defined for remove tokens of a sequence from KV cache.
+        Args:
+            seq: A integer indicate the identity of the sequence.
+        '''
+        llama_cpp.llama_kv_cache_seq_rm(self._ctx,seq,-1,-1)
+
+    ## ============================== Release Method ============================== ##
+    def close(self) -> None:
+        '''The method is defined for finish queued and generating requests,
+        and free the batch context.'''
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        # Queue the closing mark after every queued request
+        self._requests.put((float('inf'),next(self._order),None))
+        self._worker.join()
+        llama_cpp.llama_batch_free(self._batch)
+        llama_cpp.llama_free(self._ctx)
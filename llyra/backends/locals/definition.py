@@ -1,6 +1,19 @@
-from llama_cpp import Llama
-from ...components import LocalConfig, Strategy, Prompt, Log
-from .utils import set_gpu
+from llama_cpp import Llama, LlamaRAMCache
+from ...components import LocalConfig, Strategy, Prompt, Log, Session, Cache, SemanticCache, make_sink, make_tracer
+from ...components.caches.utils import make_key, make_scope
+from ...components.logs.utils import make_metrics
+from ...components.configs.utils import struct_model_name
+from .utils import set_gpu, set_engine, set_limit, read_stamp
+from .scheduler import Scheduler
+from .batcher import Batcher
+from ...errors.locals import LocalModelNotRegisteredError, LocalBatcherClosedError, LocalQueueFullError
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from contextlib import contextmanager
+from collections import OrderedDict, deque
+from functools import partial
+from threading import Lock, Thread, Event
+from queue import SimpleQueue
+from time import monotonic, sleep, perf_counter
 from pathlib import Path
 
 class Local:
@@ -15,79 +28,1180 @@ class Local:
         self.config = LocalConfig()
         self.strategy = Strategy()
         self.prompt = Prompt()
-        self.log = Log()
         # Load local config
         self.config.load(path)
+        # Initialize log attribute with configured sink
+        self.log = Log(make_sink(self.config.log))
+        # Initialize tracer attribute with configured exporter
+        self.tracer = make_tracer(self.config.trace)
         # Load inference strategy
         self.strategy.load(self.config.strategy)
-        # Initialize backend attribute
-        self.backend = Llama(model_path=self.config.path,
-                             n_gpu_layers=set_gpu(self.config.gpu),
-                             chat_format=self.config.format,
-                             use_mlock=self.config.ram,
-                             n_ctx=0,
-                             verbose=False)
-        # Define I/O attributes
-        self.query: str
-        self.response: str
+        # Initialize model state attributes,
+        # which are saved states of chat sessions by model and session,
+        # and owner of current state of each model
+        self._states:OrderedDict = OrderedDict()
+        self._active:dict = {}
+        # Initialize chat session attribute
+        self.session = Session(capacity=self.config.session.capacity,
+                               ttl=self.config.session.ttl,
+                               memory=self.config.session.memory,
+                               release=self._release)
+        # Initialize response cache attribute
+        self.cache = None
+        if self.config.response.enable:
+            self.cache = Cache(capacity=self.config.response.capacity,
+                               ttl=self.config.response.ttl,
+                               path=self.config.response.path if self.config.response.disk else None,
+                               size=self.config.response.size)
+        # Initialize semantic cache attribute
+        self.semantic = None
+        if self.config.semantic.enable:
+            self.semantic = SemanticCache(capacity=self.config.semantic.capacity,
+                                          threshold=self.config.semantic.threshold,
+                                          ttl=self.config.semantic.ttl)
+        # Initialize model lifecycle attributes,
+        # which are loaded models in least recently used order,
+        # their batchers, file stamps, when they are used last
+        # and how many inferences are running on them
+        self._models:OrderedDict = OrderedDict()
+        self._batchers:dict = {}
+        self._stamps:dict = {}
+        self._used:dict = {}
+        self._busy:dict = {}
+        self._embedder:Llama = None
+        self._guard = Lock()
+        # Initialize embedding lock attribute,
+        # since callers embed queries from their own threads with batching
+        self._embedding = Lock()
+        self._watcher:Thread = None
+        # Initialize scheduler attribute serving requests to the model one at a time
+        self._scheduler = self._queue()
+        # Discriminate whether load model until first inference
+        if not self.config.lazy:
+            self._load()
+
+    ## ============================= Lifecycle Methods ============================= ##
+    @property
+    def backend(self) -> Llama:
+        '''The property is defined for access the instance of the default model,
+        and load the model when it isn't loaded.
+        Returns:
+            A Llama instance indicate the loaded model.
+        '''
+        return self._acquire()
+
+    @property
+    def batcher(self) -> Batcher:
+        '''The property is defined for access the batcher of the default model,
+        and load the model when it isn't loaded.
+        Returns:
+            A Batcher instance indicate the batcher generating single calls together.
+        '''
+        return self._batch()
+
+    @property
+    def models(self) -> list:
+        '''The property is defined for read names of loaded models.
+        Returns:
+            A list of strings indicate the loaded models
+            from least to most recently used.
+        '''
+        with self._guard:
+            return list(self._models)
+
+    def load(self,model:str=None) -> None:
+        '''The method is defined for load a model when it isn't loaded,
+        after requests queued before.
+        Args:
+            model: A string indicate the name of the registered model,
+                and load the model of `local.model` section by set it to `None`.
+        '''
+        self._scheduler.run(self._load,self._resolve(model))
+
+    def unload(self,model:str=None) -> None:
+        '''The method is defined for unload a model and release its memory,
+        after requests queued before.
+        Args:
+            model: A string indicate the name of the registered model,
+                and unload all models by set it to `None`.
+        '''
+        name = self._resolve(model) if model != None else None
+        self._scheduler.run(self._unload,name)
+
+    def reconfigure(self,format:str,gpu:bool,ram:bool,
+                    engine:dict=None,reload:bool=True) -> bool:
+        '''The method is defined for update config parameters of model loading,
+        and load the models again when they're loaded and parameters are changed,
+        after requests queued before.
+        Args:
+            format: A sting indicate the format of chat inference's input.
+            gpu: A boolean indicate whether using GPU for inference acceleration.
+            ram: A boolean indicate whether keeping the model loaded in memory.
+            engine: A dictionary indicate the engine parameters to update.
+            reload: A boolean indicate whether load the loaded models again,
+                or apply updated parameters to the models loaded next time.
+        Returns:
+            A boolean indicate whether any parameter is changed.
+        '''
+        return self._scheduler.run(self._reconfigure,format,gpu,ram,engine,reload)
+
+    def warmup(self,model:str=None) -> None:
+        '''The method is defined for warm up a model with a tiny inference,
+        so that the first real inference doesn't pay for lazy initialization.
+        Args:
+            model: A string indicate the name of the registered model,
+                and warm up the model of `local.model` section by set it to `None`.
+        '''
+        self._scheduler.run(self._warmup,self._resolve(model))
+
+    def _unload(self,model:str=None) -> None:
+        '''The method is defined for drop model instances under the guard.
+        Args:
+            model: A string indicate the name of the registered model,
+                and drop all models by set it to `None`.
+        '''
+        with self._guard:
+            self._free(model)
+
+    def _reconfigure(self,format:str,gpu:bool,ram:bool,
+                     engine:dict=None,reload:bool=True) -> bool:
+        '''The method is defined for update config parameters of model loading,
+        and load the models again when they're loaded and parameters are changed.
+        Args:
+            format: A sting indicate the format of chat inference's input.
+            gpu: A boolean indicate whether using GPU for inference acceleration.
+            ram: A boolean indicate whether keeping the model loaded in memory.
+            engine: A dictionary indicate the engine parameters to update.
+            reload: A boolean indicate whether load the loaded models again,
+                or apply updated parameters to the models loaded next time.
+        Returns:
+            changed: A boolean indicate whether any parameter is changed.
+        '''
+        # Update config parameters and unload the models when they are changed
+        with self._guard:
+            changed = self.config.update(format,gpu,ram,engine)
+            loaded = list(self._models)
+            if changed and reload and loaded:
+                self._free()
+        # Discriminate whether load the models again with updated parameters
+        if changed and reload:
+            for name in loaded:
+                self._load(name)
+        return changed
+
+    def _queue(self) -> Scheduler|None:
+        '''The method is defined for make the scheduler
+        serving requests to the models one at a time.
+        Returns:
+            A Scheduler instance indicate the scheduler of requests.
+        '''
+        return Scheduler(policy=self.config.scheduler.policy,
+                         queue=self.config.scheduler.queue,
+                         block=self.config.scheduler.block,
+                         timeout=self.config.scheduler.timeout)
+
+    def _resolve(self,model:str|None) -> str:
+        '''The method is defined for select the name of a registered model.
+        Args:
+            model: A string indicate the name of the model,
+                and select the model of `local.model` section by set it to `None`.
+        Returns:
+            name: A string indicate the name of the registered model.
+        '''
+        if model == None:
+            return self.config.model.name
+        name = struct_model_name(model)
+        if name not in self.config.registry.models:
+            raise LocalModelNotRegisteredError(model)
+        return name
+
+    def _acquire(self,model:str=None) -> Llama:
+        '''The method is defined for access the instance of a model,
+        and load the model when it isn't loaded or its model file is changed.
+        Args:
+            model: A string indicate the name of the registered model,
+                and access the model of `local.model` section by set it to `None`.
+        Returns:
+            instance: A Llama instance indicate the loaded model.
+        '''
+        name = self._resolve(model)
+        with self._guard:
+            instance = self._models.get(name)
+            # Mark the model used unless it's loaded again
+            if instance != None and not self._changed(name):
+                self._models.move_to_end(name)
+                self._used[name] = monotonic()
+                return instance
+        return self._load(name)
+
+    def _batch(self,model:str=None) -> Batcher:
+        '''The method is defined for access the batcher of a model,
+        and load the model when it isn't loaded or its model file is changed.
+        Args:
+            model: A string indicate the name of the registered model,
+                and access the model of `local.model` section by set it to `None`.
+        Returns:
+            batcher: A Batcher instance indicate the batcher generating single calls together.
+        '''
+        self._acquire(model)
+        batcher = self._batchers.get(self._resolve(model))
+        # Discriminate whether the model is unloaded by another thread since
+        if batcher == None:
+            raise LocalBatcherClosedError()
+        return batcher
+
+    @contextmanager
+    def _use(self,model:str=None):
+        '''The method is defined for mark a model in use while an inference runs on it,
+        so the model isn't unloaded after idle timeout until the inference ends.
+        Args:
+            model: A string indicate the name of the registered model,
+                and mark the model of `local.model` section by set it to `None`.
+        '''
+        name = self._resolve(model)
+        with self._guard:
+            self._busy[name] = self._busy.get(name,0) + 1
+        try:
+            yield
+        finally:
+            with self._guard:
+                self._busy[name] -= 1
+                if not self._busy[name]:
+                    del self._busy[name]
+                # Count idle time from the end of the inference
+                if name in self._used:
+                    self._used[name] = monotonic()
+
+    def _track(self,stream,model:str=None):
+        '''The method is defined for mark a model in use until a stream on it ends.
+        Args:
+            stream: A generator indicate the response chunks of the stream.
+            model: A string indicate the name of the registered model,
+                and mark the model of `local.model` section by set it to `None`.
+        Yields:
+            A dictionary indicate the response chunk of the stream.
+        '''
+        with self._use(model):
+            yield from stream
+
+    def _changed(self,name:str) -> bool:
+        '''The method is defined for discriminate whether the file of a loaded model
+        is changed since loading, which is never checked without hot reload.
+        Args:
+            name: A string indicate the name of the loaded model.
+        Returns:
+            A boolean indicate whether the model should be loaded again.
+        '''
+        if not self.config.registry.reload:
+            return False
+        # Keep the loaded model while its file is replaced
+        stamp = read_stamp(self.config.locate(name))
+        return stamp != None and stamp != self._stamps[name]
+
+    def _load(self,model:str=None) -> Llama:
+        '''The method is defined for load a model when it isn't loaded,
+        or load it again when its model file is changed,
+        after unloading least recently used models beyond memory budget.
+        Args:
+            model: A string indicate the name of the registered model,
+                and load the model of `local.model` section by set it to `None`.
+        Returns:
+            instance: A Llama instance indicate the loaded model.
+        '''
+        name = self._resolve(model)
+        with self._guard:
+            # Discriminate whether the model is loaded and up to date
+            if name in self._models:
+                if not self._changed(name):
+                    self._models.move_to_end(name)
+                    self._used[name] = monotonic()
+                    return self._models[name]
+                self._free(name)
+            # Unload least recently used models for the memory the model takes
+            stamp = read_stamp(self.config.locate(name))
+            self._evict(stamp[1] if stamp else 0)
+            # Load model with current config
+            instance = self._open(name)
+            self._models[name] = instance
+            self._stamps[name] = stamp
+            self._used[name] = monotonic()
+            # Discriminate whether unload models after idle timeout
+            if self.config.idle and self._watcher == None:
+                self._watcher = Thread(target=self._watch,daemon=True)
+                self._watcher.start()
+        # Discriminate whether warm up the model after loading
+        if self.config.warmup:
+            self._warmup(name)
+        return instance
+
+    def _open(self,name:str) -> Llama:
+        '''The method is defined for make the instance of a model with current config,
+        and its batcher when continuous batching is enabled.
+        Args:
+            name: A string indicate the name of the registered model.
+        Returns:
+            instance: A Llama instance indicate the loaded model.
+        '''
+        instance = Llama(model_path=self.config.locate(name),
+                         n_gpu_layers=set_gpu(self.config.gpu,
+                                              self.config.engine.n_gpu_layers),
+                         chat_format=(self.config.registry.models[name].format
+                                      or self.config.format),
+                         use_mlock=self.config.ram,
+                         verbose=False,
+                         **set_engine(self.config.engine))
+        # Discriminate whether cache model states by prompt prefix
+        if self.config.cache.capacity:
+            instance.set_cache(LlamaRAMCache(self.config.cache.capacity))
+        # Discriminate whether generate single calls together in a batch context
+        if self.config.batch.slots:
+            self._batchers[name] = Batcher(instance,self.config.batch.slots,
+                                           self.config.batch.context,
+                                           policy=self.config.scheduler.policy,
+                                           queue=self.config.scheduler.queue,
+                                           block=self.config.scheduler.block,
+                                           timeout=self.config.scheduler.timeout)
+        return instance
+
+    def _evict(self,size:int) -> None:
+        '''The method is defined for unload least recently used models
+        until a model of the size fits in memory budget along with the others.
+        Args:
+            size: A integer indicate the bytes of the model file to load.
+        '''
+        budget = self.config.registry.budget
+        if not budget:
+            return
+        # Unload models in least recently used order, and load a model
+        # larger than the budget alone
+        while self._models and sum(stamp[1] for stamp in self._stamps.values()
+                                   if stamp) + size > budget:
+            self._free(next(iter(self._models)))
+
+    def _warmup(self,model:str=None) -> None:
+        '''The method is defined for run a tiny inference on a model.
+        Args:
+            model: A string indicate the name of the registered model,
+                and warm up the model of `local.model` section by set it to `None`.
+        '''
+        self._switch(False,model)
+        self._acquire(model).create_completion(prompt=' ',max_tokens=1)
+
+    def _watch(self) -> None:
+        '''The method is defined for unload each model
+        once it isn't accessed within idle timeout and no inference runs on it.'''
+        while True:
+            with self._guard:
+                remain = self.config.idle
+                now = monotonic()
+                for name in list(self._models):
+                    # Keep the model while inferences are running on it
+                    if self._busy.get(name):
+                        remain = min(remain,self.config.idle)
+                        continue
+                    left = self.config.idle - (now - self._used[name])
+                    # Discriminate whether the model is idle for long enough
+                    if left <= 0:
+                        self._free(name)
+                    else:
+                        remain = min(remain,left)
+                # Discriminate whether any model is still loaded
+                if not self._models:
+                    self._watcher = None
+                    return
+            sleep(remain)
+
+    def _free(self,model:str=None) -> None:
+        '''The method is defined for drop a model instance,
+        its batcher and model states bound to them,
+        and drop embedding model instance with the last model.
+        Args:
+            model: A string indicate the name of the loaded model,
+                and drop all models by set it to `None`.
+        '''
+        for name in [model] if model != None else list(self._models):
+            if name not in self._models:
+                continue
+            self._close(name)
+            del self._models[name]
+            self._stamps.pop(name,None)
+            self._used.pop(name,None)
+            self._active.pop(name,None)
+            for key in [key for key in self._states if key[0] == name]:
+                del self._states[key]
+        if not self._models:
+            self._embedder = None
+
+    def _close(self,name:str) -> None:
+        '''The method is defined for release resources bound to a model instance.
+        Args:
+            name: A string indicate the name of the loaded model.
+        '''
+        batcher = self._batchers.pop(name,None)
+        if batcher != None:
+            batcher.close()
 
     ## ============================= Inference Methods ============================= ##
-    def call(self,message:str) -> str:
+    def call(self,message:str,priority:int=0,model:str=None) -> str:
+        '''The method is defined for fulfill single LLM call,
+        which waits in the request queue for the model.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            A string indicate the output content from model inference.
+        '''
+        # Generate together with other calls without waiting for the model
+        if self.config.batch.slots:
+            return self._call(message,priority,model)
+        return self._scheduler.run(self._call,message,0,model,priority=priority)
+
+    def chat(self,message:str,keep:bool,session:str=None,priority:int=0,
+             model:str=None) -> str:
+        '''The method is defined for fulfill iterative chat inference,
+        which waits in the request queue for the model.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            A string indicate the output content from model inference.
+        '''
+        return self._scheduler.run(self._chat,message,keep,session,model,
+                                   priority=priority)
+
+    ## ========================== Batch Inference Method ========================== ##
+    def call_many(self,messages:list,concurrency:int,progress=None,
+                  priority:int=0,model:str=None) -> list:
+        '''The method is defined for fulfill batch of single LLM calls
+        each queued as its own request for the single local model,
+        or together on the batcher with continuous batching.
+        Args:
+            messages: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum inferences in flight
+                with continuous batching, or the maximum calls waiting in the queue
+                at once otherwise, since local model infers one input at a time.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            A list indicate the output content of each input in order,
+            or the exception raised by the inference of the input.
+        '''
+        if self.config.batch.slots:
+            return self._call_batched(messages,concurrency,progress,priority,model)
+        return self._call_many(messages,concurrency,progress,priority,model)
+
+    ## ========================== Stream Inference Methods ========================== ##
+    def stream_call(self,message:str,priority:int=0,model:str=None):
+        '''The method is defined for fulfill single LLM call in streaming,
+        which waits in the request queue for the model.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        # Generate together with other calls without waiting for the model
+        if self.config.batch.slots:
+            yield from self._stream_call(message,priority,model)
+        else:
+            yield from self._relay(self._stream_call,(message,0,model),priority)
+
+    def stream_chat(self,message:str,keep:bool,session:str=None,priority:int=0,
+                    model:str=None):
+        '''The method is defined for fulfill iterative chat inference in streaming,
+        which waits in the request queue for the model.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                and higher priority is served first with `priority` policy.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        yield from self._relay(self._stream_chat,(message,keep,session,model),priority)
+
+    def _relay(self,stream,args:tuple,priority:int):
+        '''The method is defined for pass pieces of a stream running on the worker,
+        which stops generation once the caller stops reading.
+        Args:
+            stream: A callable indicate the stream request making a generator.
+            args: A tuple indicate the arguments of the stream request.
+            priority: A integer indicate the priority of the request.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        pieces = SimpleQueue()
+        stop = Event()
+        end = object()
+        # Define the request generating pieces into the hand-over queue
+        def pump() -> None:
+            if stop.is_set():
+                return
+            generator = stream(*args)
+            try:
+                for piece in generator:
+                    pieces.put(piece)
+                    if stop.is_set():
+                        break
+            finally:
+                generator.close()
+                pieces.put(end)
+        # Queue the request and pass pieces until the stream ends
+        future = self._scheduler.submit(pump,priority=priority)
+        try:
+            while True:
+                piece = pieces.get()
+                if piece is end:
+                    break
+                yield piece
+            future.result()
+        finally:
+            stop.set()
+
+    ## ============================== Request Methods ============================== ##
+    def _call(self,message:str,priority:int=0,model:str=None) -> str:
         '''The method is defined for fulfill single LLM call.
         Args:
             message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request on the batcher.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
         Returns:
             A string indicate the output content from model inference.
         '''
-        # Get input content
-        self.query = message
+        # Select the registered model of the inference
+        name = self._resolve(model)
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('call')
         # Make prompt for inference
-        prompt = self.prompt.call(self.query)
-        # Execute model inference
-        response = self.backend.create_completion(prompt=prompt,
-            stop=self.strategy.call.stop,
-            temperature=self.strategy.call.temperature)
-        # Extract response content
-        self.response = response['choices'][0]['text']
+        with span.stage('prompt'):
+            prompt = self.prompt.call(message)
+        # Read cached response of the query or similar query
+        with span.stage('cache'):
+            output, ticket = self._recall('call',message,prompt,None,
+                                          self.strategy.call.stop,
+                                          self.strategy.call.temperature,
+                                          self.strategy.call.max_tokens,
+                                          name)
+        cached = output != None
+        span.set(cached=cached)
+        truncated = False
+        usage = {}
+        # Execute model inference without cached response
+        if not cached:
+            with span.stage('infer'):
+                response = self._complete(prompt,self.strategy.call.stop,
+                                          self.strategy.call.temperature,
+                                          self.strategy.call.max_tokens,
+                                          priority,model=name)
+            # Extract response content and whether it's truncated
+            with span.stage('extract'):
+                output = response['choices'][0]['text']
+                truncated = response['choices'][0].get('finish_reason') == 'length'
+                usage = response.get('usage',{})
+            self._remember(ticket,output)
         # Make log record
-        self.log.call(model=self.config.model.name,
-                      input=self.query,output=self.response,
-                      temperature=self.strategy.call.temperature)
+        metrics = make_metrics(perf_counter() - start,None,
+                               usage.get('prompt_tokens'),usage.get('completion_tokens'))
+        with span.stage('log'):
+            self.log.call(model=name,
+                          input=message,output=output,
+                          temperature=self.strategy.call.temperature,
+                          cached=cached,
+                          truncated=truncated,
+                          metrics=metrics)
+        span.end()
         # Return model response
-        return self.response
+        return output
     
-    def chat(self,message:str,keep:bool) -> str:
+    def _chat(self,message:str,keep:bool,session:str=None,model:str=None) -> str:
         '''The method is defined for fulfill iterative chat inference.
         Args:
             message: A string indicate the input content for chat inference.
             keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
         Returns:
             response: A string indicate the output content from model inference.
         '''
-        # Get input content
-        self.query = message
+        # Select the registered model of the inference
+        name = self._resolve(model)
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('chat')
+        # Select chat history and model state of the session
+        history = self._history(session)
+        self._switch(session,name)
         # Discriminate whether keep current section content
-        self.prompt.iterate(None,None,None,keep)
-        # Make prompt for inference
-        prompt = self.prompt.chat(role=self.strategy.chat.role,
-                                  content=self.query,
-                                  addition=self.strategy.chat.addition)
-        # Execute model inference
-        response = self.backend.create_chat_completion(messages=prompt,
-            stop=self.strategy.chat.stop,
-            temperature=self.strategy.chat.temperature)
-        # Extract response content
-        self.response = response['choices'][0]['message']['content']
+        with span.stage('trim'):
+            history.iterate(None,None,None,keep)
+        # Read cached response of similar opening query
+        output, ticket = None, None
+        if self.semantic != None and history.empty:
+            with span.stage('cache'):
+                output, ticket = self._recall('chat',message,None,
+                                              self.strategy.chat.addition,
+                                              self.strategy.chat.stop,
+                                              self.strategy.chat.temperature,
+                                              self.strategy.chat.max_tokens,
+                                              name)
+        cached = output != None
+        span.set(cached=cached)
+        truncated = False
+        usage = {}
+        # Execute model inference without cached response
+        if not cached:
+            # Make prompt for inference
+            with span.stage('prompt'):
+                prompt = history.chat(role=self.strategy.chat.role,
+                                      content=message,
+                                      addition=self.strategy.chat.addition,
+                                      context=self.strategy.chat.context,
+                                      counter=partial(self._count,model=name),
+                                      summarize=partial(self._summarize,model=name))
+            # Execute model inference
+            with span.stage('infer'):
+                response = self._converse(prompt,self.strategy.chat.stop,
+                                          self.strategy.chat.temperature,
+                                          self.strategy.chat.max_tokens,
+                                          session,model=name)
+            # Extract response content and whether it's truncated
+            with span.stage('extract'):
+                output = response['choices'][0]['message']['content']
+                truncated = response['choices'][0].get('finish_reason') == 'length'
+                usage = response.get('usage',{})
+            self._remember(ticket,output)
         # Update prompt section content
-        self.prompt.iterate(role=self.strategy.chat.role,
-                            input=self.query,output=self.response,
+        with span.stage('history'):
+            history.iterate(role=self.strategy.chat.role,
+                            input=message,output=output,
                             keep=True)
+        if session != None:
+            self.session.touch(session)
         # Make log record
-        self.log.chat(model=self.config.model.name,
-                      addition=self.strategy.chat.addition,
-                      role=self.strategy.chat.role,
-                      input=self.query,output=self.response,
-                      temperature=self.strategy.chat.temperature,
-                      keep=keep)
+        metrics = make_metrics(perf_counter() - start,None,
+                               usage.get('prompt_tokens'),usage.get('completion_tokens'))
+        with span.stage('log'):
+            self.log.chat(model=name,
+                          addition=self.strategy.chat.addition,
+                          role=self.strategy.chat.role,
+                          input=message,output=output,
+                          temperature=self.strategy.chat.temperature,
+                          keep=keep,
+                          session=session,
+                          cached=cached,
+                          truncated=truncated,
+                          metrics=metrics)
+        span.end()
         # Return model reponse
-        return self.response
\ No newline at end of file
+        return output
+
+    ## =========================== Batch Request Methods =========================== ##
+    def _call_many(self,messages:list,concurrency:int,progress=None,
+                   priority:int=0,model:str=None) -> list:
+        '''The method is defined for fulfill batch of single LLM calls
+        each queued as its own request for the model,
+        so other requests are served between them.
+        Args:
+            messages: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum calls waiting in the queue at once.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the requests.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            results: A list indicate the output content of each input in order,
+                or the exception raised by the inference of the input.
+        '''
+        results = [None] * len(messages)
+        queued = deque()
+        # Define collecting the earliest queued call
+        def collect() -> None:
+            index, future = queued.popleft()
+            try:
+                results[index] = future.result()
+            except Exception as error:
+                results[index] = error
+            if progress:
+                progress(index + 1,len(messages))
+        # Queue single calls with bounded calls waiting at once
+        for index, message in enumerate(messages):
+            if len(queued) >= max(1,concurrency):
+                collect()
+            try:
+                future = self._scheduler.submit(self._call,message,0,model,
+                                                priority=priority)
+            except LocalQueueFullError as error:
+                future = Future()
+                future.set_exception(error)
+            queued.append((index,future))
+        # Collect the rest queued calls
+        while queued:
+            collect()
+        # Return model responses in input order
+        return results
+
+    def _call_batched(self,messages:list,concurrency:int,progress=None,
+                      priority:int=0,model:str=None) -> list:
+        '''The method is defined for fulfill batch of single LLM calls
+        running concurrently in caller threads with bounded concurrency,
+        which are generated together on the batcher or the workers.
+        Args:
+            messages: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum inferences in flight.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the requests on the batcher.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Returns:
+            results: A list indicate the output content of each input in order,
+                or the exception raised by the inference of the input.
+        '''
+        results = [None] * len(messages)
+        finished = 0
+        with ThreadPoolExecutor(max_workers=max(1,concurrency)) as executor:
+            # Execute single calls in worker pool
+            futures = {executor.submit(self._call,message,priority,model): index
+                       for index, message in enumerate(messages)}
+            # Collect model responses as they finish
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as error:
+                    results[index] = error
+                finished += 1
+                if progress:
+                    progress(finished,len(messages))
+        # Return model responses in input order
+        return results
+
+    ## ============================= Completion Methods ============================= ##
+    def _complete(self,prompt:str,stop:str|list,temperature:float,max_tokens:int=0,
+                  priority:int=0,stream:bool=False,model:str=None):
+        '''The method is defined for execute single call inference on the batcher
+        when continuous batching is enabled, or on the model otherwise.
+        Args:
+            prompt: A string indicate proper structed content for inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            priority: A integer indicate the priority of the request on the batcher.
+            stream: A boolean indicate whether generate the response in streaming.
+            model: A string indicate the name of the registered model,
+                and use the model of `local.model` section by set it to `None`.
+        Returns:
+            A dictionary indicate the response in llama-cpp completion format,
+            or a generator of response chunks in streaming.
+        '''
+        # Discriminate whether generate together with other calls
+        if self.config.batch.slots:
+            batcher = self._batch(model)
+            if stream:
+                return self._track(batcher.stream(prompt,stop,temperature,
+                                                  max_tokens,priority),model)
+            with self._use(model):
+                return batcher.complete(prompt,stop,temperature,max_tokens,priority)
+        self._switch(False,model)
+        instance = self._acquire(model)
+        if stream:
+            return self._track(instance.create_completion(prompt=prompt,
+                                                          stop=stop,
+                                                          temperature=temperature,
+                                                          stream=True,
+                                                          **set_limit(max_tokens)),model)
+        with self._use(model):
+            return instance.create_completion(prompt=prompt,
+                                              stop=stop,
+                                              temperature=temperature,
+                                              **set_limit(max_tokens))
+
+    def _converse(self,messages:list,stop:str|list,temperature:float,max_tokens:int,
+                  session:str|None,stream:bool=False,model:str=None):
+        '''The method is defined for execute chat inference on the model,
+        whose state is switched to the chat session before.
+        Args:
+            messages: A list indicate proper structed content for chat inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            session: A string indicate the identity of the chat session.
+            stream: A boolean indicate whether generate the response in streaming.
+            model: A string indicate the name of the registered model,
+                and use the model of `local.model` section by set it to `None`.
+        Returns:
+            A dictionary indicate the response in llama-cpp chat completion format,
+            or a generator of response chunks in streaming.
+        '''
+        instance = self._acquire(model)
+        if stream:
+            return self._track(instance.create_chat_completion(messages=messages,
+                                                               stop=stop,
+                                                               temperature=temperature,
+                                                               stream=True,
+                                                               **set_limit(max_tokens)),model)
+        with self._use(model):
+            return instance.create_chat_completion(messages=messages,
+                                                   stop=stop,
+                                                   temperature=temperature,
+                                                   **set_limit(max_tokens))
+
+    ## ============================ Session Select Method ============================ ##
+    def _history(self,session:str|None) -> Prompt:
+        '''The method is defined for select chat history of a session.
+        Args:
+            session: A string indicate the identity of the chat session,
+                and select the default session by set it to `None`.
+        Returns:
+            A Prompt instance indicate the chat history of the session.
+        '''
+        if session == None:
+            return self.prompt
+        else:
+            return self.session.get(session)
+
+    ## ============================ Model State Methods ============================ ##
+    def _switch(self,owner:str|None|bool,model:str=None) -> None:
+        '''The method is defined for switch model state to the inference owner,
+        so evaluated prefix of a chat session is reused after switching back.
+        Args:
+            owner: A string indicate the identity of the chat session,
+                `None` indicate the default chat session,
+                and `False` indicate single call inferences.
+            model: A string indicate the name of the registered model,
+                and use the model of `local.model` section by set it to `None`.
+        '''
+        name = self._resolve(model)
+        instance = self._acquire(name)
+        active = self._active.get(name,False)
+        # Discriminate whether model state belongs to the owner
+        if owner == active:
+            return
+        # Save model state of the leaving chat session
+        if active is not False and self.config.cache.states:
+            self._states[(name,active)] = instance.save_state()
+            self._states.move_to_end((name,active))
+            while len(self._states) > self.config.cache.states:
+                self._states.popitem(last=False)
+        # Restore model state of the entering chat session
+        if owner is not False and (name,owner) in self._states:
+            instance.load_state(self._states[(name,owner)])
+        self._active[name] = owner
+
+    def _release(self,session:str) -> None:
+        '''The method is defined for release log records and model state
+        of an evicted chat session.
+        Args:
+            session: A string indicate the identity of the chat session.
+        '''
+        self.log.release(session)
+        for key in [key for key in self._states if key[1] == session]:
+            self._states.pop(key,None)
+        for name in [name for name, owner in self._active.items() if owner == session]:
+            self._active[name] = False
+
+    ## =========================== Response Cache Methods =========================== ##
+    def _key(self,prompt:str,stop:str|list,temperature:float,
+             max_tokens:int=0,model:str=None) -> str|None:
+        '''The method is defined for make cache key of a single call inference,
+        which is only cached when it's deterministic.
+        Args:
+            prompt: A string indicate proper structed content for inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            model: A string indicate the name of the registered model,
+                and use the model of `local.model` section by set it to `None`.
+        Returns:
+            A string indicate the cache key,
+            or `None` indicate the response shouldn't be cached.
+        '''
+        if self.cache == None or temperature != 0:
+            return None
+        return make_key('local',self._resolve(model),prompt,stop,temperature,
+                        set_limit(max_tokens))
+
+    def _recall(self,type:str,message:str,prompt:str|None,addition:str|None,
+                stop:str|list,temperature:float,max_tokens:int=0,
+                model:str=None) -> tuple:
+        '''The method is defined for read cached response of the query
+        or a query similar to it.
+        Args:
+            type: A string indicate the inference type.
+            message: A string indicate the input content for model inference.
+            prompt: A string indicate proper structed content for single call,
+                which is `None` for chat inference.
+            addition: A string indicate additional prompt for chat inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            model: A string indicate the name of the registered model,
+                and use the model of `local.model` section by set it to `None`.
+        Returns:
+            response: A string indicate the cached response,
+                or `None` indicate the response isn't cached.
+            ticket: A tuple indicate where the response is cached after inference.
+        '''
+        # Read cached response of deterministic single call
+        key = self._key(prompt,stop,temperature,max_tokens,model) if prompt != None else None
+        response = self.cache.get(key) if key else None
+        # Read cached response of similar query
+        probe = None
+        if response == None and self.semantic != None:
+            scope = make_scope(type,self._resolve(model),addition,stop,temperature,
+                               set_limit(max_tokens))
+            vector = self._embed(message)
+            response = self.semantic.get(vector,scope)
+            probe = (vector,scope)
+        return response, (key,probe,perf_counter())
+
+    def _embed(self,text:str) -> list:
+        '''The method is defined for embed a text with the embedding model,
+        which is loaded by first embedding and unloaded with the model,
+        and embeds one text at a time.
+        Args:
+            text: A string indicate the content to embed.
+        Returns:
+            A list indicate the embedding of the content,
+            or embeddings of its tokens with models without pooling.
+        '''
+        with self._guard:
+            # Discriminate whether the embedding model is loaded
+            if self._embedder == None:
+                # Embed with the inference model without specific embedding model
+                if self.config.semantic.model:
+                    path = (self.config.model.directory
+                            + struct_model_name(self.config.semantic.model)
+                            + self.config.model.suffix)
+                else:
+                    path = self.config.path
+                # Load embedding model with short context for queries
+                self._embedder = Llama(model_path=path,
+                                       n_gpu_layers=set_gpu(self.config.gpu,
+                                                            self.config.engine.n_gpu_layers),
+                                       embedding=True,
+                                       n_ctx=512,
+                                       verbose=False)
+            embedder = self._embedder
+        # Embed under the lock since the embedding context isn't thread-safe
+        with self._embedding:
+            return embedder.embed(text)
+
+    def _remember(self,ticket:tuple|None,response:str) -> None:
+        '''The method is defined for cache response of an inference.
+        Args:
+            ticket: A tuple indicate where the response is cached,
+                or `None` indicate the response isn't cached.
+            response: A string indicate the output content from model inference.
+        '''
+        if ticket == None:
+            return
+        key, probe, start = ticket
+        if key:
+            self.cache.put(key,response)
+        if probe:
+            self.semantic.put(*probe,response,perf_counter() - start)
+
+    ## =============================== Context Methods =============================== ##
+    def _count(self,text:str,model:str=None) -> int:
+        '''The method is defined for count tokens of a string with model tokenizer.
+        Args:
+            text: A string indicate the content to count.
+            model: A string indicate the name of the registered model,
+                and use the model of `local.model` section by set it to `None`.
+        Returns:
+            A integer indicate the number of tokens.
+        '''
+        return len(self._acquire(model).tokenize(text.encode('utf-8'),
+                                                 add_bos=False,special=True))
+
+    def _summarize(self,messages:list,model:str=None) -> str:
+        '''The method is defined for make summary of dropped chat history.
+        Args:
+            messages: A list indicate the summary prompt for chat inference.
+            model: A string indicate the name of the registered model,
+                and use the model of `local.model` section by set it to `None`.
+        Returns:
+            A string indicate the summary from model inference.
+        '''
+        instance = self._acquire(model)
+        with self._use(model):
+            response = instance.create_chat_completion(messages=messages,temperature=0)
+        return response['choices'][0]['message']['content']
+
+    ## =========================== Stream Request Methods =========================== ##
+    def _stream_call(self,message:str,priority:int=0,model:str=None):
+        '''The method is defined for fulfill single LLM call in streaming.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request on the batcher.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        # Select the registered model of the inference
+        name = self._resolve(model)
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('stream_call')
+        # Make prompt for inference
+        with span.stage('prompt'):
+            prompt = self.prompt.call(message)
+        # Read cached response of the query or similar query
+        with span.stage('cache'):
+            output, ticket = self._recall('call',message,prompt,None,
+                                          self.strategy.call.stop,
+                                          self.strategy.call.temperature,
+                                          self.strategy.call.max_tokens,
+                                          name)
+        cached = output != None
+        span.set(cached=cached)
+        truncated = False
+        first, count, tokens = None, None, None
+        if cached:
+            yield output
+        else:
+            # Execute model inference and pass through response pieces
+            with span.stage('infer'):
+                stream = self._complete(prompt,self.strategy.call.stop,
+                                        self.strategy.call.temperature,
+                                        self.strategy.call.max_tokens,
+                                        priority,stream=True,model=name)
+                # Count each response piece as a generated token
+                pieces = []
+                count = 0
+                for chunk in stream:
+                    piece = chunk['choices'][0]['text']
+                    if piece:
+                        if first == None:
+                            first = perf_counter() - start
+                        pieces.append(piece)
+                        count += 1
+                        yield piece
+                    if chunk['choices'][0].get('finish_reason') == 'length':
+                        truncated = True
+            output = ''.join(pieces)
+            tokens = self._count(prompt,name)
+            self._remember(ticket,output)
+        # Make log record
+        with span.stage('log'):
+            self.log.call(model=name,
+                          input=message,output=output,
+                          temperature=self.strategy.call.temperature,
+                          cached=cached,
+                          truncated=truncated,
+                          metrics=make_metrics(perf_counter() - start,first,tokens,count))
+        span.end()
+
+    def _stream_chat(self,message:str,keep:bool,session:str=None,model:str=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            model: A string indicate the name of the registered model,
+                and infer with the model of `local.model` section by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        # Select the registered model of the inference
+        name = self._resolve(model)
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('stream_chat')
+        # Select chat history and model state of the session
+        history = self._history(session)
+        self._switch(session,name)
+        # Discriminate whether keep current section content
+        with span.stage('trim'):
+            history.iterate(None,None,None,keep)
+        # Read cached response of similar opening query
+        output, ticket = None, None
+        if self.semantic != None and history.empty:
+            with span.stage('cache'):
+                output, ticket = self._recall('chat',message,None,
+                                              self.strategy.chat.addition,
+                                              self.strategy.chat.stop,
+                                              self.strategy.chat.temperature,
+                                              self.strategy.chat.max_tokens,
+                                              name)
+        cached = output != None
+        span.set(cached=cached)
+        truncated = False
+        first, count, tokens = None, None, None
+        if cached:
+            yield output
+        else:
+            # Make prompt for inference
+            with span.stage('prompt'):
+                prompt = history.chat(role=self.strategy.chat.role,
+                                      content=message,
+                                      addition=self.strategy.chat.addition,
+                                      context=self.strategy.chat.context,
+                                      counter=partial(self._count,model=name),
+                                      summarize=partial(self._summarize,model=name))
+            # Execute model inference and pass through response pieces
+            with span.stage('infer'):
+                stream = self._converse(prompt,self.strategy.chat.stop,
+                                        self.strategy.chat.temperature,
+                                        self.strategy.chat.max_tokens,
+                                        session,stream=True,model=name)
+                # Count each response piece as a generated token
+                pieces = []
+                count = 0
+                for chunk in stream:
+                    piece = chunk['choices'][0]['delta'].get('content')
+                    if piece:
+                        if first == None:
+                            first = perf_counter() - start
+                        pieces.append(piece)
+                        count += 1
+                        yield piece
+                    if chunk['choices'][0].get('finish_reason') == 'length':
+                        truncated = True
+            output = ''.join(pieces)
+            tokens = sum(self._count(record['content'],name) for record in prompt)
+            self._remember(ticket,output)
+        # Update prompt section content
+        with span.stage('history'):
+            history.iterate(role=self.strategy.chat.role,
+                            input=message,output=output,
+                            keep=True)
+        if session != None:
+            self.session.touch(session)
+        # Make log record
+        with span.stage('log'):
+            self.log.chat(model=name,
+                          addition=self.strategy.chat.addition,
+                          role=self.strategy.chat.role,
+                          input=message,output=output,
+                          temperature=self.strategy.chat.temperature,
+                          keep=keep,
+                          session=session,
+                          cached=cached,
+                          truncated=truncated,
+                          metrics=make_metrics(perf_counter() - start,first,tokens,count))
+        span.end()
\ No newline at end of file
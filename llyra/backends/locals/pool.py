@@ -0,0 +1,673 @@
+from llama_cpp import Llama, LlamaRAMCache
+from .definition import Local
+from .utils import set_gpu, set_engine, set_limit
+from ...errors.locals import LocalWorkerError, LocalModelNotRegisteredError
+from collections import OrderedDict
+from concurrent.futures import Future
+from itertools import count
+from queue import Empty, SimpleQueue
+from threading import Thread, Lock
+from time import monotonic, sleep
+from os import cpu_count
+from pathlib import Path
+import multiprocessing
+import pickle
+
+# Mark of a finished stream in the hand-over queue
+END = None
+
+## ============================== Function `serve()` ============================== ##
+def serve(settings:dict,capacity:int,states:int,requests,responses,cancel) -> None:
+    '''The function is defined for serve requests in a worker process,
+    with its own model instance over the memory-mapped model file.
+    Args:
+        settings: A dictionary indicate the keyword arguments of model loading.
+        capacity: A integer indicate the bytes of prompt-prefix state cache.
+        states: A integer indicate the maximum chat sessions with saved model state.
+        requests: A Queue instance indicate the requests sent to the worker.
+        responses: A Queue instance indicate the responses sent from the worker.
+        cancel: A Value instance indicate the identity of the cancelled stream.
+    '''
+    # Load the model in the worker process
+    model = Llama(**settings)
+    if capacity:
+        model.set_cache(LlamaRAMCache(capacity))
+    # Initialize model state attributes,
+    # which are saved states of chat sessions and owner of current state
+    saved = OrderedDict()
+    active = False
+    while True:
+        request = requests.get()
+        # Discriminate whether the worker is stopped
+        if request == None:
+            return
+        id, method, owner, parameters = request
+        # Discriminate whether drop saved state of an evicted chat session
+        if method == None:
+            saved.pop(owner,None)
+            if active == owner:
+                active = False
+            continue
+        try:
+            # Switch model state to the owner of the request
+            if owner != active:
+                if active is not False and states:
+                    saved[active] = model.save_state()
+                    saved.move_to_end(active)
+                    while len(saved) > states:
+                        saved.popitem(last=False)
+                if owner is not False and owner in saved:
+                    model.load_state(saved[owner])
+                active = owner
+            # Execute model inference and pass through response chunks
+            result = getattr(model,method)(**parameters)
+            if parameters.get('stream'):
+                for chunk in result:
+                    if cancel.value == id:
+                        result.close()
+                        break
+                    responses.put((id,'chunk',chunk))
+                result = None
+            responses.put((id,'done',result))
+        except Exception as error:
+            # Send the error as it is only when it can be sent to the caller
+            try:
+                pickle.dumps(error)
+            except Exception:
+                error = RuntimeError(repr(error))
+            responses.put((id,'error',error))
+
+class Worker:
+    '''The class is defined for handle a worker process and its requests in flight.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,index:int,settings:dict,capacity:int,states:int,context) -> None:
+        '''The method is defined for initialize Worker class object,
+        which starts the worker process.
+        Args:
+            index: A integer indicate the index of the worker.
+            settings: A dictionary indicate the keyword arguments of model loading.
+            capacity: A integer indicate the bytes of prompt-prefix state cache.
+            states: A integer indicate the maximum chat sessions with saved model state.
+            context: A multiprocessing context indicate how the process is started.
+        '''
+        # Get worker attributes
+        self.index = index
+        # Initialize load attributes,
+        # which are requests in flight and when the worker is used last
+        self.outstanding = 0
+        self.used = monotonic()
+        # Start worker process
+        self.requests = context.Queue()
+        self.responses = context.Queue()
+        self.cancel = context.Value('q',-1)
+        self.process = context.Process(target=serve,
+                                       args=(settings,capacity,states,self.requests,
+                                             self.responses,self.cancel),
+                                       daemon=True)
+        self.process.start()
+        # Start reader thread passing responses to their requests
+        self._ids = count()
+        self._pending:dict = {}
+        self._lock = Lock()
+        self._stopped = False
+        self._reader = Thread(target=self._read,daemon=True)
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        '''The property is defined for discriminate whether the worker serves requests.
+        Returns:
+            A boolean indicate whether the worker process is running.
+        '''
+        return not self._stopped and self.process.is_alive()
+
+    ## ============================== Request Methods ============================== ##
+    def request(self,method:str,owner:str|None|bool,parameters:dict) -> Future:
+        '''The method is defined for send a request to the worker process.
+        Args:
+            method: A string indicate the name of inference method of the model.
+            owner: A string indicate the identity of the chat session,
+                `None` indicate the default chat session,
+                and `False` indicate single call inferences.
+            parameters: A dictionary indicate the keyword arguments of the method.
+        Returns:
+            future: A Future instance indicate the response of the request.
+        '''
+        future = Future()
+        self._send(method,owner,parameters,future)
+        return future
+
+    def stream(self,method:str,owner:str|None|bool,parameters:dict):
+        '''The method is defined for send a stream request to the worker process,
+        which stops generation once the caller stops reading.
+        Args:
+            method: A string indicate the name of inference method of the model.
+            owner: A string indicate the identity of the chat session,
+                `None` indicate the default chat session,
+                and `False` indicate single call inferences.
+            parameters: A dictionary indicate the keyword arguments of the method.
+        Yields:
+            A dictionary indicate the response chunk.
+        '''
+        chunks = SimpleQueue()
+        id = self._send(method,owner,parameters,chunks)
+        finished = False
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is END:
+                    finished = True
+                    return
+                if isinstance(chunk,BaseException):
+                    finished = True
+                    raise chunk
+                yield chunk
+        finally:
+            if not finished:
+                self.cancel.value = id
+
+    def release(self,owner:str) -> None:
+        '''The method is defined for drop saved model state of a chat session.
+        Args:
+            owner: A string indicate the identity of the chat session.
+        '''
+        self.requests.put((-1,None,owner,None))
+
+    def _send(self,method:str,owner:str|None|bool,parameters:dict,sink) -> int:
+        '''The method is defined for register where the response goes and send a request.
+        Args:
+            method: A string indicate the name of inference method of the model.
+            owner: A string indicate the identity of the chat session.
+            parameters: A dictionary indicate the keyword arguments of the method.
+            sink: A Future or SimpleQueue instance indicate where the response goes.
+        Returns:
+            id: A integer indicate the identity of the request.
+        '''
+        with self._lock:
+            id = next(self._ids)
+            self._pending[id] = sink
+        self.requests.put((id,method,owner,parameters))
+        return id
+
+    ## =============================== Reader Method =============================== ##
+    def _read(self) -> None:
+        '''The method is defined for pass responses of the worker process
+        to their requests, and fail requests left when the process exits.'''
+        while True:
+            try:
+                id, kind, payload = self.responses.get(timeout=0.5)
+            except Empty:
+                if self.process.is_alive():
+                    continue
+                break
+            self._pass(id,kind,payload)
+        # Pass responses sent right before exit, and fail the rest
+        while True:
+            try:
+                self._pass(*self.responses.get(timeout=0.1))
+            except Empty:
+                break
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for sink in pending.values():
+            error = LocalWorkerError(self.index,self.process.exitcode)
+            if isinstance(sink,Future):
+                sink.set_exception(error)
+            else:
+                sink.put(error)
+
+    def _pass(self,id:int,kind:str,payload) -> None:
+        '''The method is defined for pass a response to its request.
+        Args:
+            id: A integer indicate the identity of the request.
+            kind: A string indicate the kind of the response,
+                `chunk` for stream chunk, `done` for the end and `error` for failure.
+            payload: A value indicate the content of the response.
+        '''
+        with self._lock:
+            sink = self._pending.get(id) if kind == 'chunk' else self._pending.pop(id,None)
+        if sink == None:
+            return
+        if isinstance(sink,Future):
+            if kind == 'error':
+                sink.set_exception(payload)
+            else:
+                sink.set_result(payload)
+        else:
+            sink.put(END if kind == 'done' else payload)
+
+    ## ============================== Release Method ============================== ##
+    def stop(self) -> None:
+        '''The method is defined for stop the worker process
+        after requests sent before.'''
+        self._stopped = True
+        self.requests.put(None)
+        self.process.join()
+        self._reader.join()
+
+class LocalPool(Local):
+    '''The class is defined for fulfill local LLM call on worker processes,
+    each running the model over the same memory-mapped model file.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,path:str|Path) -> None:
+        '''The method is defined for initialize LocalPool class object.
+        Args:
+            path: A string or Path instance indicate the path to the config file.
+        '''
+        # Initialize worker attributes,
+        # which are worker handles and worker of each chat session
+        self._workers:list = []
+        self._routes:dict = {}
+        self._lock = Lock()
+        self._context = multiprocessing.get_context('spawn')
+        # Initialize parent class
+        super().__init__(path)
+
+    ## ============================= Inference Methods ============================= ##
+    def call(self,message:str,priority:int=0,model:str=None) -> str:
+        '''The method is defined for fulfill single LLM call
+        on the least loaded worker.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                which is ignored since each worker serves requests in arrival order.
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        Returns:
+            A string indicate the output content from model inference.
+        '''
+        return self._call(message,0,model)
+
+    def chat(self,message:str,keep:bool,session:str=None,priority:int=0,
+             model:str=None) -> str:
+        '''The method is defined for fulfill iterative chat inference
+        on the worker keeping the chat session,
+        after former iterations of the chat session running in other threads.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                which is ignored since each worker serves requests in arrival order.
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        Returns:
+            A string indicate the output content from model inference.
+        '''
+        with self._history(session).hold():
+            return self._chat(message,keep,session,model)
+
+    def call_many(self,messages:list,concurrency:int,progress=None,
+                  priority:int=0,model:str=None) -> list:
+        '''The method is defined for fulfill batch of single LLM calls
+        spread over the workers with bounded concurrency.
+        Args:
+            messages: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum inferences in flight.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the request,
+                which is ignored since each worker serves requests in arrival order.
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        Returns:
+            A list indicate the output content of each input in order,
+            or the exception raised by the inference of the input.
+        '''
+        return self._call_batched(messages,concurrency,progress,0,model)
+
+    def stream_call(self,message:str,priority:int=0,model:str=None):
+        '''The method is defined for fulfill single LLM call in streaming
+        on the least loaded worker.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                which is ignored since each worker serves requests in arrival order.
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        yield from self._stream_call(message,0,model)
+
+    def stream_chat(self,message:str,keep:bool,session:str=None,priority:int=0,
+                    model:str=None):
+        '''The method is defined for fulfill iterative chat inference in streaming
+        on the worker keeping the chat session,
+        after former iterations of the chat session running in other threads.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                which is ignored since each worker serves requests in arrival order.
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        with self._history(session).hold():
+            yield from self._stream_chat(message,keep,session,model)
+
+    @property
+    def loads(self) -> list:
+        '''The property is defined for read requests in flight of each worker.
+        Returns:
+            A list of integers indicate the outstanding requests of each worker,
+            or `None` indicate the worker is stopped.
+        '''
+        with self._lock:
+            return [worker.outstanding if worker != None else None
+                    for worker in self._workers]
+
+    ## ============================= Lifecycle Methods ============================= ##
+    def load(self,model:str=None) -> None:
+        '''The method is defined for start worker processes loading the model
+        when they aren't started.
+        Args:
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        '''
+        self._load(self._resolve(model))
+
+    def unload(self,model:str=None) -> None:
+        '''The method is defined for stop worker processes after their requests.
+        Args:
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        '''
+        name = self._resolve(model) if model != None else None
+        self._unload(name)
+
+    def reconfigure(self,format:str,gpu:bool,ram:bool,
+                    engine:dict=None,reload:bool=True) -> bool:
+        '''The method is defined for update config parameters of model loading,
+        and start worker processes again when they're started and parameters are changed.
+        Args:
+            format: A sting indicate the format of chat inference's input.
+            gpu: A boolean indicate whether using GPU for inference acceleration.
+            ram: A boolean indicate whether keeping the model loaded in memory.
+            engine: A dictionary indicate the engine parameters to update.
+            reload: A boolean indicate whether start the workers again,
+                or apply updated parameters to the workers started next time.
+        Returns:
+            A boolean indicate whether any parameter is changed.
+        '''
+        return self._reconfigure(format,gpu,ram,engine,reload)
+
+    def warmup(self,model:str=None) -> None:
+        '''The method is defined for warm up each running worker with a tiny inference.
+        Args:
+            model: A string indicate the name of the model,
+                which only accepts the model of `local.model` section.
+        '''
+        self._warmup(self._resolve(model))
+
+    def _queue(self) -> None:
+        '''The method is defined for leave serving requests to the workers,
+        which serve requests in arrival order themselves.'''
+        return None
+
+    def _resolve(self,model:str|None) -> str:
+        '''The method is defined for select the name of the model served by workers.
+        Args:
+            model: A string indicate the name of the model,
+                and select the model of `local.model` section by set it to `None`.
+        Returns:
+            name: A string indicate the name of the model of `local.model` section.
+        '''
+        name = super()._resolve(model)
+        # Discriminate whether the workers serve the model
+        if name != self.config.model.name:
+            raise LocalModelNotRegisteredError(model)
+        return name
+
+    def _open(self,name:str) -> Llama:
+        '''The method is defined for load vocabulary of the model for counting tokens,
+        and start worker processes loading the model.
+        Args:
+            name: A string indicate the name of the model.
+        Returns:
+            model: A Llama instance indicate the vocabulary of the model.
+        '''
+        model = Llama(model_path=self.config.path,vocab_only=True,verbose=False)
+        with self._lock:
+            self._workers = [self._start(index)
+                             for index in range(self.config.pool.workers)]
+        return model
+
+    def _start(self,index:int) -> Worker:
+        '''The method is defined for start a worker process loading the model.
+        Args:
+            index: A integer indicate the index of the worker.
+        Returns:
+            A Worker instance indicate the started worker.
+        '''
+        # Share CPU cores between workers unless threads are set
+        engine = set_engine(self.config.engine)
+        if not self.config.engine.n_threads:
+            engine['n_threads'] = max(1,(cpu_count() or 1) // self.config.pool.workers)
+        if not self.config.engine.n_threads_batch:
+            engine['n_threads_batch'] = engine['n_threads']
+        settings = dict(model_path=self.config.path,
+                        n_gpu_layers=set_gpu(self.config.gpu,
+                                             self.config.engine.n_gpu_layers),
+                        chat_format=self.config.format,
+                        use_mlock=self.config.ram,
+                        verbose=False,
+                        **engine)
+        return Worker(index,settings,self.config.cache.capacity,
+                      self.config.cache.states,self._context)
+
+    def _warmup(self,model:str=None) -> None:
+        '''The method is defined for run a tiny inference on each running worker.
+        Args:
+            model: A string indicate the name of the model.
+        '''
+        self._acquire(model)
+        with self._lock:
+            workers = [worker for worker in self._workers if worker != None]
+        futures = [worker.request('create_completion',False,
+                                  {'prompt': ' ','max_tokens': 1})
+                   for worker in workers]
+        for future in futures:
+            future.result()
+
+    def _watch(self) -> None:
+        '''The method is defined for stop each worker
+        once it isn't used within idle timeout.'''
+        while True:
+            idle = []
+            remain = self.config.idle
+            with self._guard, self._lock:
+                # Discriminate whether the workers are still started
+                if not self._models:
+                    self._watcher = None
+                    return
+                now = monotonic()
+                for index, worker in enumerate(self._workers):
+                    if worker == None or worker.outstanding:
+                        continue
+                    left = self.config.idle - (now - worker.used)
+                    # Discriminate whether the worker is idle for long enough
+                    if left <= 0:
+                        idle.append(worker)
+                        self._workers[index] = None
+                        for owner in [owner for owner, route in self._routes.items()
+                                      if route == index]:
+                            del self._routes[owner]
+                    else:
+                        remain = min(remain,left)
+            for worker in idle:
+                worker.stop()
+            sleep(remain)
+
+    def _close(self,name:str) -> None:
+        '''The method is defined for stop worker processes after their requests.
+        Args:
+            name: A string indicate the name of the model.
+        '''
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._routes.clear()
+        for worker in workers:
+            if worker != None:
+                worker.stop()
+
+    ## ============================== Dispatch Methods ============================== ##
+    def _select(self,owner:str|None|bool) -> Worker:
+        '''The method is defined for select the worker of a request,
+        and start it again when it's stopped.
+        Args:
+            owner: A string indicate the identity of the chat session,
+                `None` indicate the default chat session,
+                and `False` indicate single call inferences.
+        Returns:
+            worker: A Worker instance indicate the selected worker.
+        '''
+        while True:
+            # Start the workers when they aren't started
+            self._acquire()
+            with self._lock:
+                # Start the workers again when they're stopped by another thread since
+                if not self._workers:
+                    continue
+                # Route chat session to its former worker,
+                # or select the least loaded worker preferring running workers
+                index = self._routes.get(owner) if owner is not False else None
+                if index == None:
+                    index = min(range(len(self._workers)),
+                                key=lambda index: (self._workers[index].outstanding
+                                                   if self._workers[index] != None else 0,
+                                                   self._workers[index] == None))
+                    if owner is not False:
+                        self._routes[owner] = index
+                # Start the worker again when it's stopped or exited
+                worker = self._workers[index]
+                if worker == None or not worker.alive:
+                    worker = self._workers[index] = self._start(index)
+                worker.outstanding += 1
+                worker.used = monotonic()
+                return worker
+
+    def _settle(self,worker:Worker) -> None:
+        '''The method is defined for count a request finished by a worker.
+        Args:
+            worker: A Worker instance indicate the worker of the request.
+        '''
+        with self._lock:
+            worker.outstanding -= 1
+            worker.used = monotonic()
+
+    def _dispatch(self,method:str,owner:str|None|bool,parameters:dict):
+        '''The method is defined for execute a request on the selected worker.
+        Args:
+            method: A string indicate the name of inference method of the model.
+            owner: A string indicate the identity of the chat session,
+                `None` indicate the default chat session,
+                and `False` indicate single call inferences.
+            parameters: A dictionary indicate the keyword arguments of the method.
+        Returns:
+            A dictionary indicate the response,
+            or a generator of response chunks in streaming.
+        '''
+        worker = self._select(owner)
+        if parameters.get('stream'):
+            return self._forward(worker,method,owner,parameters)
+        try:
+            return worker.request(method,owner,parameters).result()
+        finally:
+            self._settle(worker)
+
+    def _forward(self,worker:Worker,method:str,owner:str|None|bool,parameters:dict):
+        '''The method is defined for pass response chunks of a stream request.
+        Args:
+            worker: A Worker instance indicate the worker of the request.
+            method: A string indicate the name of inference method of the model.
+            owner: A string indicate the identity of the chat session.
+            parameters: A dictionary indicate the keyword arguments of the method.
+        Yields:
+            A dictionary indicate the response chunk.
+        '''
+        try:
+            yield from worker.stream(method,owner,parameters)
+        finally:
+            self._settle(worker)
+
+    ## ============================= Completion Methods ============================= ##
+    def _complete(self,prompt:str,stop:str|list,temperature:float,max_tokens:int=0,
+                  priority:int=0,stream:bool=False,model:str=None):
+        '''The method is defined for execute single call inference
+        on the least loaded worker.
+        Args:
+            prompt: A string indicate proper structed content for inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            priority: A integer indicate the priority of the request, which is ignored.
+            stream: A boolean indicate whether generate the response in streaming.
+            model: A string indicate the name of the model.
+        Returns:
+            A dictionary indicate the response in llama-cpp completion format,
+            or a generator of response chunks in streaming.
+        '''
+        return self._dispatch('create_completion',False,
+                              dict(prompt=prompt,stop=stop,temperature=temperature,
+                                   stream=stream,**set_limit(max_tokens)))
+
+    def _converse(self,messages:list,stop:str|list,temperature:float,max_tokens:int,
+                  session:str|None,stream:bool=False,model:str=None):
+        '''The method is defined for execute chat inference
+        on the worker keeping the chat session.
+        Args:
+            messages: A list indicate proper structed content for chat inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            max_tokens: A integer indicate the maximum tokens of generation.
+            session: A string indicate the identity of the chat session.
+            stream: A boolean indicate whether generate the response in streaming.
+            model: A string indicate the name of the model.
+        Returns:
+            A dictionary indicate the response in llama-cpp chat completion format,
+            or a generator of response chunks in streaming.
+        '''
+        return self._dispatch('create_chat_completion',session,
+                              dict(messages=list(messages),stop=stop,
+                                   temperature=temperature,stream=stream,
+                                   **set_limit(max_tokens)))
+
+    def _summarize(self,messages:list,model:str=None) -> str:
+        '''The method is defined for make summary of dropped chat history
+        on the least loaded worker.
+        Args:
+            messages: A list indicate the summary prompt for chat inference.
+            model: A string indicate the name of the model.
+        Returns:
+            A string indicate the summary from model inference.
+        '''
+        response = self._dispatch('create_chat_completion',False,
+                                  dict(messages=list(messages),temperature=0))
+        return response['choices'][0]['message']['content']
+
+    ## ============================ Model State Methods ============================ ##
+    def _switch(self,owner:str|None|bool,model:str=None) -> None:
+        '''The method is defined for leave model state switching to the workers,
+        which switch states of their own chat sessions.
+        Args:
+            owner: A string indicate the identity of the chat session.
+            model: A string indicate the name of the model.
+        '''
+        pass
+
+    def _release(self,session:str) -> None:
+        '''The method is defined for release log records, worker route
+        and saved model state of an evicted chat session.
+        Args:
+            session: A string indicate the identity of the chat session.
+        '''
+        self.log.release(session)
+        with self._lock:
+            index = self._routes.pop(session,None)
+            worker = self._workers[index] if index != None else None
+        if worker != None and worker.alive:
+            worker.release(session)
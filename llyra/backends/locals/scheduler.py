@@ -0,0 +1,105 @@
+from ...errors.locals import LocalQueueFullError
+from concurrent.futures import Future
+from itertools import count
+from queue import PriorityQueue, Full
+from threading import Thread, current_thread
+
+class Scheduler:
+    '''The class is defined for serialize requests to the single local model,
+    which wait in a bounded queue and run one at a time on a worker thread.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,policy:str='fifo',queue:int=64,
+                 block:bool=True,timeout:float=0) -> None:
+        '''The method is defined for initialize Scheduler class object.
+        Args:
+            policy: A string indicate the order queued requests are served in,
+                `fifo` for arrival order,
+                or `priority` for higher priority first and arrival order among equals.
+            queue: A integer indicate the maximum requests waiting for the worker,
+                and queue them unlimited by set it to 0.
+            block: A boolean indicate whether wait for a free place in full queue,
+                or raise at once.
+            timeout: A float indicate the seconds waiting for a free place in full queue,
+                and wait for ever by set it to 0.
+        '''
+        # Get queue attributes
+        self.policy = policy
+        self.queue = queue
+        self.block = block
+        self.timeout = timeout
+        # Initialize request queue ordered by rank and arrival
+        self._requests:PriorityQueue = PriorityQueue(queue)
+        self._order = count()
+        # Start worker thread serving requests
+        self._worker = Thread(target=self._run,daemon=True)
+        self._worker.start()
+
+    ## ============================== Submit Methods ============================== ##
+    def submit(self,function,*args,priority:int=0,block:bool=None) -> Future:
+        '''The method is defined for queue a request to run on the worker thread,
+        and run it at once when it's submitted from the worker thread itself.
+        Args:
+            function: A callable indicate the request.
+            args: Positional arguments indicate the arguments of the request.
+            priority: A integer indicate the priority of the request,
+                which is ignored with `fifo` policy.
+            block: A boolean indicate whether wait for a free place in full queue,
+                and follow the scheduler by set it to `None`.
+        Returns:
+            future: A Future instance indicate the result of the request.
+        '''
+        future = Future()
+        # Discriminate whether the request is nested in a running request
+        if current_thread() is self._worker:
+            self._execute(future,function,args)
+            return future
+        # Queue the request or raise when the queue stays full
+        rank = -priority if self.policy == 'priority' else 0
+        block = self.block if block == None else block
+        try:
+            self._requests.put((rank,next(self._order),future,function,args),
+                               block,self.timeout if self.timeout else None)
+        except Full:
+            raise LocalQueueFullError(self.queue)
+        return future
+
+    def run(self,function,*args,priority:int=0):
+        '''The method is defined for queue a request and wait for its result.
+        Args:
+            function: A callable indicate the request.
+            args: Positional arguments indicate the arguments of the request.
+            priority: A integer indicate the priority of the request.
+        Returns:
+            A value indicate the result of the request.
+        '''
+        return self.submit(function,*args,priority=priority).result()
+
+    @property
+    def pending(self) -> int:
+        '''The property is defined for count requests waiting in queue.
+        Returns:
+            A integer indicate the number of waiting requests.
+        '''
+        return self._requests.qsize()
+
+    ## ============================== Worker Methods ============================== ##
+    def _run(self) -> None:
+        '''The method is defined for serve queued requests one at a time.'''
+        while True:
+            _, _, future, function, args = self._requests.get()
+            if future.set_running_or_notify_cancel():
+                self._execute(future,function,args)
+
+    def _execute(self,future:Future,function,args:tuple) -> None:
+        '''The method is defined for run a request and settle its future.
+        Args:
+            future: A Future instance indicate the result of the request.
+            function: A callable indicate the request.
+            args: A tuple indicate the arguments of the request.
+        '''
+        try:
+            result = function(*args)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
\ No newline at end of file
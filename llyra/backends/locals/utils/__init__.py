@@ -1 +1 @@
-from .funcs import set_gpu
\ No newline at end of file
+from .funcs import set_gpu, set_engine, set_limit, read_stamp
\ No newline at end of file
@@ -1,13 +1,73 @@
+from ....components.configs.utils import Engine, KV_TYPES
+import os
+
 ## ============================= Function `set_gpu()` ============================= ##
-def set_gpu(gpu:bool) -> int:
+def set_gpu(gpu:bool,layers:int=-1) -> int:
     '''The function is defined for properly set whether using GPU for acceleration.
     Args:
         gpu: A boolean indicate whether using GPU for inference acceleration.
+        layers: A integer indicate number of layers offload to GPU when GPU is used,
+            and offload all layers by set it to -1.
     Returns:
         layer: A integer indicate number of layers offload to GPU.
     '''
     if gpu:
-        layer = int(-1)
+        layer = int(layers)
     else:
         layer = int(0)
-    return layer
\ No newline at end of file
+    return layer
+
+## ============================ Function `set_engine()` ============================ ##
+def set_engine(engine:Engine) -> dict:
+    '''The function is defined for make llama.cpp parameters of model loading
+    from engine parameters.
+    Args:
+        engine: A Engine instance indicate the engine parameters of local model.
+    Returns:
+        parameters: A dictionary indicate the keyword arguments of model loading.
+    '''
+    parameters = {'n_ctx': engine.n_ctx,
+                  'n_batch': engine.n_batch,
+                  'n_ubatch': engine.n_ubatch,
+                  'use_mmap': engine.use_mmap,
+                  'flash_attn': engine.flash_attn}
+    # Discriminate whether threads are set or detected by llama.cpp
+    if engine.n_threads:
+        parameters['n_threads'] = engine.n_threads
+    if engine.n_threads_batch:
+        parameters['n_threads_batch'] = engine.n_threads_batch
+    # Discriminate whether KV cache is quantized
+    if engine.type_k:
+        parameters['type_k'] = KV_TYPES[engine.type_k]
+    if engine.type_v:
+        parameters['type_v'] = KV_TYPES[engine.type_v]
+    return parameters
+
+## ============================= Function `set_limit()` ============================= ##
+def set_limit(max_tokens:int) -> dict:
+    '''The function is defined for make llama.cpp parameters of generation length,
+    which keeps the default limit of llama.cpp when it isn't set.
+    Args:
+        max_tokens: A integer indicate the maximum tokens of generation.
+    Returns:
+        parameters: A dictionary indicate the keyword arguments of inference.
+    '''
+    parameters = {'max_tokens': max_tokens} if max_tokens else {}
+    return parameters
+
+## ============================ Function `read_stamp()` ============================ ##
+def read_stamp(path:str) -> tuple|None:
+    '''The function is defined for read the stamp of a model file,
+    which changes once the file is rewritten or replaced.
+    Args:
+        path: A string indicate the path to the model file.
+    Returns:
+        stamp: A tuple indicate the modification time in nanoseconds
+            and bytes of the file, or `None` indicate the file isn't readable.
+    '''
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+    stamp = (status.st_mtime_ns,status.st_size)
+    return stamp
\ No newline at end of file
@@ -1 +1,2 @@
-from .definition import Remote
\ No newline at end of file
+from .definition import Remote
+from .asynchronous import AsyncRemote
\ No newline at end of file
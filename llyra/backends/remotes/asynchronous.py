@@ -0,0 +1,551 @@
+from ...components import RemoteConfig, Strategy, Prompt, Log, Session, Cache, SemanticCache, make_sink, make_tracer
+from ...components.caches.utils import make_key, make_scope
+from ...components.logs.utils import make_metrics
+from ...components.strategys.utils import Call, Chat
+from .backends import AsyncOllama, AsyncBalancer
+from .backends.utils import set_predict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from time import perf_counter
+import asyncio
+
+class AsyncRemote:
+    '''The class is defined for fulfill remote LLM call asynchronously.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,path:str|Path) -> None:
+        '''The method is defined for initialize AsyncRemote class object.
+        Args:
+            path: A string or Path instance indicate the path to the config file.
+        '''
+        # Initialize component attributes
+        self.config = RemoteConfig()
+        self.strategy = Strategy()
+        self.prompt = Prompt()
+        # Load remote config
+        self.config.load(path)
+        # Initialize log attribute with configured sink
+        self.log = Log(make_sink(self.config.log))
+        # Initialize tracer attribute with configured exporter
+        self.tracer = make_tracer(self.config.trace)
+        # Load inference strategy
+        self.strategy.load(self.config.strategy)
+        # Initialize chat session attribute
+        self.session = Session(capacity=self.config.session.capacity,
+                               ttl=self.config.session.ttl,
+                               memory=self.config.session.memory,
+                               release=self._release)
+        # Initialize response cache attribute
+        self.cache = None
+        if self.config.response.enable:
+            self.cache = Cache(capacity=self.config.response.capacity,
+                               ttl=self.config.response.ttl,
+                               path=self.config.response.path if self.config.response.disk else None,
+                               size=self.config.response.size)
+        # Initialize semantic cache attribute
+        self.semantic = None
+        if self.config.semantic.enable:
+            self.semantic = SemanticCache(capacity=self.config.semantic.capacity,
+                                          threshold=self.config.semantic.threshold,
+                                          ttl=self.config.semantic.ttl)
+        # Initialize backend attribute balancing requests across servers,
+        # which probes servers itself unless servers defer their probes
+        eager = self.config.server.validate == 'eager'
+        nodes = [AsyncOllama(url=url,
+                             model=self.config.model,
+                             connections=self.config.server.connections,
+                             retries=self.config.server.retries,
+                             keep_alive=self.config.server.keep_alive,
+                             connect_timeout=self.config.server.connect_timeout,
+                             read_timeout=self.config.server.read_timeout,
+                             backoff=self.config.server.backoff,
+                             backoff_max=self.config.server.backoff_max,
+                             breaker=self.config.server.breaker,
+                             cooldown=self.config.server.cooldown,
+                             validate=False if eager else self.config.server.validate,
+                             probe_ttl=self.config.server.probe_ttl,
+                             hold=self.config.hold,
+                             warmup=self.config.warmup)
+                 for url in self.config.urls]
+        self.backend = AsyncBalancer(nodes,
+                                     balance=self.config.server.balance,
+                                     weights=self.config.server.weights,
+                                     health=self.config.server.health,
+                                     sticky=self.config.server.sticky,
+                                     validate=eager)
+        # Initialize chat lock attributes serializing iterations of each chat session
+        # across tasks, which are lock and holding task by session
+        self._locks:dict = {}
+        self._owners:dict = {}
+
+    ## ============================= Lifecycle Method ============================== ##
+    async def warmup(self) -> None:
+        '''The method is defined for ask each healthy server to load the model,
+        so the first inference doesn't wait for loading.'''
+        await self.backend.warmup()
+
+    ## ============================= Inference Methods ============================= ##
+    async def call(self,message:str,priority:int=0) -> str:
+        '''The method is defined for fulfill single LLM call.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                which is ignored since remote servers schedule requests themselves.
+        Returns:
+            A string indicate the output content from model inference.
+        '''
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('call')
+        # Make prompt for inference
+        with span.stage('prompt'):
+            prompt = self.prompt.call(message)
+        # Read cached response of the query or similar query
+        with span.stage('cache'):
+            response, ticket = await self._recall('call',message,prompt,None,
+                                                  self.strategy.call.stop,
+                                                  self.strategy.call.temperature,
+                                                  self._options(self.strategy.call))
+        cached = response != None
+        span.set(cached=cached)
+        meta = {}
+        # Execute model inference without cached response
+        if not cached:
+            with span.stage('infer'):
+                response = await self.backend.call(prompt=prompt,
+                                                   stop=self.strategy.call.stop,
+                                                   temperature=self.strategy.call.temperature,
+                                                   options=self._options(self.strategy.call),
+                                                   meta=meta)
+            self._remember(ticket,response)
+        # Make log record
+        with span.stage('log'):
+            self.log.call(model=self.config.model,
+                          input=message,output=response,
+                          temperature=self.strategy.call.temperature,
+                          cached=cached,
+                          truncated=meta.get('truncated',False),
+                          metrics=self._metrics(start,None,meta))
+        span.end()
+        # Return model response
+        return response
+
+    async def chat(self,message:str,keep:bool,session:str=None,
+                   priority:int=0) -> str:
+        '''The method is defined for fulfill iterative chat inference,
+        after former iterations of the chat session running in other tasks.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                which is ignored since remote servers schedule requests themselves.
+        Returns:
+            A string indicate the output content from model inference.
+        '''
+        async with self._turn(session):
+            return await self._chat(message,keep,session)
+
+    async def _chat(self,message:str,keep:bool,session:str=None) -> str:
+        '''The method is defined for fulfill iterative chat inference.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+        Returns:
+            response: A string indicate the output content from model inference.
+        '''
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('chat')
+        # Select chat history of the session
+        history = self._history(session)
+        # Discriminate whether keep current section content
+        with span.stage('trim'):
+            history.iterate(None,None,None,keep)
+        # Read cached response of similar opening query
+        response, ticket = None, None
+        if self.semantic != None and history.empty:
+            with span.stage('cache'):
+                response, ticket = await self._recall('chat',message,None,
+                                                      self.strategy.chat.addition,
+                                                      self.strategy.chat.stop,
+                                                      self.strategy.chat.temperature,
+                                                      self._options(self.strategy.chat))
+        cached = response != None
+        span.set(cached=cached)
+        meta = {}
+        # Execute model inference without cached response
+        if not cached:
+            # Make prompt for inference
+            with span.stage('prompt'):
+                prompt = history.chat(role=self.strategy.chat.role,
+                                      content=message,
+                                      addition=self.strategy.chat.addition,
+                                      context=self.strategy.chat.context,
+                                      counter=self._count)
+            # Execute model inference
+            with span.stage('infer'):
+                response = await self.backend.chat(prompt=prompt,
+                                                   stop=self.strategy.chat.stop,
+                                                   temperature=self.strategy.chat.temperature,
+                                                   options=self._options(self.strategy.chat),
+                                                   session=session,
+                                                   meta=meta)
+            self._remember(ticket,response)
+        # Update prompt section content
+        with span.stage('history'):
+            history.iterate(role=self.strategy.chat.role,
+                            input=message,output=response,
+                            keep=True)
+        if session != None:
+            self.session.touch(session)
+        # Make log record
+        with span.stage('log'):
+            self.log.chat(model=self.config.model,
+                          addition=self.strategy.chat.addition,
+                          role=self.strategy.chat.role,
+                          input=message,output=response,
+                          temperature=self.strategy.chat.temperature,
+                          keep=keep,
+                          session=session,
+                          cached=cached,
+                          truncated=meta.get('truncated',False),
+                          metrics=self._metrics(start,None,meta))
+        span.end()
+        # Return model response
+        return response
+
+    ## ========================== Batch Inference Method ========================== ##
+    async def call_many(self,messages:list,concurrency:int,progress=None,
+                        priority:int=0) -> list:
+        '''The method is defined for fulfill batch of single LLM calls
+        with bounded concurrency.
+        Args:
+            messages: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum inferences in flight.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the request,
+                which is ignored since remote servers schedule requests themselves.
+        Returns:
+            results: A list indicate the output content of each input in order,
+                or the exception raised by the inference of the input.
+        '''
+        results = [None] * len(messages)
+        semaphore = asyncio.Semaphore(max(1,concurrency))
+        finished = 0
+        async def infer(index:int,message:str) -> None:
+            nonlocal finished
+            # Execute single call within concurrency bound
+            async with semaphore:
+                try:
+                    results[index] = await self.call(message)
+                except Exception as error:
+                    results[index] = error
+            finished += 1
+            if progress:
+                progress(finished,len(messages))
+        await asyncio.gather(*[infer(index,message)
+                               for index, message in enumerate(messages)])
+        # Return model responses in input order
+        return results
+
+    ## =============================== Session Methods =============================== ##
+    def _history(self,session:str|None) -> Prompt:
+        '''The method is defined for select chat history of a session.
+        Args:
+            session: A string indicate the identity of the chat session,
+                and select the default session by set it to `None`.
+        Returns:
+            A Prompt instance indicate the chat history of the session.
+        '''
+        if session == None:
+            return self.prompt
+        else:
+            return self.session.get(session)
+
+    @asynccontextmanager
+    async def _turn(self,session:str|None):
+        '''The method is defined for hold a chat session for an iteration,
+        which raises instead of waiting for ever when the task holds it already,
+        e.g. chatting again before reading its stream to the end.
+        Args:
+            session: A string indicate the identity of the chat session.
+        '''
+        task = asyncio.current_task()
+        if self._owners.get(session) is task:
+            raise RuntimeError('Error: Chat session is held by unfinished iteration.')
+        async with self._locks.setdefault(session,asyncio.Lock()):
+            self._owners[session] = task
+            try:
+                yield
+            finally:
+                if self._owners.get(session) is task:
+                    del self._owners[session]
+
+    def _release(self,session:str) -> None:
+        '''The method is defined for release log records, server route
+        and chat lock of an evicted chat session.
+        Args:
+            session: A string indicate the identity of the chat session.
+        '''
+        self.log.release(session)
+        self.backend.release(session)
+        self._locks.pop(session,None)
+
+    ## ============================= Strategy Method ============================= ##
+    def _options(self,strategy:Call|Chat) -> dict:
+        '''The method is defined for make Ollama options of an inference strategy,
+        with its generation length limit sent as `num_predict`.
+        Args:
+            strategy: A Call or Chat instance indicate the inference strategy.
+        Returns:
+            A dictionary indicate the Ollama options of inference.
+        '''
+        return set_predict(strategy.options,strategy.max_tokens)
+
+    ## ============================== Metrics Method ============================== ##
+    def _metrics(self,start:float,first:float|None,meta:dict) -> dict:
+        '''The method is defined for make measurements of an inference,
+        with token counts and generation seconds reported by the server.
+        Args:
+            start: A float indicate the performance counter when the inference started.
+            first: A float indicate the seconds to the first response piece,
+                or `None` indicate it isn't observed.
+            meta: A dictionary indicate the metadata of the response.
+        Returns:
+            A dictionary indicate the measurements of the inference.
+        '''
+        return make_metrics(perf_counter() - start,first,
+                            meta.get('prompt_tokens'),meta.get('completion_tokens'),
+                            meta.get('generation'))
+
+    ## =========================== Response Cache Methods =========================== ##
+    def _key(self,prompt:str,stop:str|list,temperature:float,
+             options:dict=None) -> str|None:
+        '''The method is defined for make cache key of a single call inference,
+        which is only cached when it's deterministic.
+        Args:
+            prompt: A string indicate proper structed content for inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+        Returns:
+            A string indicate the cache key,
+            or `None` indicate the response shouldn't be cached.
+        '''
+        if self.cache == None or temperature != 0:
+            return None
+        return make_key('remote',self.config.model,prompt,stop,temperature,options)
+
+    async def _recall(self,type:str,message:str,prompt:str|None,addition:str|None,
+                      stop:str|list,temperature:float,options:dict=None) -> tuple:
+        '''The method is defined for read cached response of the query
+        or a query similar to it.
+        Args:
+            type: A string indicate the inference type.
+            message: A string indicate the input content for model inference.
+            prompt: A string indicate proper structed content for single call,
+                which is `None` for chat inference.
+            addition: A string indicate additional prompt for chat inference.
+            stop: A string or list indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+        Returns:
+            response: A string indicate the cached response,
+                or `None` indicate the response isn't cached.
+            ticket: A tuple indicate where the response is cached after inference.
+        '''
+        # Read cached response of deterministic single call
+        key = self._key(prompt,stop,temperature,options) if prompt != None else None
+        response = self.cache.get(key) if key else None
+        # Read cached response of similar query
+        probe = None
+        if response == None and self.semantic != None:
+            scope = make_scope(type,self.config.model,addition,stop,temperature,options)
+            vector = await self.backend.embed(message,self.config.semantic.model)
+            response = self.semantic.get(vector,scope)
+            probe = (vector,scope)
+        return response, (key,probe,perf_counter())
+
+    def _remember(self,ticket:tuple|None,response:str) -> None:
+        '''The method is defined for cache response of an inference.
+        Args:
+            ticket: A tuple indicate where the response is cached,
+                or `None` indicate the response isn't cached.
+            response: A string indicate the output content from model inference.
+        '''
+        if ticket == None:
+            return
+        key, probe, start = ticket
+        if key:
+            self.cache.put(key,response)
+        if probe:
+            self.semantic.put(*probe,response,perf_counter() - start)
+
+    ## =============================== Context Method ================================ ##
+    def _count(self,text:str) -> int:
+        '''The method is defined for estimate tokens of a string,
+        since remote server doesn't expose its tokenizer.
+        Args:
+            text: A string indicate the content to count.
+        Returns:
+            A integer indicate the estimated number of tokens.
+        '''
+        return len(text) // 4 + 1
+
+    ## ========================== Stream Inference Methods ========================== ##
+    async def stream_call(self,message:str,priority:int=0):
+        '''The method is defined for fulfill single LLM call in streaming.
+        Args:
+            message: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request,
+                which is ignored since remote servers schedule requests themselves.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('stream_call')
+        # Make prompt for inference
+        with span.stage('prompt'):
+            prompt = self.prompt.call(message)
+        # Read cached response of the query or similar query
+        with span.stage('cache'):
+            response, ticket = await self._recall('call',message,prompt,None,
+                                                  self.strategy.call.stop,
+                                                  self.strategy.call.temperature,
+                                                  self._options(self.strategy.call))
+        cached = response != None
+        span.set(cached=cached)
+        meta = {}
+        first = None
+        if cached:
+            yield response
+        else:
+            # Execute model inference and pass through response pieces
+            with span.stage('infer'):
+                pieces = []
+                async for piece in self.backend.stream_call(prompt=prompt,
+                        stop=self.strategy.call.stop,
+                        temperature=self.strategy.call.temperature,
+                        options=self._options(self.strategy.call),
+                        meta=meta):
+                    if first == None:
+                        first = perf_counter() - start
+                    pieces.append(piece)
+                    yield piece
+            response = ''.join(pieces)
+            self._remember(ticket,response)
+        # Make log record
+        with span.stage('log'):
+            self.log.call(model=self.config.model,
+                          input=message,output=response,
+                          temperature=self.strategy.call.temperature,
+                          cached=cached,
+                          truncated=meta.get('truncated',False),
+                          metrics=self._metrics(start,first,meta))
+        span.end()
+
+    async def stream_chat(self,message:str,keep:bool,session:str=None,
+                          priority:int=0):
+        '''The method is defined for fulfill iterative chat inference in streaming,
+        after former iterations of the chat session running in other tasks.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+            priority: A integer indicate the priority of the request,
+                which is ignored since remote servers schedule requests themselves.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        async with self._turn(session):
+            async for piece in self._stream_chat(message,keep,session):
+                yield piece
+
+    async def _stream_chat(self,message:str,keep:bool,session:str=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session: A string indicate the identity of the chat session.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        # Start timing and tracing the inference
+        start = perf_counter()
+        span = self.tracer.start('stream_chat')
+        # Select chat history of the session
+        history = self._history(session)
+        # Discriminate whether keep current section content
+        with span.stage('trim'):
+            history.iterate(None,None,None,keep)
+        # Read cached response of similar opening query
+        response, ticket = None, None
+        if self.semantic != None and history.empty:
+            with span.stage('cache'):
+                response, ticket = await self._recall('chat',message,None,
+                                                      self.strategy.chat.addition,
+                                                      self.strategy.chat.stop,
+                                                      self.strategy.chat.temperature,
+                                                      self._options(self.strategy.chat))
+        cached = response != None
+        span.set(cached=cached)
+        meta = {}
+        first = None
+        if cached:
+            yield response
+        else:
+            # Make prompt for inference
+            with span.stage('prompt'):
+                prompt = history.chat(role=self.strategy.chat.role,
+                                      content=message,
+                                      addition=self.strategy.chat.addition,
+                                      context=self.strategy.chat.context,
+                                      counter=self._count)
+            # Execute model inference and pass through response pieces
+            with span.stage('infer'):
+                pieces = []
+                async for piece in self.backend.stream_chat(prompt=prompt,
+                        stop=self.strategy.chat.stop,
+                        temperature=self.strategy.chat.temperature,
+                        options=self._options(self.strategy.chat),
+                        session=session,
+                        meta=meta):
+                    if first == None:
+                        first = perf_counter() - start
+                    pieces.append(piece)
+                    yield piece
+            response = ''.join(pieces)
+            self._remember(ticket,response)
+        # Update prompt section content
+        with span.stage('history'):
+            history.iterate(role=self.strategy.chat.role,
+                            input=message,output=response,
+                            keep=True)
+        if session != None:
+            self.session.touch(session)
+        # Make log record
+        with span.stage('log'):
+            self.log.chat(model=self.config.model,
+                          addition=self.strategy.chat.addition,
+                          role=self.strategy.chat.role,
+                          input=message,output=response,
+                          temperature=self.strategy.chat.temperature,
+                          keep=keep,
+                          session=session,
+                          cached=cached,
+                          truncated=meta.get('truncated',False),
+                          metrics=self._metrics(start,first,meta))
+        span.end()
+
+    ## ============================== Release Method ============================== ##
+    async def close(self) -> None:
+        '''The method is defined for release pooled connections,
+        persist buffered log records and spans of the backend.'''
+        await self.backend.close()
+        self.log.close()
+        self.tracer.close()
+        if self.cache != None:
+            self.cache.close()
@@ -1 +1,4 @@
-from .ollama import Ollama
\ No newline at end of file
+from .ollama import Ollama
+from .ollama_async import AsyncOllama
+from .balancer import Balancer
+from .balancer_async import AsyncBalancer
\ No newline at end of file
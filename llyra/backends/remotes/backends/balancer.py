@@ -0,0 +1,283 @@
+from ....errors.remotes import RemoteError, RemoteServerConnectionError, RemoteServerConnectTimeoutError, RemoteServerUnavailableError
+from threading import Lock, Thread, Event
+
+# Errors of a node worth sending the request to another node,
+# excluding read timeout since the node may be still generating
+FAILOVER = (RemoteServerConnectionError,RemoteServerConnectTimeoutError,RemoteServerUnavailableError)
+
+class Balancer:
+    '''The class is defined for distribute requests across several ollama servers,
+    with the same inference methods as a single server.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,nodes:list,balance:str='least',weights:list=None,
+                 health:float=10,sticky:bool=True,validate:bool=True) -> None:
+        '''The method is defined for initialize Balancer class object.
+        Args:
+            nodes: A list indicate the clients of each server,
+                which are probed here unless they defer their probes.
+            balance: A string indicate the balancing policy,
+                `least` for least outstanding requests,
+                or `weighted` for weighted round-robin.
+            weights: A list of integers indicate the weight of each server,
+                and weight servers equally by set it to `None`.
+            health: A float indicate the seconds between health checks,
+                and never check health after initialization by set it to 0.
+            sticky: A boolean indicate whether route each chat session
+                to the same server to keep its cache warm.
+            validate: A boolean indicate whether probe each server on initialization,
+                and assume servers healthy until health checks by set it to `False`.
+        '''
+        # Get input attributes
+        self.nodes = nodes
+        self.balance = balance
+        self.weights = weights if weights else [1] * len(nodes)
+        self.health = health
+        self.sticky = sticky
+        # Initialize routing state attributes,
+        # which are health, outstanding requests and round-robin credit of each server,
+        # and server of each chat session
+        self._healthy:list = [True] * len(nodes)
+        self._outstanding:list = [0] * len(nodes)
+        self._credits:list = [0] * len(nodes)
+        self._next = 0
+        self._routes:dict = {}
+        self._lock = Lock()
+        # Probe each server and raise only when no server is usable
+        if validate:
+            self.check(fresh=False)
+            if not any(self._healthy):
+                self.nodes[0].probe()
+        # Discriminate whether check health of servers periodically
+        self._stop = Event()
+        self._watcher:Thread = None
+        if self.health and len(nodes) > 1:
+            self._watcher = Thread(target=self._watch,daemon=True)
+            self._watcher.start()
+
+    ## ============================= Inference Methods ============================= ##
+    def call(self,prompt:str,stop:str|list,temperature:float,
+             options:dict=None,meta:dict=None) -> str:
+        '''The method is defined for fulfill single call inference.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Returns:
+            A string indicate the model response content.
+        '''
+        return self._send('call',None,prompt,stop,temperature,options,meta)
+
+    def chat(self,prompt:list,stop:str|list,temperature:float,
+             options:dict=None,session:str=None,meta:dict=None) -> str:
+        '''The method is defined for fulfill iterative chat inference.
+        Args:
+            prompt: A list indicate proper structed content for chat inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            session: A string indicate the identity of the chat session,
+                and `None` indicate the default chat session.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Returns:
+            A string indicate the model response content.
+        '''
+        return self._send('chat',('chat',session),
+                          prompt,stop,temperature,options,meta)
+
+    def embed(self,text:str,model:str=None) -> list:
+        '''The method is defined for embed a text.
+        Args:
+            text: A string indicate the content to embed.
+            model: A string indicate the name of embedding model,
+                and embed with the inference model by set it to `None`.
+        Returns:
+            A list indicate the embedding of the content.
+        '''
+        return self._send('embed',None,text,model)
+
+    def warmup(self) -> None:
+        '''The method is defined for ask each healthy server to load the model.'''
+        for index, node in enumerate(self.nodes):
+            if self._healthy[index]:
+                node.warmup()
+
+    ## ========================== Stream Inference Methods ========================== ##
+    def stream_call(self,prompt:str,stop:str|list,temperature:float,
+                    options:dict=None,meta:dict=None):
+        '''The method is defined for fulfill single call inference in streaming.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        yield from self._stream('stream_call',None,
+                                prompt,stop,temperature,options,meta)
+
+    def stream_chat(self,prompt:list,stop:str|list,temperature:float,
+                    options:dict=None,session:str=None,meta:dict=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            prompt: A list indicate proper structed content for chat inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            session: A string indicate the identity of the chat session,
+                and `None` indicate the default chat session.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        yield from self._stream('stream_chat',('chat',session),
+                                prompt,stop,temperature,options,meta)
+
+    ## ============================== Routing Methods ============================== ##
+    def release(self,session:str) -> None:
+        '''The method is defined for forget the server of an evicted chat session.
+        Args:
+            session: A string indicate the identity of the chat session.
+        '''
+        with self._lock:
+            self._routes.pop(('chat',session),None)
+
+    def check(self,fresh:bool=True) -> None:
+        '''The method is defined for probe health of each server.
+        Args:
+            fresh: A boolean indicate whether probe each server
+                regardless of probe result shared in the process.
+        '''
+        for index, node in enumerate(self.nodes):
+            try:
+                node.probe(fresh)
+            except RemoteError:
+                self._healthy[index] = False
+            else:
+                self._healthy[index] = True
+
+    def _select(self,key:tuple|None,tried:set) -> int:
+        '''The method is defined for select the server of a request.
+        Args:
+            key: A tuple indicate the route of the chat session,
+                or `None` indicate the request isn't routed sticky.
+            tried: A set indicate the servers already failed the request.
+        Returns:
+            index: A integer indicate the index of selected server.
+        '''
+        with self._lock:
+            # Select healthy servers, or every untried server when none is healthy
+            candidates = [index for index in range(len(self.nodes))
+                          if index not in tried and self._healthy[index]
+                          and not self.nodes[index].breaker.open]
+            if not candidates:
+                candidates = [index for index in range(len(self.nodes))
+                              if index not in tried]
+            # Route chat session to its former server
+            if self.sticky and key != None:
+                index = self._routes.get(key)
+                if index in candidates:
+                    return index
+            # Select server by balancing policy
+            if self.balance == 'weighted':
+                for candidate in candidates:
+                    self._credits[candidate] += self.weights[candidate]
+                index = max(candidates,key=lambda candidate: self._credits[candidate])
+                self._credits[index] -= sum(self.weights[candidate]
+                                            for candidate in candidates)
+            else:
+                count = len(self.nodes)
+                index = min(candidates,key=lambda candidate:
+                            (self._outstanding[candidate],(candidate - self._next) % count))
+                self._next = index + 1
+            if self.sticky and key != None:
+                self._routes[key] = index
+            return index
+
+    def _begin(self,index:int) -> None:
+        '''The method is defined for count a request sent to a server.
+        Args:
+            index: A integer indicate the index of the server.
+        '''
+        with self._lock:
+            self._outstanding[index] += 1
+
+    def _end(self,index:int) -> None:
+        '''The method is defined for count a request finished by a server.
+        Args:
+            index: A integer indicate the index of the server.
+        '''
+        with self._lock:
+            self._outstanding[index] -= 1
+
+    ## ============================== Request Methods ============================== ##
+    def _send(self,method:str,key:tuple|None,*args):
+        '''The method is defined for send a request to selected server,
+        and send it to another server when the server fails.
+        Args:
+            method: A string indicate the name of inference method.
+            key: A tuple indicate the route of the chat session,
+                or `None` indicate the request isn't routed sticky.
+        Returns:
+            A value indicate the result of the inference method.
+        '''
+        tried = set()
+        while True:
+            index = self._select(key,tried)
+            self._begin(index)
+            try:
+                return getattr(self.nodes[index],method)(*args)
+            except FAILOVER:
+                tried.add(index)
+                if len(tried) == len(self.nodes):
+                    raise
+            finally:
+                self._end(index)
+
+    def _stream(self,method:str,key:tuple|None,*args):
+        '''The method is defined for stream from selected server,
+        and stream from another server when the server fails before first piece.
+        Args:
+            method: A string indicate the name of stream inference method.
+            key: A tuple indicate the route of the chat session,
+                or `None` indicate the request isn't routed sticky.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        tried = set()
+        while True:
+            index = self._select(key,tried)
+            self._begin(index)
+            started = False
+            try:
+                for piece in getattr(self.nodes[index],method)(*args):
+                    started = True
+                    yield piece
+                return
+            except FAILOVER:
+                tried.add(index)
+                if started or len(tried) == len(self.nodes):
+                    raise
+            finally:
+                self._end(index)
+
+    ## ============================ Health Check Method ============================ ##
+    def _watch(self) -> None:
+        '''The method is defined for probe health of each server periodically.'''
+        while not self._stop.wait(self.health):
+            self.check()
+
+    ## ============================== Release Method ============================== ##
+    def close(self) -> None:
+        '''The method is defined for stop health checks
+        and release pooled connections of each server.'''
+        self._stop.set()
+        for node in self.nodes:
+            node.close()
\ No newline at end of file
@@ -0,0 +1,151 @@
+from .balancer import Balancer, FAILOVER
+import asyncio
+
+class AsyncBalancer(Balancer):
+    '''The class is defined for distribute asynchronous requests
+    across several ollama servers, with the same inference methods as a single server.'''
+    ## ============================= Inference Methods ============================= ##
+    async def call(self,prompt:str,stop:str|list,temperature:float,
+                   options:dict=None,meta:dict=None) -> str:
+        '''The method is defined for fulfill single call inference.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Returns:
+            A string indicate the model response content.
+        '''
+        return await self._send('call',None,prompt,stop,temperature,options,meta)
+
+    async def chat(self,prompt:list,stop:str|list,temperature:float,
+                   options:dict=None,session:str=None,meta:dict=None) -> str:
+        '''The method is defined for fulfill iterative chat inference.
+        Args:
+            prompt: A list indicate proper structed content for chat inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            session: A string indicate the identity of the chat session,
+                and `None` indicate the default chat session.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Returns:
+            A string indicate the model response content.
+        '''
+        return await self._send('chat',('chat',session),
+                                prompt,stop,temperature,options,meta)
+
+    async def embed(self,text:str,model:str=None) -> list:
+        '''The method is defined for embed a text.
+        Args:
+            text: A string indicate the content to embed.
+            model: A string indicate the name of embedding model,
+                and embed with the inference model by set it to `None`.
+        Returns:
+            A list indicate the embedding of the content.
+        '''
+        return await self._send('embed',None,text,model)
+
+    async def warmup(self) -> None:
+        '''The method is defined for ask each healthy server to load the model.'''
+        await asyncio.gather(*[node.warmup() for index, node in enumerate(self.nodes)
+                               if self._healthy[index]])
+
+    ## ========================== Stream Inference Methods ========================== ##
+    async def stream_call(self,prompt:str,stop:str|list,temperature:float,
+                          options:dict=None,meta:dict=None):
+        '''The method is defined for fulfill single call inference in streaming.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        async for piece in self._stream('stream_call',None,
+                                        prompt,stop,temperature,options,meta):
+            yield piece
+
+    async def stream_chat(self,prompt:list,stop:str|list,temperature:float,
+                          options:dict=None,session:str=None,meta:dict=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            prompt: A list indicate proper structed content for chat inference.
+            stop: A string or a list of strings
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            session: A string indicate the identity of the chat session,
+                and `None` indicate the default chat session.
+            meta: A dictionary indicate where metadata of the response is filled.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        async for piece in self._stream('stream_chat',('chat',session),
+                                        prompt,stop,temperature,options,meta):
+            yield piece
+
+    ## ============================== Request Methods ============================== ##
+    async def _send(self,method:str,key:tuple|None,*args):
+        '''The method is defined for send a request to selected server,
+        and send it to another server when the server fails.
+        Args:
+            method: A string indicate the name of inference method.
+            key: A tuple indicate the route of the chat session,
+                or `None` indicate the request isn't routed sticky.
+        Returns:
+            A value indicate the result of the inference method.
+        '''
+        tried = set()
+        while True:
+            index = self._select(key,tried)
+            self._begin(index)
+            try:
+                return await getattr(self.nodes[index],method)(*args)
+            except FAILOVER:
+                tried.add(index)
+                if len(tried) == len(self.nodes):
+                    raise
+            finally:
+                self._end(index)
+
+    async def _stream(self,method:str,key:tuple|None,*args):
+        '''The method is defined for stream from selected server,
+        and stream from another server when the server fails before first piece.
+        Args:
+            method: A string indicate the name of stream inference method.
+            key: A tuple indicate the route of the chat session,
+                or `None` indicate the request isn't routed sticky.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        tried = set()
+        while True:
+            index = self._select(key,tried)
+            self._begin(index)
+            started = False
+            try:
+                async for piece in getattr(self.nodes[index],method)(*args):
+                    started = True
+                    yield piece
+                return
+            except FAILOVER:
+                tried.add(index)
+                if started or len(tried) == len(self.nodes):
+                    raise
+            finally:
+                self._end(index)
+
+    ## ============================== Release Method ============================== ##
+    async def close(self) -> None:
+        '''The method is defined for stop health checks
+        and release pooled connections of each server.'''
+        self._stop.set()
+        for node in self.nodes:
+            await node.close()
\ No newline at end of file
@@ -1,20 +1,110 @@
 import requests
-from .utils import convert_str2list
-from ....errors.remotes import RemoteServerConnectionError, RemoteServiceNotCompatibleError, RemoteModelNotAvailableError, RemoteServiceError
+import json
+from time import sleep
+from threading import Lock, Thread
+from .utils import make_body, read_meta, make_session, compute_backoff, read_error, Breaker, TRANSIENT, PROBES
+from ....errors.remotes import RemoteError, RemoteServerConnectionError, RemoteServiceNotCompatibleError, RemoteModelNotAvailableError, RemoteServiceError, RemoteServerTimeoutError, RemoteServerConnectTimeoutError
 
 class Ollama:
     '''The class is defined for abstract basic methods 
     for remote backend of Ollama service.'''
     ## ============================= Initialize Method ============================= ##
-    def __init__(self,url:str,model:str) -> None:
+    def __init__(self,url:str,model:str,
+                 pool:int=10,connections:int=10,block:bool=False,
+                 retries:int=0,keep_alive:bool=True,
+                 connect_timeout:float=5,read_timeout:float=600,
+                 backoff:float=0.5,backoff_max:float=8,
+                 breaker:int=5,cooldown:float=30,
+                 validate:bool|str=True,probe_ttl:float=60,
+                 hold:str|int=None,warmup:bool=False) -> None:
         '''The method is defined for initialize Ollama class object.
         Args:
             url: A string indicate the url of ollama server before specific interface.
             model: A string indicate the name of model for inference.
+            pool: A integer indicate the number of host connection pools to cache.
+            connections: A integer indicate the maximum connections kept per host.
+            block: A boolean indicate whether waiting for a free connection
+                when the per-host limit is reached.
+            retries: A integer indicate the maximum retries of failed requests.
+            keep_alive: A boolean indicate whether reusing connections across requests.
+            connect_timeout: A float indicate the seconds waiting for connection,
+                and wait forever by set it to 0.
+            read_timeout: A float indicate the seconds waiting for response data,
+                and wait forever by set it to 0.
+            backoff: A float indicate the seconds of delay ceiling before first retry.
+            backoff_max: A float indicate the maximum seconds of delay ceiling.
+            breaker: A integer indicate the consecutive failed requests
+                failing later requests fast, and never fail fast by set it to 0.
+            cooldown: A float indicate the seconds failing fast
+                before a trial request is allowed.
+            validate: A boolean indicate whether probe the model availability
+                on initialization, or a string indicate when to probe it,
+                `lazy` for before first request
+                or `background` for in a thread without blocking initialization.
+            probe_ttl: A float indicate the seconds a probe result is shared
+                by clients in the process, and never share it by set it to 0.
+            hold: A string or a integer indicate how long ollama keeps the model loaded
+                after each request, and keep it as server default by set it to `None`.
+            warmup: A boolean indicate whether ask ollama to load the model
+                along with the probe, so the first request doesn't wait for loading.
+        '''
+        # Make pooled session shared by all requests
+        self.session = make_session(pool,connections,block,keep_alive)
+        # Get request policy attributes
+        self.timeout = (connect_timeout or None,read_timeout or None)
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.breaker = Breaker(breaker,cooldown)
+        # Get input attributes
+        self.url = url
+        self.model = model
+        self.validate = validate
+        self.probe_ttl = probe_ttl
+        self.hold = hold
+        self._preload = warmup
+        # Initialize startup state attributes,
+        # which are whether startup is deferred, the background startup thread
+        # and its error raised on first request
+        self._pending = False
+        self._starter:Thread = None
+        self._failure:RemoteError = None
+        self._gate = Lock()
+        # Discriminate when to test service availability
+        if validate == 'background':
+            self._pending = True
+            self._starter = Thread(target=self._background,daemon=True)
+            self._starter.start()
+        elif validate == 'lazy':
+            self._pending = True
+        else:
+            self._start()
+
+    ## ============================== Startup Methods ============================== ##
+    def probe(self,fresh:bool=False) -> None:
+        '''The method is defined for test whether the server is reachable,
+        serves compatible service and provides the model.
+        Args:
+            fresh: A boolean indicate whether probe the server
+                regardless of probe result shared in the process.
+        '''
+        models = PROBES.fetch(self.url,self._tags,self.probe_ttl,fresh)
+        if self.model not in models:
+            raise RemoteModelNotAvailableError(self.model)
+
+    def warmup(self) -> None:
+        '''The method is defined for ask ollama to load the model into memory,
+        so the first inference doesn't wait for loading.'''
+        self._confirm()
+        self._load()
+
+    def _tags(self) -> list:
+        '''The method is defined for list models provided by the server.
+        Returns:
+            model_names: A list of strings indicate the names of provided models.
         '''
-        # Test service availability
         try:
-            test = requests.get(url=url+'tags')
+            test = self.session.get(url=self.url+'tags',timeout=self.timeout)
         except requests.RequestException:
             raise RemoteServerConnectionError()
         try:
@@ -24,74 +114,104 @@ class Ollama:
                 for available_model in available_models]
         except (requests.RequestException, KeyError):
             raise RemoteServiceNotCompatibleError()
-        if model not in model_names:
-            raise RemoteModelNotAvailableError(model)
-        # Get input attributes
-        self.url = url
-        self.model = model
+        return model_names
+
+    def _start(self) -> None:
+        '''The method is defined for probe the model availability when required,
+        and load the model in best effort when required.'''
+        if self.validate:
+            self.probe()
+        if self._preload:
+            try:
+                self._load()
+            except RemoteError:
+                pass
+
+    def _load(self) -> None:
+        '''The method is defined for load the model with a generation without prompt.'''
+        load = self._post('generate',{'model': self.model})
+        response_content = load.json()
+        # Discriminate whether the model is loaded
+        if 'error' in response_content:
+            raise RemoteServiceError(response_content['error'])
+
+    def _background(self) -> None:
+        '''The method is defined for start up in a thread,
+        keeping the error for the first request.'''
+        try:
+            self._start()
+        except RemoteError as error:
+            self._failure = error
+
+    def _confirm(self) -> None:
+        '''The method is defined for finish deferred startup before a request,
+        which is retried by the next request when it fails.'''
+        # Discriminate whether startup is deferred
+        if not self._pending:
+            return
+        with self._gate:
+            if not self._pending:
+                return
+            # Wait for background startup and raise its error once
+            if self._starter != None:
+                self._starter.join()
+                self._starter = None
+                error, self._failure = self._failure, None
+                if error != None:
+                    raise error
+            else:
+                self._start()
+            self._pending = False
 
     ## ============================= Inference Methods ============================= ##
-    def call(self,prompt:str,stop:str|list,temperature:float) -> str:
+    def call(self,prompt:str,stop:str|list,temperature:float,
+             options:dict=None,meta:dict=None) -> str:
         '''The method is defined for fulfill single call inference.
         Args:
             prompt: A string indicate the content for model inference.
             stop: A string or a list of strings 
                 indicate where the model should stop generation.
             temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled,
+                such as whether generation is truncated.
         Returns:
             A string indicate the model response content.
         '''
-        # Make options
-        options = {
-            'stop': convert_str2list(stop),
-            'temperature': temperature
-            }
         # Make request body
-        body = {
-            'model': self.model,
-            'prompt': prompt,
-            'stream': False,
-            'options': options,
-            }
+        body = make_body(self.model,'prompt',prompt,stop,temperature,
+                         options,False)
         # Execute remote inference
-        call = requests.post(url=self.url+'generate',
-                             json=body,
-                             stream=False)
+        call = self._request('generate',body)
         response_content = call.json()
         # Extract response string
         try:
             response = response_content['response']
         except KeyError:
             raise RemoteServiceError(response_content['error'])
+        read_meta(response_content,meta)
         # Return remote inference response
         return response
     
-    def chat(self,prompt:list,stop:str|list,temperature:float) -> str:
+    def chat(self,prompt:list,stop:str|list,temperature:float,
+             options:dict=None,meta:dict=None) -> str:
         '''The method is defined for fulfill single call inference.
         Args:
             prompt: A list indicate proper structed content for chat inference.
             stop: A string or a list of strings 
                 indicate where the model should stop generation.
             temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled,
+                such as whether generation is truncated.
         Returns:
             A string indicate the model response content.
         '''
-        # Make options
-        options = {
-            'stop': convert_str2list(stop),
-            'temperature': temperature
-            }
         # Make request body
-        body = {
-            'model': self.model,
-            'messages': prompt,
-            'stream': False,
-            'options': options,
-            }
+        body = make_body(self.model,'messages',prompt,stop,temperature,
+                         options,False)
         # Execute remote inference
-        chat = requests.post(url=self.url+'chat',
-                             json=body,
-                             stream=False)
+        chat = self._request('chat',body)
         response_content = chat.json()
         # Extract response string
         try:
@@ -100,5 +220,183 @@ class Ollama:
             raise RemoteServiceError(response_content['error'])
         else:
             response = response_message['content']
+        read_meta(response_content,meta)
         # Return remote inference response
-        return response
\ No newline at end of file
+        return response
+
+    ## ========================== Stream Inference Methods ========================== ##
+    def stream_call(self,prompt:str,stop:str|list,temperature:float,
+                    options:dict=None,meta:dict=None):
+        '''The method is defined for fulfill single call inference in streaming.
+        Args:
+            prompt: A string indicate the content for model inference.
+            stop: A string or a list of strings 
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled,
+                such as whether generation is truncated.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        # Make request body
+        body = make_body(self.model,'prompt',prompt,stop,temperature,
+                         options,True)
+        # Execute remote inference
+        with self._request('generate',body,stream=True) as call:
+            # Extract response string from each line of NDJSON stream
+            for line in self._lines(call):
+                if not line:
+                    continue
+                response_content = json.loads(line)
+                try:
+                    response = response_content['response']
+                except KeyError:
+                    raise RemoteServiceError(response_content['error'])
+                if response:
+                    yield response
+                if response_content.get('done'):
+                    read_meta(response_content,meta)
+                    break
+
+    def stream_chat(self,prompt:list,stop:str|list,temperature:float,
+                    options:dict=None,meta:dict=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            prompt: A list indicate proper structed content for chat inference.
+            stop: A string or a list of strings 
+                indicate where the model should stop generation.
+            temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options of strategy.
+            meta: A dictionary indicate where metadata of the response is filled,
+                such as whether generation is truncated.
+        Yields:
+            A string indicate the piece of model response content.
+        '''
+        # Make request body
+        body = make_body(self.model,'messages',prompt,stop,temperature,
+                         options,True)
+        # Execute remote inference
+        with self._request('chat',body,stream=True) as chat:
+            # Extract response string from each line of NDJSON stream
+            for line in self._lines(chat):
+                if not line:
+                    continue
+                response_content = json.loads(line)
+                try:
+                    response_message = response_content['message']
+                except KeyError:
+                    raise RemoteServiceError(response_content['error'])
+                if response_message['content']:
+                    yield response_message['content']
+                if response_content.get('done'):
+                    read_meta(response_content,meta)
+                    break
+
+    ## ============================== Embedding Method ============================== ##
+    def embed(self,text:str,model:str=None) -> list:
+        '''The method is defined for embed a text with Ollama embeddings interface.
+        Args:
+            text: A string indicate the content to embed.
+            model: A string indicate the name of embedding model,
+                and embed with the inference model by set it to `None`.
+        Returns:
+            A list indicate the embedding of the content.
+        '''
+        # Make request body
+        body = {
+            'model': model if model else self.model,
+            'prompt': text,
+            }
+        # Execute remote embedding
+        embed = self._request('embeddings',body)
+        response_content = embed.json()
+        # Extract embedding
+        try:
+            embedding = response_content['embedding']
+        except KeyError:
+            raise RemoteServiceError(response_content['error'])
+        # Return remote embedding
+        return embedding
+
+    ## ============================== Request Methods ============================== ##
+    def _request(self,interface:str,body:dict,stream:bool=False) -> requests.Response:
+        '''The method is defined for post a request to ollama service
+        after deferred startup is finished.
+        Args:
+            interface: A string indicate the specific interface of ollama service.
+            body: A dictionary indicate the request body.
+            stream: A boolean indicate whether streaming response content.
+        Returns:
+            A Response instance indicate the response of the request.
+        '''
+        self._confirm()
+        return self._post(interface,body,stream)
+
+    def _post(self,interface:str,body:dict,stream:bool=False) -> requests.Response:
+        '''The method is defined for post a request to ollama service,
+        with timeouts, jittered exponential backoff retries of failed connections
+        and transient failures,
+        and circuit breaker failing fast while the server keeps failing.
+        Args:
+            interface: A string indicate the specific interface of ollama service.
+            body: A dictionary indicate the request body.
+            stream: A boolean indicate whether streaming response content.
+        Returns:
+            response: A Response instance indicate the response of the request.
+        '''
+        # Keep the model loaded as long as required
+        if self.hold != None and 'keep_alive' not in body:
+            body = {**body,'keep_alive': self.hold}
+        # Fail fast while the server keeps failing
+        self.breaker.allow()
+        for attempt in range(self.retries + 1):
+            # Wait before retrying failed request
+            if attempt:
+                sleep(compute_backoff(attempt,self.backoff,self.backoff_max))
+            try:
+                response = self.session.post(url=self.url+interface,
+                                             json=body,
+                                             stream=stream,
+                                             timeout=self.timeout)
+            except requests.ConnectTimeout:
+                error = RemoteServerConnectTimeoutError()
+            except requests.ConnectionError:
+                error = RemoteServerConnectionError()
+            except requests.Timeout:
+                # Don't retry request the server may be still generating
+                self.breaker.failure()
+                raise RemoteServerTimeoutError()
+            except requests.RequestException:
+                self.breaker.failure()
+                raise RemoteServerConnectionError()
+            else:
+                # Discriminate whether the server failed transiently
+                if response.status_code not in TRANSIENT:
+                    self.breaker.success()
+                    return response
+                error = RemoteServiceError(read_error(response))
+                response.close()
+        self.breaker.failure()
+        raise error
+
+    def _lines(self,response:requests.Response):
+        '''The method is defined for read lines of streaming response content.
+        Args:
+            response: A Response instance indicate the streaming response.
+        Yields:
+            A bytes indicate the line of NDJSON stream.
+        '''
+        try:
+            yield from response.iter_lines()
+        except requests.Timeout:
+            self.breaker.failure()
+            raise RemoteServerTimeoutError()
+        except requests.RequestException:
+            self.breaker.failure()
+            raise RemoteServerConnectionError()
+
+    ## ============================== Release Method ============================== ##
+    def close(self) -> None:
+        '''The method is defined for release pooled connections of the session.'''
+        self.session.close()
\ No newline at end of file
@@ -1 +1,5 @@
-from .funcs import convert_str2list
\ No newline at end of file
+from .funcs import convert_str2list
+from .funcs import make_session
+from .funcs import compute_backoff, read_error, TRANSIENT
+from .funcs import make_body, set_predict, read_meta
+from .classes import Breaker, Probes, PROBES
\ No newline at end of file
@@ -0,0 +1,108 @@
+from .....errors.remotes import RemoteServerUnavailableError
+from threading import Lock
+from time import monotonic
+
+class Breaker:
+    '''The class is defined for circuit breaker of remote requests,
+    which fails requests fast while remote server keeps failing.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,threshold:int=5,cooldown:float=30) -> None:
+        '''The method is defined for initialize Breaker class object.
+        Args:
+            threshold: A integer indicate the consecutive failed requests
+                opening the circuit, and never open it by set it to 0.
+            cooldown: A float indicate the seconds failing fast
+                before a trial request is allowed.
+        '''
+        # Get limit attributes
+        self.threshold = threshold
+        self.cooldown = cooldown
+        # Initialize state attributes,
+        # which are consecutive failures and when the circuit opened or last tried
+        self.failures = 0
+        self._opened:float = None
+        self._lock = Lock()
+
+    ## ============================== State Methods ============================== ##
+    def allow(self) -> None:
+        '''The method is defined for check whether a request is allowed,
+        and allow one trial request after each cooldown while the circuit is open.'''
+        with self._lock:
+            # Discriminate whether the circuit is open
+            if self._opened == None:
+                return
+            now = monotonic()
+            remain = self.cooldown - (now - self._opened)
+            if remain > 0:
+                raise RemoteServerUnavailableError(remain)
+            # Restart cooldown so the trial request is the only one allowed
+            self._opened = now
+
+    def success(self) -> None:
+        '''The method is defined for close the circuit after a successful request.'''
+        with self._lock:
+            self.failures = 0
+            self._opened = None
+
+    def failure(self) -> None:
+        '''The method is defined for count a failed request,
+        and open the circuit once failures reach threshold.'''
+        with self._lock:
+            self.failures += 1
+            if self.threshold and self.failures >= self.threshold:
+                self._opened = monotonic()
+
+    @property
+    def open(self) -> bool:
+        '''The property is defined for read whether the circuit is open.
+        Returns:
+            A boolean indicate whether requests fail fast.
+        '''
+        return self._opened != None
+
+class Probes:
+    '''The class is defined for cache models provided by each ollama server,
+    which is shared by clients in the process so each server is probed once per ttl.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self) -> None:
+        '''The method is defined for initialize Probes class object.'''
+        # Initialize cache attributes,
+        # which are expiration and model names of each server,
+        # and lock of each server so concurrent clients wait for one probe
+        self._entries:dict = {}
+        self._locks:dict = {}
+        self._lock = Lock()
+
+    ## ============================== Access Methods ============================== ##
+    def fetch(self,url:str,loader,ttl:float,fresh:bool=False) -> frozenset:
+        '''The method is defined for get models provided by a server,
+        and probe the server when they aren't cached or expired.
+        Args:
+            url: A string indicate the url of ollama server before specific interface.
+            loader: A callable indicate the probe returning model names of the server.
+            ttl: A float indicate the seconds a probe result is kept,
+                and probe every time by set it to 0.
+            fresh: A boolean indicate whether probe the server regardless of cache.
+        Returns:
+            models: A frozenset indicate the model names provided by the server.
+        '''
+        # Select the lock of the server
+        with self._lock:
+            lock = self._locks.setdefault(url,Lock())
+        with lock:
+            # Discriminate whether cached probe result is alive
+            entry = self._entries.get(url)
+            if not fresh and ttl and entry != None and entry[0] > monotonic():
+                return entry[1]
+            # Probe the server and cache the result
+            models = frozenset(loader())
+            self._entries[url] = (monotonic() + ttl,models)
+            return models
+
+    def clear(self) -> None:
+        '''The method is defined for drop all cached probe results.'''
+        with self._lock:
+            self._entries.clear()
+
+# Probe results shared by all clients in the process
+PROBES = Probes()
\ No newline at end of file
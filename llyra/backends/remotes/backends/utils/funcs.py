@@ -1,3 +1,10 @@
+import requests
+from requests.adapters import HTTPAdapter
+from random import uniform
+
+# HTTP status codes of transient failures worth retrying
+TRANSIENT = (429,500,502,503,504)
+
 def convert_str2list(parameter:str|list) -> list:
     '''The function is defind for convert string parameter to list 
     for the needs of remote backend.
@@ -9,4 +16,129 @@ def convert_str2list(parameter:str|list) -> list:
     if type(parameter) == str:
         return [parameter]
     elif type(parameter) == list:
-        return parameter
\ No newline at end of file
+        return parameter
+
+## =========================== Function `make_session()` =========================== ##
+def make_session(pool:int,connections:int,block:bool,
+                 keep_alive:bool) -> requests.Session:
+    '''The function is defined for make pooled HTTP session for remote backend,
+    which leaves retrying failed requests to the backend.
+    Args:
+        pool: A integer indicate the number of host connection pools to cache.
+        connections: A integer indicate the maximum connections kept per host.
+        block: A boolean indicate whether waiting for a free connection
+            when the per-host limit is reached.
+        keep_alive: A boolean indicate whether reusing connections across requests.
+    Returns:
+        session: A Session instance indicate the pooled HTTP session.
+    '''
+    # Make connection pool adapter
+    adapter = HTTPAdapter(pool_connections=pool,
+                          pool_maxsize=connections,
+                          max_retries=0,
+                          pool_block=block)
+    # Make session mounted with the adapter
+    session = requests.Session()
+    session.mount('http://',adapter)
+    session.mount('https://',adapter)
+    # Discriminate whether closing connection after each request
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+    # Return pooled session
+    return session
+
+## ========================== Function `compute_backoff()` ========================== ##
+def compute_backoff(attempt:int,base:float,cap:float) -> float:
+    '''The function is defined for compute delay before retrying a failed request,
+    which grows exponentially and is fully jittered,
+    so that clients failed together don't retry together.
+    Args:
+        attempt: A integer indicate the number of the retry, starting from 1.
+        base: A float indicate the seconds of delay ceiling before first retry.
+        cap: A float indicate the maximum seconds of delay ceiling.
+    Returns:
+        A float indicate the seconds to wait before the retry.
+    '''
+    return uniform(0,min(cap,base * 2 ** (attempt - 1)))
+
+## ============================ Function `read_error()` ============================ ##
+def read_error(response) -> str:
+    '''The function is defined for read error message of a failed response.
+    Args:
+        response: A Response instance indicate the failed response
+            with its content read.
+    Returns:
+        A string indicate the error message from ollama service,
+        or the status code without message.
+    '''
+    try:
+        return response.json()['error']
+    except (ValueError,KeyError,TypeError):
+        return f'HTTP {response.status_code}'
+
+## =========================== Function `make_body()` =========================== ##
+def make_body(model:str,field:str,prompt:str|list,stop:str|list,temperature:float,
+              options:dict|None,stream:bool) -> dict:
+    '''The function is defined for make request body of ollama inference.
+    Args:
+        model: A string indicate the name of model for inference.
+        field: A string indicate the field of prompt,
+            `prompt` for generate interface or `messages` for chat interface.
+        prompt: A string or list indicate proper structed content for inference.
+        stop: A string or a list of strings
+            indicate where the model should stop generation.
+        temperature: A float indicate the model inference temperature.
+        options: A dictionary indicate the Ollama options of strategy,
+            and `keep_alive` among them is sent beside the options.
+        stream: A boolean indicate whether streaming response content.
+    Returns:
+        body: A dictionary indicate the request body.
+    '''
+    # Split model residence from model options
+    extra = dict(options) if options else {}
+    keep_alive = extra.pop('keep_alive',None)
+    # Make request body
+    body = {
+        'model': model,
+        field: prompt,
+        'stream': stream,
+        'options': {'stop': convert_str2list(stop),
+                    'temperature': temperature,
+                    **extra},
+        }
+    if keep_alive != None:
+        body['keep_alive'] = keep_alive
+    return body
+
+## =========================== Function `set_predict()` =========================== ##
+def set_predict(options:dict,max_tokens:int) -> dict:
+    '''The function is defined for make Ollama options with generation length limit,
+    which is overridden by `num_predict` option set explicitly.
+    Args:
+        options: A dictionary indicate the Ollama options of strategy.
+        max_tokens: A integer indicate the maximum tokens of generation,
+            and keep the options unchanged by set it to 0.
+    Returns:
+        A dictionary indicate the Ollama options of inference.
+    '''
+    if not max_tokens:
+        return options
+    return {'num_predict': max_tokens, **options}
+
+## ============================ Function `read_meta()` ============================ ##
+def read_meta(content:dict,meta:dict|None) -> None:
+    '''The function is defined for read metadata of the final Ollama response,
+    which are whether generation is truncated, token counts and generation seconds.
+    Args:
+        content: A dictionary indicate the final response content.
+        meta: A dictionary indicate where the metadata is filled,
+            and skip reading metadata by set it to `None`.
+    '''
+    if meta == None:
+        return
+    meta['truncated'] = content.get('done_reason') == 'length'
+    # Read token counts and generation seconds reported by the server
+    meta['prompt_tokens'] = content.get('prompt_eval_count')
+    meta['completion_tokens'] = content.get('eval_count')
+    if content.get('eval_duration'):
+        meta['generation'] = content['eval_duration'] / 1e9
\ No newline at end of file
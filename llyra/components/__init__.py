@@ -1,4 +1,7 @@
 from .configs import LocalConfig, RemoteConfig
 from .strategys import Strategy
 from .prompts import Prompt
-from .logs import Log
\ No newline at end of file
+from .logs import Log, make_sink
+from .sessions import Session
+from .caches import Cache, SemanticCache
+from .tracers import Tracer, make_tracer
\ No newline at end of file
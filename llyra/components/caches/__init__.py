@@ -0,0 +1,2 @@
+from .definition import Cache
+from .semantic import SemanticCache
\ No newline at end of file
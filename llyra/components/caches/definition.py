@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from threading import Lock
+from pathlib import Path
+from time import time
+import sqlite3
+
+class Cache:
+    '''The class is defined to define universal attributes and methods,
+    for caching responses of deterministic inferences in memory and on disk.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,capacity:int=1024,ttl:float=0,
+                 path:str|Path=None,size:int=0) -> None:
+        '''The method is defined for initialize Cache class object.
+        Args:
+            capacity: A integer indicate the maximum responses kept in memory.
+            ttl: A float indicate the seconds a cached response is kept,
+                and keep cached responses forever by set it to 0.
+            path: A string or Path instance indicate the directory of disk cache,
+                and keep responses only in memory by set it to `None`.
+            size: A integer indicate the maximum responses kept on disk,
+                and keep them unlimited by set it to 0.
+        '''
+        # Get limit attributes
+        self.capacity = capacity
+        self.ttl = ttl
+        self.size = size
+        # Initialize memory tier ordered from least recently used,
+        # which maps key to response and its expiration
+        self._entries:OrderedDict = OrderedDict()
+        self._lock = Lock()
+        # Initialize counter attributes
+        self.hits = 0
+        self.misses = 0
+        # Initialize disk tier
+        self._connection:sqlite3.Connection = None
+        if path != None:
+            Path(path).mkdir(parents=True,exist_ok=True)
+            self._connection = sqlite3.connect(Path(path) / 'responses.db',
+                                               check_same_thread=False)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('''CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY, response TEXT, expire REAL)''')
+            self._connection.execute('''CREATE INDEX IF NOT EXISTS responses_expire
+                ON responses (expire) WHERE expire != 0''')
+            self._connection.commit()
+
+    ## ============================== Access Methods ============================== ##
+    def get(self,key:str) -> str|None:
+        '''The method is defined for get cached response of an inference.
+        Args:
+            key: A string indicate the cache key of the inference.
+        Returns:
+            response: A string indicate the cached response,
+                or `None` indicate the response isn't cached.
+        '''
+        now = time()
+        with self._lock:
+            # Seek response in memory tier
+            entry = self._entries.get(key)
+            if entry != None and (entry[1] == 0 or entry[1] > now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry != None:
+                del self._entries[key]
+            # Seek response in disk tier and promote it to memory tier
+            if self._connection != None:
+                row = self._connection.execute(
+                    'SELECT response, expire FROM responses WHERE key = ?',
+                    (key,)).fetchone()
+                if row != None and (row[1] == 0 or row[1] > now):
+                    self._remember(key,row[0],row[1])
+                    self.hits += 1
+                    return row[0]
+            self.misses += 1
+            return None
+
+    def put(self,key:str,response:str) -> None:
+        '''The method is defined for cache response of an inference.
+        Args:
+            key: A string indicate the cache key of the inference.
+            response: A string indicate the response of the inference.
+        '''
+        expire = time() + self.ttl if self.ttl else 0
+        with self._lock:
+            self._remember(key,response,expire)
+            # Write response through to disk tier
+            if self._connection != None:
+                with self._connection:
+                    self._connection.execute(
+                        'INSERT OR REPLACE INTO responses VALUES (?,?,?)',
+                        (key,response,expire))
+                    self._trim()
+
+    def clear(self) -> None:
+        '''The method is defined for drop all cached responses and reset counters.'''
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._connection != None:
+                with self._connection:
+                    self._connection.execute('DELETE FROM responses')
+
+    def stats(self) -> dict:
+        '''The method is defined for read counters of the cache.
+        Returns:
+            A dictionary indicate hits, misses, hit rate and responses kept in memory.
+        '''
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'rate': self.hits / total if total else 0.0,
+                    'size': len(self._entries)}
+
+    def close(self) -> None:
+        '''The method is defined for release the disk cache.'''
+        with self._lock:
+            if self._connection != None:
+                self._connection.close()
+                self._connection = None
+
+    ## ============================= Internal Methods ============================= ##
+    def _remember(self,key:str,response:str,expire:float) -> None:
+        '''The method is defined for keep response in memory tier.
+        Args:
+            key: A string indicate the cache key of the inference.
+            response: A string indicate the response of the inference.
+            expire: A float indicate the timestamp the response expires at,
+                or 0 indicate the response never expires.
+        '''
+        self._entries[key] = (response,expire)
+        self._entries.move_to_end(key)
+        # Evict least recently used responses beyond capacity
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def _trim(self) -> None:
+        '''The method is defined for drop expired and oldest responses on disk.'''
+        self._connection.execute(
+            'DELETE FROM responses WHERE expire != 0 AND expire <= ?',(time(),))
+        # Drop responses written before the latest `size` writes
+        if self.size:
+            self._connection.execute('''DELETE FROM responses
+                WHERE rowid <= (SELECT MAX(rowid) FROM responses) - ?''',(self.size,))
\ No newline at end of file
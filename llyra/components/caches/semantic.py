@@ -0,0 +1,209 @@
+from threading import Lock
+from time import time
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class SemanticCache:
+    '''The class is defined to define universal attributes and methods,
+    for caching responses of queries similar in meaning by their embeddings.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,capacity:int=1024,threshold:float=0.95,ttl:float=0) -> None:
+        '''The method is defined for initialize SemanticCache class object.
+        Args:
+            capacity: A integer indicate the maximum responses kept in the index.
+            threshold: A float indicate the minimum cosine similarity
+                between queries sharing a cached response.
+            ttl: A float indicate the seconds a cached response is kept,
+                and keep cached responses forever by set it to 0.
+        '''
+        # Discriminate whether vectorized index is available
+        if numpy == None:
+            raise ImportError('Semantic cache requires `numpy` installed.')
+        # Get limit attributes
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        # Initialize index attributes,
+        # which are normalized embeddings allocated by first cached response,
+        # scope of each slot with -1 for empty slots,
+        # expiration, last access, inference seconds and response of each slot
+        self._vectors = None
+        self._scopes = numpy.full(capacity,-1,dtype=numpy.int64)
+        self._expires = numpy.zeros(capacity,dtype=numpy.float64)
+        self._used = numpy.zeros(capacity,dtype=numpy.int64)
+        self._costs = numpy.zeros(capacity,dtype=numpy.float64)
+        self._responses:list = [None] * capacity
+        self._clock = 0
+        # Initialize scope attributes,
+        # which are id of each scope with cached responses,
+        # scope of each id and the next id to assign
+        self._ids:dict = {}
+        self._names:dict = {}
+        self._serial = 0
+        self._lock = Lock()
+        # Initialize counter attributes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved = 0.0
+
+    ## ============================== Access Methods ============================== ##
+    def get(self,vector:list,scope:str) -> str|None:
+        '''The method is defined for get cached response of the most similar query.
+        Args:
+            vector: A list indicate the embedding of the query,
+                or embeddings of its tokens which are averaged.
+            scope: A string indicate inference parameters the response is shared in.
+        Returns:
+            response: A string indicate the cached response,
+                or `None` indicate no query similar enough is cached.
+        '''
+        query = self._normalize(vector)
+        now = time()
+        with self._lock:
+            # Discriminate whether any response comparable is cached
+            id = self._ids.get(scope)
+            if (id == None or self._vectors is None
+                    or query.shape[0] != self._vectors.shape[1]):
+                self.misses += 1
+                return None
+            # Drop expired responses
+            self._expire(now)
+            # Score cached responses of the scope in one matrix product
+            mask = self._scopes == id
+            if not mask.any():
+                self.misses += 1
+                return None
+            scores = self._vectors @ query
+            scores[~mask] = -numpy.inf
+            slot = int(numpy.argmax(scores))
+            # Discriminate whether the most similar query is similar enough
+            if scores[slot] < self.threshold:
+                self.misses += 1
+                return None
+            self._clock += 1
+            self._used[slot] = self._clock
+            self.hits += 1
+            self.saved += float(self._costs[slot])
+            return self._responses[slot]
+
+    def put(self,vector:list,scope:str,response:str,cost:float=0) -> None:
+        '''The method is defined for cache response of a query.
+        Args:
+            vector: A list indicate the embedding of the query,
+                or embeddings of its tokens which are averaged.
+            scope: A string indicate inference parameters the response is shared in.
+            response: A string indicate the response of the query.
+            cost: A float indicate the seconds the inference of the query took,
+                which is counted as saved by each hit of the response.
+        '''
+        query = self._normalize(vector)
+        now = time()
+        with self._lock:
+            # Allocate index by dimension of first embedding
+            if self._vectors is None or query.shape[0] != self._vectors.shape[1]:
+                self._vectors = numpy.zeros((self.capacity,query.shape[0]),
+                                            dtype=numpy.float32)
+                self._scopes.fill(-1)
+                self._ids.clear()
+                self._names.clear()
+            # Drop expired responses before selecting slot
+            self._expire(now)
+            # Select empty slot, or evict least recently used response
+            empty = numpy.flatnonzero(self._scopes < 0)
+            evicted = None
+            if empty.size:
+                slot = int(empty[0])
+            else:
+                slot = int(numpy.argmin(self._used))
+                evicted = int(self._scopes[slot])
+                self.evictions += 1
+            # Assign id to the scope without cached responses
+            id = self._ids.get(scope)
+            if id == None:
+                id = self._serial
+                self._serial += 1
+                self._ids[scope] = id
+                self._names[id] = scope
+            # Keep response in the slot
+            self._clock += 1
+            self._vectors[slot] = query
+            self._scopes[slot] = id
+            self._expires[slot] = now + self.ttl if self.ttl else numpy.inf
+            self._used[slot] = self._clock
+            self._costs[slot] = cost
+            self._responses[slot] = response
+            # Drop scope of the evicted response once it has no response left
+            if evicted != None:
+                self._forget([evicted])
+
+    def clear(self) -> None:
+        '''The method is defined for drop all cached responses and reset counters.'''
+        with self._lock:
+            self._scopes.fill(-1)
+            self._responses = [None] * self.capacity
+            self._ids.clear()
+            self._names.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.saved = 0.0
+
+    def stats(self) -> dict:
+        '''The method is defined for read counters of the cache.
+        Returns:
+            A dictionary indicate hits, misses, hit rate, responses kept,
+            evicted responses and inference seconds saved by hits.
+        '''
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'rate': self.hits / total if total else 0.0,
+                    'size': int((self._scopes >= 0).sum()),
+                    'evictions': self.evictions,
+                    'saved': self.saved}
+
+    ## ============================= Internal Methods ============================= ##
+    def _expire(self,now:float) -> None:
+        '''The method is defined for drop expired responses,
+        and scopes left without cached responses.
+        Args:
+            now: A float indicate the current timestamp.
+        '''
+        if not self.ttl:
+            return
+        expired = (self._expires <= now) & (self._scopes >= 0)
+        if not expired.any():
+            return
+        ids = numpy.unique(self._scopes[expired])
+        self._scopes[expired] = -1
+        self._forget(ids)
+
+    def _forget(self,ids) -> None:
+        '''The method is defined for drop scopes without cached responses,
+        so ids of scopes only kept while they have responses in the index.
+        Args:
+            ids: A iterable of integers indicate ids of scopes to check.
+        '''
+        for id in ids:
+            id = int(id)
+            if id in self._names and not (self._scopes == id).any():
+                del self._ids[self._names.pop(id)]
+
+    def _normalize(self,vector:list):
+        '''The method is defined for make unit length embedding,
+        so cosine similarity is a dot product.
+        Args:
+            vector: A list indicate the embedding of the query,
+                or embeddings of its tokens which are averaged.
+        Returns:
+            A ndarray indicate the normalized embedding.
+        '''
+        query = numpy.asarray(vector,dtype=numpy.float32)
+        if query.ndim > 1:
+            query = query.mean(axis=0)
+        norm = numpy.linalg.norm(query)
+        return query / norm if norm else query
\ No newline at end of file
@@ -0,0 +1 @@
+from .funcs import make_key, make_scope
\ No newline at end of file
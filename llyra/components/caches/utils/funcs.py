@@ -0,0 +1,45 @@
+from hashlib import sha256
+import json
+
+## =========================== Function `make_key()` =========================== ##
+def make_key(backend:str,model:str,prompt:str|list,
+             stop:str|list,temperature:float,options:dict=None) -> str:
+    '''The function is defined for make cache key of an inference.
+    Args:
+        backend: A string indicate the kind of backend executing inference.
+        model: A string indicate the name of model for inference.
+        prompt: A string or list indicate the structed prompt for inference.
+        stop: A string or list indicate where the model should stop generation.
+        temperature: A float indicate the model inference temperature.
+        options: A dictionary indicate the Ollama options of remote inference,
+            or the generation length limit of local inference,
+            which keeps keys of inferences without options unchanged.
+    Returns:
+        A string indicate the digest of inference parameters.
+    '''
+    parameters = [backend,model,prompt,stop,temperature]
+    if options:
+        parameters.append(sorted(options.items()))
+    content = json.dumps(parameters,ensure_ascii=False,separators=(',',':'))
+    return sha256(content.encode('utf-8')).hexdigest()
+
+## ========================== Function `make_scope()` ========================== ##
+def make_scope(type:str,model:str,addition:str|None,
+               stop:str|list,temperature:float,options:dict=None) -> str:
+    '''The function is defined for make scope of semantic cache,
+    which only shares responses among queries inferred with same parameters.
+    Args:
+        type: A string indicate the inference type.
+        model: A string indicate the name of model for inference.
+        addition: A string indicate additional prompt for chat inference.
+        stop: A string or list indicate where the model should stop generation.
+        temperature: A float indicate the model inference temperature.
+        options: A dictionary indicate the Ollama options of remote inference,
+            or the generation length limit of local inference.
+    Returns:
+        A string indicate the serialized inference parameters.
+    '''
+    parameters = [type,model,addition,stop,temperature]
+    if options:
+        parameters.append(sorted(options.items()))
+    return json.dumps(parameters,ensure_ascii=False,separators=(',',':'))
\ No newline at end of file
@@ -1,6 +1,7 @@
 import tomllib
 from pathlib import Path
-from ...errors.configs import ConfigSectionMissingError, ConfigParameterMissingError
+from .utils import Sessions, Logs, Responses, Semantics, Traces, struct_path, read_option
+from ...errors.configs import ConfigSectionMissingError, ConfigParameterMissingError, ConfigParameterInvalidError
 
 class Config:
     '''The class is defined to define basic attributes and internal methods, 
@@ -10,6 +11,11 @@ class Config:
         '''The method is defined for initializing Config class object.'''
         # Define global config attribute
         self.strategy:Path = None
+        self.session:Sessions = None
+        self.log:Logs = None
+        self.response:Responses = None
+        self.semantic:Semantics = None
+        self.trace:Traces = None
         # Define assistant internal attribute
         self._path:Path = Path('configs/config.toml')
         self._content:dict = None
@@ -47,4 +53,56 @@ class Config:
         except KeyError:
             raise ConfigParameterMissingError('global','strategy')
         else:
-            self.strategy:Path = Path(strategy)
\ No newline at end of file
+            self.strategy:Path = Path(strategy)
+        # Read session config attribute
+        content = self._content.get('session',{})
+        capacity = read_option(content,'session','capacity',1024,int)
+        ttl = read_option(content,'session','ttl',0,(int,float))
+        memory = read_option(content,'session','memory',0,int)
+        self.session:Sessions = Sessions(capacity,ttl,memory)
+        # Read log config attribute
+        content = self._content.get('log',{})
+        sink = read_option(content,'log','sink','memory',str)
+        if sink not in ('memory','jsonl','sqlite'):
+            raise ConfigParameterInvalidError('log','sink',
+                                              '`memory`, `jsonl` or `sqlite`')
+        path = struct_path(read_option(content,'log','path','logs/',str))
+        buffer = read_option(content,'log','buffer',256,int)
+        interval = read_option(content,'log','interval',1.0,(int,float))
+        segment = read_option(content,'log','segment',67108864,int)
+        self.log:Logs = Logs(sink,path,buffer,interval,segment)
+        # Read response cache config attribute
+        content = self._content.get('cache',{}).get('response',{})
+        enable = read_option(content,'cache.response','enable',False,bool)
+        capacity = read_option(content,'cache.response','capacity',1024,int)
+        ttl = read_option(content,'cache.response','ttl',0,(int,float))
+        disk = read_option(content,'cache.response','disk',False,bool)
+        path = read_option(content,'cache.response','path','caches/',str)
+        size = read_option(content,'cache.response','size',0,int)
+        self.response:Responses = Responses(enable,capacity,ttl,disk,
+                                            struct_path(path),size)
+        # Read semantic cache config attribute
+        content = self._content.get('cache',{}).get('semantic',{})
+        enable = read_option(content,'cache.semantic','enable',False,bool)
+        threshold = read_option(content,'cache.semantic','threshold',0.95,(int,float))
+        if not 0 <= threshold <= 1:
+            raise ConfigParameterInvalidError('cache.semantic','threshold',
+                                              'a number between 0 and 1')
+        capacity = read_option(content,'cache.semantic','capacity',1024,int)
+        ttl = read_option(content,'cache.semantic','ttl',0,(int,float))
+        model = read_option(content,'cache.semantic','model','',str)
+        self.semantic:Semantics = Semantics(enable,threshold,capacity,ttl,model)
+        # Read trace config attribute
+        content = self._content.get('trace',{})
+        exporter = read_option(content,'trace','exporter','none',str)
+        if exporter not in ('none','jsonl','prometheus'):
+            raise ConfigParameterInvalidError('trace','exporter',
+                                              '`none`, `jsonl` or `prometheus`')
+        path = struct_path(read_option(content,'trace','path','traces/',str))
+        buffer = read_option(content,'trace','buffer',256,int)
+        host = read_option(content,'trace','host','127.0.0.1',str)
+        port = read_option(content,'trace','port',9464,int)
+        if not 0 <= port <= 65535:
+            raise ConfigParameterInvalidError('trace','port',
+                                              'a integer between 0 and 65535')
+        self.trace:Traces = Traces(exporter,path,buffer,host,port)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from .basic import Config
-from .utils import Model, struct_model_name, struct_path, struct_suffix
-from ...errors.configs import ConfigSectionMissingError, ConfigParameterMissingError
+from .utils import Model, Cache, Engine, Scheduling, Batching, Pooling, Registry, struct_model_name, struct_path, struct_suffix, read_option, check_engine
+from ...errors.configs import ConfigSectionMissingError, ConfigParameterMissingError, ConfigParameterInvalidError
+from dataclasses import fields, replace
 from warnings import warn
 from pathlib import Path
 
@@ -16,6 +17,15 @@ class LocalConfig(Config):
         self.format:str = None
         self.gpu:bool = None
         self.ram:bool = None
+        self.lazy:bool = None
+        self.idle:float = None
+        self.warmup:bool = None
+        self.cache:Cache = None
+        self.engine:Engine = None
+        self.scheduler:Scheduling = None
+        self.batch:Batching = None
+        self.pool:Pooling = None
+        self.registry:Registry = None
         # Define path attribute
         self.path:str = None
 
@@ -80,24 +90,126 @@ class LocalConfig(Config):
             message += ' , auto-fallback to `False`.'
             warn(message,RuntimeWarning)
             self.ram = False
+        # Read model lifecycle config parameters
+        self.lazy = read_option(content,'local','lazy',False,bool)
+        self.idle = read_option(content,'local','idle',0,(int,float))
+        self.warmup = read_option(content,'local','warmup',False,bool)
+        # Read model state cache config parameters
+        cache = content.get('cache',{})
+        capacity = read_option(cache,'local.cache','capacity',0,int)
+        states = read_option(cache,'local.cache','states',4,int)
+        self.cache:Cache = Cache(capacity,states)
+        # Read engine config parameters
+        engine = content.get('engine',{})
+        self.engine:Engine = Engine()
+        for field in fields(Engine):
+            value = engine.get(field.name,field.default)
+            expectation = check_engine(field.name,value)
+            if expectation != None:
+                raise ConfigParameterInvalidError('local.engine',field.name,expectation)
+            setattr(self.engine,field.name,value)
+        # Read scheduler config parameters
+        scheduler = content.get('scheduler',{})
+        policy = read_option(scheduler,'local.scheduler','policy','fifo',str)
+        if policy not in ('fifo','priority'):
+            raise ConfigParameterInvalidError('local.scheduler','policy',
+                                              '`fifo` or `priority`')
+        queue = read_option(scheduler,'local.scheduler','queue',64,int)
+        if queue < 0:
+            raise ConfigParameterInvalidError('local.scheduler','queue',
+                                              'a non-negative integer')
+        block = read_option(scheduler,'local.scheduler','block',True,bool)
+        timeout = read_option(scheduler,'local.scheduler','timeout',0,(int,float))
+        if timeout < 0:
+            raise ConfigParameterInvalidError('local.scheduler','timeout',
+                                              'a non-negative number')
+        self.scheduler:Scheduling = Scheduling(policy,queue,block,timeout)
+        # Read continuous batching config parameters
+        batch = content.get('batch',{})
+        slots = read_option(batch,'local.batch','slots',0,int)
+        if slots < 0:
+            raise ConfigParameterInvalidError('local.batch','slots',
+                                              'a non-negative integer')
+        context = read_option(batch,'local.batch','context',0,int)
+        if context < 0:
+            raise ConfigParameterInvalidError('local.batch','context',
+                                              'a non-negative integer')
+        self.batch:Batching = Batching(slots,context)
+        # Read worker pool config parameters
+        pool = content.get('pool',{})
+        workers = read_option(pool,'local.pool','workers',2,int)
+        if workers < 1:
+            raise ConfigParameterInvalidError('local.pool','workers',
+                                              'a positive integer')
+        self.pool:Pooling = Pooling(workers)
+        # Read model registry config parameters
+        registry = content.get('registry',{})
+        budget = read_option(registry,'local.registry','budget',0,int)
+        if budget < 0:
+            raise ConfigParameterInvalidError('local.registry','budget',
+                                              'a non-negative integer')
+        reload = read_option(registry,'local.registry','reload',True,bool)
+        models = {self.model.name: self.model}
+        for entry in read_option(registry,'local.registry','models',[],list):
+            ## Discriminate whether the entry names a new model
+            if not isinstance(entry,dict) or not isinstance(entry.get('name'),str):
+                raise ConfigParameterInvalidError('local.registry','models',
+                                                  'tables with a `name` string')
+            name = struct_model_name(entry['name'])
+            if name in models:
+                raise ConfigParameterInvalidError('local.registry','models',
+                                                  'tables with unique `name` strings')
+            ## Follow model section for parameters the entry doesn't set
+            directory = struct_path(entry.get('directory',self.model.directory))
+            suffix = struct_suffix(entry.get('suffix',self.model.suffix))
+            models[name] = Model(name,directory,suffix,entry.get('format'))
+        self.registry:Registry = Registry(budget,reload,models)
         # Make model file path
         self.path = self.model.directory + self.model.name + self.model.suffix
 
+    ## =============================== Locate Method =============================== ##
+    def locate(self,name:str) -> str:
+        '''The method is defined for make model file path of a registered model.
+        Args:
+            name: A string indicate the name of the registered model.
+        Returns:
+            A string indicate the path to the model file.
+        '''
+        model = self.registry.models[name]
+        return model.directory + model.name + model.suffix
+
     ## =============================== Update Method =============================== ##
     def update(self,
                format:str,
                gpu:bool,
-               ram:bool,) -> None:
+               ram:bool,
+               engine:dict=None) -> bool:
         '''The method is defined for update config parameters with inputs.
         Args:
             format: A sting indicate the format of chat inference's input.
             gpu: A boolean indicate whether using GPU for inference acceleration.
             ram: A boolean indicate whether keeping the model loaded in memory.
-        '''        
+            engine: A dictionary indicate the engine parameters to update.
+        Returns:
+            changed: A boolean indicate whether parameters applied on model loading
+                are changed, so the loaded model should be loaded again.
+        '''
+        # Discriminate whether engine parameters are valid before updating any
+        engine = engine if engine else {}
+        for name, value in engine.items():
+            expectation = check_engine(name,value)
+            if expectation != None:
+                raise ValueError(f'Invalid `{name}` engine parameter, expect {expectation}.')
+        # Update config parameters and record their former values
+        former = (self.format,self.gpu,self.ram,self.engine)
         if format != '':
             self.format = format
         if gpu != None:
             self.gpu = gpu
         if ram != None:
             self.ram = ram
-    
\ No newline at end of file
+        if engine:
+            self.engine = replace(self.engine,**engine)
+        # Return whether any parameter is changed
+        changed = former != (self.format,self.gpu,self.ram,self.engine)
+        return changed
\ No newline at end of file
@@ -1,6 +1,6 @@
 from .basic import Config
-from .utils import Server, struct_path, struct_url
-from ...errors.configs import ConfigSectionMissingError, ConfigParameterMissingError
+from .utils import Server, struct_path, struct_url, read_option
+from ...errors.configs import ConfigSectionMissingError, ConfigParameterMissingError, ConfigParameterInvalidError
 from pathlib import Path
 
 class RemoteConfig(Config):
@@ -13,8 +13,11 @@ class RemoteConfig(Config):
         # Define config attributes
         self.server:Server = None
         self.model:str = None
-        # Define url attribute
+        self.warmup:bool = None
+        self.hold:str|int = None
+        # Define url attributes
         self.url:str = None
+        self.urls:list = None
 
     ## ================================ Load Method ================================ ##
     def load(self,path:str|Path) -> None:
@@ -41,27 +44,80 @@ class RemoteConfig(Config):
         except KeyError:
             raise ConfigParameterMissingError('remote.server','url')
         else:
-            url = struct_url(url)
+            if isinstance(url,list) and url and all(isinstance(item,str) for item in url):
+                url = [struct_url(item) for item in url]
+            elif isinstance(url,str):
+                url = struct_url(url)
+            else:
+                raise ConfigParameterInvalidError('remote.server','url',
+                                                  'a url or a non-empty list of urls')
         try:
             port = server['port']
         except KeyError:
             raise ConfigParameterMissingError('remote.server','port')
+        ## Discriminate whether each server has its port
+        count = len(url) if isinstance(url,list) else 1
+        if isinstance(port,list) and len(port) != count:
+            raise ConfigParameterInvalidError('remote.server','port',
+                                              'a port or a list of ports as long as `url`')
         try:
             endpoint = server['endpoint']
         except KeyError:
             raise ConfigParameterMissingError('remote.server','endpoint')
         else:
             endpoint = struct_path(endpoint)
-        self.server:Server = Server(url,port,endpoint)
+        ## Read connection pool config parameters
+        pool = read_option(server,'remote.server','pool',10,int)
+        connections = read_option(server,'remote.server','connections',10,int)
+        block = read_option(server,'remote.server','block',False,bool)
+        retries = read_option(server,'remote.server','retries',0,int)
+        keep_alive = read_option(server,'remote.server','keep_alive',True,bool)
+        ## Read request policy config parameters
+        connect_timeout = read_option(server,'remote.server','connect_timeout',5,(int,float))
+        read_timeout = read_option(server,'remote.server','read_timeout',600,(int,float))
+        backoff = read_option(server,'remote.server','backoff',0.5,(int,float))
+        backoff_max = read_option(server,'remote.server','backoff_max',8,(int,float))
+        breaker = read_option(server,'remote.server','breaker',5,int)
+        cooldown = read_option(server,'remote.server','cooldown',30,(int,float))
+        ## Read load balancing config parameters
+        balance = read_option(server,'remote.server','balance','least',str)
+        if balance not in ('least','weighted'):
+            raise ConfigParameterInvalidError('remote.server','balance',
+                                              '`least` or `weighted`')
+        weights = read_option(server,'remote.server','weights',None,list)
+        if weights != None and (len(weights) != count
+                                or not all(type(weight) == int and weight > 0
+                                           for weight in weights)):
+            raise ConfigParameterInvalidError('remote.server','weights',
+                                              'a list of positive integers as long as `url`')
+        health = read_option(server,'remote.server','health',10,(int,float))
+        sticky = read_option(server,'remote.server','sticky',True,bool)
+        ## Read startup config parameters
+        validate = read_option(server,'remote.server','validate','eager',str)
+        if validate not in ('eager','lazy','background'):
+            raise ConfigParameterInvalidError('remote.server','validate',
+                                              '`eager`, `lazy` or `background`')
+        probe_ttl = read_option(server,'remote.server','probe_ttl',60,(int,float))
+        self.server:Server = Server(url,port,endpoint,
+                                    pool,connections,block,retries,keep_alive,
+                                    connect_timeout,read_timeout,
+                                    backoff,backoff_max,breaker,cooldown,
+                                    balance,weights,health,sticky,
+                                    validate,probe_ttl)
         # Read inference config parameter
         try:
             self.model = content['model']
         except KeyError:
             raise ConfigParameterMissingError('remote','model')
-        # Make API url
-        self.url = self.server.url
-        self.url += ':' + str(self.server.port)
-        self.url += '/' + self.server.endpoint
+        # Read model residence config parameters
+        self.warmup = read_option(content,'remote','warmup',False,bool)
+        hold = read_option(content,'remote','hold','',(str,int))
+        self.hold = hold if hold != '' else None
+        # Make API url of each server
+        urls = url if isinstance(url,list) else [url]
+        ports = port if isinstance(port,list) else [port] * count
+        self.urls = [f'{base}:{number}/{endpoint}' for base, number in zip(urls,ports)]
+        self.url = self.urls[0]
     
     ## =============================== Update Method =============================== ##
     def update(self,) -> None:
@@ -1,5 +1,18 @@
 from .funcs import struct_path
 from .funcs import struct_suffix, struct_model_name
 from .funcs import struct_url
+from .funcs import read_option
+from .funcs import check_engine, ENGINE, KV_TYPES
 from .classes import Model
-from .classes import Server
\ No newline at end of file
+from .classes import Server
+from .classes import Sessions
+from .classes import Cache
+from .classes import Engine
+from .classes import Scheduling
+from .classes import Batching
+from .classes import Pooling
+from .classes import Registry
+from .classes import Logs
+from .classes import Responses
+from .classes import Semantics
+from .classes import Traces
\ No newline at end of file
@@ -9,10 +9,13 @@ class Model:
         name: A string indicate the name of local model for inference.
         directory: A string indicate the path of the directory placing the model file.
         suffix: A string indicate the suffix of model file format.
+        format: A string indicate the format of chat inference's input,
+            and follow `format` parameter of local section by set it to `None`.
     '''
     name: str
     directory: str
     suffix: str
+    format: str = None
 
 ## ============================= Dataclass `Server()` ============================= ##
 @dataclass
@@ -20,10 +23,266 @@ class Server:
     '''
     The class is defined for managing parameters of server section in remote section.
     Args:
-        url: A string indicate the base url of remote inference server.
-        port: A integer indicate the service port of remote inference server.
+        url: A string indicate the base url of remote inference server,
+            or a list of strings indicate base urls of several servers.
+        port: A integer indicate the service port of remote inference server,
+            or a list of integers indicate service port of each server.
         endpoint: A string indicate the endpoint before specific service interface.
+        pool: A integer indicate the number of host connection pools to cache.
+        connections: A integer indicate the maximum connections kept per host.
+        block: A boolean indicate whether waiting for a free connection
+            when the per-host limit is reached.
+        retries: A integer indicate the maximum retries of failed requests.
+        keep_alive: A boolean indicate whether reusing connections across requests.
+        connect_timeout: A float indicate the seconds waiting for connection,
+            and wait forever by set it to 0.
+        read_timeout: A float indicate the seconds waiting for response data,
+            and wait forever by set it to 0.
+        backoff: A float indicate the seconds of delay ceiling before first retry.
+        backoff_max: A float indicate the maximum seconds of delay ceiling.
+        breaker: A integer indicate the consecutive failed requests
+            failing later requests fast, and never fail fast by set it to 0.
+        cooldown: A float indicate the seconds failing fast
+            before a trial request is allowed.
+        balance: A string indicate the policy distributing requests across servers,
+            `least` for least outstanding requests or `weighted` for weighted round-robin.
+        weights: A list of integers indicate the weight of each server,
+            and weight servers equally by set it to `None`.
+        health: A float indicate the seconds between health checks of servers,
+            and never check health after initialization by set it to 0.
+        sticky: A boolean indicate whether route each chat session to the same server.
+        validate: A string indicate when to probe the model availability of servers,
+            `eager` for on initialization, `lazy` for before first request,
+            or `background` for in a thread without blocking initialization.
+        probe_ttl: A float indicate the seconds a probe result is shared
+            by clients in the process, and never share it by set it to 0.
     '''
-    url: str
-    port: int
-    endpoint: str
\ No newline at end of file
+    url: str|list
+    port: int|list
+    endpoint: str
+    pool: int = 10
+    connections: int = 10
+    block: bool = False
+    retries: int = 0
+    keep_alive: bool = True
+    connect_timeout: float = 5
+    read_timeout: float = 600
+    backoff: float = 0.5
+    backoff_max: float = 8
+    breaker: int = 5
+    cooldown: float = 30
+    balance: str = 'least'
+    weights: list = None
+    health: float = 10
+    sticky: bool = True
+    validate: str = 'eager'
+    probe_ttl: float = 60
+
+## ============================ Dataclass `Sessions()` ============================ ##
+@dataclass
+class Sessions:
+    '''
+    The class is defined for managing parameters of session section.
+    Args:
+        capacity: A integer indicate the maximum number of kept chat sessions.
+        ttl: A float indicate the seconds an idle chat session is kept,
+            and keep idle sessions forever by set it to 0.
+        memory: A integer indicate the maximum characters kept by all chat sessions,
+            and keep them unlimited by set it to 0.
+    '''
+    capacity: int = 1024
+    ttl: float = 0
+    memory: int = 0
+
+## ============================== Dataclass `Cache()` ============================== ##
+@dataclass
+class Cache:
+    '''
+    The class is defined for managing parameters of cache section in local section.
+    Args:
+        capacity: A integer indicate the bytes of model states cached by prompt prefix,
+            and disable the prefix cache by set it to 0.
+        states: A integer indicate the maximum number of chat sessions
+            whose model state is saved for switching back.
+    '''
+    capacity: int = 0
+    states: int = 4
+
+## ============================= Dataclass `Engine()` ============================= ##
+@dataclass
+class Engine:
+    '''
+    The class is defined for managing parameters of engine section in local section.
+    Args:
+        n_ctx: A integer indicate the context length of the model,
+            and use context length the model trained with by set it to 0.
+        n_batch: A integer indicate the maximum tokens submitted in a prompt batch.
+        n_ubatch: A integer indicate the maximum tokens computed in a physical batch.
+        n_threads: A integer indicate the threads for generation,
+            and detect the threads by set it to 0.
+        n_threads_batch: A integer indicate the threads for prompt processing,
+            and detect the threads by set it to 0.
+        n_gpu_layers: A integer indicate the layers offload to GPU when GPU is used,
+            and offload all layers by set it to -1.
+        use_mmap: A boolean indicate whether map the model file into memory.
+        flash_attn: A boolean indicate whether use flash attention.
+        type_k: A string indicate the quantization type of key cache,
+            and keep default type by set it to empty.
+        type_v: A string indicate the quantization type of value cache,
+            and keep default type by set it to empty.
+    '''
+    n_ctx: int = 0
+    n_batch: int = 512
+    n_ubatch: int = 512
+    n_threads: int = 0
+    n_threads_batch: int = 0
+    n_gpu_layers: int = -1
+    use_mmap: bool = True
+    flash_attn: bool = False
+    type_k: str = ''
+    type_v: str = ''
+
+## =========================== Dataclass `Scheduling()` =========================== ##
+@dataclass
+class Scheduling:
+    '''
+    The class is defined for managing parameters of scheduler section in local section.
+    Args:
+        policy: A string indicate the order queued requests are served in,
+            which is `fifo` or `priority`.
+        queue: A integer indicate the maximum requests waiting for the model,
+            and queue them unlimited by set it to 0.
+        block: A boolean indicate whether wait for a free place in full queue,
+            or raise at once.
+        timeout: A float indicate the seconds waiting for a free place in full queue,
+            and wait for ever by set it to 0.
+    '''
+    policy: str = 'fifo'
+    queue: int = 64
+    block: bool = True
+    timeout: float = 0
+
+## ============================ Dataclass `Batching()` ============================ ##
+@dataclass
+class Batching:
+    '''
+    The class is defined for managing parameters of batch section in local section.
+    Args:
+        slots: A integer indicate the maximum single calls generated together,
+            and generate one inference at a time by set it to 0.
+        context: A integer indicate the tokens of the batch context
+            shared by all generating calls, and give each call
+            the context of the model by set it to 0.
+    '''
+    slots: int = 0
+    context: int = 0
+
+## ============================ Dataclass `Pooling()` ============================= ##
+@dataclass
+class Pooling:
+    '''
+    The class is defined for managing parameters of pool section in local section.
+    Args:
+        workers: A integer indicate the number of worker processes
+            each running the model in `local-pool` mode.
+    '''
+    workers: int = 2
+
+## ============================ Dataclass `Registry()` ============================ ##
+@dataclass
+class Registry:
+    '''
+    The class is defined for managing parameters of registry section in local section.
+    Args:
+        budget: A integer indicate the bytes of model files loaded together,
+            and never unload a model for another by set it to 0.
+        reload: A boolean indicate whether load a model again
+            once its model file is changed on disk.
+        models: A dictionary indicate the Model instance of each registered model name,
+            including the model of model section.
+    '''
+    budget: int = 0
+    reload: bool = True
+    models: dict = None
+
+## ============================== Dataclass `Logs()` ============================== ##
+@dataclass
+class Logs:
+    '''
+    The class is defined for managing parameters of log section.
+    Args:
+        sink: A string indicate where log records are kept,
+            which is `memory`, `jsonl` or `sqlite`.
+        path: A string indicate the directory placing log files of disk sinks.
+        buffer: A integer indicate the maximum records written to disk at once.
+        interval: A float indicate the maximum seconds a record waits in buffer.
+        segment: A integer indicate the bytes of a JSONL segment before rotation.
+    '''
+    sink: str = 'memory'
+    path: str = 'logs/'
+    buffer: int = 256
+    interval: float = 1.0
+    segment: int = 67108864
+
+## ============================ Dataclass `Responses()` ============================ ##
+@dataclass
+class Responses:
+    '''
+    The class is defined for managing parameters of response section in cache section.
+    Args:
+        enable: A boolean indicate whether cache responses of deterministic calls.
+        capacity: A integer indicate the maximum responses kept in memory.
+        ttl: A float indicate the seconds a cached response is kept,
+            and keep cached responses forever by set it to 0.
+        disk: A boolean indicate whether keep cached responses on disk as well.
+        path: A string indicate the directory placing the disk cache.
+        size: A integer indicate the maximum responses kept on disk,
+            and keep them unlimited by set it to 0.
+    '''
+    enable: bool = False
+    capacity: int = 1024
+    ttl: float = 0
+    disk: bool = False
+    path: str = 'caches/'
+    size: int = 0
+
+## =========================== Dataclass `Semantics()` =========================== ##
+@dataclass
+class Semantics:
+    '''
+    The class is defined for managing parameters of semantic section in cache section.
+    Args:
+        enable: A boolean indicate whether cache responses of similar queries.
+        threshold: A float indicate the minimum cosine similarity
+            between queries sharing a cached response.
+        capacity: A integer indicate the maximum responses kept in the index.
+        ttl: A float indicate the seconds a cached response is kept,
+            and keep cached responses forever by set it to 0.
+        model: A string indicate the name of embedding model,
+            and embed with the inference model by set it to empty.
+    '''
+    enable: bool = False
+    threshold: float = 0.95
+    capacity: int = 1024
+    ttl: float = 0
+    model: str = ''
+
+## ============================= Dataclass `Traces()` ============================= ##
+@dataclass
+class Traces:
+    '''
+    The class is defined for managing parameters of trace section.
+    Args:
+        exporter: A string indicate where spans of inference stages are exported,
+            which is `none`, `jsonl` or `prometheus`.
+        path: A string indicate the directory placing span files of JSONL exporter.
+        buffer: A integer indicate the maximum spans written to disk at once.
+        host: A string indicate the address the metrics endpoint listens on.
+        port: A integer indicate the port the metrics endpoint listens on,
+            and pick a free port by set it to 0.
+    '''
+    exporter: str = 'none'
+    path: str = 'traces/'
+    buffer: int = 256
+    host: str = '127.0.0.1'
+    port: int = 9464
\ No newline at end of file
@@ -1,3 +1,24 @@
+from ....errors.configs import ConfigParameterInvalidError
+
+# KV cache quantization types of llama.cpp by name
+KV_TYPES = {'f32': 0, 'f16': 1, 'q4_0': 2, 'q4_1': 3,
+            'q5_0': 6, 'q5_1': 7, 'q8_0': 8}
+
+# Engine parameters of local model with their valid types and minimum values,
+# which are passed to llama.cpp on model loading
+ENGINE = {
+    'n_ctx': ((int,),0),
+    'n_batch': ((int,),1),
+    'n_ubatch': ((int,),1),
+    'n_threads': ((int,),0),
+    'n_threads_batch': ((int,),0),
+    'n_gpu_layers': ((int,),-1),
+    'use_mmap': ((bool,),None),
+    'flash_attn': ((bool,),None),
+    'type_k': ((str,),None),
+    'type_v': ((str,),None),
+    }
+
 ## =========================== Function `struct_path()` =========================== ##
 def struct_path(path:str) -> str:
     '''The method is defined for struct of multi-kind path/url.
@@ -63,4 +84,56 @@ def struct_url(url:str) -> str:
     else:
         structed_url = url
     # Return structed url
-    return structed_url
\ No newline at end of file
+    return structed_url
+
+## =========================== Function `read_option()` =========================== ##
+def read_option(content:dict,section:str,parameter:str,
+                default,expectation:type|tuple) -> object:
+    '''The function is defined for read optional parameter of a config section.
+    Args:
+        content: A dictionary indicate the content of the config section.
+        section: A string indicate the name of the config section.
+        parameter: A string indicate the name of the optional parameter.
+        default: A value indicate the fallback when the parameter is missing.
+        expectation: A type or a tuple of types indicate the valid parameter types.
+    Returns:
+        value: A value indicate the parameter provided or the fallback value.
+    '''
+    # Discriminate whether the parameter is provided
+    try:
+        value = content[parameter]
+    except KeyError:
+        return default
+    # Discriminate whether the parameter is valid
+    if not isinstance(expectation,tuple):
+        expectation = (expectation,)
+    if type(value) not in expectation:
+        names = ' or '.join(f'`{kind.__name__}`' for kind in expectation)
+        raise ConfigParameterInvalidError(section,parameter,names)
+    # Return parameter value
+    return value
+
+## =========================== Function `check_engine()` =========================== ##
+def check_engine(name:str,value) -> str|None:
+    '''The function is defined for validate an engine parameter of local model.
+    Args:
+        name: A string indicate the name of the engine parameter.
+        value: A value indicate the value of the engine parameter.
+    Returns:
+        A string indicate the expectation of the parameter when it's invalid,
+        or `None` indicate the parameter is valid.
+    '''
+    # Discriminate whether the parameter is supported
+    try:
+        expectation, minimum = ENGINE[name]
+    except KeyError:
+        return 'a supported engine parameter'
+    # Discriminate whether the parameter type is valid
+    if type(value) not in expectation:
+        return ' or '.join(f'`{kind.__name__}`' for kind in expectation)
+    # Discriminate whether the parameter value is valid
+    if minimum != None and value < minimum:
+        return f'a integer no less than {minimum}'
+    if name in ('type_k','type_v') and value and value not in KV_TYPES:
+        return ' or '.join(f'`{kind}`' for kind in KV_TYPES)
+    return None
@@ -1 +1,2 @@
-from .definition import Log
\ No newline at end of file
+from .definition import Log
+from .sinks import make_sink
\ No newline at end of file
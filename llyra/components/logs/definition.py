@@ -1,21 +1,40 @@
 from .utils import make_new_iteration, convert2readable_log, Section
+from .utils import make_section_event, make_iteration_event, make_stats
+from .sinks import Sink
 from ..utils import Role
-from copy import deepcopy
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import attrgetter
+from threading import Lock
 
 class Log:
     '''The class is defined to define universal attributes and methods,
     for working with logs.'''
     ## ============================= Initialize Method ============================= ##
-    def __init__(self) -> None:
-        '''The method is defined to initialize Log class object.'''
-        # Initialize inference history attributes
-        self.id = 0
+    def __init__(self,sink:Sink=None) -> None:
+        '''The method is defined to initialize Log class object.
+        Args:
+            sink: A Sink instance indicate where log records are persisted,
+                and keep log records in memory by set it to `None`.
+        '''
+        # Initialize inference history attributes,
+        # which only keeps records still continued when persisted by sink
+        self._sink = sink
+        self.id = sink.next_id() if sink else 0
         self._history = []
+        # Initialize chat session attributes
+        self._sessions = {}
+        self._owned = {}
+        # Initialize lock attribute serializing records and reads across threads
+        self._lock = Lock()
 
     ## ============================== Record Methods ============================== ##
     def call(self,model:str,
               input:str,output:str,
-              temperature:float
+              temperature:float,
+              cached:bool=False,
+              truncated:bool=False,
+              metrics:dict=None
               ) -> None:
         '''The method is defined to record bisic log for single call inference.
         Args:
@@ -23,22 +42,30 @@ class Log:
             input: A string indicate input content for model inference.
             output: A string indicate response of model inference.
             temperature: A float indicate the model inference temperature.
+            cached: A boolean indicate whether the response is read from cache.
+            truncated: A boolean indicate whether generation stopped at `max_tokens`.
+            metrics: A dictionary indicate the measurements of the inference.
         '''
-        # Make history content of the inference
-        new_section = Section(self.id,'call',model,None,None,temperature)
-        new_iteration = make_new_iteration(input,output)
-        new_section.iteration.append(new_iteration)
-        # Append history attribute
-        self._history.append(new_section)
-        # Update history ID
-        self.id += 1
+        with self._lock:
+            # Make history content of the inference
+            new_section = Section(self.id,'call',model,None,None,temperature)
+            new_iteration = make_new_iteration(input,output,cached,truncated,metrics)
+            # Append history attribute
+            self._push(new_section)
+            self._record(new_section,new_iteration)
+            # Update history ID
+            self.id += 1
 
     def chat(self,model:str,
               addition:str,
               role:Role,
               input:str,output:str,
               temperature:float,
-              keep:bool) -> None:
+              keep:bool,
+              session:str=None,
+              cached:bool=False,
+              truncated:bool=False,
+              metrics:dict=None) -> None:
         '''The method is defined to record basic log for iterative chat inference.
         Args:
             model: A string indicate the name of model file.
@@ -48,51 +75,234 @@ class Log:
             input: A string indicate input content for model inference.
             output: A string indicate response of model inference.
             temperature: A float indicate the model inference temperature.
-            keep: A boolean indicate whether continue the iteration.     
+            keep: A boolean indicate whether continue the iteration,
+                which starts a new record anyway when the model is changed.
+            session: A string indicate the identity of the chat session,
+                and record into the default session by set it to `None`.
+            cached: A boolean indicate whether the response is read from cache.
+            truncated: A boolean indicate whether generation stopped at `max_tokens`.
+            metrics: A dictionary indicate the measurements of the inference.
         '''
-        # Discriminate whether continue the iteration
-        if self._history:
-            record = self._history[-1]
-        else:
-            record = Section(None,None,None,None,None,None)
-        if record.type == 'chat' and keep:
-            section = self._history.pop(-1)
-        else:
+        with self._lock:
+            # Discriminate whether record into specific session
+            if session != None:
+                self._chat_session(model,addition,role,input,output,
+                                   temperature,keep,session,cached,truncated,metrics)
+                return
+            # Discriminate whether continue the iteration
+            if self._history:
+                record = self._history[-1]
+            else:
+                record = Section(None,None,None,None,None,None)
+            if (record.type == 'chat' and keep and record.id not in self._owned
+                    and record.model == model):
+                section = record
+            else:
+                # Make history content of the inference
+                section = Section(self.id,'chat',model,addition,role,temperature)
+                self._push(section)
+                # Update history ID
+                self.id += 1
+            # Make iteration content
+            new_iteration = make_new_iteration(input,output,cached,truncated,metrics)
+            # Append history intertion
+            self._record(section,new_iteration)
+
+    def _chat_session(self,model:str,
+                      addition:str,
+                      role:Role,
+                      input:str,output:str,
+                      temperature:float,
+                      keep:bool,
+                      session:str,
+                      cached:bool=False,
+                      truncated:bool=False,
+                      metrics:dict=None) -> None:
+        '''The method is defined to record basic log for iterative chat inference
+        of specific chat session.
+        Args:
+            model: A string indicate the name of model file.
+            addition: A string indicate the content of additional prompt.
+            role: A dataclass indicate input, output, and prompt role of
+                iterative chat inference.
+            input: A string indicate input content for model inference.
+            output: A string indicate response of model inference.
+            temperature: A float indicate the model inference temperature.
+            keep: A boolean indicate whether continue the iteration,
+                which starts a new record anyway when the model is changed.
+            session: A string indicate the identity of the chat session.
+            cached: A boolean indicate whether the response is read from cache.
+            truncated: A boolean indicate whether generation stopped at `max_tokens`.
+            metrics: A dictionary indicate the measurements of the inference.
+        '''
+        # Discriminate whether continue the iteration of the session
+        section = self._sessions.get(session)
+        if section == None or not keep or section.model != model:
+            # Stop continuing former record of the session
+            if section != None:
+                self._disown(section)
             # Make history content of the inference
             section = Section(self.id,'chat',model,addition,role,temperature)
+            self._sessions[session] = section
+            self._owned[self.id] = session
+            self._push(section)
             # Update history ID
             self.id += 1
-        # Make iteration content
-        new_iteration = make_new_iteration(input,output)
         # Append history intertion
-        section.iteration.append(new_iteration)
-        # Append history attribute
+        self._record(section,make_new_iteration(input,output,cached,truncated,metrics))
+
+    def release(self,session:str) -> None:
+        '''The method is defined to stop continuing records of a chat session.
+        Args:
+            session: A string indicate the identity of the chat session.
+        '''
+        with self._lock:
+            section = self._sessions.pop(session,None)
+            if section != None:
+                self._disown(section)
+
+    ## ============================== Persist Methods ============================== ##
+    def _push(self,section:Section) -> None:
+        '''The method is defined to append a new record to history.
+        Args:
+            section: A dataclass indicate the new log record.
+        '''
+        # Discriminate whether keep all records in memory
+        if self._sink == None:
+            self._history.append(section)
+            return
+        # Forget owner of last record which can't be continued any more
+        if self._history:
+            last = self._history.pop()
+            session = self._owned.get(last.id)
+            if session != None and self._sessions.get(session) is not last:
+                del self._owned[last.id]
+        # Keep only the last record and persist the new one
         self._history.append(section)
+        self._sink.write(make_section_event(section))
+
+    def _disown(self,section:Section) -> None:
+        '''The method is defined to forget owner session of a record persisted by sink,
+        unless it's the last record which can't be continued as default session.
+        Args:
+            section: A dataclass indicate the log record no longer continued.
+        '''
+        if self._sink and section is not self._history[-1]:
+            self._owned.pop(section.id,None)
+
+    def _record(self,section:Section,iteration:dict) -> None:
+        '''The method is defined to append a new iteration to a record.
+        Args:
+            section: A dataclass indicate the continued log record.
+            iteration: A dictionary indicate the record of the iteration.
+        '''
+        if self._sink == None:
+            section.iteration.append(iteration)
+        else:
+            self._sink.write(make_iteration_event(section.id,iteration))
+
+    def close(self) -> None:
+        '''The method is defined to persist buffered records and release the sink.'''
+        if self._sink:
+            self._sink.close()
 
 ## ============================== Record Read Method ============================== ##
-    def get(self,id:int) -> dict | list:
-        '''The method is defined to read log records in reasonable way.
+    def get(self,id:int,offset:int=0,limit:int=None,
+            type:str=None,model:str=None,
+            since:float=None,until:float=None) -> dict | list:
+        '''The method is defined to read log records in reasonable way,
+        which serializes only the read records on each call.
         Args:
             id: A integer indicate the specific inference log.\n
                 Start from 0. \n
-                And read all records by set it minus.
+                And read records selected by other arguments by set it minus.
+            offset: A integer indicate the number of selected records skipped.
+            limit: A integer indicate the maximum number of read records,
+                and read all selected records by set it to `None`.
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
         Returns:
             A dictionary indicate the specific log records.
-            Or a list of each log record's dictionary. 
+            Or a list of each selected log record's dictionary. 
         '''
-        # Discriminate whether return all log records
-        if id >= 0:
-            # Seek and transfrom specific log record
-            try:
-                section = deepcopy(self._history[id])
-            except IndexError:
+        # Discriminate whether read log records persisted by sink
+        if self._sink:
+            self._sink.flush()
+            if id < 0:
+                return self._sink.select(offset,limit,type,model,since,until)
+            output = self._sink.read(id)
+            if output == None:
                 raise IndexError('Error: Record not created.')
+            return output
+        with self._lock:
+            # Discriminate whether return all log records
+            if id >= 0:
+                # Seek and transfrom specific log record
+                try:
+                    section = self._history[id]
+                except IndexError:
+                    raise IndexError('Error: Record not created.')
+                else:
+                    output = convert2readable_log(section)
             else:
-                output = convert2readable_log(section)
-        else:
-            # Transform all log records
-            output = []
-            for section in self._history:
-                output.append(convert2readable_log(deepcopy(section)))
+                # Transform selected log records
+                output = [convert2readable_log(section) for section in
+                          self._select(offset,limit,type,model,since,until)]
         # Return reasonable log record
         return output
+
+    def _select(self,offset:int,limit:int|None,
+                type:str|None,model:str|None,
+                since:float|None,until:float|None) -> list:
+        '''The method is defined to select records kept in memory,
+        which costs time by selected records rather than all records.
+        Args:
+            offset: A integer indicate the number of selected records skipped.
+            limit: A integer indicate the maximum number of selected records.
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
+        Returns:
+            A list of selected records in order.
+        '''
+        # Find records within time range, which are created in order
+        start = 0
+        end = len(self._history)
+        if since != None:
+            start = bisect_left(self._history,since,
+                                key=attrgetter('create_at'))
+        if until != None:
+            end = bisect_right(self._history,until,
+                              key=attrgetter('create_at'))
+        # Slice records directly without other filters
+        if type == None and model == None:
+            start = min(start + max(offset,0),end)
+            if limit != None:
+                end = min(end,start + max(limit,0))
+            return self._history[start:end]
+        # Filter records until enough records are selected
+        selected = (self._history[index] for index in range(start,end)
+                    if (type == None or self._history[index].type == type)
+                    and (model == None or self._history[index].model == model))
+        stop = None if limit == None else max(offset,0) + max(limit,0)
+        return list(islice(selected,max(offset,0),stop))
+
+## ============================= Record Stats Method ============================= ##
+    def stats(self,type:str=None,model:str=None,
+              since:float=None,until:float=None) -> dict:
+        '''The method is defined to aggregate measurements of selected log records.
+        Args:
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
+        Returns:
+            A dictionary indicate the counts of inferences,
+            cached and truncated responses, the sums of token counts,
+            and the mean, percentiles and maximum of latency,
+            time to first token and tokens per second.
+        '''
+        return make_stats(self.get(-1,0,None,type,model,since,until))
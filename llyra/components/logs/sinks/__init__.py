@@ -0,0 +1,4 @@
+from .basic import Sink
+from .jsonl import JsonlSink
+from .sqlite import SqliteSink
+from .funcs import make_sink
\ No newline at end of file
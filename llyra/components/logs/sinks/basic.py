@@ -0,0 +1,150 @@
+from abc import ABC, abstractmethod
+from queue import Queue, Empty
+from threading import Thread, Lock
+from time import monotonic
+from warnings import warn
+import atexit
+
+class Sink(ABC):
+    '''The class is defined to define basic attributes and methods,
+    for keeping log records out of memory with a buffered background writer.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,buffer:int=256,interval:float=1.0) -> None:
+        '''The method is defined for initialize Sink class object.
+        Args:
+            buffer: A integer indicate the maximum records persisted at once.
+            interval: A float indicate the maximum seconds a record waits in buffer.
+        '''
+        # Get buffer attributes
+        self.buffer = max(1,buffer)
+        self.interval = interval
+        # Initialize writer attributes
+        self._queue:Queue = Queue()
+        self._lock = Lock()
+        self._flush = object()
+        self._stop = object()
+        self._writer = Thread(target=self._run,daemon=True)
+        self._writer.start()
+        # Persist buffered records before interpreter exits
+        atexit.register(self.close)
+
+    ## ============================== Write Methods ============================== ##
+    def write(self,record:dict) -> None:
+        '''The method is defined for put a log record into write buffer.
+        Args:
+            record: A dictionary indicate a `section` or `iteration` log event.
+        '''
+        self._queue.put(record)
+
+    def flush(self) -> None:
+        '''The method is defined for wait until buffered records are persisted.'''
+        if self._writer.is_alive():
+            self._queue.put(self._flush)
+            self._queue.join()
+
+    def close(self) -> None:
+        '''The method is defined for persist buffered records and stop the writer.'''
+        if self._writer.is_alive():
+            self._queue.put(self._stop)
+            self._writer.join()
+            atexit.unregister(self.close)
+            with self._lock:
+                self._release()
+
+    ## ============================== Read Methods ============================== ##
+    def read(self,id:int) -> dict|None:
+        '''The method is defined for read a readable log record.
+        Args:
+            id: A integer indicate the identity of the log record.
+        Returns:
+            A dictionary indicate the readable log record,
+            or `None` indicate the record isn't created.
+        '''
+        with self._lock:
+            return self._read(id)
+
+    def select(self,offset:int=0,limit:int=None,
+               type:str=None,model:str=None,
+               since:float=None,until:float=None) -> list:
+        '''The method is defined for read readable log records selected by filters.
+        Args:
+            offset: A integer indicate the number of selected records skipped.
+            limit: A integer indicate the maximum number of read records,
+                and read all selected records by set it to `None`.
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
+        Returns:
+            A list of each selected readable log record's dictionary in order.
+        '''
+        with self._lock:
+            if limit != None:
+                limit = max(limit,0)
+            return self._select(max(offset,0),limit,type,model,since,until)
+
+    def next_id(self) -> int:
+        '''The method is defined for get identity of next log record,
+        so records continue after the persisted ones.
+        Returns:
+            A integer indicate the identity of next log record.
+        '''
+        with self._lock:
+            return self._next_id()
+
+    ## ============================= Internal Methods ============================= ##
+    def _run(self) -> None:
+        '''The method is defined for persist buffered records in batches.'''
+        while True:
+            # Collect records until buffer is full, interval passes or flush is asked
+            batch = [self._queue.get()]
+            deadline = monotonic() + self.interval
+            while (len(batch) < self.buffer
+                   and batch[-1] is not self._flush and batch[-1] is not self._stop):
+                remain = deadline - monotonic()
+                if remain <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remain))
+                except Empty:
+                    break
+            # Persist collected records
+            records = [record for record in batch
+                       if record is not self._flush and record is not self._stop]
+            if records:
+                try:
+                    with self._lock:
+                        self._persist(records)
+                except Exception as error:
+                    message = f'Failed to persist {len(records)} log records: {error}'
+                    warn(message,RuntimeWarning)
+            for _ in batch:
+                self._queue.task_done()
+            # Discriminate whether stop the writer
+            if batch[-1] is self._stop:
+                return
+
+    @abstractmethod
+    def _persist(self,records:list) -> None:
+        '''The method is defined for persist a batch of log events.
+        Args:
+            records: A list of dictionaries indicate log events in order.
+        '''
+
+    @abstractmethod
+    def _read(self,id:int) -> dict|None:
+        '''The method is defined for read a readable log record from disk.'''
+
+    @abstractmethod
+    def _select(self,offset:int,limit:int|None,
+                type:str|None,model:str|None,
+                since:float|None,until:float|None) -> list:
+        '''The method is defined for read selected readable log records from disk.'''
+
+    @abstractmethod
+    def _next_id(self) -> int:
+        '''The method is defined for get identity of next log record from disk.'''
+
+    def _release(self) -> None:
+        '''The method is defined for release files held by the sink.'''
+        pass
\ No newline at end of file
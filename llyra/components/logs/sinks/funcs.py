@@ -0,0 +1,20 @@
+from .basic import Sink
+from .jsonl import JsonlSink
+from .sqlite import SqliteSink
+from ...configs.utils import Logs
+
+## =========================== Function `make_sink()` =========================== ##
+def make_sink(config:Logs) -> Sink|None:
+    '''The function is defined for make log sink with log config.
+    Args:
+        config: A dataclass indicate parameters of log section.
+    Returns:
+        A Sink instance indicate the configured disk sink,
+        or `None` indicate keeping log records in memory.
+    '''
+    if config.sink == 'jsonl':
+        return JsonlSink(config.path,config.segment,config.buffer,config.interval)
+    elif config.sink == 'sqlite':
+        return SqliteSink(config.path,config.buffer,config.interval)
+    else:
+        return None
\ No newline at end of file
@@ -0,0 +1,247 @@
+from .basic import Sink
+from ..utils import convert2readable_event, convert2readable_iteration
+from pathlib import Path
+from math import inf
+import json
+
+class JsonlSink(Sink):
+    '''The class is defined for keeping log events in rotated JSONL segments,
+    which are append-only and read by scanning.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,path:str|Path,segment:int=67108864,
+                 buffer:int=256,interval:float=1.0) -> None:
+        '''The method is defined for initialize JsonlSink class object.
+        Args:
+            path: A string or Path instance indicate the directory of segments.
+            segment: A integer indicate the bytes of a segment before rotation.
+            buffer: A integer indicate the maximum records persisted at once.
+            interval: A float indicate the maximum seconds a record waits in buffer.
+        '''
+        # Get segment attributes
+        self.path = Path(path)
+        self.segment = segment
+        self.path.mkdir(parents=True,exist_ok=True)
+        # Index existing segments by identity and creation of their first log record
+        self._segments:list = sorted(self.path.glob('llyra-*.jsonl'))
+        firsts = [self._first(file) for file in self._segments]
+        self._starts:list = [None if first == None else first['id'] for first in firsts]
+        self._times:list = [None if first == None else first['create_at'] for first in firsts]
+        # Index lowest identity continued in each segment once it's read
+        self._lowest:list = [None] * len(self._segments)
+        # Open last segment for appending
+        if not self._segments:
+            self._rotate()
+        self._file = open(self._segments[-1],'a',encoding='utf-8')
+        # Initialize parent class
+        super().__init__(buffer,interval)
+
+    ## ============================= Internal Methods ============================= ##
+    def _persist(self,records:list) -> None:
+        '''The method is defined for append a batch of log events to segments.
+        Args:
+            records: A list of dictionaries indicate log events in order.
+        '''
+        for record in records:
+            # Discriminate whether rotate to a new segment
+            if self._file.tell() >= self.segment:
+                self._file.close()
+                self._rotate()
+                self._file = open(self._segments[-1],'a',encoding='utf-8')
+            # Keep identity of first log record of the segment
+            if record['event'] == 'section' and self._starts[-1] == None:
+                self._starts[-1] = record['id']
+                self._times[-1] = record['create_at']
+            # Keep lowest identity continued in the segment
+            elif record['event'] == 'iteration' and self._lowest[-1] != None:
+                self._lowest[-1] = min(self._lowest[-1],record['id'])
+            self._file.write(json.dumps(record,ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def _read(self,id:int) -> dict|None:
+        '''The method is defined for read a readable log record from segments,
+        scanning from the segment creating it.
+        Args:
+            id: A integer indicate the identity of the log record.
+        Returns:
+            record: A dictionary indicate the readable log record,
+                or `None` indicate the record isn't created.
+        '''
+        record = None
+        for index in range(self._locate(id),len(self._segments)):
+            # Skip segments not continuing the created log record
+            if record != None and self._continued(index) > id:
+                continue
+            for event in self._events(index):
+                if event['id'] != id:
+                    continue
+                if event['event'] == 'section':
+                    record = convert2readable_event(event)
+                elif record != None:
+                    record['iteration'].append(convert2readable_iteration(event))
+        return record
+
+    def _select(self,offset:int,limit:int|None,
+                type:str|None,model:str|None,
+                since:float|None,until:float|None) -> list:
+        '''The method is defined for read selected readable log records from segments.
+        Args:
+            offset: A integer indicate the number of selected records skipped.
+            limit: A integer indicate the maximum number of read records.
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
+        Returns:
+            A list of each selected readable log record's dictionary in order.
+        '''
+        records = {}
+        start, matched = self._seek(offset,type,model,since)
+        for index in range(start,len(self._segments)):
+            # Skip segments not continuing read log records once enough are read
+            if (limit != None and len(records) >= limit
+                    and (not records or self._continued(index) > max(records))):
+                continue
+            for event in self._events(index):
+                if event['event'] == 'iteration':
+                    # Append iteration of selected log record
+                    if event['id'] in records:
+                        records[event['id']]['iteration'].append(
+                            convert2readable_iteration(event))
+                    continue
+                # Discriminate whether the log record is selected
+                if ((type != None and event['type'] != type)
+                        or (model != None and event['model'] != model)
+                        or (since != None and event['create_at'] < since)
+                        or (until != None and event['create_at'] > until)):
+                    continue
+                matched += 1
+                if matched > offset and (limit == None or len(records) < limit):
+                    records[event['id']] = convert2readable_event(event)
+        return list(records.values())
+
+    def _next_id(self) -> int:
+        '''The method is defined for get identity of next log record from segments.
+        Returns:
+            A integer indicate the identity of next log record.
+        '''
+        # Seek the last segment creating any log record
+        for index in range(len(self._segments) - 1,-1,-1):
+            if self._starts[index] != None:
+                break
+        else:
+            return 0
+        # Find the last created log record
+        last = self._starts[index]
+        for event in self._scan(index):
+            if event['event'] == 'section':
+                last = max(last,event['id'])
+        return last + 1
+
+    def _release(self) -> None:
+        '''The method is defined for close the appended segment.'''
+        self._file.close()
+
+    def _rotate(self) -> None:
+        '''The method is defined for start a new empty segment.'''
+        number = int(self._segments[-1].stem.split('-')[-1]) + 1 if self._segments else 0
+        self._segments.append(self.path / f'llyra-{number:08d}.jsonl')
+        self._starts.append(None)
+        self._times.append(None)
+        self._lowest.append(inf)
+        self._segments[-1].touch()
+
+    def _locate(self,id:int) -> int:
+        '''The method is defined for find the segment which may create a log record.
+        Args:
+            id: A integer indicate the identity of the log record.
+        Returns:
+            A integer indicate the index of the segment.
+        '''
+        index = 0
+        for position, start in enumerate(self._starts):
+            # Skip segments without log record
+            if start == None:
+                continue
+            if start > id:
+                break
+            index = position
+        return index
+
+    def _seek(self,offset:int,type:str|None,model:str|None,since:float|None) -> tuple:
+        '''The method is defined for find the first segment which may create
+        selected log records, since records are created in order of identity and time.
+        Args:
+            offset: A integer indicate the number of selected records skipped.
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+        Returns:
+            index: A integer indicate the index of the first scanned segment.
+            matched: A integer indicate the number of selected records before it.
+        '''
+        starts = [start for start in self._starts if start != None]
+        if not starts:
+            return 0, 0
+        # Skip segments created before the earliest creation timestamp
+        if since != None:
+            index = 0
+            for position, time in enumerate(self._times):
+                if time == None:
+                    continue
+                if time >= since:
+                    break
+                index = position
+            return index, 0
+        # Skip segments before the record at offset when every record is selected
+        if type == None and model == None:
+            index = self._locate(starts[0] + offset)
+            return index, self._starts[index] - starts[0]
+        return 0, 0
+
+    def _continued(self,index:int) -> float:
+        '''The method is defined for get the lowest identity of log records
+        continued by iterations in a segment, reading the segment once.
+        Args:
+            index: A integer indicate the index of the segment.
+        Returns:
+            A number indicate the lowest identity, or infinity without iteration.
+        '''
+        if self._lowest[index] == None:
+            self._lowest[index] = min((event['id'] for event in self._events(index)
+                                       if event['event'] == 'iteration'),default=inf)
+        return self._lowest[index]
+
+    def _scan(self,index:int):
+        '''The method is defined for iterate log events from a segment to the last.
+        Args:
+            index: A integer indicate the index of the first scanned segment.
+        Yields:
+            A dictionary indicate the log event in order.
+        '''
+        for position in range(index,len(self._segments)):
+            yield from self._events(position)
+
+    def _events(self,index:int):
+        '''The method is defined for iterate log events of a segment.
+        Args:
+            index: A integer indicate the index of the segment.
+        Yields:
+            A dictionary indicate the log event in order.
+        '''
+        with open(self._segments[index],encoding='utf-8') as segment:
+            for line in segment:
+                yield json.loads(line)
+
+    def _first(self,file:Path) -> dict|None:
+        '''The method is defined for read the event of first log record of a segment.
+        Args:
+            file: A Path instance indicate the segment file.
+        Returns:
+            A dictionary indicate the `section` event, or `None` without log record.
+        '''
+        with open(file,encoding='utf-8') as segment:
+            for line in segment:
+                event = json.loads(line)
+                if event['event'] == 'section':
+                    return event
+        return None
\ No newline at end of file
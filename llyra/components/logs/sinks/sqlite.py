@@ -0,0 +1,162 @@
+from .basic import Sink
+from pathlib import Path
+import sqlite3
+import json
+
+class SqliteSink(Sink):
+    '''The class is defined for keeping log events in a SQLite database,
+    which reads a log record by its identity through index.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,path:str|Path,buffer:int=256,interval:float=1.0) -> None:
+        '''The method is defined for initialize SqliteSink class object.
+        Args:
+            path: A string or Path instance indicate the directory of database file.
+            buffer: A integer indicate the maximum records persisted at once.
+            interval: A float indicate the maximum seconds a record waits in buffer.
+        '''
+        # Get database attributes
+        self.path = Path(path)
+        self.path.mkdir(parents=True,exist_ok=True)
+        # Open database shared by writer and readers under lock
+        self._connection = sqlite3.connect(self.path / 'llyra.db',
+                                           check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('''CREATE TABLE IF NOT EXISTS sections (
+            id INTEGER PRIMARY KEY, type TEXT, model TEXT, addition TEXT,
+            role TEXT, temperature REAL, create_at REAL)''')
+        self._connection.execute('''CREATE TABLE IF NOT EXISTS iterations (
+            id INTEGER, query TEXT, response TEXT, extra TEXT)''')
+        # Add column of extra iteration fields to database of former version
+        columns = [row[1] for row in
+                   self._connection.execute('PRAGMA table_info(iterations)')]
+        if 'extra' not in columns:
+            self._connection.execute('ALTER TABLE iterations ADD COLUMN extra TEXT')
+        self._connection.execute('''CREATE INDEX IF NOT EXISTS iterations_id
+            ON iterations (id)''')
+        self._connection.execute('''CREATE INDEX IF NOT EXISTS sections_create_at
+            ON sections (create_at)''')
+        self._connection.commit()
+        # Initialize parent class
+        super().__init__(buffer,interval)
+
+    ## ============================= Internal Methods ============================= ##
+    def _persist(self,records:list) -> None:
+        '''The method is defined for insert a batch of log events in one transaction.
+        Args:
+            records: A list of dictionaries indicate log events in order.
+        '''
+        with self._connection:
+            for record in records:
+                if record['event'] == 'section':
+                    role = json.dumps(record['role']) if record['role'] else None
+                    self._connection.execute(
+                        'INSERT INTO sections VALUES (?,?,?,?,?,?,?)',
+                        (record['id'],record['type'],record['model'],
+                         record['addition'],role,
+                         record['temperature'],record['create_at']))
+                else:
+                    extra = {key: value for key, value in record.items()
+                             if key not in ('event','id','query','response')}
+                    self._connection.execute(
+                        'INSERT INTO iterations VALUES (?,?,?,?)',
+                        (record['id'],record['query'],record['response'],
+                         json.dumps(extra) if extra else None))
+
+    def _read(self,id:int) -> dict|None:
+        '''The method is defined for read a readable log record from database.
+        Args:
+            id: A integer indicate the identity of the log record.
+        Returns:
+            record: A dictionary indicate the readable log record,
+                or `None` indicate the record isn't created.
+        '''
+        row = self._connection.execute('SELECT * FROM sections WHERE id = ?',
+                                       (id,)).fetchone()
+        if row == None:
+            return None
+        record = self._convert(row)
+        for row in self._connection.execute(
+                '''SELECT id, query, response, extra FROM iterations
+                WHERE id = ? ORDER BY rowid''',(id,)):
+            record['iteration'].append(self._iteration(row))
+        return record
+
+    def _select(self,offset:int,limit:int|None,
+                type:str|None,model:str|None,
+                since:float|None,until:float|None) -> list:
+        '''The method is defined for read selected readable log records from database.
+        Args:
+            offset: A integer indicate the number of selected records skipped.
+            limit: A integer indicate the maximum number of read records.
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
+        Returns:
+            A list of each selected readable log record's dictionary in order.
+        '''
+        # Make conditions of filters
+        conditions, parameters = [], []
+        for condition, parameter in (('type = ?',type),('model = ?',model),
+                                     ('create_at >= ?',since),('create_at <= ?',until)):
+            if parameter != None:
+                conditions.append(condition)
+                parameters.append(parameter)
+        where = ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+        # Read selected log records
+        records = {row[0]: self._convert(row) for row in self._connection.execute(
+            f'SELECT * FROM sections{where} ORDER BY id LIMIT ? OFFSET ?',
+            (*parameters,-1 if limit == None else limit,offset))}
+        if not records:
+            return []
+        # Read iterations within identity range of selected log records
+        for row in self._connection.execute(
+                '''SELECT id, query, response, extra FROM iterations
+                WHERE id BETWEEN ? AND ? ORDER BY rowid''',
+                (min(records),max(records))):
+            if row[0] in records:
+                records[row[0]]['iteration'].append(self._iteration(row))
+        return list(records.values())
+
+    def _next_id(self) -> int:
+        '''The method is defined for get identity of next log record from database.
+        Returns:
+            A integer indicate the identity of next log record.
+        '''
+        row = self._connection.execute('SELECT MAX(id) FROM sections').fetchone()
+        return 0 if row[0] == None else row[0] + 1
+
+    def _release(self) -> None:
+        '''The method is defined for close the database.'''
+        self._connection.close()
+
+    def _convert(self,row:tuple) -> dict:
+        '''The method is defined for covert a row of log record to readable format.
+        Args:
+            row: A tuple indicate the row of `sections` table.
+        Returns:
+            A dictionary indicate the readable log record without iterations.
+        '''
+        id, type, model, addition, role, temperature, create_at = row
+        return {'id': id,
+                'type': type,
+                'model': model,
+                'addition': addition,
+                'role': json.loads(role) if role else None,
+                'temperature': temperature,
+                'iteration': [],
+                'create_at': create_at}
+
+    def _iteration(self,row:tuple) -> dict:
+        '''The method is defined for covert a row of iteration to readable format.
+        Args:
+            row: A tuple indicate the row of `iterations` table.
+        Returns:
+            iteration: A dictionary indicate the record of the iteration.
+        '''
+        id, query, response, extra = row
+        iteration = {'query': query,'response': response}
+        if extra:
+            iteration.update(json.loads(extra))
+        return iteration
\ No newline at end of file
@@ -1,2 +1,5 @@
 from .funcs import make_new_iteration, convert2readable_log
+from .funcs import make_section_event, make_iteration_event
+from .funcs import convert2readable_event, convert2readable_iteration
+from .funcs import make_metrics, make_stats, compute_percentile
 from .classes import Section
\ No newline at end of file
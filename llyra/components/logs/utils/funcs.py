@@ -1,28 +1,191 @@
 from .classes import Section
 
 ## ======================== Function `make_new_iteration()` ======================== ##
-def make_new_iteration(input:str,output:str) -> dict:
+def make_new_iteration(input:str,output:str,cached:bool=False,
+                       truncated:bool=False,metrics:dict=None) -> dict:
     '''The function is defined for make valid record of each iteration.
     Agrs:
         input: A string indicate input content for model inference. 
         output: A string indicate response of model inference.
+        cached: A boolean indicate whether the response is read from cache,
+            which is only recorded when it's `True`.
+        truncated: A boolean indicate whether generation stopped at `max_tokens`,
+            which is only recorded when it's `True`.
+        metrics: A dictionary indicate the measurements of the inference.
     Returns:
-        A dictionary indicate the record of the iteration.
+        iteration: A dictionary indicate the record of the iteration.
+    '''
+    iteration = {'query': input, 'response': output}
+    if cached:
+        iteration['cached'] = True
+    if truncated:
+        iteration['truncated'] = True
+    if metrics:
+        iteration['metrics'] = metrics
+    return iteration
+
+## ========================== Function `make_metrics()` ========================== ##
+def make_metrics(latency:float,ttft:float|None,
+                 prompt_tokens:int|None,completion_tokens:int|None,
+                 generation:float=None) -> dict:
+    '''The function is defined for make measurements of an inference.
+    Args:
+        latency: A float indicate the wall-clock seconds of the inference.
+        ttft: A float indicate the seconds to the first response piece,
+            or `None` indicate it isn't observed.
+        prompt_tokens: A integer indicate the tokens of the prompt,
+            or `None` indicate it isn't reported.
+        completion_tokens: A integer indicate the tokens of the response,
+            or `None` indicate it isn't reported.
+        generation: A float indicate the seconds of generation reported by the backend,
+            which also estimates the seconds to the first token when it isn't observed.
+    Returns:
+        metrics: A dictionary indicate the latency, time to first token,
+            token counts and generated tokens per second.
+    '''
+    # Estimate time to first token by generation seconds reported
+    if ttft == None and generation:
+        ttft = max(latency - generation,0.0)
+    # Compute generated tokens per second
+    if generation == None:
+        generation = latency - ttft if ttft != None else latency
+    tps = None
+    if completion_tokens and generation > 0:
+        tps = completion_tokens / generation
+    metrics = {'latency': latency,
+               'ttft': ttft,
+               'prompt_tokens': prompt_tokens,
+               'completion_tokens': completion_tokens,
+               'tps': tps}
+    return metrics
+
+## ======================== Function `compute_percentile()` ======================== ##
+def compute_percentile(values:list,percent:float) -> float:
+    '''The function is defined for compute percentile of sorted values
+    by linear interpolation between closest ranks.
+    Args:
+        values: A list of floats indicate the sorted values.
+        percent: A float indicate the percent of the percentile.
+    Returns:
+        A float indicate the percentile value.
+    '''
+    rank = (len(values) - 1) * percent / 100
+    low = int(rank)
+    high = min(low + 1,len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+## ========================== Function `make_stats()` ========================== ##
+def make_stats(records:list) -> dict:
+    '''The function is defined for aggregate measurements of log records.
+    Args:
+        records: A list of dictionaries indicate the readable log records.
+    Returns:
+        stats: A dictionary indicate the counts of inferences,
+            cached and truncated responses, the sums of token counts,
+            and the mean, percentiles and maximum of each measurement.
     '''
-    return {'query': input, 'response': output}
+    # Collect measurements of each iteration
+    iterations = [iteration for record in records for iteration in record['iteration']]
+    samples = {'latency': [],'ttft': [],'tps': []}
+    stats = {'count': len(iterations),
+             'cached': sum(1 for iteration in iterations if iteration.get('cached')),
+             'truncated': sum(1 for iteration in iterations if iteration.get('truncated')),
+             'prompt_tokens': 0,
+             'completion_tokens': 0}
+    for iteration in iterations:
+        metrics = iteration.get('metrics') or {}
+        for name in ('prompt_tokens','completion_tokens'):
+            stats[name] += metrics.get(name) or 0
+        for name, values in samples.items():
+            if metrics.get(name) != None:
+                values.append(metrics[name])
+    # Summarize each measurement
+    for name, values in samples.items():
+        if not values:
+            stats[name] = None
+            continue
+        values.sort()
+        stats[name] = {'mean': sum(values) / len(values),
+                       'p50': compute_percentile(values,50),
+                       'p90': compute_percentile(values,90),
+                       'p99': compute_percentile(values,99),
+                       'max': values[-1]}
+    return stats
 
 ## ======================= Function `convert2readable_log()` ======================= ##
 def convert2readable_log(section:Section) -> dict:
-    '''The function is defined for covert internal log format to readable format.
+    '''The function is defined for covert internal log format to readable format,
+    which copies containers of the record instead of deep copying it.
     Args:
         section: A dataclass indicate log record of inference.
     Returns:
         readable_record: A dictionary indicate the readable log record of inference.
     '''
     # Covert record in first layer
-    readable_record = vars(section)
+    readable_record = dict(vars(section))
+    readable_record['iteration'] = [dict(iteration) for iteration in section.iteration]
+    # Copy measurements nested in each iteration
+    for iteration in readable_record['iteration']:
+        if iteration.get('metrics'):
+            iteration['metrics'] = dict(iteration['metrics'])
     # Discriminate whether necessary to convert record in second layer
     if section.role:
-        readable_record['role'] = vars(section.role)
+        readable_record['role'] = dict(vars(section.role))
     # Return readable record
-    return readable_record
\ No newline at end of file
+    return readable_record
+
+## ======================== Function `make_section_event()` ======================== ##
+def make_section_event(section:Section) -> dict:
+    '''The function is defined for make log event of a new log record.
+    Args:
+        section: A dataclass indicate log record of inference.
+    Returns:
+        A dictionary indicate the log event of the record without iterations.
+    '''
+    return {'event': 'section',
+            'id': section.id,
+            'type': section.type,
+            'model': section.model,
+            'addition': section.addition,
+            'role': vars(section.role).copy() if section.role else None,
+            'temperature': section.temperature,
+            'create_at': section.create_at}
+
+## ======================= Function `make_iteration_event()` ======================= ##
+def make_iteration_event(id:int,iteration:dict) -> dict:
+    '''The function is defined for make log event of a new iteration.
+    Args:
+        id: A integer indicate the identity of the log record of the iteration.
+        iteration: A dictionary indicate the record of the iteration.
+    Returns:
+        A dictionary indicate the log event of the iteration.
+    '''
+    return {'event': 'iteration', 'id': id, **iteration}
+
+## ====================== Function `convert2readable_event()` ====================== ##
+def convert2readable_event(event:dict) -> dict:
+    '''The function is defined for covert log event of a record to readable format.
+    Args:
+        event: A dictionary indicate the log event of a new log record.
+    Returns:
+        A dictionary indicate the readable log record without iterations.
+    '''
+    return {'id': event['id'],
+            'type': event['type'],
+            'model': event['model'],
+            'addition': event['addition'],
+            'role': event['role'],
+            'temperature': event['temperature'],
+            'iteration': [],
+            'create_at': event['create_at']}
+
+## ==================== Function `convert2readable_iteration()` ==================== ##
+def convert2readable_iteration(event:dict) -> dict:
+    '''The function is defined for covert log event of an iteration to readable format.
+    Args:
+        event: A dictionary indicate the log event of the iteration.
+    Returns:
+        A dictionary indicate the record of the iteration.
+    '''
+    return {key: value for key, value in event.items()
+            if key != 'event' and key != 'id'}
\ No newline at end of file
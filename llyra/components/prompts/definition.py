@@ -1,5 +1,8 @@
-from .utils import make_new_inference
+from .utils import make_new_inference, make_summary_prompt
 from ..utils import Role
+from ..strategys.utils import Context
+from contextlib import contextmanager
+from threading import Lock, get_ident
 
 class Prompt():
     '''The class is defined to define universal attributes and methods,
@@ -7,53 +10,78 @@ class Prompt():
     ## ============================= Initialize Method ============================= ##
     def __init__(self) -> None:
         '''The method is defined for initialize Prompt class object.'''
-        # Initialize chat iteration attribute
-        self._iteration:list = []
+        # Initialize chat message buffer attribute,
+        # which is additional prompt, iteration records and pending input in order
+        self._messages:list = []
+        # Initialize buffer state attributes
+        self._addition:dict = None
+        self._pending:bool = False
+        # Initialize token counts of additional prompt, iteration records and pending input
+        self._head_count:int = 0
+        self._counts:list = []
+        self._total:int = 0
+        self._pending_count:int = 0
+        # Initialize characters count of chat iteration
+        self.size:int = 0
+        # Initialize lock attributes serializing iterations of the chat across threads,
+        # which are the lock and identity of its holding thread
+        self.lock = Lock()
+        self._owner:int = None
 
     ## ============================= Generate Methods ============================= ##
     def call(self,content:str) -> str:
         '''The method is defined for generate prompt of single call inference.
-        Args: 
+        Args:
             content: A string indicate the input content for model inference.
         Returns:
-            prompt: A string indicate proper structed content for inference.            
+            prompt: A string indicate proper structed content for inference.
         '''
         # Make structed prompt
         prompt = content
         # Return prompte for inference
-        return prompt 
+        return prompt
 
-    def chat(self,role:Role,content:str,addition:str) -> list:
+    def chat(self,role:Role,content:str,addition:str,
+             context:Context=None,counter=None,summarize=None) -> list:
         '''The method is defined for generate prompt of iterative chat inference.
+        The returned list is the internal buffer reused across iterations,
+        so it should be consumed before next iteration and never be modified.
         Args:
             role: A dataclass indicate input and prompt role of
                 iterative chat inference.
             content: A string indicate the input content for model inference.
             addition: A string indicate additional prompt for model inference.
+            context: A dataclass indicate the context window strategy.
+            counter: A callable indicate the tokenizer counting tokens of a string.
+            summarize: A callable indicate the inference making summary
+                from a summary prompt, and fallback to `window` policy without it.
         Returns:
             prompt: A list indicate proper structed content for chat inference.
         '''
-        # Get iterative chat role prompt parameters
-        prompt = role.prompt
-        input = role.input
-        # Get iteration record
-        iteration_prompt = self._iteration[:]
+        # Discard input left by unfinished iteration
+        self._discard()
         # Discrinimate whether and how to add additional prompt
         if addition:
-            additional_prompt = make_new_inference(role=prompt,
+            additional_prompt = make_new_inference(role=role.prompt,
                                                    content=addition)
-            iteration_prompt.insert(0,additional_prompt)
+        else:
+            additional_prompt = None
+        self._place(additional_prompt)
+        # Discriminate whether shrink iteration history into context window
+        if context and counter and (context.budget or context.policy == 'last'):
+            self._fit(role,content,context,counter,summarize)
         # Make structed prompt
-        user_prompt = make_new_inference(role=input,content=content)
-        iteration_prompt.append(user_prompt)
+        user_prompt = make_new_inference(role=role.input,content=content)
+        self._messages.append(user_prompt)
+        self._pending = True
         # Return prompt for inference
-        return iteration_prompt
-    
+        return self._messages
+
     ## ======================== Additional Method for Chat ======================== ##
     def iterate(self,role:Role,input:str,output:str,keep:bool) -> None:
         '''The method is defined for update chat iteration history record.
         Args:
-            role: A dataclass indicate the input and output role of 
+            role: A dataclass indicate the input and output role of
                 the iteration record.
             input: A string indicate the input content of the iteration record.
             output: A string indicate the output content of the iteration record.
@@ -61,15 +89,176 @@ class Prompt():
         '''
         # Discriminate whether continue last chat iteration
         if not keep:
-            self._iteration = []
+            del self._messages[self._head():]
+            self._pending = False
+            self.size = 0
+            self._counts = []
+            self._total = 0
         # Discriminate whether make new iteration records
         if role == None:
             return
         # Append input record to iteration record attribute
         if input:
-            input_record = make_new_inference(role.input,input)
-            self._iteration.append(input_record)
+            # Discriminate whether the input is pending from prompt generation
+            if self._pending and self._messages[-1]['content'] == input:
+                self._pending = False
+                # Keep token count of the input when counts are up to date
+                if len(self._counts) == len(self._messages) - self._head() - 1:
+                    self._counts.append(self._pending_count)
+                    self._total += self._pending_count
+            else:
+                self._discard()
+                input_record = make_new_inference(role.input,input)
+                self._messages.append(input_record)
+            self.size += len(input)
         # Append output record to iteration record attribute
         if output:
+            self._discard()
             output_record = make_new_inference(role.output,output)
-            self._iteration.append(output_record)
\ No newline at end of file
+            self._messages.append(output_record)
+            self.size += len(output)
+
+    @property
+    def iteration(self) -> list:
+        '''The property is defined for read a copy of chat iteration history record.
+        Returns:
+            A list indicate the iteration records without additional prompt.
+        '''
+        end = len(self._messages) - int(self._pending)
+        return self._messages[self._head():end]
+
+    @property
+    def empty(self) -> bool:
+        '''The property is defined for discriminate whether chat iteration
+        history record is empty without copying it.
+        Returns:
+            A boolean indicate whether there is no iteration record.
+        '''
+        return len(self._messages) - int(self._pending) == self._head()
+
+    @contextmanager
+    def hold(self):
+        '''The method is defined for hold the chat for an iteration across threads,
+        which raises instead of waiting for ever when the thread holds it already,
+        e.g. chatting again before reading its stream to the end.'''
+        if self._owner == get_ident():
+            raise RuntimeError('Error: Chat session is held by unfinished iteration.')
+        with self.lock:
+            self._owner = get_ident()
+            try:
+                yield
+            finally:
+                self._owner = None
+
+    ## ============================= Internal Methods ============================= ##
+    def _head(self) -> int:
+        '''The method is defined for get where iteration records start in buffer.
+        Returns:
+            A integer indicate the index of first iteration record.
+        '''
+        return int(self._addition != None)
+
+    def _place(self,additional_prompt:dict|None) -> None:
+        '''The method is defined for place additional prompt at head of buffer,
+        which only costs linear time when additional prompt changes.
+        Args:
+            additional_prompt: A dictionary indicate the record of additional prompt,
+                or `None` indicate no additional prompt.
+        '''
+        # Discriminate whether additional prompt changes
+        if additional_prompt == self._addition:
+            return
+        self._head_count = -1
+        # Update head of buffer
+        if self._addition == None:
+            self._messages.insert(0,additional_prompt)
+        elif additional_prompt == None:
+            del self._messages[0]
+        else:
+            self._messages[0] = additional_prompt
+        self._addition = additional_prompt
+
+    def _discard(self) -> None:
+        '''The method is defined for discard pending input record
+        left by unfinished iteration.'''
+        if self._pending:
+            self._messages.pop()
+            self._pending = False
+
+    def _measure(self,counter) -> None:
+        '''The method is defined for count tokens of records not counted yet.
+        Args:
+            counter: A callable indicate the tokenizer counting tokens of a string.
+        '''
+        head = self._head()
+        # Count additional prompt when it changes
+        if self._head_count < 0:
+            self._head_count = counter(self._addition['content']) if head else 0
+        # Count iteration records appended since last count
+        for record in self._messages[head + len(self._counts):]:
+            count = counter(record['content'])
+            self._counts.append(count)
+            self._total += count
+
+    def _drop(self,number:int) -> None:
+        '''The method is defined for drop oldest iteration records.
+        Args:
+            number: A integer indicate the number of dropped records.
+        '''
+        head = self._head()
+        for record in self._messages[head:head + number]:
+            self.size -= len(record['content'])
+        self._total -= sum(self._counts[:number])
+        del self._messages[head:head + number]
+        del self._counts[:number]
+
+    def _fit(self,role:Role,content:str,context:Context,
+             counter,summarize) -> None:
+        '''The method is defined for shrink iteration history
+        to fit the context window with the input.
+        Args:
+            role: A dataclass indicate input and prompt role of
+                iterative chat inference.
+            content: A string indicate the input content for model inference.
+            context: A dataclass indicate the context window strategy.
+            counter: A callable indicate the tokenizer counting tokens of a string.
+            summarize: A callable indicate the inference making summary
+                from a summary prompt.
+        '''
+        # Count tokens of all records
+        self._measure(counter)
+        self._pending_count = counter(content)
+        head = self._head()
+        # Keep only last iterations with `last` policy
+        if context.policy == 'last':
+            excess = len(self._counts) - context.last * 2
+            if excess > 0:
+                self._drop(excess)
+        # Discriminate whether the prompt exceeds token budget
+        if not context.budget:
+            return
+        excess = self._head_count + self._total + self._pending_count - context.budget
+        if excess <= 0:
+            return
+        # Find oldest records to drop, ending before an input record
+        number = 0
+        while number < len(self._counts) and excess > 0:
+            excess -= self._counts[number]
+            number += 1
+        while (number < len(self._counts)
+               and self._messages[head + number]['role'] != role.input):
+            number += 1
+        # Discriminate whether replace dropped records with their summary
+        if context.policy == 'summary' and summarize and number:
+            summary_role = role.prompt if role.prompt else 'system'
+            records = self._messages[head:head + number]
+            summary = summarize(make_summary_prompt(summary_role,role.input,records))
+            self._drop(number)
+            record = make_new_inference(summary_role,
+                'Summary of earlier conversation: ' + summary)
+            self._messages.insert(head,record)
+            self._counts.insert(0,counter(record['content']))
+            self._total += self._counts[0]
+            self.size += len(record['content'])
+        else:
+            self._drop(number)
\ No newline at end of file
@@ -1 +1 @@
-from .funcs import make_new_inference
\ No newline at end of file
+from .funcs import make_new_inference, make_summary_prompt
\ No newline at end of file
@@ -10,4 +10,25 @@ def make_new_inference(role:str,content:str) -> dict:
     # Make single prompt dictionary
     prompt = {'role':role,'content': content}
     # Return single prompt dictionary
-    return prompt    
\ No newline at end of file
+    return prompt    
+
+## ======================= Function `make_summary_prompt()` ======================= ##
+def make_summary_prompt(prompt:str,input:str,records:list) -> list:
+    '''The function is defined for make prompt asking model to summarize
+    iteration records.
+    Args:
+        prompt: A string indicate the role of the summary instruction.
+        input: A string indicate the role of the records transcript.
+        records: A list indicate the iteration records for summary.
+    Returns:
+        A list indicate proper structed content for summary inference.
+    '''
+    # Make summary instruction
+    instruction = 'Summarize the conversation below briefly, '
+    instruction += 'keeping every fact needed to continue it.'
+    # Make transcript of iteration records
+    transcript = '\n'.join(f"{record['role']}: {record['content']}"
+                           for record in records)
+    # Return summary prompt
+    return [make_new_inference(prompt,instruction),
+            make_new_inference(input,transcript)]
@@ -0,0 +1 @@
+from .definition import Session
\ No newline at end of file
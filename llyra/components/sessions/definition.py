@@ -0,0 +1,126 @@
+from ..prompts import Prompt
+from collections import OrderedDict
+from time import monotonic
+from threading import RLock
+
+class Session:
+    '''The class is defined to define universal attributes and methods,
+    for managing independent chat sessions against one shared backend.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,capacity:int=1024,ttl:float=0,memory:int=0,
+                 release=None) -> None:
+        '''The method is defined for initialize Session class object.
+        Args:
+            capacity: A integer indicate the maximum number of kept sessions.
+            ttl: A float indicate the seconds an idle session is kept,
+                and keep idle sessions forever by set it to 0.
+            memory: A integer indicate the maximum characters kept by all sessions,
+                and keep them unlimited by set it to 0.
+            release: A callable indicate the hook called with the session id
+                when a session is evicted.
+        '''
+        # Get limit attributes
+        self.capacity = capacity
+        self.ttl = ttl
+        self.memory = memory
+        self._release = release
+        # Initialize session attributes ordered from least recently used
+        self._prompts:OrderedDict = OrderedDict()
+        self._access:dict = {}
+        self._sizes:dict = {}
+        self.size = 0
+        # Initialize lock attribute serializing access across threads,
+        # which is reentrant for release hooks reading sessions
+        self._lock = RLock()
+
+    ## ============================== Access Methods ============================== ##
+    def get(self,id:str) -> Prompt:
+        '''The method is defined for get prompt of a session,
+        and create the session when it doesn't exist.
+        Args:
+            id: A string indicate the identity of the session.
+        Returns:
+            prompt: A Prompt instance indicate the chat history of the session.
+        '''
+        with self._lock:
+            now = monotonic()
+            # Evict expired sessions
+            self._expire(now)
+            # Discriminate whether the session exists
+            try:
+                prompt = self._prompts[id]
+            except KeyError:
+                prompt = Prompt()
+                self._prompts[id] = prompt
+                self._sizes[id] = 0
+                # Evict least recently used sessions beyond capacity
+                while len(self._prompts) > self.capacity:
+                    self._evict(next(iter(self._prompts)))
+            else:
+                self._prompts.move_to_end(id)
+            # Update access time
+            self._access[id] = now
+            # Return prompt of the session
+            return prompt
+
+    def touch(self,id:str) -> None:
+        '''The method is defined for update memory usage of a session
+        after its chat history changed.
+        Args:
+            id: A string indicate the identity of the session.
+        '''
+        with self._lock:
+            # Discriminate whether the session still exists
+            try:
+                prompt = self._prompts[id]
+            except KeyError:
+                return
+            # Update memory usage
+            self.size += prompt.size - self._sizes[id]
+            self._sizes[id] = prompt.size
+            # Evict least recently used sessions beyond memory cap
+            if self.memory:
+                while self.size > self.memory and len(self._prompts) > 1:
+                    self._evict(next(iter(self._prompts)))
+
+    def drop(self,id:str) -> None:
+        '''The method is defined for drop a session.
+        Args:
+            id: A string indicate the identity of the session.
+        '''
+        with self._lock:
+            if id in self._prompts:
+                self._evict(id)
+
+    def __len__(self) -> int:
+        '''The method is defined for count kept sessions.'''
+        return len(self._prompts)
+
+    def __contains__(self,id:str) -> bool:
+        '''The method is defined for discriminate whether a session is kept.'''
+        return id in self._prompts
+
+    ## ============================= Internal Methods ============================= ##
+    def _evict(self,id:str) -> None:
+        '''The method is defined for evict a session.
+        Args:
+            id: A string indicate the identity of the session.
+        '''
+        self._prompts.pop(id)
+        self._access.pop(id)
+        self.size -= self._sizes.pop(id)
+        if self._release:
+            self._release(id)
+
+    def _expire(self,now:float) -> None:
+        '''The method is defined for evict sessions idle longer than ttl.
+        Args:
+            now: A float indicate the current monotonic time.
+        '''
+        if not self.ttl:
+            return
+        while self._prompts:
+            id = next(iter(self._prompts))
+            if now - self._access[id] <= self.ttl:
+                break
+            self._evict(id)
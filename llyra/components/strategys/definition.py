@@ -1,6 +1,6 @@
-from .utils import Call, Chat
+from .utils import Call, Chat, Context, check_option
 from ..utils import Role
-from ...errors.strategys import StrategySectionMissingError, StrategyParameterMissingError
+from ...errors.strategys import StrategySectionMissingError, StrategyParameterMissingError, StrategyParameterInvalidError
 from warnings import warn
 from pathlib import Path
 import tomllib
@@ -48,7 +48,9 @@ class Strategy:
             message += 'in `strategy.toml` , auto-fallback to `0`.'
             warn(message,RuntimeWarning)
             temperature = 0
-        self.call:Call = Call(stop,temperature)
+        options = self._options(call,'call')
+        max_tokens = self._limit(call,'call')
+        self.call:Call = Call(stop,temperature,options,max_tokens)
         # Read chat strategy parameters
         ## Extract all chat strategy parameters
         try:
@@ -104,24 +106,81 @@ class Strategy:
             message += "in `strategy.toml` , auto-fallback to `0`."
             warn(message,RuntimeWarning)
             temperature = 0
-        self.chat:Chat = Chat(role,addition,stop,temperature)
+        ## Read chat context parameters
+        context = Context()
+        context_content = chat.get('context',{})
+        for parameter, kind in (('budget',int),('last',int),('policy',str)):
+            if parameter not in context_content:
+                continue
+            value = context_content[parameter]
+            if type(value) != kind:
+                raise StrategyParameterInvalidError('chat.context',parameter,
+                                                    f'`{kind.__name__}`')
+            setattr(context,parameter,value)
+        if context.policy not in ('window','last','summary'):
+            raise StrategyParameterInvalidError('chat.context','policy',
+                '`window`, `last` or `summary`')
+        options = self._options(chat,'chat')
+        max_tokens = self._limit(chat,'chat')
+        self.chat:Chat = Chat(role,addition,stop,temperature,context,options,max_tokens)
+
+    def _options(self,content:dict,section:str) -> dict:
+        '''The method is defined for read Ollama options of a strategy section.
+        Args:
+            content: A dictionary indicate the content of the strategy section.
+            section: A string indicate the name of the strategy section.
+        Returns:
+            options: A dictionary indicate the validated Ollama options.
+        '''
+        options = content.get('options',{})
+        if type(options) != dict:
+            raise StrategyParameterInvalidError(section,'options','a table of Ollama options')
+        for name, value in options.items():
+            expectation = check_option(name,value)
+            if expectation != None:
+                raise StrategyParameterInvalidError(f'{section}.options',name,expectation)
+        return dict(options)
+
+    def _limit(self,content:dict,section:str) -> int:
+        '''The method is defined for read generation length limit of a strategy section.
+        Args:
+            content: A dictionary indicate the content of the strategy section.
+            section: A string indicate the name of the strategy section.
+        Returns:
+            max_tokens: A integer indicate the maximum tokens of generation.
+        '''
+        max_tokens = content.get('max_tokens',0)
+        if type(max_tokens) != int or max_tokens < 0:
+            raise StrategyParameterInvalidError(section,'max_tokens',
+                                                'a non-negative integer')
+        return max_tokens
 
     ## ============================== Update Methods ============================== ##
-    def update_call(self,stop:str|list,temperature:float) -> None:
+    def update_call(self,stop:str|list,temperature:float,options:dict=None,
+                    max_tokens:int=None) -> None:
         '''The method is defined for update inference strategy for call.
         Args:
             stop: A string or a list of strings 
                 indicate where the model should stop generation.
             temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options to update,
+                and drop an option by set its value to `None`.
+            max_tokens: A integer indicate the maximum tokens of generation,
+                and keep the default limit of the backend by set it to 0.
         '''
         if stop != None:
             self.call.stop = stop
         if temperature != None:
             self.call.temperature = temperature
+        if options != None:
+            self.call.options = self._merge(self.call.options,options)
+        if max_tokens != None:
+            self.call.max_tokens = self._check_limit(max_tokens)
 
     def update_chat(self,addition:str,
                     prompt_role:str,input_role:str,output_role:str,
-                    stop:str|list,temperature:float) -> None:
+                    stop:str|list,temperature:float,options:dict=None,
+                    max_tokens:int=None) -> None:
         '''The method is defined for update inference strategy for chat.
         Args:
             addition: A string indicate additional prompt for chat inference.
@@ -131,6 +190,10 @@ class Strategy:
             stop: A string or a list of strings
                 indicate where the model should stop generation.
             temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options to update,
+                and drop an option by set its value to `None`.
+            max_tokens: A integer indicate the maximum tokens of generation,
+                and keep the default limit of the backend by set it to 0.
         '''
         if addition != None:
             self.chat.addition = addition
@@ -149,4 +212,38 @@ class Strategy:
             self.chat.stop = stop
         if temperature != None:
             self.chat.temperature = temperature
-                    
\ No newline at end of file
+        if options != None:
+            self.chat.options = self._merge(self.chat.options,options)
+        if max_tokens != None:
+            self.chat.max_tokens = self._check_limit(max_tokens)
+
+    def _merge(self,current:dict,options:dict) -> dict:
+        '''The method is defined for make Ollama options updated at runtime.
+        Args:
+            current: A dictionary indicate the Ollama options in use.
+            options: A dictionary indicate the Ollama options to update,
+                and drop an option by set its value to `None`.
+        Returns:
+            merged: A dictionary indicate the updated Ollama options.
+        '''
+        merged = dict(current)
+        for name, value in options.items():
+            if value == None:
+                merged.pop(name,None)
+                continue
+            expectation = check_option(name,value)
+            if expectation != None:
+                raise ValueError(f'Invalid `{name}` option, expect {expectation}.')
+            merged[name] = value
+        return merged
+
+    def _check_limit(self,max_tokens:int) -> int:
+        '''The method is defined for validate generation length limit updated at runtime.
+        Args:
+            max_tokens: A integer indicate the maximum tokens of generation.
+        Returns:
+            max_tokens: A integer indicate the validated maximum tokens.
+        '''
+        if type(max_tokens) != int or max_tokens < 0:
+            raise ValueError('Invalid `max_tokens`, expect a non-negative integer.')
+        return max_tokens
\ No newline at end of file
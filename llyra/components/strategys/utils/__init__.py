@@ -1 +1,2 @@
-from .classes import Call, Chat
\ No newline at end of file
+from .classes import Call, Chat, Context
+from .funcs import check_option, OPTIONS
\ No newline at end of file
@@ -1,5 +1,6 @@
 from ...utils import Role
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Literal
 
 ## ============================== Dataclass `Call()` ============================== ##
 @dataclass
@@ -9,9 +10,32 @@ class Call:
     Args:
         stop: A string indicate where the model should stop generation.
         temperature: A float indicate the model inference temperature.
+        options: A dictionary indicate the Ollama options passed through
+            to remote inference, such as `num_ctx`, `num_predict` and `keep_alive`.
+        max_tokens: A integer indicate the maximum tokens of generation,
+            and keep the default limit of the backend by set it to 0.
     '''
     stop: str|list
     temperature: float
+    options: dict = field(default_factory=dict)
+    max_tokens: int = 0
+
+## ============================= Dataclass `Context()` ============================= ##
+@dataclass
+class Context:
+    '''The class is defined for work with strategies with
+    context window of iterative chat inference.
+    Args:
+        budget: A integer indicate the maximum tokens of chat prompt,
+            and keep all iteration history by set it to 0.
+        policy: A choice indicate how to shrink iteration history over budget,
+            `window` drops oldest iterations, `last` keeps only last iterations,
+            and `summary` replaces oldest iterations with their summary.
+        last: A integer indicate the number of kept iterations of `last` policy.
+    '''
+    budget: int = 0
+    policy: Literal['window','last','summary'] = 'window'
+    last: int = 0
 
 ## ============================== Dataclass `Chat()` ============================== ## 
 @dataclass
@@ -24,8 +48,16 @@ class Chat:
         addition: A string indicate additional prompt for chat inference.
         stop: A string indicate where the model should stop generation.
         temperature: A float indicate the model inference temperature.
+        context: A dataclass indicate the context window strategy.
+        options: A dictionary indicate the Ollama options passed through
+            to remote inference, such as `num_ctx`, `num_predict` and `keep_alive`.
+        max_tokens: A integer indicate the maximum tokens of generation,
+            and keep the default limit of the backend by set it to 0.
     '''
     role: Role
     addition: str
     stop: str|list
-    temperature: float    
\ No newline at end of file
+    temperature: float
+    context: Context = field(default_factory=Context)
+    options: dict = field(default_factory=dict)
+    max_tokens: int = 0
\ No newline at end of file
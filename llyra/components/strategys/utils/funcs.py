@@ -0,0 +1,47 @@
+# Ollama model options passed through strategy with their valid types,
+# and `keep_alive` which is sent beside the options
+OPTIONS = {
+    'num_ctx': (int,),
+    'num_predict': (int,),
+    'num_batch': (int,),
+    'num_thread': (int,),
+    'num_gpu': (int,),
+    'main_gpu': (int,),
+    'num_keep': (int,),
+    'low_vram': (bool,),
+    'use_mmap': (bool,),
+    'use_mlock': (bool,),
+    'numa': (bool,),
+    'top_k': (int,),
+    'top_p': (int,float),
+    'min_p': (int,float),
+    'typical_p': (int,float),
+    'repeat_last_n': (int,),
+    'repeat_penalty': (int,float),
+    'presence_penalty': (int,float),
+    'frequency_penalty': (int,float),
+    'mirostat': (int,),
+    'mirostat_tau': (int,float),
+    'mirostat_eta': (int,float),
+    'penalize_newline': (bool,),
+    'seed': (int,),
+    'keep_alive': (str,int),
+    }
+
+## ========================= Function `check_option()` ========================== ##
+def check_option(name:str,value) -> str|None:
+    '''The function is defined for validate an Ollama option of strategy.
+    Args:
+        name: A string indicate the name of the option.
+        value: A value indicate the value of the option.
+    Returns:
+        A string indicate the expectation of the option when it's invalid,
+        or `None` indicate the option is valid.
+    '''
+    # Discriminate whether the option is supported
+    if name not in OPTIONS:
+        return 'a supported Ollama option'
+    # Discriminate whether the value is valid
+    if type(value) not in OPTIONS[name]:
+        return ' or '.join(f'`{kind.__name__}`' for kind in OPTIONS[name])
+    return None
\ No newline at end of file
@@ -0,0 +1,4 @@
+from .basic import Tracer, Span
+from .jsonl import JsonlTracer
+from .prometheus import PrometheusTracer
+from .funcs import make_tracer
\ No newline at end of file
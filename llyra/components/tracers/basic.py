@@ -0,0 +1,145 @@
+from secrets import token_hex
+from time import perf_counter, time
+
+class Span:
+    '''The class is defined for measuring an inference or a stage of it,
+    which is exported by its tracer once it ends.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,tracer:'Tracer',name:str,kind:str,
+                 trace:str,parent:str|None,attributes:dict) -> None:
+        '''The method is defined for initialize Span class object and start timing.
+        Args:
+            tracer: A Tracer instance indicate where the span is exported.
+            name: A string indicate the name of the inference or the stage.
+            kind: A string indicate the name of the inference the span belongs to.
+            trace: A string indicate the identity shared by spans of the inference.
+            parent: A string indicate the identity of the span of the inference,
+                or `None` indicate the span is the inference itself.
+            attributes: A dictionary indicate additional details of the span.
+        '''
+        # Get span attributes
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace = trace
+        self.id = token_hex(8)
+        self.parent = parent
+        self.attributes = attributes
+        # Initialize timing attributes
+        self.timestamp = time()
+        self.duration:float = None
+        self.error:str = None
+        self._start = perf_counter()
+
+    ## ============================== Stage Methods ============================== ##
+    def stage(self,name:str,**attributes) -> 'Span':
+        '''The method is defined for start the span of a stage of the inference,
+        which is ended by leaving its context.
+        Args:
+            name: A string indicate the name of the stage.
+            attributes: Keyword arguments indicate additional details of the stage.
+        Returns:
+            A Span instance indicate the span of the stage.
+        '''
+        return Span(self.tracer,name,self.kind,self.trace,self.id,attributes)
+
+    def set(self,**attributes) -> None:
+        '''The method is defined for add details to the span.
+        Args:
+            attributes: Keyword arguments indicate additional details of the span.
+        '''
+        self.attributes.update(attributes)
+
+    def end(self,error:BaseException=None) -> None:
+        '''The method is defined for stop timing and export the span once.
+        Args:
+            error: A exception indicate what interrupted the span,
+                or `None` indicate the span finished normally.
+        '''
+        if self.duration != None:
+            return
+        self.duration = perf_counter() - self._start
+        if error != None:
+            self.error = type(error).__name__
+        self.tracer.export(self)
+
+    def record(self) -> dict:
+        '''The method is defined for make a readable record of the span.
+        Returns:
+            A dictionary indicate identities, timing and details of the span.
+        '''
+        return {'trace': self.trace,
+                'span': self.id,
+                'parent': self.parent,
+                'kind': self.kind,
+                'name': self.name,
+                'timestamp': self.timestamp,
+                'duration': self.duration,
+                'error': self.error,
+                'attributes': self.attributes}
+
+    ## ============================= Context Methods ============================= ##
+    def __enter__(self) -> 'Span':
+        return self
+
+    def __exit__(self,kind,error,traceback) -> bool:
+        self.end(error)
+        return False
+
+class NullSpan(Span):
+    '''The class is defined for standing in for spans while tracing is disabled,
+    which measures and exports nothing.'''
+    def __init__(self) -> None:
+        pass
+
+    def stage(self,name:str,**attributes) -> Span:
+        return self
+
+    def set(self,**attributes) -> None:
+        pass
+
+    def end(self,error:BaseException=None) -> None:
+        pass
+
+    def __exit__(self,kind,error,traceback) -> bool:
+        return False
+
+# Shared span handed out while tracing is disabled
+NULL_SPAN = NullSpan()
+
+class Tracer:
+    '''The class is defined to define basic attributes and methods,
+    for tracing stages of inferences with exporters overriding `export()`,
+    which traces nothing unless enabled.'''
+    # Discriminate whether spans are measured and exported
+    enabled:bool = False
+
+    ## ============================== Span Method ============================== ##
+    def start(self,name:str,**attributes) -> Span:
+        '''The method is defined for start the span of an inference.
+        Args:
+            name: A string indicate the name of the inference.
+            attributes: Keyword arguments indicate additional details of the inference.
+        Returns:
+            A Span instance indicate the span of the inference,
+            which is shared and does nothing while tracing is disabled.
+        '''
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self,name,name,token_hex(16),None,attributes)
+
+    ## ============================= Export Methods ============================= ##
+    def export(self,span:Span) -> None:
+        '''The method is defined for export an ended span.
+        Args:
+            span: A Span instance indicate the ended span.
+        '''
+        pass
+
+    def flush(self) -> None:
+        '''The method is defined for write exported spans kept in buffer.'''
+        pass
+
+    def close(self) -> None:
+        '''The method is defined for write exported spans and release the exporter.'''
+        pass
\ No newline at end of file
@@ -0,0 +1,20 @@
+from .basic import Tracer
+from .jsonl import JsonlTracer
+from .prometheus import PrometheusTracer
+from ..configs.utils import Traces
+
+## ========================== Function `make_tracer()` ========================== ##
+def make_tracer(config:Traces) -> Tracer:
+    '''The function is defined for make tracer of inference stages with trace config.
+    Args:
+        config: A dataclass indicate parameters of trace section.
+    Returns:
+        A Tracer instance indicate the configured exporter,
+        or the disabled tracer costing nearly nothing.
+    '''
+    if config.exporter == 'jsonl':
+        return JsonlTracer(config.path,config.buffer)
+    elif config.exporter == 'prometheus':
+        return PrometheusTracer(config.host,config.port)
+    else:
+        return Tracer()
\ No newline at end of file
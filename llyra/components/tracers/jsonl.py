@@ -0,0 +1,63 @@
+from .basic import Tracer, Span
+from pathlib import Path
+from threading import Lock
+import atexit
+import json
+
+class JsonlTracer(Tracer):
+    '''The class is defined for dumping spans of inference stages into a JSONL file,
+    with one span record per line appended in batches.'''
+    enabled = True
+
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,path:str|Path,buffer:int=256) -> None:
+        '''The method is defined for initialize JsonlTracer class object.
+        Args:
+            path: A string or Path instance indicate the directory of the span file.
+            buffer: A integer indicate the maximum spans written at once.
+        '''
+        # Get file attributes
+        self.path = Path(path)
+        self.buffer = max(1,buffer)
+        self.path.mkdir(parents=True,exist_ok=True)
+        # Open span file for appending
+        self._file = open(self.path / 'spans.jsonl','a',encoding='utf-8')
+        self._pending:list = []
+        self._lock = Lock()
+        # Write buffered spans before interpreter exits
+        atexit.register(self.close)
+
+    ## ============================= Export Methods ============================= ##
+    def export(self,span:Span) -> None:
+        '''The method is defined for put an ended span into write buffer,
+        and write the buffer once it's full.
+        Args:
+            span: A Span instance indicate the ended span.
+        '''
+        line = json.dumps(span.record(),ensure_ascii=False,default=str)
+        with self._lock:
+            self._pending.append(line)
+            if len(self._pending) >= self.buffer:
+                self._write()
+
+    def flush(self) -> None:
+        '''The method is defined for write spans kept in buffer.'''
+        with self._lock:
+            self._write()
+
+    def close(self) -> None:
+        '''The method is defined for write spans kept in buffer and close the file.'''
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write()
+            self._file.close()
+        atexit.unregister(self.close)
+
+    ## ============================= Internal Method ============================= ##
+    def _write(self) -> None:
+        '''The method is defined for append buffered spans to the file.'''
+        if self._pending and not self._file.closed:
+            self._file.write('\n'.join(self._pending) + '\n')
+            self._file.flush()
+        self._pending.clear()
\ No newline at end of file
@@ -0,0 +1,109 @@
+from .basic import Tracer, Span
+from bisect import bisect_left
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Lock, Thread
+
+# Upper bounds in seconds of histogram buckets of stage durations
+BUCKETS = (0.001,0.005,0.01,0.025,0.05,0.1,0.25,0.5,1.0,2.5,5.0,10.0,30.0,60.0)
+
+class PrometheusTracer(Tracer):
+    '''The class is defined for aggregating spans of inference stages into histograms,
+    which are served as Prometheus text on a metrics endpoint.'''
+    enabled = True
+
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,host:str='127.0.0.1',port:int=9464,serve:bool=True) -> None:
+        '''The method is defined for initialize PrometheusTracer class object.
+        Args:
+            host: A string indicate the address the metrics endpoint listens on.
+            port: A integer indicate the port the metrics endpoint listens on,
+                and pick a free port by set it to 0.
+            serve: A boolean indicate whether serve the metrics endpoint,
+                or only render metrics by `render()`.
+        '''
+        # Initialize histogram attributes,
+        # which are bucket counts, seconds sum and count of each stage of each inference,
+        # and interrupted spans of each stage of each inference
+        self._series:dict = {}
+        self._errors:dict = {}
+        self._lock = Lock()
+        # Discriminate whether serve the metrics endpoint in background
+        self.port = port
+        self._server:ThreadingHTTPServer = None
+        if serve:
+            self._server = ThreadingHTTPServer((host,port),MetricsHandler)
+            self._server.daemon_threads = True
+            self._server.tracer = self
+            self.port = self._server.server_address[1]
+            Thread(target=self._server.serve_forever,daemon=True).start()
+
+    ## ============================= Export Methods ============================= ##
+    def export(self,span:Span) -> None:
+        '''The method is defined for count an ended span into its histogram.
+        Args:
+            span: A Span instance indicate the ended span.
+        '''
+        key = (span.kind,span.name if span.parent != None else 'total')
+        index = bisect_left(BUCKETS,span.duration)
+        with self._lock:
+            series = self._series.get(key)
+            if series == None:
+                series = self._series[key] = [[0] * len(BUCKETS),0.0,0]
+            if index < len(BUCKETS):
+                series[0][index] += 1
+            series[1] += span.duration
+            series[2] += 1
+            if span.error != None:
+                self._errors[key] = self._errors.get(key,0) + 1
+
+    def close(self) -> None:
+        '''The method is defined for stop serving the metrics endpoint.'''
+        if self._server != None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    ## ============================== Render Method ============================== ##
+    def render(self) -> str:
+        '''The method is defined for render histograms in Prometheus text format.
+        Returns:
+            A string indicate the exposition of stage durations and errors.
+        '''
+        with self._lock:
+            series = {key: (list(value[0]),value[1],value[2])
+                      for key, value in self._series.items()}
+            errors = dict(self._errors)
+        lines = ['# HELP llyra_stage_duration_seconds Seconds spent in each stage of inferences.',
+                 '# TYPE llyra_stage_duration_seconds histogram']
+        for (kind,stage), (buckets,total,count) in sorted(series.items()):
+            labels = f'inference="{kind}",stage="{stage}"'
+            cumulative = 0
+            for bound, number in zip(BUCKETS,buckets):
+                cumulative += number
+                lines.append(f'llyra_stage_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'llyra_stage_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'llyra_stage_duration_seconds_sum{{{labels}}} {total}')
+            lines.append(f'llyra_stage_duration_seconds_count{{{labels}}} {count}')
+        lines.append('# HELP llyra_stage_errors_total Stages of inferences interrupted by errors.')
+        lines.append('# TYPE llyra_stage_errors_total counter')
+        for (kind,stage), count in sorted(errors.items()):
+            lines.append(f'llyra_stage_errors_total{{inference="{kind}",stage="{stage}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    '''The class is defined for answering scrapes of the metrics endpoint.'''
+    def do_GET(self) -> None:
+        '''The method is defined for respond rendered metrics on `/metrics`.'''
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.tracer.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type','text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length',str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self,format:str,*args) -> None:
+        '''The method is defined for keep scrapes out of standard error.'''
+        pass
\ No newline at end of file
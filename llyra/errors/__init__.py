@@ -1,3 +1,4 @@
 from .configs import ConfigError
 from .strategys import StrategyError
-from .remotes import RemoteError
\ No newline at end of file
+from .remotes import RemoteError
+from .locals import LocalError
\ No newline at end of file
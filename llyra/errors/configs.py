@@ -27,4 +27,19 @@ class ConfigParameterMissingError(ConfigError):
         '''
         indication = f'Missing `{parameter}` parameter of `{section}` section '
         indication += 'in `config.toml`.'
-        super().__init__(indication)
\ No newline at end of file
+        super().__init__(indication)
+
+## ============================ Parameter Invalid Error ============================ ##
+class ConfigParameterInvalidError(ConfigError):
+    '''The class is defined for indicate error 
+    when config file provide invalid value of parameters.'''
+    def __init__(self,section:str,parameter:str,expectation:str):
+        '''
+        Args:
+            section: A string indicate the belonging section of the invalid parameter.
+            parameter: A string indicate the invalid parameter in config file.
+            expectation: A string indicate the expected value of the parameter.
+        '''
+        indication = f'Invalid `{parameter}` parameter of `{section}` section '
+        indication += f'in `config.toml`, expect {expectation}.'
+        super().__init__(indication)
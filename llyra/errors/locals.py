@@ -0,0 +1,74 @@
+## ================================= Local Error ================================= ##
+class LocalError(Exception):
+    '''The class is defined as the base of all custom errors of process of local.'''
+    pass
+
+## =========================== Local Queue Full Error =========================== ##
+class LocalQueueFullError(LocalError):
+    '''The class is defined for indicate error
+    when the queue of requests waiting for the local model is full.'''
+    def __init__(self,capacity:int):
+        '''
+        Args:
+            capacity: A integer indicate the maximum requests waiting in the queue.
+        '''
+        indication = f'Request queue is full with {capacity} requests waiting.'
+        super().__init__(indication)
+
+## ========================= Local Context Exceeded Error ========================= ##
+class LocalContextExceededError(LocalError):
+    '''The class is defined for indicate error
+    when a prompt doesn't fit in the context of a batched sequence.'''
+    def __init__(self,tokens:int,context:int):
+        '''
+        Args:
+            tokens: A integer indicate the number of tokens of the prompt.
+            context: A integer indicate the number of tokens of a sequence context.
+        '''
+        indication = f'Prompt of {tokens} tokens exceeds sequence context of {context} tokens.'
+        super().__init__(indication)
+
+## ============================== Local Decode Error ============================== ##
+class LocalDecodeError(LocalError):
+    '''The class is defined for indicate error
+    when llama.cpp fails to decode a batch of sequences.'''
+    def __init__(self,code:int):
+        '''
+        Args:
+            code: A integer indicate the status code returned by llama.cpp.
+        '''
+        indication = f'Batch decoding failed with status code {code}.'
+        super().__init__(indication)
+
+## ========================== Local Batcher Closed Error ========================== ##
+class LocalBatcherClosedError(LocalError):
+    '''The class is defined for indicate error
+    when a request is submitted to a batcher closed with its model.'''
+    def __init__(self):
+        indication = 'Batcher is closed since the model is unloaded.'
+        super().__init__(indication)
+
+## ============================== Local Worker Error ============================== ##
+class LocalWorkerError(LocalError):
+    '''The class is defined for indicate error
+    when a worker process exits with requests in flight.'''
+    def __init__(self,index:int,code:int|None):
+        '''
+        Args:
+            index: A integer indicate the index of the worker process.
+            code: A integer indicate the exit code of the worker process.
+        '''
+        indication = f'Worker {index} exited with code {code} before responding.'
+        super().__init__(indication)
+
+## ======================= Local Model Not Registered Error ======================= ##
+class LocalModelNotRegisteredError(LocalError):
+    '''The class is defined for indicate error
+    when an inference asks for a model not registered in config file.'''
+    def __init__(self,model:str):
+        '''
+        Args:
+            model: A string indicate the name of the unregistered model.
+        '''
+        indication = f'`{model}` not registered as local model.'
+        super().__init__(indication)
\ No newline at end of file
@@ -43,3 +43,31 @@ class RemoteModelNotAvailableError(RemoteError):
         '''
         indication = f'`{model}` not available on remote server.'
         super().__init__(indication)
+
+## ========================= Remote Server Timeout Error ========================= ##
+class RemoteServerTimeoutError(RemoteError):
+    '''The class is defined for indicate error
+    when remote server doesn't respond within timeout.'''
+    def __init__(self):
+        indication = "Server didn't respond in time."
+        super().__init__(indication)
+
+## ===================== Remote Server Connect Timeout Error ===================== ##
+class RemoteServerConnectTimeoutError(RemoteServerTimeoutError):
+    '''The class is defined for indicate error
+    when failed to connect with remote server within timeout.'''
+    def __init__(self):
+        indication = "Can't connect to server in time."
+        RemoteError.__init__(self,indication)
+
+## ======================= Remote Server Unavailable Error ======================= ##
+class RemoteServerUnavailableError(RemoteError):
+    '''The class is defined for indicate error
+    when requests fail fast since remote server keeps failing.'''
+    def __init__(self,remain:float):
+        '''
+        Args:
+            remain: A float indicate the seconds before requests are tried again.
+        '''
+        indication = f'Server is unhealthy, retry after {remain:.1f} seconds.'
+        super().__init__(indication)
\ No newline at end of file
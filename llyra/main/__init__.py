@@ -1 +1,2 @@
-from .definition import Llyra
\ No newline at end of file
+from .definition import Llyra
+from .asynchronous import AsyncLlyra
\ No newline at end of file
@@ -0,0 +1,175 @@
+from .definition import Llyra
+from ..backends import AsyncLocal, AsyncRemote
+from typing import Literal
+from pathlib import Path
+
+class AsyncLlyra(Llyra):
+    '''The class is defined for unified asynchronous interface
+    of inference and advance methods.'''
+    ## ============================= Initialize Method ============================= ##
+    def __init__(self,mode:Literal['local','remote'],path:str|Path=None) -> None:
+        '''The method is defined for initialize AsyncLlyra class object.
+        Args:
+            mode: A choice indicate the mode of AsyncLlyra.
+            path: A string or Path instance indicate the path to the config file.
+        '''
+        # Initialize backend attribute
+        if mode == 'local':
+            self._backend = AsyncLocal(path)
+        elif mode == 'remote':
+            self._backend = AsyncRemote(path)
+
+    ## ============================= Inference Methods ============================= ##
+    async def call(self,input:str,priority:int=0,model:str=None) -> str:
+        '''The method is defined for fulfill single LLM call.
+        Args:
+            input: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Returns:
+            output: A string indicate the output content from model inference.
+        '''
+        return await self._backend.call(input,priority,**self._override(model))
+
+    async def chat(self,message:str,keep:bool,session_id:str=None,
+                   priority:int=0,model:str=None) -> str:
+        '''The method is defined for fulfill iterative chat inference.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session_id: A string indicate the identity of independent chat session,
+                and chat in the default session by set it to `None`.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Returns:
+            response: A string indicate the output content from model inference.
+        '''
+        return await self._backend.chat(message,keep,session_id,priority,
+                                        **self._override(model))
+
+    ## ========================== Batch Inference Method ========================== ##
+    async def call_many(self,inputs:list,concurrency:int=1,progress=None,
+                        priority:int=0,model:str=None) -> list:
+        '''The method is defined for fulfill batch of single LLM calls.
+        Args:
+            inputs: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum inferences in flight
+                against remote backend.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Returns:
+            outputs: A list indicate the output content of each input in order,
+                or the exception raised by the inference of the input.
+        '''
+        return await self._backend.call_many(inputs,concurrency,progress,priority,
+                                             **self._override(model))
+
+    ## ========================== Stream Inference Methods ========================== ##
+    async def stream_call(self,input:str,priority:int=0,model:str=None):
+        '''The method is defined for fulfill single LLM call in streaming.
+        Args:
+            input: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        async for piece in self._backend.stream_call(input,priority,
+                                                     **self._override(model)):
+            yield piece
+
+    async def stream_chat(self,message:str,keep:bool,session_id:str=None,
+                          priority:int=0,model:str=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session_id: A string indicate the identity of independent chat session,
+                and chat in the default session by set it to `None`.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        async for piece in self._backend.stream_chat(message,keep,session_id,priority,
+                                                     **self._override(model)):
+            yield piece
+
+    ## =========================== Config Update Method =========================== ##
+    async def update_config(self,format:str='',gpu:bool=None,ram:bool=None,
+                            engine:dict=None,reload:bool=True) -> bool:
+        '''The method is defined for update config parameters 
+        of local backend inference.
+        Args:
+            format: A sting indicate the format of chat inference's input.
+            gpu: A boolean indicate whether using GPU for inference acceleration.
+            ram: A boolean indicate whether keeping the model loaded in memory.
+            engine: A dictionary indicate the engine parameters to update,
+                such as `n_threads`, `n_batch` or `type_k`.
+            reload: A boolean indicate whether load the loaded model again
+                when parameters are changed.
+        Returns:
+            A boolean indicate whether any parameter is changed.
+        '''
+        try:
+            method = self._backend.reconfigure
+        except AttributeError:
+            error = '`update_config()` only available with backend `local`.'
+            raise AttributeError(error)
+        return await method(format,gpu,ram,engine,reload)
+
+    ## ========================== Model Lifecycle Methods ========================== ##
+    async def load(self,model:str=None) -> None:
+        '''The method is defined for load a model of local backend
+        when it isn't loaded.
+        Args:
+            model: A string indicate the name of the registered model,
+                and load the model of `local.model` section by set it to `None`.
+        '''
+        try:
+            method = self._backend.load
+        except AttributeError:
+            error = '`load()` only available with backend `local`.'
+            raise AttributeError(error)
+        await method(model)
+
+    async def unload(self,model:str=None) -> None:
+        '''The method is defined for unload a model of local backend,
+        which is loaded again by next inference.
+        Args:
+            model: A string indicate the name of the registered model,
+                and unload all loaded models by set it to `None`.
+        '''
+        try:
+            method = self._backend.unload
+        except AttributeError:
+            error = '`unload()` only available with backend `local`.'
+            raise AttributeError(error)
+        await method(model)
+
+    async def warmup(self) -> None:
+        '''The method is defined for warm up the model of the backend,
+        which asks remote servers to load the model with backend `remote`.'''
+        await self._backend.warmup()
+
+    ## ============================== Release Method ============================== ##
+    async def close(self) -> None:
+        '''The method is defined for release resources held by the backend.'''
+        await self._backend.close()
@@ -1,11 +1,12 @@
-from ..backends import Local, Remote
+from ..backends import Local, LocalPool, Remote
+from ..components import Tracer
 from typing import Literal
 from pathlib import Path
 
 class Llyra:
     '''The class is defined for unified interface of inference and advance methods.'''
     ## ============================= Initialize Method ============================= ##
-    def __init__(self,mode:Literal['local','remote'],path:str|Path=None) -> None:
+    def __init__(self,mode:Literal['local','local-pool','remote'],path:str|Path=None) -> None:
         '''The method is defined for initialize Llyra class object.
         Args:
             mode: A choice indicate the mode of Llyra.
@@ -14,43 +15,121 @@ class Llyra:
         # Initialize backend attribute
         if mode == 'local':
             self._backend = Local(path)
+        elif mode == 'local-pool':
+            self._backend = LocalPool(path)
         elif mode == 'remote':
             self._backend = Remote(path)
     
     ## ============================= Inference Methods ============================= ##
-    def call(self,input:str) -> str:
+    def call(self,input:str,priority:int=0,model:str=None) -> str:
         '''The method is defined for fulfill single LLM call.
         Args:
             input: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
         Returns:
             output: A string indicate the output content from model inference.
         '''
-        return self._backend.call(input)
+        return self._backend.call(input,priority,**self._override(model))
     
-    def chat(self,message:str,keep:bool) -> str:
+    def chat(self,message:str,keep:bool,session_id:str=None,
+             priority:int=0,model:str=None) -> str:
         '''The method is defined for fulfill iterative chat inference.
         Args:
             message: A string indicate the input content for chat inference.
             keep: A boolean indicate whether continue last chat iteration.
+            session_id: A string indicate the identity of independent chat session,
+                and chat in the default session by set it to `None`.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
         Returns:
             response: A string indicate the output content from model inference.
         '''
-        return self._backend.chat(message,keep)
+        return self._backend.chat(message,keep,session_id,priority,
+                                  **self._override(model))
     
+    ## ========================== Batch Inference Method ========================== ##
+    def call_many(self,inputs:list,concurrency:int=1,progress=None,
+                  priority:int=0,model:str=None) -> list:
+        '''The method is defined for fulfill batch of single LLM calls.
+        Args:
+            inputs: A list of strings indicate the input contents for model inference.
+            concurrency: A integer indicate the maximum inferences in flight
+                against remote backend.
+            progress: A callable indicate the hook called with the number of
+                finished inferences and the number of all inferences.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Returns:
+            outputs: A list indicate the output content of each input in order,
+                or the exception raised by the inference of the input.
+        '''
+        return self._backend.call_many(inputs,concurrency,progress,priority,
+                                       **self._override(model))
+
+    ## ========================== Stream Inference Methods ========================== ##
+    def stream_call(self,input:str,priority:int=0,model:str=None):
+        '''The method is defined for fulfill single LLM call in streaming.
+        Args:
+            input: A string indicate the input content for model inference.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        yield from self._backend.stream_call(input,priority,**self._override(model))
+
+    def stream_chat(self,message:str,keep:bool,session_id:str=None,
+                    priority:int=0,model:str=None):
+        '''The method is defined for fulfill iterative chat inference in streaming.
+        Args:
+            message: A string indicate the input content for chat inference.
+            keep: A boolean indicate whether continue last chat iteration.
+            session_id: A string indicate the identity of independent chat session,
+                and chat in the default session by set it to `None`.
+            priority: A integer indicate the priority of the request
+                queued for backend `local`, and higher priority is served first.
+            model: A string indicate the name of the model registered
+                for backend `local`, and infer with the model of `local.model` section
+                by set it to `None`.
+        Yields:
+            A string indicate the piece of output content from model inference.
+        '''
+        yield from self._backend.stream_chat(message,keep,session_id,priority,
+                                             **self._override(model))
+
     ## ========================== Strategy Update Methods ========================== ##
-    def update_call(self,stop:str|list=None,temperature:float=None) -> None:
+    def update_call(self,stop:str|list=None,temperature:float=None,
+                    options:dict=None,max_tokens:int=None) -> None:
         '''The method is defined for update strategy parameters 
         of single call inference.
         Args:
             stop: A string or a list of strings 
                 indicate where the model should stop generation.
             temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options to update
+                for backend `remote`, and drop an option by set its value to `None`.
+            max_tokens: A integer indicate the maximum tokens of generation,
+                and keep the default limit of the backend by set it to 0.
         '''
-        self._backend.strategy.update_call(stop,temperature)
+        self._backend.strategy.update_call(stop,temperature,options,max_tokens)
 
     def update_chat(self,addition:str=None,
             prompt_role:str=None,input_role:str=None,output_role:str=None,
-            stop:str|list=None,temperature:float=None) -> None:
+            stop:str|list=None,temperature:float=None,
+            options:dict=None,max_tokens:int=None) -> None:
         '''The method is defined for update strategy parameters 
         of iterative chat inference.
         Args:
@@ -61,35 +140,177 @@ class Llyra:
             stop: A string or a list of strings
                 indicate where the model should stop generation.
             temperature: A float indicate the model inference temperature.
+            options: A dictionary indicate the Ollama options to update
+                for backend `remote`, and drop an option by set its value to `None`.
+            max_tokens: A integer indicate the maximum tokens of generation,
+                and keep the default limit of the backend by set it to 0.
         '''
         self._backend.strategy.update_chat(addition,
             prompt_role,input_role,output_role,
-            stop,temperature)
+            stop,temperature,options,max_tokens)
         
     ## =========================== Config Update Method =========================== ##
-    def update_config(self,format:str=None,gpu:bool=None,ram:bool=None) -> None:
+    def update_config(self,format:str='',gpu:bool=None,ram:bool=None,
+                      engine:dict=None,reload:bool=True) -> bool:
         '''The method is defined for update config parameters 
         of local backend inference.
         Args:
             format: A sting indicate the format of chat inference's input.
             gpu: A boolean indicate whether using GPU for inference acceleration.
             ram: A boolean indicate whether keeping the model loaded in memory.
+            engine: A dictionary indicate the engine parameters to update,
+                such as `n_threads`, `n_batch` or `type_k`.
+            reload: A boolean indicate whether load the loaded model again
+                when parameters are changed.
+        Returns:
+            A boolean indicate whether any parameter is changed.
         '''
         try:
-            self._backend.config.update(format,gpu,ram)
+            method = self._backend.reconfigure
         except AttributeError:
             error = '`update_config()` only available with backend `local`.'
             raise AttributeError(error)
+        return method(format,gpu,ram,engine,reload)
         
+    ## ========================== Model Lifecycle Methods ========================== ##
+    def load(self,model:str=None) -> None:
+        '''The method is defined for load a model of local backend
+        when it isn't loaded.
+        Args:
+            model: A string indicate the name of the registered model,
+                and load the model of `local.model` section by set it to `None`.
+        '''
+        try:
+            method = self._backend.load
+        except AttributeError:
+            error = '`load()` only available with backend `local`.'
+            raise AttributeError(error)
+        method(model)
+
+    def unload(self,model:str=None) -> None:
+        '''The method is defined for unload a model of local backend,
+        which is loaded again by next inference.
+        Args:
+            model: A string indicate the name of the registered model,
+                and unload all loaded models by set it to `None`.
+        '''
+        try:
+            method = self._backend.unload
+        except AttributeError:
+            error = '`unload()` only available with backend `local`.'
+            raise AttributeError(error)
+        method(model)
+
+    def warmup(self) -> None:
+        '''The method is defined for warm up the model of the backend,
+        which asks remote servers to load the model with backend `remote`.'''
+        self._backend.warmup()
+
+    ## ============================ Model Select Method ============================ ##
+    def _override(self,model:str|None) -> dict:
+        '''The method is defined for make keyword argument selecting the model
+        of an inference, which is only available with backend `local`.
+        Args:
+            model: A string indicate the name of the registered model,
+                and infer with the model of config file by set it to `None`.
+        Returns:
+            A dictionary indicate the keyword argument passed to the backend.
+        '''
+        if model == None:
+            return {}
+        if not isinstance(self._backend,Local):
+            error = '`model` argument only available with backend `local`.'
+            raise ValueError(error)
+        return {'model': model}
+
+    ## ============================ Session Drop Method ============================ ##
+    def drop_session(self,session_id:str) -> None:
+        '''The method is defined for drop chat history of a chat session.
+        Args:
+            session_id: A string indicate the identity of the chat session.
+        '''
+        self._backend.session.drop(session_id)
+
     ## ============================== Get Log Method ============================== ##
-    def get_log(self,id:int) -> dict|list:
+    def get_log(self,id:int=-1,offset:int=0,limit:int=None,
+                type:str=None,model:str=None,
+                since:float=None,until:float=None) -> dict|list:
         '''The method is defined to read log records in reasonable way.
         Args:
             id: A integer indicate the specific inference log.\n
                 Start from 0. \n
-                And read all records by set it minus.
+                And read records selected by other arguments by set it minus.
+            offset: A integer indicate the number of selected records skipped.
+            limit: A integer indicate the maximum number of read records,
+                and read all selected records by set it to `None`.
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
         Returns:
             A dictionary indicate the specific log records.
-            Or a list of each log record's dictionary. 
+            Or a list of each selected log record's dictionary. 
+        '''
+        return self._backend.log.get(id,offset,limit,type,model,since,until)
+
+    def get_stats(self,type:str=None,model:str=None,
+                  since:float=None,until:float=None) -> dict:
+        '''The method is defined to aggregate inference measurements of log records.
+        Args:
+            type: A string indicate the inference type of selected records.
+            model: A string indicate the model name of selected records.
+            since: A float indicate the earliest creation timestamp of selected records.
+            until: A float indicate the latest creation timestamp of selected records.
+        Returns:
+            A dictionary indicate the counts of inferences,
+            cached and truncated responses, the sums of token counts,
+            and the mean, `p50`, `p90`, `p99` and maximum of `latency`,
+            `ttft` and `tps`, or `None` for a measurement never observed.
+        '''
+        return self._backend.log.stats(type,model,since,until)
+
+    ## =============================== Tracer Method =============================== ##
+    def set_tracer(self,tracer:Tracer) -> None:
+        '''The method is defined for replace the tracer of inference stages,
+        and release the tracer configured before.
+        Args:
+            tracer: A Tracer instance indicate the exporter of spans,
+                which is a subclass enabled and overriding `export()` for custom hooks.
         '''
-        return self._backend.log.get(id)   
+        self._backend.tracer.close()
+        self._backend.tracer = tracer
+
+    ## ================================ Cache Methods ================================ ##
+    def get_cache_stats(self,kind:Literal['response','semantic']='response') -> dict:
+        '''The method is defined for read hit statistics of a cache.
+        Args:
+            kind: A choice indicate the response cache of exact calls,
+                or the semantic cache of similar queries.
+        Returns:
+            A dictionary indicate the hits, misses, hit rate
+            and number of kept responses,
+            with evictions and inference seconds saved of semantic cache.
+        '''
+        return self._cache(kind,'get_cache_stats').stats()
+
+    def clear_cache(self,kind:Literal['response','semantic']='response') -> None:
+        '''The method is defined for drop all responses kept by a cache.
+        Args:
+            kind: A choice indicate the response cache of exact calls,
+                or the semantic cache of similar queries.
+        '''
+        self._cache(kind,'clear_cache').clear()
+
+    def _cache(self,kind:str,method:str):
+        '''The method is defined for select an enabled cache of the backend.
+        Args:
+            kind: A string indicate the kind of cache.
+            method: A string indicate the name of calling method for error message.
+        Returns:
+            A Cache or SemanticCache instance indicate the selected cache.
+        '''
+        cache = self._backend.cache if kind == 'response' else self._backend.semantic
+        if cache == None:
+            error = f'`{method}()` only available with {kind} cache enabled.'
+            raise AttributeError(error)
+        return cache
\ No newline at end of file
@@ -0,0 +1,82 @@
+import pytest
+from llyra.backends.locals import batcher as module
+from llyra.backends.locals.batcher import Batcher, Generation
+
+class FakeModel:
+    '''The class is defined for fake model detokenizing scripted tokens.'''
+    model = None
+    pieces = {1: b'Hel',2: b'lo E',3: b'N',4: b'D more',5: b'\xe4\xbd',6: b'\xa0'}
+    def detokenize(self,tokens:list) -> bytes:
+        return b''.join(self.pieces[token] for token in tokens)
+
+@pytest.fixture
+def batcher(monkeypatch):
+    # Replace llama.cpp calls of finishing a sequence
+    monkeypatch.setattr(module.llama_cpp,'llama_token_is_eog',
+                        lambda model, token: token == 0,raising=False)
+    monkeypatch.setattr(module.llama_cpp,'llama_kv_cache_seq_rm',
+                        lambda *args: None,raising=False)
+    monkeypatch.setattr(module.llama_cpp,'llama_sampler_free',
+                        lambda sampler: None,raising=False)
+    batcher = Batcher.__new__(Batcher)
+    batcher.model = FakeModel()
+    batcher.limit = 64
+    batcher._ctx = None
+    batcher._seqs = []
+    batcher._active = []
+    return batcher
+
+def admit(batcher:Batcher,stop:list,max_tokens:int=16,stream:bool=True) -> Generation:
+    '''The function is defined for put a request into a sequence of the batch.'''
+    generation = Generation([7,8],stop,0,max_tokens,stream)
+    generation.seq = 0
+    generation.position = 2
+    generation.evaluated = 2
+    batcher._active.append(generation)
+    return generation
+
+def drain(generation:Generation) -> list:
+    '''The function is defined for collect passed pieces of a request.'''
+    pieces = []
+    while not generation.pieces.empty():
+        pieces.append(generation.pieces.get())
+    return pieces
+
+## ============================== `_accept()` Method Test ============================== ##
+def test_accept_method_with_stop_sequence(batcher):
+    '''Test whether method holds back the start of a stop sequence,
+    and cuts the response at the stop sequence.'''
+    generation = admit(batcher,['END'])
+    for token in (1,2,3,4):
+        batcher._accept(generation,token)
+    assert drain(generation) == ['Hel','lo ',None]
+    assert generation.future.result() == {
+        'choices': [{'text': 'Hello ','finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': 2,'completion_tokens': 4,'total_tokens': 6}}
+    assert batcher._active == []
+    assert batcher._seqs == [0]
+
+def test_accept_method_with_end_of_generation(batcher):
+    '''Test whether method finishes the sequence on end of generation token,
+    without counting it as a generated token.'''
+    generation = admit(batcher,[],stream=False)
+    batcher._accept(generation,1)
+    batcher._accept(generation,0)
+    response = generation.future.result()
+    assert response['choices'] == [{'text': 'Hel','finish_reason': 'stop'}]
+    assert response['usage']['completion_tokens'] == 1
+
+def test_accept_method_with_length_limit(batcher):
+    '''Test whether method finishes the sequence once it reaches `max_tokens`.'''
+    generation = admit(batcher,[],max_tokens=2)
+    batcher._accept(generation,1)
+    batcher._accept(generation,2)
+    assert drain(generation) == ['Hel','lo E',None]
+    assert generation.future.result()['choices'][0]['finish_reason'] == 'length'
+
+def test_accept_method_with_split_character(batcher):
+    '''Test whether method joins a character split across tokens.'''
+    generation = admit(batcher,[])
+    batcher._accept(generation,5)
+    batcher._accept(generation,6)
+    assert drain(generation) == ['你']
@@ -0,0 +1,186 @@
+import os
+import pytest
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from time import sleep
+from llyra.backends import Local
+from llyra.backends.locals import definition as module
+from llyra.backends.locals.scheduler import Scheduler
+from llyra.components import LocalConfig, SemanticCache
+from llyra.errors.locals import LocalModelNotRegisteredError
+
+class FakeModel:
+    '''The class is defined for fake model instance remembering its file.'''
+    def __init__(self,path:str) -> None:
+        self.path = path
+
+class FakeEmbedder:
+    '''The class is defined for fake embedding model counting embeddings in flight.'''
+    def __init__(self,**settings) -> None:
+        self.running = 0
+        self.peak = 0
+    def embed(self,text:str) -> list:
+        self.running += 1
+        self.peak = max(self.peak,self.running)
+        sleep(0.01)
+        self.running -= 1
+        return [1.0,float(len(text))]
+
+@pytest.fixture
+def local(tmp_path):
+    # Set model files and test config file
+    for name, size in (('default',100),('coder',150),('tiny',50)):
+        (tmp_path / f'{name}.gguf').write_bytes(bytes(size))
+    content = f'''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = false
+    ram = false
+    [local.model]
+    name = "default"
+    directory = "{tmp_path.as_posix()}"
+    suffix = ".gguf"
+    [local.registry]
+    budget = 250
+    [[local.registry.models]]
+    name = "coder"
+    [[local.registry.models]]
+    name = "tiny.gguf"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Make backend without loading models
+    local = Local.__new__(Local)
+    local.config = LocalConfig()
+    local.config.load(test_toml)
+    local._models = OrderedDict()
+    local._batchers = {}
+    local._stamps = {}
+    local._used = {}
+    local._busy = {}
+    local._states = OrderedDict()
+    local._active = {}
+    local._embedder = None
+    local._guard = Lock()
+    local._embedding = Lock()
+    local._watcher = None
+    local._open = lambda name: FakeModel(local.config.locate(name))
+    return local
+
+## ============================= `_resolve()` Method Test ============================== ##
+def test_resolve_method(local):
+    '''Test whether method selects registered models by name or file name.'''
+    assert local._resolve(None) == 'default'
+    assert local._resolve('tiny.gguf') == 'tiny'
+    with pytest.raises(LocalModelNotRegisteredError):
+        local._resolve('missing')
+
+## =============================== `_load()` Method Test =============================== ##
+def test_load_method_evicting_least_recently_used_model(local):
+    '''Test whether method unloads least recently used models
+    for a model beyond memory budget.'''
+    local._load()
+    local._load('tiny')
+    local._acquire()
+    assert local.models == ['tiny','default']
+    local._load('coder')
+    assert local.models == ['default','coder']
+
+def test_load_method_with_model_beyond_budget(local):
+    '''Test whether method loads a model larger than memory budget alone.'''
+    local.config.registry.budget = 120
+    local._load()
+    local._load('coder')
+    assert local.models == ['coder']
+
+def test_load_method_dropping_states_of_evicted_model(local):
+    '''Test whether method drops saved model states with the evicted model.'''
+    local._load()
+    local._states[('default','session')] = 'state'
+    local._active['default'] = 'session'
+    local._load('coder')
+    local._load('tiny')
+    assert local.models == ['coder','tiny']
+    assert local._states == {}
+    assert local._active == {}
+
+## ============================= `_acquire()` Method Test ============================== ##
+def test_acquire_method_with_changed_model_file(local,tmp_path):
+    '''Test whether method loads a model again once its file is changed,
+    and keeps the model while its file is missing.'''
+    former = local._acquire('tiny')
+    assert local._acquire('tiny') is former
+    (tmp_path / 'tiny.gguf').write_bytes(bytes(60))
+    os.utime(tmp_path / 'tiny.gguf',ns=(0,0))
+    latter = local._acquire('tiny')
+    assert latter is not former
+    (tmp_path / 'tiny.gguf').unlink()
+    assert local._acquire('tiny') is latter
+
+def test_acquire_method_without_reload(local,tmp_path):
+    '''Test whether method keeps a model with changed file without hot reload.'''
+    local.config.registry.reload = False
+    former = local._acquire()
+    (tmp_path / 'default.gguf').write_bytes(bytes(10))
+    assert local._acquire() is former
+
+## ============================== `_watch()` Method Test =============================== ##
+def test_watch_method_keeping_model_in_use(local):
+    '''Test whether method keeps a model while a stream runs on it beyond idle timeout,
+    and unloads the model after idle timeout since the stream ends.'''
+    local.config.idle = 0.2
+    local._load()
+    def stream():
+        for piece in ('a','b','c'):
+            sleep(0.1)
+            yield piece
+    assert list(local._track(stream())) == ['a','b','c']
+    assert local.models == ['default']
+    sleep(0.5)
+    assert local.models == []
+
+
+## =============================== `_embed()` Method Test ============================== ##
+def test_embed_method_from_threads_with_batching(local,monkeypatch):
+    '''Test whether method embeds one query at a time
+    when single calls read semantic cache from their own threads with batching.'''
+    monkeypatch.setattr(module,'Llama',FakeEmbedder)
+    local.config.batch.slots = 4
+    local.cache = None
+    local.semantic = SemanticCache(capacity=16)
+    # Read semantic cache of single calls from several threads at once
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda index: local._recall('call',f'query {index}',
+                                                                None,None,[],0.6),
+                                    range(16)))
+    assert all(response == None for response, _ in results)
+    assert local._embedder.peak == 1
+
+
+## ============================= `call_many()` Method Test ============================= ##
+def test_call_many_method_queueing_each_call(local):
+    '''Test whether method queues each single call as its own request,
+    so other requests are served between them.'''
+    local._scheduler = Scheduler()
+    order = []
+    def call(message:str,priority:int=0,model:str=None) -> str:
+        # Queue another request while the first call runs
+        if message == 'a':
+            Thread(target=local._scheduler.submit,args=(order.append,'other')).start()
+            while not local._scheduler.pending:
+                sleep(0.001)
+        if message == 'boom':
+            raise ValueError('boom')
+        order.append(message)
+        return message.upper()
+    local._call = call
+    progress = []
+    results = local.call_many(['a','boom','c'],1,
+                              lambda finished, total: progress.append((finished,total)))
+    assert results[0] == 'A' and results[2] == 'C'
+    assert isinstance(results[1],ValueError)
+    assert order == ['a','other','c']
+    assert progress == [(1,3),(2,3),(3,3)]
@@ -0,0 +1,120 @@
+import pytest
+from queue import Queue
+from threading import Lock
+from types import SimpleNamespace
+from llyra.backends.locals import pool as module
+from llyra.backends.locals.pool import LocalPool, serve
+
+class FakeModel:
+    '''The class is defined for fake model recording switched states.'''
+    def __init__(self,**settings) -> None:
+        self.loaded = []
+    def save_state(self) -> str:
+        return 'state'
+    def load_state(self,state:str) -> None:
+        self.loaded.append(state)
+    def create_completion(self,prompt:str,stream:bool=False,**parameters):
+        if prompt == 'boom':
+            raise ValueError('boom')
+        if stream:
+            return ({'choices': [{'text': piece}]} for piece in prompt)
+        return {'choices': [{'text': prompt}]}
+
+class FakeWorker:
+    '''The class is defined for fake worker handle without process.'''
+    def __init__(self,index:int) -> None:
+        self.index = index
+        self.outstanding = 0
+        self.used = 0
+        self.alive = True
+
+@pytest.fixture
+def pool():
+    pool = LocalPool.__new__(LocalPool)
+    pool._lock = Lock()
+    pool._routes = {}
+    pool._workers = [FakeWorker(0),FakeWorker(1),FakeWorker(2)]
+    pool._acquire = lambda model=None: None
+    pool._start = FakeWorker
+    return pool
+
+def run(requests:list,cancel:int=-1) -> list:
+    '''The function is defined for serve requests in current thread
+    and collect responses.'''
+    queue, responses = Queue(), Queue()
+    for request in requests + [None]:
+        queue.put(request)
+    serve({},0,2,queue,responses,SimpleNamespace(value=cancel))
+    return [responses.get() for _ in range(responses.qsize())]
+
+## ============================== `_select()` Method Test ============================== ##
+def test_select_method_with_least_loaded_worker(pool):
+    '''Test whether method selects the worker with least requests in flight.'''
+    pool._workers[0].outstanding = 2
+    pool._workers[1].outstanding = 1
+    worker = pool._select(False)
+    assert worker.index == 2
+    assert worker.outstanding == 1
+    pool._settle(worker)
+    assert worker.outstanding == 0
+
+def test_select_method_with_sticky_session(pool):
+    '''Test whether method routes a chat session to its former worker
+    regardless of load, while single calls aren't routed.'''
+    first = pool._select('session')
+    first.outstanding = 5
+    assert pool._select('session') is first
+    assert pool._select(False) is not first
+    assert pool._routes == {'session': first.index}
+
+def test_select_method_with_stopped_worker(pool):
+    '''Test whether method prefers running workers,
+    and starts a stopped worker again when it's selected.'''
+    pool._workers[1] = None
+    pool._workers[0].outstanding = 1
+    assert pool._select(False).index == 2
+    worker = pool._select(False)
+    assert worker.index == 1
+    assert pool._workers[1] is worker
+
+def test_select_method_with_workers_stopped_since_loading(pool):
+    '''Test whether method starts the workers again
+    when they're stopped by another thread after loading.'''
+    workers = pool._workers
+    calls = []
+    def acquire(model=None):
+        # Stop the workers right after the first loading
+        calls.append(model)
+        pool._workers = [] if len(calls) == 1 else workers
+    pool._acquire = acquire
+    assert pool._select(False).index == 0
+    assert len(calls) == 2
+
+## ============================== `_queue()` Method Test ============================== ##
+def test_queue_method_without_scheduler(pool):
+    '''Test whether the pool serves lifecycle requests without scheduler thread,
+    since workers serve requests in arrival order themselves.'''
+    assert pool._queue() == None
+    unloaded = []
+    pool._unload = unloaded.append
+    pool.unload()
+    assert unloaded == [None]
+
+## ============================== `serve()` Function Test ============================== ##
+def test_serve_function(monkeypatch):
+    '''Test whether function answers requests and errors by their identities.'''
+    monkeypatch.setattr(module,'Llama',FakeModel)
+    responses = run([(0,'create_completion',False,{'prompt': 'hi'}),
+                     (1,'create_completion',False,{'prompt': 'boom'})])
+    assert responses[0] == (0,'done',{'choices': [{'text': 'hi'}]})
+    assert responses[1][:2] == (1,'error')
+    assert isinstance(responses[1][2],ValueError)
+
+def test_serve_function_with_stream(monkeypatch):
+    '''Test whether function passes stream chunks and stops cancelled streams.'''
+    monkeypatch.setattr(module,'Llama',FakeModel)
+    responses = run([(0,'create_completion',False,{'prompt': 'ab','stream': True})])
+    assert [kind for _, kind, _ in responses] == ['chunk','chunk','done']
+    responses = run([(3,'create_completion',False,{'prompt': 'ab','stream': True})],
+                    cancel=3)
+    assert responses == [(3,'done',None)]
@@ -0,0 +1,670 @@
+import pytest
+import asyncio
+import json
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Thread
+from llyra.backends.remotes import Remote, AsyncRemote
+from llyra.backends.remotes.backends import Ollama, AsyncOllama, Balancer, AsyncBalancer
+from llyra.backends.remotes.backends.utils import Breaker, compute_backoff, set_predict, PROBES
+from llyra.errors.remotes import RemoteServerConnectionError, RemoteServerTimeoutError, RemoteServerUnavailableError, RemoteServiceError, RemoteServiceNotCompatibleError
+
+class FakeOllama(ThreadingHTTPServer):
+    '''The class is defined for fake ollama server answering scripted responses.'''
+    daemon_threads = True
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1',0),FakeHandler)
+        # Scripted responses of inference interfaces,
+        # which are status, delay seconds and body in order
+        self.script:list = []
+        self.hits:dict = {}
+        self.bodies:list = []
+        self.healthy = True
+        self.reason = 'stop'
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/api/'
+
+class FakeHandler(BaseHTTPRequestHandler):
+    '''The class is defined for handle requests of fake ollama server.'''
+    def log_message(self,*args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.hits['tags'] = self.server.hits.get('tags',0) + 1
+        if self.server.healthy:
+            self._reply(200,{'models': [{'name': 'test-model'}]})
+        else:
+            self._reply(503,{'error': 'down'})
+
+    def do_POST(self) -> None:
+        interface = self.path.rsplit('/',1)[-1]
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.hits[interface] = self.server.hits.get(interface,0) + 1
+        self.server.bodies.append(body)
+        # Reply scripted response, or successful response after script
+        if self.server.script:
+            status, delay, content = self.server.script.pop(0)
+            time.sleep(delay)
+            if status != 200:
+                self._reply(status,content)
+                return
+        reason = self.server.reason
+        if body.get('stream') and interface == 'chat':
+            lines = [{'message': {'role': 'assistant','content': 'Hello'},'done': False},
+                     {'message': {'role': 'assistant','content': '!'},
+                      'done': True,'done_reason': reason}]
+            self._reply(200,lines)
+        elif body.get('stream'):
+            lines = [{'response': 'Hello','done': False},
+                     {'response': '!','done': True,'done_reason': reason}]
+            self._reply(200,lines)
+        elif interface == 'chat':
+            self._reply(200,{'message': {'role': 'assistant','content': 'Hello!'},
+                             'done_reason': reason})
+        else:
+            self._reply(200,{'response': 'Hello!','done_reason': reason,
+                             'prompt_eval_count': 12,'eval_count': 20,
+                             'eval_duration': 500000000})
+
+    def _reply(self,status:int,content) -> None:
+        if isinstance(content,list):
+            data = ''.join(json.dumps(line) + '\n' for line in content).encode()
+        else:
+            data = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header('Content-Type','application/json')
+        self.send_header('Content-Length',str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def start_server() -> FakeOllama:
+    server = FakeOllama()
+    Thread(target=server.serve_forever,args=(0.05,),daemon=True).start()
+    return server
+
+def stop_server(server:FakeOllama) -> None:
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(autouse=True)
+def probes():
+    PROBES.clear()
+    yield PROBES
+    PROBES.clear()
+
+@pytest.fixture
+def server():
+    server = start_server()
+    yield server
+    stop_server(server)
+
+@pytest.fixture
+def servers():
+    servers = [start_server(),start_server()]
+    yield servers
+    for server in servers:
+        stop_server(server)
+
+def make_ollama(server,**kwargs) -> Ollama:
+    options = {'retries': 2,'backoff': 0.01,'backoff_max': 0.02,
+               'read_timeout': 0.5,'breaker': 0}
+    options.update(kwargs)
+    return Ollama(server.url,'test-model',**options)
+
+@pytest.fixture
+def remote_config(server,tmp_path):
+    # Set test prompt file
+    test_prompt = tmp_path / 'prompt.txt'
+    test_prompt.write_text('This is for test.')
+    # Set test strategy file
+    test_strategy = tmp_path / 'strategy.toml'
+    test_strategy.write_text(f'''
+    [call]
+    stop = "<EOF>"
+    temperature = 0.2
+    [chat]
+    prompt = "{test_prompt}"
+    stop = "<EOF>"
+    temperature = 0.8
+    [chat.role]
+    prompt = "system"
+    input = "user"
+    output = "assistant"
+    ''')
+    # Set test config file
+    test_config = tmp_path / 'config.toml'
+    test_config.write_text(f'''
+    [global]
+    strategy = "{test_strategy}"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = "http://127.0.0.1"
+    port = {server.server_address[1]}
+    endpoint = "api/"
+    ''')
+    return test_config
+
+@pytest.fixture
+def remote(remote_config):
+    remote = Remote(remote_config)
+    return remote
+
+def make_balancer(servers,**kwargs) -> Balancer:
+    nodes = [make_ollama(server,validate=False) for server in servers]
+    return Balancer(nodes,health=0,**kwargs)
+
+## ===================== `compute_backoff()` Function Test ====================== ##
+def test_compute_backoff_function():
+    '''Test whether the function jitters delay under exponential ceiling properly.'''
+    for attempt, ceiling in [(1,0.5),(2,1.0),(3,2.0),(8,4.0)]:
+        delays = [compute_backoff(attempt,0.5,4) for _ in range(100)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert len(set(delays)) > 1
+
+## ============================== Breaker Class Test ============================== ##
+def test_breaker_opening_and_recovering(monkeypatch):
+    '''Test whether the circuit opens after threshold failures,
+    and closes after a successful trial request.'''
+    now = [0.0]
+    monkeypatch.setattr('llyra.backends.remotes.backends.utils.classes.monotonic',
+                        lambda: now[0])
+    breaker = Breaker(threshold=2,cooldown=10)
+    breaker.failure()
+    breaker.allow()
+    breaker.failure()
+    assert breaker.open
+    with pytest.raises(RemoteServerUnavailableError):
+        breaker.allow()
+    # Validate only one trial request is allowed after cooldown
+    now[0] = 10.0
+    breaker.allow()
+    with pytest.raises(RemoteServerUnavailableError):
+        breaker.allow()
+    breaker.success()
+    assert not breaker.open
+    breaker.allow()
+
+## ============================ Ollama Request Test ============================ ##
+def test_call_method_retrying_transient_failures(server):
+    '''Test whether the method retries transient failures until success.'''
+    ollama = make_ollama(server)
+    server.script = [(503,0,{'error': 'busy'}),(500,0,{'error': 'oops'})]
+    assert ollama.call('Hi!',None,0) == 'Hello!'
+    assert server.hits['generate'] == 3
+
+def test_call_method_exhausting_retries(server):
+    '''Test whether the method raises service error after retries run out.'''
+    ollama = make_ollama(server,retries=1)
+    server.script = [(503,0,{'error': 'busy'})] * 2
+    with pytest.raises(RemoteServiceError,match='busy'):
+        ollama.call('Hi!',None,0)
+    assert server.hits['generate'] == 2
+
+def test_call_method_not_retrying_client_error(server):
+    '''Test whether the method doesn't retry failures of the request itself.'''
+    ollama = make_ollama(server)
+    server.script = [(404,0,{'error': 'model not found'})]
+    with pytest.raises(RemoteServiceError,match='model not found'):
+        ollama.call('Hi!',None,0)
+    assert server.hits['generate'] == 1
+
+def test_call_method_with_read_timeout(server):
+    '''Test whether the method gives up a hung server after read timeout.'''
+    ollama = make_ollama(server,retries=0,read_timeout=0.2)
+    server.script = [(200,1,None)]
+    start = time.monotonic()
+    with pytest.raises(RemoteServerTimeoutError):
+        ollama.call('Hi!',None,0)
+    assert time.monotonic() - start < 1
+
+def test_call_method_not_retrying_read_timeout(server):
+    '''Test whether the method raises timeout error at once after read timeout,
+    without retrying the request the server may be still generating.'''
+    ollama = make_ollama(server,retries=2,read_timeout=0.2)
+    server.script = [(200,1,None)]
+    with pytest.raises(RemoteServerTimeoutError):
+        ollama.call('Hi!',None,0)
+    assert server.hits['generate'] == 1
+
+def test_call_method_with_unreachable_server(server):
+    '''Test whether the method raises connection error when server is gone.'''
+    ollama = make_ollama(server)
+    server.shutdown()
+    server.server_close()
+    with pytest.raises(RemoteServerConnectionError):
+        ollama.call('Hi!',None,0)
+
+def test_call_method_failing_fast_with_open_circuit(server):
+    '''Test whether the method fails fast while the server keeps failing,
+    and recovers after cooldown.'''
+    ollama = make_ollama(server,retries=0,breaker=2,cooldown=0.3)
+    server.script = [(503,0,{'error': 'busy'})] * 2
+    for _ in range(2):
+        with pytest.raises(RemoteServiceError):
+            ollama.call('Hi!',None,0)
+    with pytest.raises(RemoteServerUnavailableError):
+        ollama.call('Hi!',None,0)
+    assert server.hits['generate'] == 2
+    time.sleep(0.3)
+    assert ollama.call('Hi!',None,0) == 'Hello!'
+    assert not ollama.breaker.open
+
+def test_stream_call_method_retrying_transient_failures(server):
+    '''Test whether the method retries transient failures before streaming.'''
+    ollama = make_ollama(server)
+    server.script = [(502,0,{'error': 'bad gateway'})]
+    assert list(ollama.stream_call('Hi!',None,0)) == ['Hello','!']
+    assert server.hits['generate'] == 2
+
+def test_call_method_passing_ollama_options(server):
+    '''Test whether the method passes Ollama options through,
+    with `keep_alive` beside the options overriding the client default.'''
+    ollama = make_ollama(server,hold='5m')
+    ollama.call('Hi!','<EOF>',0,{'num_ctx': 4096,'keep_alive': -1})
+    ollama.call('Hi!','<EOF>',0)
+    assert server.bodies[0]['options'] == {'stop': ['<EOF>'],'temperature': 0,
+                                           'num_ctx': 4096}
+    assert server.bodies[0]['keep_alive'] == -1
+    assert server.bodies[1]['keep_alive'] == '5m'
+
+def test_call_method_reading_truncation(server):
+    '''Test whether the method reports generation stopped at `num_predict`,
+    which is set by `max_tokens` of strategy unless set explicitly.'''
+    ollama = make_ollama(server)
+    assert set_predict({'num_ctx': 4096},0) == {'num_ctx': 4096}
+    assert set_predict({'num_predict': 8},64) == {'num_predict': 8}
+    meta = {}
+    ollama.call('Hi!','<EOF>',0,set_predict({},64),meta)
+    assert server.bodies[0]['options']['num_predict'] == 64
+    assert meta['truncated'] == False
+    server.reason = 'length'
+    ollama.chat([{'role': 'user','content': 'Hi!'}],'<EOF>',0,None,meta)
+    assert meta['truncated'] == True
+    meta = {}
+    assert list(ollama.stream_call('Hi!',None,0,None,meta)) == ['Hello','!']
+    assert meta['truncated'] == True
+
+def test_call_method_reading_usage(server):
+    '''Test whether the method reports token counts and generation seconds.'''
+    ollama = make_ollama(server)
+    meta = {}
+    ollama.call('Hi!','<EOF>',0,None,meta)
+    assert meta == {'truncated': False,'prompt_tokens': 12,
+                    'completion_tokens': 20,'generation': 0.5}
+
+## ========================== AsyncOllama Request Test ========================== ##
+def test_async_call_method_retrying_transient_failures(server):
+    '''Test whether the method retries transient failures until success.'''
+    async def run() -> str:
+        ollama = AsyncOllama(server.url,'test-model',retries=2,
+                             backoff=0.01,backoff_max=0.02,breaker=0)
+        try:
+            return await ollama.call('Hi!',None,0)
+        finally:
+            await ollama.close()
+    server.script = [(503,0,{'error': 'busy'}),(429,0,{'error': 'slow down'})]
+    assert asyncio.run(run()) == 'Hello!'
+    assert server.hits['generate'] == 3
+
+def test_async_stream_call_method_with_read_timeout(server):
+    '''Test whether the method gives up a hung server after read timeout.'''
+    async def run() -> list:
+        ollama = AsyncOllama(server.url,'test-model',read_timeout=0.2,breaker=0)
+        try:
+            return [piece async for piece in ollama.stream_call('Hi!',None,0)]
+        finally:
+            await ollama.close()
+    server.script = [(200,1,None)]
+    with pytest.raises(RemoteServerTimeoutError):
+        asyncio.run(run())
+
+def test_async_call_method_not_retrying_read_timeout(server):
+    '''Test whether the method raises timeout error at once after read timeout.'''
+    async def run() -> str:
+        ollama = AsyncOllama(server.url,'test-model',retries=2,read_timeout=0.2,
+                             backoff=0.01,backoff_max=0.02,breaker=0)
+        try:
+            return await ollama.call('Hi!',None,0)
+        finally:
+            await ollama.close()
+    server.script = [(200,1,None)]
+    with pytest.raises(RemoteServerTimeoutError):
+        asyncio.run(run())
+    assert server.hits['generate'] == 1
+
+def test_async_call_method_failing_fast_with_open_circuit(server):
+    '''Test whether the method fails fast while the server keeps failing.'''
+    async def run() -> None:
+        ollama = AsyncOllama(server.url,'test-model',breaker=1,cooldown=30)
+        try:
+            with pytest.raises(RemoteServiceError):
+                await ollama.call('Hi!',None,0)
+            with pytest.raises(RemoteServerUnavailableError):
+                await ollama.call('Hi!',None,0)
+        finally:
+            await ollama.close()
+    server.script = [(500,0,{'error': 'oops'})]
+    asyncio.run(run())
+    assert server.hits['generate'] == 1
+
+## =========================== Balancer Routing Test ============================ ##
+def test_balancer_spreading_requests_evenly(servers):
+    '''Test whether the least outstanding policy spreads sequential requests
+    over servers in turn.'''
+    balancer = make_balancer(servers)
+    for _ in range(4):
+        assert balancer.call('Hi!',None,0) == 'Hello!'
+    assert [server.hits['generate'] for server in servers] == [2,2]
+
+def test_balancer_picking_least_outstanding_server(servers):
+    '''Test whether the policy avoids the server busy with a request.'''
+    balancer = make_balancer(servers)
+    balancer._begin(0)
+    for _ in range(3):
+        balancer.call('Hi!',None,0)
+    assert servers[0].hits.get('generate',0) == 0
+    assert servers[1].hits['generate'] == 3
+
+def test_balancer_with_weighted_policy(servers):
+    '''Test whether the weighted round-robin policy follows server weights.'''
+    balancer = make_balancer(servers,balance='weighted',weights=[3,1])
+    for _ in range(8):
+        balancer.call('Hi!',None,0)
+    assert [server.hits['generate'] for server in servers] == [6,2]
+
+def test_balancer_skipping_unhealthy_server(servers):
+    '''Test whether the balancer skips unhealthy server until it recovers.'''
+    servers[0].healthy = False
+    balancer = make_balancer(servers)
+    for _ in range(3):
+        balancer.call('Hi!',None,0)
+    assert servers[0].hits.get('generate',0) == 0
+    servers[0].healthy = True
+    balancer.check()
+    balancer.call('Hi!',None,0)
+    balancer.call('Hi!',None,0)
+    assert servers[0].hits['generate'] >= 1
+
+def test_balancer_without_healthy_server(servers):
+    '''Test whether the balancer raises probe error when no server is usable.'''
+    for server in servers:
+        server.healthy = False
+    with pytest.raises(RemoteServiceNotCompatibleError):
+        make_balancer(servers)
+
+def test_balancer_with_periodic_health_check(servers):
+    '''Test whether the balancer notices server going down by health checks.'''
+    nodes = [make_ollama(server,validate=False) for server in servers]
+    balancer = Balancer(nodes,health=0.05)
+    servers[1].healthy = False
+    time.sleep(0.3)
+    balancer.close()
+    assert balancer._healthy == [True,False]
+
+def test_balancer_routing_chat_session_sticky(servers):
+    '''Test whether each chat session keeps talking to the same server,
+    and is routed again after release.'''
+    balancer = make_balancer(servers)
+    for _ in range(3):
+        assert balancer.chat([],None,0,session='a') == 'Hello!'
+    balancer.chat([],None,0,session='b')
+    assert sorted(server.hits['chat'] for server in servers) == [1,3]
+    route = balancer._routes[('chat','a')]
+    balancer.release('a')
+    assert ('chat','a') not in balancer._routes
+    assert route in (0,1)
+
+def test_balancer_failing_over_unreachable_server(servers):
+    '''Test whether requests to a server gone after probe go to another server.'''
+    balancer = make_balancer(servers)
+    stop_server(servers[0])
+    for _ in range(3):
+        assert balancer.call('Hi!',None,0) == 'Hello!'
+    assert list(balancer.stream_call('Hi!',None,0)) == ['Hello','!']
+    assert servers[1].hits['generate'] == 4
+
+def test_balancer_raising_when_every_server_fails(servers):
+    '''Test whether the balancer raises after every server fails the request.'''
+    balancer = make_balancer(servers)
+    for server in servers:
+        stop_server(server)
+    with pytest.raises(RemoteServerConnectionError):
+        balancer.call('Hi!',None,0)
+
+def test_balancer_not_failing_over_read_timeout(servers):
+    '''Test whether the balancer raises at once after read timeout,
+    without sending the request the server may be still generating to another server.'''
+    nodes = [make_ollama(server,validate=False,read_timeout=0.2) for server in servers]
+    balancer = Balancer(nodes,health=0)
+    for server in servers:
+        server.script = [(200,1,None)]
+    with pytest.raises(RemoteServerTimeoutError):
+        balancer.call('Hi!',None,0)
+    assert sum(server.hits.get('generate',0) for server in servers) == 1
+
+## ========================= AsyncBalancer Routing Test ========================= ##
+def test_async_balancer_failing_over_unreachable_server(servers):
+    '''Test whether requests to a server gone after probe go to another server.'''
+    async def run() -> list:
+        nodes = [AsyncOllama(server.url,'test-model',breaker=0,validate=False)
+                 for server in servers]
+        balancer = AsyncBalancer(nodes,health=0)
+        stop_server(servers[0])
+        try:
+            results = [await balancer.call('Hi!',None,0) for _ in range(2)]
+            results.append([piece async for piece in balancer.stream_call('Hi!',None,0)])
+            return results
+        finally:
+            await balancer.close()
+    assert asyncio.run(run()) == ['Hello!','Hello!',['Hello','!']]
+    assert servers[1].hits['generate'] == 3
+
+def test_async_balancer_not_failing_over_read_timeout(servers):
+    '''Test whether the balancer raises at once after read timeout,
+    without sending the request the server may be still generating to another server.'''
+    async def run() -> str:
+        nodes = [AsyncOllama(server.url,'test-model',read_timeout=0.2,breaker=0,validate=False)
+                 for server in servers]
+        balancer = AsyncBalancer(nodes,health=0)
+        try:
+            return await balancer.call('Hi!',None,0)
+        finally:
+            await balancer.close()
+    for server in servers:
+        server.script = [(200,1,None)]
+    with pytest.raises(RemoteServerTimeoutError):
+        asyncio.run(run())
+    assert sum(server.hits.get('generate',0) for server in servers) == 1
+
+## ============================ Ollama Startup Test ============================= ##
+def test_probe_method_sharing_result_in_process(server):
+    '''Test whether clients of the same server share one probe within ttl.'''
+    for _ in range(3):
+        make_ollama(server)
+    assert server.hits['tags'] == 1
+    ollama = make_ollama(server)
+    ollama.probe(fresh=True)
+    assert server.hits['tags'] == 2
+    make_ollama(server,probe_ttl=0)
+    make_ollama(server,probe_ttl=0)
+    assert server.hits['tags'] == 4
+
+def test_initialize_method_with_lazy_validation(server):
+    '''Test whether the probe is deferred to first request,
+    and retried by next request after it fails.'''
+    server.healthy = False
+    ollama = make_ollama(server,validate='lazy')
+    assert server.hits.get('tags',0) == 0
+    with pytest.raises(RemoteServiceNotCompatibleError):
+        ollama.call('Hi!',None,0)
+    assert server.hits.get('generate',0) == 0
+    server.healthy = True
+    assert ollama.call('Hi!',None,0) == 'Hello!'
+    assert ollama.call('Hi!',None,0) == 'Hello!'
+    assert server.hits['tags'] == 2
+
+def test_initialize_method_with_background_validation(server):
+    '''Test whether the probe runs in a thread and its error is raised
+    on first request.'''
+    server.healthy = False
+    ollama = make_ollama(server,validate='background')
+    with pytest.raises(RemoteServiceNotCompatibleError):
+        ollama.call('Hi!',None,0)
+    server.healthy = True
+    assert ollama.call('Hi!',None,0) == 'Hello!'
+
+def test_warmup_method_with_hold(server):
+    '''Test whether the method loads the model with a request without prompt,
+    and each request keeps the model loaded as long as required.'''
+    ollama = make_ollama(server,hold='30m')
+    ollama.warmup()
+    ollama.call('Hi!',None,0)
+    assert server.bodies[0] == {'model': 'test-model','keep_alive': '30m'}
+    assert server.bodies[1]['keep_alive'] == '30m'
+
+def test_initialize_method_with_warmup(server):
+    '''Test whether the model is loaded along with the probe,
+    which doesn't fail initialization when loading fails.'''
+    make_ollama(server,warmup=True)
+    assert server.bodies == [{'model': 'test-model'}]
+    server.script = [(404,0,{'error': 'model not found'})]
+    make_ollama(server,warmup=True)
+
+def test_async_initialize_method_with_background_validation(server):
+    '''Test whether the probe and warmup run in a thread,
+    and first request waits for them.'''
+    async def run() -> str:
+        ollama = AsyncOllama(server.url,'test-model',validate='background',
+                             hold=-1,warmup=True)
+        try:
+            return await ollama.call('Hi!',None,0)
+        finally:
+            await ollama.close()
+    assert asyncio.run(run()) == 'Hello!'
+    assert server.bodies[0] == {'model': 'test-model','keep_alive': -1}
+    assert server.bodies[1]['keep_alive'] == -1
+
+## =========================== Remote Inference Test ============================ ##
+def test_chat_method_with_chat_temperature(remote,server):
+    '''Test whether the method infers with temperature of chat strategy,
+    while call infers with temperature of call strategy.'''
+    remote.call('Hi!')
+    remote.chat('Hi!',False)
+    list(remote.stream_chat('Hi!',True))
+    temperatures = [body['options']['temperature'] for body in server.bodies
+                    if 'options' in body]
+    assert temperatures == [0.2,0.8,0.8]
+
+def test_call_many_method_through_call_path(remote,server):
+    '''Test whether the method runs each input through the single call path,
+    reading caches and tracing each inference.'''
+    recalled, spans = [], []
+    recall, start = remote._recall, remote.tracer.start
+    remote._recall = lambda type, message, *args: recalled.append(message) or recall(
+        type,message,*args)
+    remote.tracer.start = lambda name, **attributes: spans.append(name) or start(
+        name,**attributes)
+    server.script = [(404,0,{'error': 'model not found'})]
+    progress = []
+    results = remote.call_many(['a','b','c'],1,
+                               lambda finished, total: progress.append(finished))
+    assert isinstance(results[0],RemoteServiceError)
+    assert results[1:] == ['Hello!','Hello!']
+    assert recalled == ['a','b','c']
+    assert spans == ['call'] * 3
+    assert progress == [1,2,3]
+    assert len(remote.log.get(-1)) == 2
+
+## ============================= Remote Stream Test ============================= ##
+def test_stream_call_method_yielding_pieces_in_order(remote):
+    '''Test whether the method yields response pieces in order,
+    which join into the response of blocking call.'''
+    pieces = list(remote.stream_call('Hi!'))
+    assert pieces == ['Hello','!']
+    assert ''.join(pieces) == remote.call('Hi!')
+    records = remote.log.get(-1)
+    assert [record['iteration'][0]['response'] for record in records] == ['Hello!'] * 2
+    assert records[0]['iteration'][0]['metrics']['ttft'] != None
+
+def test_stream_chat_method_recording_after_exhausted(remote):
+    '''Test whether the method writes chat history and log record
+    only when the stream is exhausted.'''
+    stream = remote.stream_chat('Hi!',False)
+    assert next(stream) == 'Hello'
+    assert remote.prompt.iteration == []
+    assert remote.log.get(-1) == []
+    assert list(stream) == ['!']
+    assert remote.prompt.iteration == [{'role': 'user','content': 'Hi!'},
+                                       {'role': 'assistant','content': 'Hello!'}]
+    iterations = remote.log.get(0)['iteration']
+    assert [iteration['response'] for iteration in iterations] == ['Hello!']
+    assert remote.chat('Hi!',True) == 'Hello!'
+    assert len(remote.log.get(0)['iteration']) == 2
+
+def test_stream_chat_method_closed_early(remote):
+    '''Test whether the method records nothing when the stream is closed early,
+    and releases the chat session for later iterations.'''
+    stream = remote.stream_chat('Hi!',False,session='a')
+    assert next(stream) == 'Hello'
+    stream.close()
+    assert remote.session.get('a').iteration == []
+    assert remote.log.get(-1) == []
+    assert list(remote.stream_chat('Hi!',True,session='a')) == ['Hello','!']
+    assert remote.session.get('a').iteration == [{'role': 'user','content': 'Hi!'},
+                                                 {'role': 'assistant','content': 'Hello!'}]
+    assert len(remote.log.get(-1)) == 1
+
+def test_chat_method_with_unfinished_stream(remote):
+    '''Test whether the method raises instead of waiting for ever
+    when the thread chats again before reading its stream to the end.'''
+    stream = remote.stream_chat('Hi!',False)
+    assert next(stream) == 'Hello'
+    with pytest.raises(RuntimeError,match='unfinished iteration'):
+        remote.chat('Again!',True)
+    assert list(stream) == ['!']
+    assert remote.chat('Again!',True) == 'Hello!'
+
+## ========================== AsyncRemote Inference Test ========================== ##
+def test_async_call_many_method_through_call_path(remote_config,server):
+    '''Test whether the method runs each input through the single call path,
+    keeping the exception of each input in place.'''
+    async def run() -> list:
+        remote = AsyncRemote(remote_config)
+        calls = []
+        call = remote.call
+        async def record(message:str,priority:int=0) -> str:
+            calls.append(message)
+            return await call(message,priority)
+        remote.call = record
+        try:
+            return await remote.call_many(['a','b','c'],2), calls
+        finally:
+            await remote.close()
+    server.script = [(404,0,{'error': 'model not found'})]
+    results, calls = asyncio.run(run())
+    assert sorted(calls) == ['a','b','c']
+    assert sum(isinstance(result,RemoteServiceError) for result in results) == 1
+    assert results.count('Hello!') == 2
+
+def test_async_chat_method_serializing_session(remote_config,server):
+    '''Test whether the method runs overlapping chats of a session one at a time,
+    and raises when the task chats again before reading its stream to the end.'''
+    async def run():
+        remote = AsyncRemote(remote_config)
+        try:
+            await asyncio.gather(remote.chat('a',True),remote.chat('b',True))
+            stream = remote.stream_chat('c',True)
+            assert await stream.__anext__() == 'Hello'
+            with pytest.raises(RuntimeError,match='unfinished iteration'):
+                await remote.chat('d',True)
+            await stream.aclose()
+            return remote.prompt.iteration
+        finally:
+            await remote.close()
+    server.script = [(200,0.2,None)]
+    iteration = asyncio.run(run())
+    assert [record['content'] for record in iteration] == ['a','Hello!','b','Hello!']
+    assert len(server.bodies[-2]['messages']) == 4
\ No newline at end of file
@@ -0,0 +1,84 @@
+import pytest
+from threading import Event
+from llyra.backends.locals.scheduler import Scheduler
+from llyra.errors.locals import LocalQueueFullError
+
+def hold(scheduler:Scheduler) -> Event:
+    '''The function is defined for occupy the worker until the returned event is set.'''
+    started = Event()
+    release = Event()
+    def blocker():
+        started.set()
+        release.wait(5)
+    scheduler.submit(blocker)
+    started.wait(5)
+    return release
+
+## ============================== `submit()` Method Test ============================== ##
+def test_submit_method():
+    '''Test whether method can run request on the worker and settle its future.'''
+    scheduler = Scheduler()
+    future = scheduler.submit(lambda x, y: x + y,1,2)
+    assert future.result(5) == 3
+
+def test_submit_method_with_exception():
+    '''Test whether method settle the future with exception raised by request.'''
+    scheduler = Scheduler()
+    def failure():
+        raise ValueError('test-error')
+    with pytest.raises(ValueError,match='test-error'):
+        scheduler.submit(failure).result(5)
+    # Validate the worker keeps serving after failed request
+    assert scheduler.run(lambda: 'ok') == 'ok'
+
+def test_submit_method_with_fifo_policy():
+    '''Test whether method serve requests in arrival order regardless of priority.'''
+    scheduler = Scheduler('fifo')
+    order = []
+    release = hold(scheduler)
+    futures = [scheduler.submit(order.append,index,priority=index)
+               for index in range(4)]
+    release.set()
+    for future in futures:
+        future.result(5)
+    assert order == [0,1,2,3]
+
+def test_submit_method_with_priority_policy():
+    '''Test whether method serve higher priority first,
+    and arrival order among equal priorities.'''
+    scheduler = Scheduler('priority')
+    order = []
+    release = hold(scheduler)
+    futures = [scheduler.submit(order.append,name,priority=priority)
+               for name, priority in (('low',0),('high',5),('low-2',0),('mid',2))]
+    release.set()
+    for future in futures:
+        future.result(5)
+    assert order == ['high','mid','low','low-2']
+
+def test_submit_method_with_nested_request():
+    '''Test whether method run request submitted by running request at once.'''
+    scheduler = Scheduler(queue=1)
+    def outer():
+        return scheduler.run(lambda: 'inner') + '-outer'
+    assert scheduler.run(outer) == 'inner-outer'
+
+def test_submit_method_with_full_queue():
+    '''Test whether method raise exception properly when the queue is full.'''
+    scheduler = Scheduler(queue=1,block=False)
+    release = hold(scheduler)
+    scheduler.submit(lambda: None)
+    assert scheduler.pending == 1
+    with pytest.raises(LocalQueueFullError,match='1 requests'):
+        scheduler.submit(lambda: None)
+    release.set()
+
+def test_submit_method_with_timeout():
+    '''Test whether method raise exception properly
+    when the queue stays full until timeout.'''
+    scheduler = Scheduler(queue=1,block=True,timeout=0.05)
+    release = hold(scheduler)
+    scheduler.submit(lambda: None)
+    with pytest.raises(LocalQueueFullError):
+        scheduler.submit(lambda: None)
+    release.set()
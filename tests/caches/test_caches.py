@@ -0,0 +1,191 @@
+import pytest
+from llyra.components import Cache
+from llyra.components.caches.utils import make_key, make_scope
+
+@pytest.fixture
+def cache():
+    cache = Cache(capacity=2)
+    return cache
+
+## =========================== `__init__()` Method Test =========================== ##
+def test_initialize_method(cache):
+    '''Test whether the class can be initialized properly.'''
+    assert cache.capacity == 2
+    assert cache.ttl == 0
+    assert cache.size == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+    assert cache._connection == None
+
+## =========================== `make_key()` Function Test =========================== ##
+def test_make_key_function():
+    '''Test whether the function make stable and distinct keys properly.'''
+    key = make_key('remote','llama-2','hello',['\n'],0)
+    assert key == make_key('remote','llama-2','hello',['\n'],0)
+    assert key != make_key('local','llama-2','hello',['\n'],0)
+    assert key != make_key('remote','llama-3','hello',['\n'],0)
+    assert key != make_key('remote','llama-2','hello!',['\n'],0)
+    assert key != make_key('remote','llama-2','hello',None,0)
+    # Validate options distinguish keys regardless of their order
+    assert key == make_key('remote','llama-2','hello',['\n'],0,{})
+    options = make_key('remote','llama-2','hello',['\n'],0,{'num_ctx': 4096,'seed': 1})
+    assert options != key
+    assert options == make_key('remote','llama-2','hello',['\n'],0,{'seed': 1,'num_ctx': 4096})
+
+## ========================== `get()`/`put()` Method Test ========================== ##
+def test_get_method_with_cached_response(cache):
+    '''Test whether the method read cached response properly.'''
+    assert cache.get('a') == None
+    cache.put('a','response')
+    assert cache.get('a') == 'response'
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+def test_put_method_evicting_least_recently_used_response(cache):
+    '''Test whether the method evict least recently used response
+    beyond capacity properly.'''
+    cache.put('a','1')
+    cache.put('b','2')
+    # Use the oldest response again
+    cache.get('a')
+    # Execute caching beyond capacity
+    cache.put('c','3')
+    # Validate kept responses
+    assert cache.get('b') == None
+    assert cache.get('a') == '1'
+    assert cache.get('c') == '3'
+
+def test_get_method_with_expired_response(monkeypatch):
+    '''Test whether the method ignore responses older than ttl properly.'''
+    now = [0.0]
+    monkeypatch.setattr('llyra.components.caches.definition.time',
+                        lambda: now[0])
+    cache = Cache(ttl=10)
+    cache.put('a','1')
+    now[0] = 5.0
+    assert cache.get('a') == '1'
+    now[0] = 11.0
+    assert cache.get('a') == None
+    assert cache.stats()['size'] == 0
+
+## ============================ Disk Tier Method Test ============================ ##
+def test_get_method_with_disk_tier(tmp_path):
+    '''Test whether responses are kept on disk across cache instances.'''
+    cache = Cache(capacity=1,path=tmp_path)
+    cache.put('a','1')
+    cache.put('b','2')
+    # Validate response evicted from memory is read from disk
+    assert cache.get('a') == '1'
+    cache.close()
+    # Validate responses are read by new cache instance
+    cache = Cache(path=tmp_path)
+    assert cache.get('b') == '2'
+    cache.close()
+
+def test_put_method_trimming_disk_tier(tmp_path):
+    '''Test whether the method drop oldest responses on disk beyond size properly.'''
+    cache = Cache(capacity=1,path=tmp_path,size=2)
+    for key in ['a','b','c']:
+        cache.put(key,key)
+    # Validate kept responses
+    assert cache.get('a') == None
+    assert cache.get('b') == 'b'
+    assert cache.get('c') == 'c'
+    cache.close()
+
+## ========================= `stats()`/`clear()` Method Test ========================= ##
+def test_stats_method(cache):
+    '''Test whether the method count hit rate properly.'''
+    assert cache.stats() == {'hits': 0,'misses': 0,'rate': 0.0,'size': 0}
+    cache.put('a','1')
+    cache.get('a')
+    cache.get('b')
+    assert cache.stats() == {'hits': 1,'misses': 1,'rate': 0.5,'size': 1}
+
+def test_clear_method(tmp_path):
+    '''Test whether the method drop all cached responses properly.'''
+    cache = Cache(path=tmp_path)
+    cache.put('a','1')
+    cache.clear()
+    assert cache.get('a') == None
+    assert cache.stats() == {'hits': 0,'misses': 1,'rate': 0.0,'size': 0}
+    cache.close()
+
+## =========================== SemanticCache Class Test =========================== ##
+@pytest.fixture
+def semantic():
+    pytest.importorskip('numpy')
+    from llyra.components import SemanticCache
+    semantic = SemanticCache(capacity=2,threshold=0.9)
+    return semantic
+
+def test_semantic_get_method_with_similar_query(semantic):
+    '''Test whether the method read response of similar query properly.'''
+    scope = make_scope('call','model',None,None,0)
+    assert semantic.get([1.0,0.0,0.0],scope) == None
+    semantic.put([1.0,0.0,0.0],scope,'response',cost=2.0)
+    # Validate similar query is answered and dissimilar query isn't
+    assert semantic.get([0.95,0.1,0.0],scope) == 'response'
+    assert semantic.get([0.0,1.0,0.0],scope) == None
+    # Validate response isn't shared across scopes
+    assert semantic.get([1.0,0.0,0.0],make_scope('call','model',None,None,0.6)) == None
+    assert semantic.stats() == {'hits': 1,'misses': 3,'rate': 0.25,'size': 1,
+                                'evictions': 0,'saved': 2.0}
+
+def test_semantic_get_method_averaging_token_embeddings(semantic):
+    '''Test whether the method compare embeddings of tokens by their average.'''
+    scope = make_scope('call','model',None,None,0)
+    semantic.put([[1.0,0.0],[1.0,0.2]],scope,'response')
+    assert semantic.get([2.0,0.2],scope) == 'response'
+
+def test_semantic_put_method_evicting_least_recently_used_response(semantic):
+    '''Test whether the method evict least recently used response
+    beyond capacity properly.'''
+    scope = make_scope('call','model',None,None,0)
+    semantic.put([1.0,0.0,0.0],scope,'a')
+    semantic.put([0.0,1.0,0.0],scope,'b')
+    # Use the oldest response again
+    semantic.get([1.0,0.0,0.0],scope)
+    # Execute caching beyond capacity
+    semantic.put([0.0,0.0,1.0],scope,'c')
+    # Validate kept responses
+    assert semantic.get([0.0,1.0,0.0],scope) == None
+    assert semantic.get([1.0,0.0,0.0],scope) == 'a'
+    assert semantic.get([0.0,0.0,1.0],scope) == 'c'
+    assert semantic.stats()['evictions'] == 1
+
+def test_semantic_put_method_dropping_scopes_of_evicted_responses(semantic):
+    '''Test whether the method drop scopes left without responses after eviction,
+    and keep responses of remaining scopes apart.'''
+    for index in range(10):
+        scope = make_scope('call','model',None,None,index / 10)
+        semantic.put([1.0,0.0],scope,str(index))
+    # Validate only scopes of kept responses are remembered
+    assert len(semantic._ids) == 2
+    assert semantic.get([1.0,0.0],make_scope('call','model',None,None,0.8)) == '8'
+    assert semantic.get([1.0,0.0],make_scope('call','model',None,None,0.9)) == '9'
+    assert semantic.get([1.0,0.0],make_scope('call','model',None,None,0.0)) == None
+
+def test_semantic_get_method_with_expired_response(monkeypatch):
+    '''Test whether the method ignore responses older than ttl properly.'''
+    pytest.importorskip('numpy')
+    from llyra.components import SemanticCache
+    now = [0.0]
+    monkeypatch.setattr('llyra.components.caches.semantic.time',lambda: now[0])
+    semantic = SemanticCache(ttl=10)
+    scope = make_scope('call','model',None,None,0)
+    semantic.put([1.0,0.0],scope,'response')
+    now[0] = 5.0
+    assert semantic.get([1.0,0.0],scope) == 'response'
+    now[0] = 11.0
+    assert semantic.get([1.0,0.0],scope) == None
+    assert semantic.stats()['size'] == 0
+    assert semantic._ids == {}
+
+def test_semantic_clear_method(semantic):
+    '''Test whether the method drop all cached responses properly.'''
+    scope = make_scope('call','model',None,None,0)
+    semantic.put([1.0,0.0],scope,'response')
+    semantic.clear()
+    assert semantic.get([1.0,0.0],scope) == None
+    assert semantic.stats()['size'] == 0
\ No newline at end of file
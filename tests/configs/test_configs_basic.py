@@ -1,6 +1,7 @@
 import pytest
 from llyra.components.configs.basic import Config
-from llyra.errors.configs import ConfigParameterMissingError, ConfigSectionMissingError
+from llyra.components.configs.utils import Sessions, Logs, Responses, Semantics, Traces
+from llyra.errors.configs import ConfigParameterMissingError, ConfigSectionMissingError, ConfigParameterInvalidError
 from pathlib import Path
 
 @pytest.fixture
@@ -13,6 +14,11 @@ def test_initialize_method(config):
     '''Test whether the class can be initialized properly.'''
     assert config._path == Path('configs/config.toml')
     assert config.strategy == None
+    assert config.session == None
+    assert config.log == None
+    assert config.response == None
+    assert config.semantic == None
+    assert config.trace == None
     assert config._content == None
 
 ## ============================= `load()` Method Test ============================= ##
@@ -27,23 +33,113 @@ def test_load_config_file_from_default_path(config):
         'global': {
             'strategy': "configs/strategy.toml",
             },
+        'session': {
+            'capacity': 1024,
+            'ttl': 0,
+            'memory': 0,
+            },
+        'log': {
+            'sink': 'memory',
+            'path': 'logs/',
+            'buffer': 256,
+            'interval': 1.0,
+            'segment': 67108864,
+            },
+        'cache': {
+            'response': {
+                'enable': False,
+                'capacity': 1024,
+                'ttl': 0,
+                'disk': False,
+                'path': 'caches/',
+                'size': 0,
+                },
+            'semantic': {
+                'enable': False,
+                'threshold': 0.95,
+                'capacity': 1024,
+                'ttl': 0,
+                'model': '',
+                },
+            },
+        'trace': {
+            'exporter': 'none',
+            'path': 'traces/',
+            'buffer': 256,
+            'host': '127.0.0.1',
+            'port': 9464,
+            },
         'local': {
             'model': {
                 'name': 'Distill-Llama-8B',
                 'directory': 'models/',
                 'suffix': '.gguf',
                 },
+            'cache': {
+                'capacity': 0,
+                'states': 4,
+                },
+            'engine': {
+                'n_ctx': 0,
+                'n_batch': 512,
+                'n_ubatch': 512,
+                'n_threads': 0,
+                'n_threads_batch': 0,
+                'n_gpu_layers': -1,
+                'use_mmap': True,
+                'flash_attn': False,
+                'type_k': '',
+                'type_v': '',
+                },
+            'scheduler': {
+                'policy': 'fifo',
+                'queue': 64,
+                'block': True,
+                'timeout': 0,
+                },
+            'batch': {
+                'slots': 0,
+                'context': 0,
+                },
+            'pool': {
+                'workers': 2,
+                },
+            'registry': {
+                'budget': 0,
+                'reload': True,
+                },
             'format': 'llama-2',
             'gpu': True,
             'ram': False,
+            'lazy': False,
+            'idle': 0,
+            'warmup': False,
             },
         'remote':{
             'server': {
                 'url': 'http://localhost',
                 'port': 11434,
                 'endpoint': 'api/',
+                'pool': 10,
+                'connections': 10,
+                'block': False,
+                'retries': 0,
+                'keep_alive': True,
+                'connect_timeout': 5,
+                'read_timeout': 600,
+                'backoff': 0.5,
+                'backoff_max': 8,
+                'breaker': 5,
+                'cooldown': 30,
+                'balance': 'least',
+                'health': 10,
+                'sticky': True,
+                'validate': 'eager',
+                'probe_ttl': 60,
                 },
             'model': 'llama-2',
+            'warmup': False,
+            'hold': '',
             }
     }
 
@@ -159,4 +255,183 @@ def test_load_config_file_without_strategy_parameter(config,tmp_path):
     # Execute config load
     with pytest.raises(ConfigParameterMissingError,
         match='Missing `strategy` parameter of `global` section in `config.toml`.'):
+        config._load(test_toml)
+
+def test_load_config_file_with_session_section(config,tmp_path):
+    '''Test whether method load session config properly.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [session]
+    capacity = 16
+    ttl = 1.5
+    memory = 4096
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    config._load(test_toml)
+    # Validate loaded value
+    assert config.session == Sessions(16,1.5,4096)
+
+def test_load_config_file_without_session_section(config,tmp_path):
+    '''Test whether method fallback to default session config properly
+    without `session` section.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    config._load(test_toml)
+    # Validate loaded value
+    assert config.session == Sessions(1024,0,0)
+    assert config.log == Logs()
+    assert config.response == Responses()
+    assert config.semantic == Semantics()
+    assert config.trace == Traces()
+
+def test_load_config_file_with_log_section(config,tmp_path):
+    '''Test whether method load log config properly.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [log]
+    sink = "sqlite"
+    path = "dummy_directory"
+    buffer = 16
+    interval = 0.5
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    config._load(test_toml)
+    # Validate loaded value
+    assert config.log == Logs('sqlite','dummy_directory/',16,0.5)
+
+def test_load_config_file_with_invalid_log_sink(config,tmp_path):
+    '''Test whether method raise exception properly with unknown log sink.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [log]
+    sink = "postgres"
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match='sink'):
+        config._load(test_toml)
+
+def test_load_config_file_with_trace_section(config,tmp_path):
+    '''Test whether method load trace config properly.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [trace]
+    exporter = "prometheus"
+    path = "dummy_directory"
+    buffer = 16
+    host = "0.0.0.0"
+    port = 0
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    config._load(test_toml)
+    # Validate loaded value
+    assert config.trace == Traces('prometheus','dummy_directory/',16,'0.0.0.0',0)
+
+@pytest.mark.parametrize('parameter',['exporter = "zipkin"','port = 70000','port = "9464"'])
+def test_load_config_file_with_invalid_trace_parameter(config,tmp_path,parameter):
+    '''Test whether method raise exception properly with invalid trace parameter.'''
+    # Set test path
+    content = f'''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [trace]
+    {parameter}
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match='trace'):
+        config._load(test_toml)
+
+def test_load_config_file_with_response_cache_section(config,tmp_path):
+    '''Test whether method load response cache config properly.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [cache.response]
+    enable = true
+    capacity = 8
+    ttl = 60
+    disk = true
+    path = "dummy_directory"
+    size = 32
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    config._load(test_toml)
+    # Validate loaded value
+    assert config.response == Responses(True,8,60,True,'dummy_directory/',32)
+
+def test_load_config_file_with_invalid_response_cache_parameter(config,tmp_path):
+    '''Test whether method raise exception properly
+    with invalid response cache parameter.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [cache.response]
+    capacity = "many"
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match='capacity'):
+        config._load(test_toml)
+
+def test_load_config_file_with_semantic_cache_section(config,tmp_path):
+    '''Test whether method load semantic cache config properly.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [cache.semantic]
+    enable = true
+    threshold = 0.9
+    capacity = 64
+    model = "nomic-embed-text"
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    config._load(test_toml)
+    # Validate loaded value
+    assert config.semantic == Semantics(True,0.9,64,0,'nomic-embed-text')
+
+def test_load_config_file_with_invalid_semantic_threshold(config,tmp_path):
+    '''Test whether method raise exception properly
+    with similarity threshold out of range.'''
+    # Set test path
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [cache.semantic]
+    threshold = 1.5
+    '''
+    test_toml = tmp_path / 'test_toml'
+    test_toml.write_text(content,encoding='utf-8')
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match='threshold'):
         config._load(test_toml)
\ No newline at end of file
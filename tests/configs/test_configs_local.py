@@ -1,7 +1,7 @@
 import pytest
 from llyra.components import LocalConfig
-from llyra.components.configs.utils import Model
-from llyra.errors.configs import ConfigSectionMissingError, ConfigParameterMissingError
+from llyra.components.configs.utils import Model, Cache, Engine, Scheduling, Batching, Pooling, Registry
+from llyra.errors.configs import ConfigSectionMissingError, ConfigParameterMissingError, ConfigParameterInvalidError
 
 @pytest.fixture
 def config():
@@ -37,6 +37,15 @@ def test_initialize_method(config):
     assert config.format == None
     assert config.gpu == None
     assert config.ram == None
+    assert config.lazy == None
+    assert config.idle == None
+    assert config.warmup == None
+    assert config.cache == None
+    assert config.engine == None
+    assert config.scheduler == None
+    assert config.batch == None
+    assert config.pool == None
+    assert config.registry == None
     assert config.path == None
 
 ## ============================= `load()` Method Test ============================= ##
@@ -64,8 +73,369 @@ def test_load_method(config,tmp_path):
     assert config.format == "test-format"
     assert config.gpu == True
     assert config.ram == False
+    assert config.lazy == False
+    assert config.idle == 0
+    assert config.warmup == False
+    assert config.cache == Cache()
+    assert config.engine == Engine()
+    assert config.scheduler == Scheduling()
+    assert config.batch == Batching()
+    assert config.pool == Pooling()
+    assert config.registry == Registry(models={'test-model': config.model})
     assert config.path == 'dummy_directory/test-model.gguf'
 
+def test_load_method_with_lifecycle_parameters(config,tmp_path):
+    '''Test whether method can load and read model lifecycle parameters properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    lazy = true
+    idle = 300
+    warmup = true
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.lazy == True
+    assert config.idle == 300
+    assert config.warmup == True
+
+def test_load_method_with_invalid_idle_parameter(config,tmp_path):
+    '''Test whether method raise exception properly 
+    with invalid `idle` parameter in `local` section.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    idle = "forever"
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match='idle'):
+        config.load(test_toml)
+
+def test_load_method_with_cache_section(config,tmp_path):
+    '''Test whether method can load and read `local.cache` section properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.cache]
+    capacity = 1073741824
+    states = 2
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.cache == Cache(1073741824,2)
+
+def test_load_method_with_engine_section(config,tmp_path):
+    '''Test whether method can load and read `local.engine` section properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.engine]
+    n_ctx = 4096
+    n_threads = 8
+    n_gpu_layers = 20
+    flash_attn = true
+    type_k = "q8_0"
+    type_v = "q8_0"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.engine == Engine(n_ctx=4096,n_threads=8,n_gpu_layers=20,
+                                   flash_attn=True,type_k='q8_0',type_v='q8_0')
+
+@pytest.mark.parametrize('line,parameter',[('n_batch = 0','n_batch'),
+                                           ('n_threads = "8"','n_threads'),
+                                           ('n_gpu_layers = -2','n_gpu_layers'),
+                                           ('type_k = "q3"','type_k')])
+def test_load_method_with_invalid_engine_parameter(config,tmp_path,line,parameter):
+    '''Test whether method raise exception properly 
+    with invalid parameter in `local.engine` section.'''
+    # Set test config file
+    content = f'''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.engine]
+    {line}
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match=parameter):
+        config.load(test_toml)
+
+def test_load_method_with_scheduler_section(config,tmp_path):
+    '''Test whether method can load and read `local.scheduler` section properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.scheduler]
+    policy = "priority"
+    queue = 8
+    block = false
+    timeout = 2.5
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.scheduler == Scheduling('priority',8,False,2.5)
+
+@pytest.mark.parametrize('line,parameter',[('policy = "lifo"','policy'),
+                                           ('queue = -1','queue'),
+                                           ('timeout = -1','timeout')])
+def test_load_method_with_invalid_scheduler_parameter(config,tmp_path,line,parameter):
+    '''Test whether method raise exception properly 
+    with invalid parameter in `local.scheduler` section.'''
+    # Set test config file
+    content = f'''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.scheduler]
+    {line}
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match=parameter):
+        config.load(test_toml)
+
+def test_load_method_with_batch_section(config,tmp_path):
+    '''Test whether method can load and read `local.batch` section properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.batch]
+    slots = 4
+    context = 8192
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.batch == Batching(4,8192)
+
+@pytest.mark.parametrize('line,parameter',[('slots = -1','slots'),
+                                           ('context = "4096"','context')])
+def test_load_method_with_invalid_batch_parameter(config,tmp_path,line,parameter):
+    '''Test whether method raise exception properly 
+    with invalid parameter in `local.batch` section.'''
+    # Set test config file
+    content = f'''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.batch]
+    {line}
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match=parameter):
+        config.load(test_toml)
+
+def test_load_method_with_pool_section(config,tmp_path):
+    '''Test whether method can load and read `local.pool` section properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.pool]
+    workers = 4
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.pool == Pooling(4)
+
+def test_load_method_with_invalid_pool_parameter(config,tmp_path):
+    '''Test whether method raise exception properly 
+    with invalid parameter in `local.pool` section.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.pool]
+    workers = 0
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match='workers'):
+        config.load(test_toml)
+
+def test_load_method_with_registry_section(config,tmp_path):
+    '''Test whether method can load and read `local.registry` section properly,
+    with registered models following `local.model` section by default.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    [local.registry]
+    budget = 8589934592
+    reload = false
+    [[local.registry.models]]
+    name = "coder-model.gguf"
+    format = "chatml"
+    [[local.registry.models]]
+    name = "other-model"
+    directory = "other_directory"
+    suffix = "bin"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.registry == Registry(8589934592,False,{
+        'test-model': Model('test-model','dummy_directory/','.gguf'),
+        'coder-model': Model('coder-model','dummy_directory/','.gguf','chatml'),
+        'other-model': Model('other-model','other_directory/','.bin')})
+    assert config.locate('coder-model') == 'dummy_directory/coder-model.gguf'
+    assert config.locate('other-model') == 'other_directory/other-model.bin'
+
+@pytest.mark.parametrize('lines,parameter',[
+    ('[local.registry]\n    budget = -1','budget'),
+    ('[local.registry]\n    reload = "true"','reload'),
+    ('[[local.registry.models]]\n    format = "chatml"','models'),
+    ('[[local.registry.models]]\n    name = "test-model.gguf"','models')])
+def test_load_method_with_invalid_registry_parameter(config,tmp_path,lines,parameter):
+    '''Test whether method raise exception properly 
+    with invalid parameter in `local.registry` section.'''
+    # Set test config file
+    content = f'''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [local]
+    format = "test-format"
+    gpu = true
+    ram = false
+    [local.model]
+    name = "test-model"
+    directory = "dummy_directory/"
+    suffix = ".gguf"
+    {lines}
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,match=parameter):
+        config.load(test_toml)
+
 def test_load_method_with_model_name_fix(config,tmp_path):
     '''Test whether method can auto fix invalid model name parameter properly.'''
     # Set test config file
@@ -345,4 +715,25 @@ def test_update_method_ignoring_ram_parameters(loaded_config):
     # Validate updated value
     assert loaded_config.format == None
     assert loaded_config.gpu == False
-    assert loaded_config.ram == False        
\ No newline at end of file
+    assert loaded_config.ram == False
+
+def test_update_method_with_engine_parameters(loaded_config):
+    '''Test whether method can update engine parameters
+    and report whether any parameter is changed properly.'''
+    # Execute config update with engine parameters
+    changed = loaded_config.update('',None,None,{'n_threads': 4,'type_k': 'q4_0'})
+    # Validate updated value
+    assert changed == True
+    assert loaded_config.engine == Engine(n_threads=4,type_k='q4_0')
+    # Execute config update with unchanged parameters
+    changed = loaded_config.update('test-format',True,None,{'n_threads': 4})
+    assert changed == False
+
+def test_update_method_with_invalid_engine_parameters(loaded_config):
+    '''Test whether method raise exception properly with invalid engine parameters,
+    and keep every config parameter unchanged.'''
+    with pytest.raises(ValueError,match='n_batch'):
+        loaded_config.update(None,False,None,{'n_threads': 4,'n_batch': 0})
+    assert loaded_config.format == 'test-format'
+    assert loaded_config.gpu == True
+    assert loaded_config.engine == Engine()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import pytest
 from llyra.components import RemoteConfig
 from llyra.components.configs.utils import Server
-from llyra.errors.configs import ConfigSectionMissingError, ConfigParameterMissingError
+from llyra.errors.configs import ConfigSectionMissingError, ConfigParameterMissingError, ConfigParameterInvalidError
 
 
 @pytest.fixture
@@ -83,6 +83,268 @@ def test_load_method_with_server_endpoint_fix(config,tmp_path):
     assert config.server == Server('http://localhost',11434,'test/')
     assert config.url == 'http://localhost:11434/test/'
 
+def test_load_method_with_connection_pool_parameters(config,tmp_path):
+    '''Test whether method can load and read connection pool parameters properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = "http://localhost"
+    port = 11434
+    endpoint = "test/"
+    pool = 2
+    connections = 32
+    block = true
+    retries = 3
+    keep_alive = false
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.server == Server('http://localhost',11434,'test/',
+                                   2,32,True,3,False)
+
+def test_load_method_with_request_policy_parameters(config,tmp_path):
+    '''Test whether method can load and read request policy parameters properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = "http://localhost"
+    port = 11434
+    endpoint = "test/"
+    retries = 2
+    connect_timeout = 1.5
+    read_timeout = 0
+    backoff = 0.1
+    backoff_max = 2
+    breaker = 0
+    cooldown = 5
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.server == Server('http://localhost',11434,'test/',
+                                   10,10,False,2,True,
+                                   1.5,0,0.1,2,0,5)
+
+def test_load_method_with_connection_pool_fallback(config,tmp_path):
+    '''Test whether method auto fallback to default connection pool parameters
+    when missing them.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = "http://localhost"
+    port = 11434
+    endpoint = "test/"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.server.pool == 10
+    assert config.server.connections == 10
+    assert config.server.block == False
+    assert config.server.retries == 0
+    assert config.server.keep_alive == True
+    assert config.server.connect_timeout == 5
+    assert config.server.read_timeout == 600
+    assert config.server.backoff == 0.5
+    assert config.server.backoff_max == 8
+    assert config.server.breaker == 5
+    assert config.server.cooldown == 30
+
+def test_load_method_with_invalid_connection_pool_parameter(config,tmp_path):
+    '''Test whether method raise exception properly
+    with invalid `connections` parameter in `remote.server` section.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = "http://localhost"
+    port = 11434
+    endpoint = "test/"
+    connections = "many"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,
+        match='Invalid `connections` parameter of `remote.server` section'):
+        config.load(test_toml)
+
+def test_load_method_with_several_servers(config,tmp_path):
+    '''Test whether method can load and read several servers with load balancing
+    parameters properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = ["http://node-a/","http://node-b"]
+    port = [11434,11435]
+    endpoint = "test/"
+    balance = "weighted"
+    weights = [3,1]
+    health = 2.5
+    sticky = false
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.server.url == ['http://node-a','http://node-b']
+    assert config.server.balance == 'weighted'
+    assert config.server.weights == [3,1]
+    assert config.server.health == 2.5
+    assert config.server.sticky == False
+    assert config.urls == ['http://node-a:11434/test/','http://node-b:11435/test/']
+    assert config.url == 'http://node-a:11434/test/'
+
+def test_load_method_with_shared_server_port(config,tmp_path):
+    '''Test whether method applies single port to each server properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = ["http://node-a","http://node-b"]
+    port = 11434
+    endpoint = "test/"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.urls == ['http://node-a:11434/test/','http://node-b:11434/test/']
+    assert config.server.balance == 'least'
+    assert config.server.weights == None
+
+@pytest.mark.parametrize('parameter,value',[('port','[11434]'),
+                                            ('balance','"random"'),
+                                            ('weights','[1,0]'),
+                                            ('weights','[1]')])
+def test_load_method_with_invalid_balancing_parameter(config,tmp_path,parameter,value):
+    '''Test whether method raise exception properly
+    with invalid load balancing parameters in `remote.server` section.'''
+    # Set test config file
+    port = '' if parameter == 'port' else 'port = 11434'
+    content = f'''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = ["http://node-a","http://node-b"]
+    {port}
+    endpoint = "test/"
+    {parameter} = {value}
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,
+        match=f'Invalid `{parameter}` parameter of `remote.server` section'):
+        config.load(test_toml)
+
+def test_load_method_with_startup_parameters(config,tmp_path):
+    '''Test whether method can load and read startup parameters properly.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    warmup = true
+    hold = "30m"
+    [remote.server]
+    url = "http://localhost"
+    port = 11434
+    endpoint = "test/"
+    validate = "background"
+    probe_ttl = 0
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.warmup == True
+    assert config.hold == '30m'
+    assert config.server.validate == 'background'
+    assert config.server.probe_ttl == 0
+
+def test_load_method_with_startup_fallback(config,tmp_path):
+    '''Test whether method auto fallback to default startup parameters
+    when missing them.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    hold = ""
+    [remote.server]
+    url = "http://localhost"
+    port = 11434
+    endpoint = "test/"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    config.load(test_toml)
+    # Validate loaded value
+    assert config.warmup == False
+    assert config.hold == None
+    assert config.server.validate == 'eager'
+    assert config.server.probe_ttl == 60
+
+def test_load_method_with_invalid_validate_parameter(config,tmp_path):
+    '''Test whether method raise exception properly
+    with invalid `validate` parameter in `remote.server` section.'''
+    # Set test config file
+    content = '''
+    [global]
+    strategy = "dummy_directory/dummy_strategy.toml"
+    [remote]
+    model = "test-model"
+    [remote.server]
+    url = "http://localhost"
+    port = 11434
+    endpoint = "test/"
+    validate = "never"
+    '''
+    test_toml = tmp_path / 'test.toml'
+    test_toml.write_text(content)
+    # Execute config load
+    with pytest.raises(ConfigParameterInvalidError,
+        match='Invalid `validate` parameter of `remote.server` section'):
+        config.load(test_toml)
+
 def test_load_method_without_model_parameter(config,tmp_path):
     '''Test whether method raise exception properly
     without `model` parameter in `remote` section.'''
@@ -1,7 +1,9 @@
 import pytest
+from threading import Thread
 from llyra.components import Log
-from llyra.components.logs.utils import Section, make_new_iteration
+from llyra.components.logs.utils import Section, make_new_iteration, make_metrics, compute_percentile
 from llyra.components.utils import Role
+from llyra.components.logs.sinks import Sink, JsonlSink, SqliteSink
 
 @pytest.fixture
 def log():
@@ -59,6 +61,24 @@ def test_call_method(log):
     # Validate record value
     assert log.id == 1
     assert log._history == [section]
+
+def test_call_method_with_cached_response(log):
+    '''Test whether the method marks inference served by response cache properly.'''
+    log.call('model','hello, there!','hi!',0,cached=True)
+    log.call('model','hello, there!','hi!',0)
+    assert log.get(0)['iteration'] == [{'query': 'hello, there!','response': 'hi!',
+                                        'cached': True}]
+    assert log.get(1)['iteration'] == [{'query': 'hello, there!','response': 'hi!'}]
+
+def test_call_method_with_truncated_response(log):
+    '''Test whether the method marks inference stopped at `max_tokens` properly.'''
+    log.call('model','hello, there!','hi',0,truncated=True)
+    log.chat('model',None,Role(None,'user','assistant'),'Hello!','Greet',0.6,True,
+             session='a',truncated=True)
+    assert log.get(0)['iteration'] == [{'query': 'hello, there!','response': 'hi',
+                                        'truncated': True}]
+    assert log.get(1)['iteration'] == [{'query': 'Hello!','response': 'Greet',
+                                        'truncated': True}]
     
 ## ============================= `chat()` method test ============================= ##    
 def test_chat_method(log):
@@ -173,6 +193,83 @@ def test_chat_method_not_keeping_recording_automatically(log):
     assert log.id == 2
     assert log._history == [former_section,section]
 
+def test_chat_method_recording_sessions_independently(log):
+    '''Test whether the method keep recording each chat session 
+    in its own record properly.'''
+    # Set executive value
+    role = Role('system','user','assistant')
+    # Execute interleaved iterative chat log record
+    log.chat('model',None,role,'a-1','A-1',0.6,True,session='a')
+    log.chat('model',None,role,'b-1','B-1',0.6,True,session='b')
+    log.chat('model',None,role,'a-2','A-2',0.6,True,session='a')
+    log.chat('model',None,role,'default','Default',0.6,True)
+    # Validate record value
+    assert log.id == 3
+    assert log._history[0].iteration == [make_new_iteration('a-1','A-1'),
+                                         make_new_iteration('a-2','A-2')]
+    assert log._history[1].iteration == [make_new_iteration('b-1','B-1')]
+    assert log._history[2].iteration == [make_new_iteration('default','Default')]
+
+def test_chat_method_not_keeping_recording_with_other_model(log):
+    '''Test whether the method stop keeping recording inference history properly
+    when the model of the iteration is changed.'''
+    # Set executive value
+    role = Role('system','user','assistant')
+    # Execute iterative chat log record switching models
+    log.chat('model',None,role,'default-1','Default-1',0.6,True)
+    log.chat('coder',None,role,'default-2','Default-2',0.6,True)
+    log.chat('model',None,role,'a-1','A-1',0.6,True,session='a')
+    log.chat('coder',None,role,'a-2','A-2',0.6,True,session='a')
+    log.chat('coder',None,role,'a-3','A-3',0.6,True,session='a')
+    # Validate record value
+    assert log.id == 4
+    assert [section.model for section in log._history] == ['model','coder','model','coder']
+    assert log._history[3].iteration == [make_new_iteration('a-2','A-2'),
+                                         make_new_iteration('a-3','A-3')]
+
+def test_chat_method_recording_from_threads(log):
+    '''Test whether the method keep record ids and iterations consistent
+    when sessions are recorded from several threads at once.'''
+    # Set executive value
+    role = Role('system','user','assistant')
+    def record(name):
+        for index in range(50):
+            log.chat('model',None,role,f'{name}-{index}','Reply',0.6,True,session=name)
+    # Execute iterative chat log record from threads
+    threads = [Thread(target=record,args=(f'session-{index}',)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Validate record value
+    assert log.id == 4
+    assert sorted(section.id for section in log._history) == [0,1,2,3]
+    assert all(len(section.iteration) == 50 for section in log._history)
+
+def test_chat_method_not_keeping_recording_released_session(log):
+    '''Test whether the method start new record after session released.'''
+    # Set executive value
+    role = Role('system','user','assistant')
+    # Execute iterative chat log record around session release
+    log.chat('model',None,role,'a-1','A-1',0.6,True,session='a')
+    log.release('a')
+    log.chat('model',None,role,'a-2','A-2',0.6,True,session='a')
+    # Validate record value
+    assert log.id == 2
+    assert log._history[1].iteration == [make_new_iteration('a-2','A-2')]
+
+def test_chat_method_with_cached_response(log):
+    '''Test whether the method marks chat iteration served by cache properly.'''
+    role = Role('system','user','assistant')
+    log.chat('model',None,role,'Hello!','Greeting!',0.6,True,cached=True)
+    log.chat('model',None,role,'Good day!','Greeting!',0.6,True)
+    log.chat('model',None,role,'Hi!','Greeting!',0.6,True,session='a',cached=True)
+    assert log.get(0)['iteration'] == [{'query': 'Hello!','response': 'Greeting!',
+                                        'cached': True},
+                                       {'query': 'Good day!','response': 'Greeting!'}]
+    assert log.get(1)['iteration'] == [{'query': 'Hi!','response': 'Greeting!',
+                                        'cached': True}]
+
 ## ============================== `get()` method test ============================== ##
 def test_get_method_with_specific_id(recorded_log):
     '''Test wether the method return readable log with provided id properly.'''
@@ -238,4 +335,217 @@ def test_get_method_for_all_logs(recorded_log):
 def test_get_method_with_invalid_id(log):
     '''Test wether the method raise exception properly when meeting invalid id.'''
     with pytest.raises(IndexError,match='Error: Record not created.'):
-        log.get(1)
\ No newline at end of file
+        log.get(1)
+
+def test_get_method_with_offset_and_limit(recorded_log):
+    '''Test wether the method return a page of readable logs properly.'''
+    the_log = recorded_log.get(-1,offset=1,limit=1)
+    assert [record['id'] for record in the_log] == [1]
+    the_log = recorded_log.get(-1,offset=2,limit=5)
+    assert [record['id'] for record in the_log] == [2]
+
+def test_get_method_with_filters(recorded_log):
+    '''Test wether the method return readable logs selected by filters properly.'''
+    the_log = recorded_log.get(-1,type='call')
+    assert [record['id'] for record in the_log] == [0,2]
+    the_log = recorded_log.get(-1,type='call',offset=1)
+    assert [record['id'] for record in the_log] == [2]
+    the_log = recorded_log.get(-1,model='other-model')
+    assert the_log == []
+    for index, section in enumerate(recorded_log._history):
+        section.create_at = float(index)
+    the_log = recorded_log.get(-1,since=1.0)
+    assert [record['id'] for record in the_log] == [1,2]
+    the_log = recorded_log.get(-1,since=0.5,until=1.5)
+    assert [record['id'] for record in the_log] == [1]
+
+def test_get_method_not_affecting_internal_records(recorded_log):
+    '''Test wether the readable log is detached from internal log records.'''
+    the_log = recorded_log.get(1)
+    the_log['role']['input'] = 'changed'
+    the_log['iteration'][0]['query'] = 'changed'
+    the_log['iteration'].append({})
+    assert recorded_log._history[1].role == Role('system','user','assistant')
+    assert recorded_log._history[1].iteration == [make_new_iteration(
+        'Hello, there!','Greeting, how can I assist you today?')]
+
+def test_get_method_not_affecting_internal_metrics(log):
+    '''Test wether measurements of the readable log are detached
+    from internal log records.'''
+    log.call('model','hello, there!','hi!',0,metrics=make_metrics(2.0,0.5,10,30))
+    the_log = log.get(0)
+    the_log['iteration'][0]['metrics']['latency'] = 99
+    assert log._history[0].iteration[0]['metrics']['latency'] == 2.0
+    assert log.get(0)['iteration'][0]['metrics']['latency'] == 2.0
+
+## ============================= `stats()` method test ============================= ##
+def test_make_metrics_function():
+    '''Test whether the function measures tokens per second of generation,
+    and estimates time to first token by generation seconds reported.'''
+    assert make_metrics(2.0,0.5,10,30) == {'latency': 2.0,'ttft': 0.5,'prompt_tokens': 10,
+                                           'completion_tokens': 30,'tps': 20.0}
+    assert make_metrics(2.0,None,10,30,1.5)['ttft'] == 0.5
+    assert make_metrics(2.0,None,10,30,1.5)['tps'] == 20.0
+    assert make_metrics(0.1,None,None,None)['tps'] == None
+
+def test_compute_percentile_function():
+    '''Test whether the function interpolates between closest ranks.'''
+    values = [1.0,2.0,3.0,4.0,5.0]
+    assert compute_percentile(values,50) == 3.0
+    assert compute_percentile(values,90) == pytest.approx(4.6)
+    assert compute_percentile([7.0],99) == 7.0
+
+def test_stats_method(log):
+    '''Test whether the method aggregates measurements of selected records.'''
+    role = Role('system','user','assistant')
+    for latency in (1.0,2.0,3.0,4.0):
+        log.call('model','hi','hello',0,metrics=make_metrics(latency,None,5,10))
+    log.chat('model',None,role,'hi','hello',0,True,cached=True,
+             metrics=make_metrics(0.01,None,None,None))
+    log.call('other','hi','hel',0,truncated=True,metrics=make_metrics(8.0,1.0,5,7))
+    stats = log.stats(model='model')
+    assert stats['count'] == 5
+    assert stats['cached'] == 1
+    assert stats['truncated'] == 0
+    assert stats['prompt_tokens'] == 20
+    assert stats['completion_tokens'] == 40
+    assert stats['latency']['p50'] == 2.0
+    assert stats['latency']['max'] == 4.0
+    assert stats['ttft'] == None
+    assert stats['tps']['mean'] == pytest.approx((10 + 5 + 10 / 3 + 2.5) / 4)
+    assert log.stats(type='call')['truncated'] == 1
+    assert log.stats(type='call')['ttft']['p99'] == 1.0
+    assert Log().stats()['count'] == 0
+
+## ============================== Sink Persist Test ============================== ##
+@pytest.fixture(params=['jsonl','sqlite'])
+def make_sink(request,tmp_path):
+    def make_sink():
+        if request.param == 'jsonl':
+            return JsonlSink(tmp_path,segment=256,buffer=4,interval=0.01)
+        else:
+            return SqliteSink(tmp_path,buffer=4,interval=0.01)
+    return make_sink
+
+def record_logs(log):
+    role = Role('system','user','assistant')
+    log.call('model','hello, there!','hello, how can I assist you today?',0.6)
+    log.chat('model','This is for test.',role,'a-1','A-1',0.6,True,session='a')
+    log.chat('model','This is for test.',role,'Hello!','Greeting!',0.6,True)
+    log.chat('model','This is for test.',role,'a-2','A-2',0.6,True,session='a')
+    log.chat('model','This is for test.',role,'Good day!','Greeting!',0.6,True)
+
+def test_sink_class_requiring_persist_methods():
+    '''Test whether a sink can't be made without its persist and read methods.'''
+    class PartialSink(Sink):
+        def _persist(self,records:list) -> None:
+            pass
+    with pytest.raises(TypeError,match='_next_id'):
+        PartialSink()
+
+def test_get_method_with_sink(make_sink):
+    '''Test whether the method reads records persisted by sink 
+    same as records kept in memory.'''
+    memory_log = Log()
+    record_logs(memory_log)
+    log = Log(make_sink())
+    record_logs(log)
+    expected = memory_log.get(-1)
+    records = log.get(-1)
+    for record in expected + records:
+        record['create_at'] = None
+    assert records == expected
+    assert log.get(2)['iteration'] == [{'query': 'Hello!','response': 'Greeting!'},
+                                       {'query': 'Good day!','response': 'Greeting!'}]
+    with pytest.raises(IndexError,match='Error: Record not created.'):
+        log.get(3)
+    records = log.get(-1,type='chat',offset=1,limit=1)
+    assert [record['id'] for record in records] == [2]
+    until = log.get(0)['create_at']
+    records = log.get(-1,until=until,type='call',model='model')
+    assert [record['id'] for record in records] == [0]
+    log.close()
+
+def test_get_method_with_jsonl_sink_seeking_segments(tmp_path):
+    '''Test whether the method pages records across segments same as memory,
+    without reading segments before the page once enough records are read.'''
+    role = Role('system','user','assistant')
+    memory_log = Log()
+    log = Log(JsonlSink(tmp_path,segment=256,buffer=4,interval=0.01))
+    for each in (memory_log,log):
+        each.chat('model',None,role,'a-1','A-1',0.6,True,session='a')
+        for index in range(40):
+            each.call('model',f'call-{index}','ok',0.6)
+        each.chat('model',None,role,'a-2','A-2',0.6,True,session='a')
+    expected = memory_log.get(-1)
+    for record in expected:
+        record['create_at'] = None
+    sink = log._sink
+    log.get(-1,limit=1)
+    assert len(sink._segments) > 4
+    read = []
+    events = sink._events
+    sink._events = lambda index: read.append(index) or events(index)
+    for offset in (0,1,17,39,40,41):
+        records = log.get(-1,offset=offset,limit=2)
+        for record in records:
+            record['create_at'] = None
+        assert records == expected[offset:offset + 2]
+    read.clear()
+    assert [record['id'] for record in log.get(-1,offset=30,limit=2)] == [30,31]
+    assert 0 not in read
+    assert len(read) < len(sink._segments)
+    since = log.get(20)['create_at']
+    assert log.get(-1,since=since,limit=1)[0]['create_at'] >= since
+    log.close()
+
+def test_chat_method_with_sink_keeping_memory_flat(make_sink):
+    '''Test whether the method keeps memory bounded with sink 
+    however many inferences are recorded.'''
+    log = Log(make_sink())
+    role = Role('system','user','assistant')
+    for index in range(200):
+        log.call('model',f'call-{index}','ok',0.6)
+        log.chat('model',None,role,f'chat-{index}','ok',0.6,True,session=str(index))
+        log.release(str(index))
+    assert len(log._history) == 1
+    assert len(log._owned) <= 1
+    assert log._sessions == {}
+    assert len(log.get(-1)) == 400
+    log.close()
+
+def test_initialize_method_with_sink_continuing_records(make_sink):
+    '''Test whether the method continues identity after persisted records.'''
+    log = Log(make_sink())
+    record_logs(log)
+    log.close()
+    log = Log(make_sink())
+    assert log.id == 3
+    log.call('model','again','ok',0.6)
+    assert log.get(3)['iteration'] == [{'query': 'again','response': 'ok'}]
+    assert len(log.get(-1)) == 4
+    log.close()
+
+def test_call_method_with_sink_keeping_cached_flag(make_sink):
+    '''Test whether the cached flag is persisted by sink.'''
+    log = Log(make_sink())
+    log.call('model','hello, there!','hi!',0,cached=True)
+    log.call('model','hello, there!','hi!',0)
+    log.close()
+    log = Log(make_sink())
+    assert log.get(0)['iteration'] == [{'query': 'hello, there!','response': 'hi!',
+                                        'cached': True}]
+    assert log.get(1)['iteration'] == [{'query': 'hello, there!','response': 'hi!'}]
+    log.close()
+
+def test_stats_method_with_sink(make_sink):
+    '''Test whether measurements are persisted and aggregated by sink.'''
+    log = Log(make_sink())
+    log.call('model','hi','hello',0,metrics=make_metrics(1.0,0.2,5,8))
+    log.call('model','hi','hello',0,metrics=make_metrics(3.0,0.4,5,8))
+    assert log.get(0)['iteration'][0]['metrics']['latency'] == 1.0
+    stats = log.stats()
+    assert stats['count'] == 2
+    assert stats['latency']['mean'] == 2.0
+    assert stats['ttft']['p50'] == pytest.approx(0.3)
+    log.close()
\ No newline at end of file
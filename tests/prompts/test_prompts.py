@@ -1,6 +1,7 @@
 import pytest
 from llyra.components import Prompt
 from llyra.components.utils import Role
+from llyra.components.strategys.utils import Context
 
 @pytest.fixture
 def prompt():
@@ -10,16 +11,16 @@ def prompt():
 @pytest.fixture
 def iterated_prompt():
     iterated_prompt = Prompt()
-    iterated_prompt._iteration.append({'role': 'user', 'content': 'Hello, there!'})
-    iterated_prompt._iteration.append(
-        {'role': 'assistant', 
-         'content': 'Greeting, how can I assistant you today?'})
+    iterated_prompt.iterate(Role('system','user','assistant'),
+                            'Hello, there!',
+                            'Greeting, how can I assistant you today?',
+                            True)
     return iterated_prompt
 
 ## =========================== `__init__()` Method Test =========================== ##
 def test_class_initialize(prompt):
     '''Test whether the class can be initialized properly.'''
-    assert prompt._iteration == []
+    assert prompt.iteration == []
 
 ## ============================ `iterate()` Method Test ============================ ##
 def test_iterate_method(prompt):
@@ -31,11 +32,21 @@ def test_iterate_method(prompt):
                    'Greeting, how can I assistant you today?',
                    True)
     # Validate record value
-    assert prompt._iteration == [
+    assert prompt.iteration == [
         {'role': 'user', 'content': 'Hello, there!'},
         {'role': 'assistant', 'content': 'Greeting, how can I assistant you today?'}
         ]
 
+def test_iterate_method_counting_size(prompt):
+    '''Test whether the method can count characters of iteration record properly.'''
+    role = Role('system','user','assistant')
+    # Execute iteration record
+    prompt.iterate(role,'Hello!','Greeting!',True)
+    assert prompt.size == 15
+    # Execute iteration record starting new record
+    prompt.iterate(role,'Hi!',None,False)
+    assert prompt.size == 3
+
 def test_iterate_method_keeping_recording(prompt):
     '''
     Test whether the method can make iteration record 
@@ -43,14 +54,14 @@ def test_iterate_method_keeping_recording(prompt):
     '''
     role = Role('system','user','assistant')
     # Set former executive value
-    prompt._iteration.append({'role': 'user', 'content': 'Dummy former record.'})
+    prompt.iterate(role,'Dummy former record.',None,True)
     # Execute iteration record
     prompt.iterate(role,
                    'Hello, there!',
                    'Greeting, how can I assistant you today?',
                    True)
     # Validate record value
-    assert prompt._iteration == [
+    assert prompt.iteration == [
         {'role': 'user', 'content': 'Dummy former record.'},
         {'role': 'user', 'content': 'Hello, there!'},
         {'role': 'assistant', 'content': 'Greeting, how can I assistant you today?'}
@@ -60,14 +71,14 @@ def test_iterate_method_starting_new_record(prompt):
     '''Test whether the method can make new iteration record properly.'''
     role = Role('system','user','assistant')
     # Set former executive value
-    prompt._iteration.append({'role': 'user', 'content': 'Hello, there!'})
+    prompt.iterate(role,'Hello, there!',None,True)
     # Execute iteration record
     prompt.iterate(role,
                    'Introduce yourself.',
                    'Greeting, how can I assistant you today?',
                    False)
     # Validate record value
-    assert prompt._iteration == [
+    assert prompt.iteration == [
         {'role': 'user', 'content': 'Introduce yourself.'},
         {'role': 'assistant', 'content': 'Greeting, how can I assistant you today?'}
         ]
@@ -77,7 +88,7 @@ def test_iterate_method_ignoring_invalid_record(prompt):
     # Execute iteration record
     prompt.iterate(None,'This is for test.','Dummy Record',True)
     # Validate record value
-    assert prompt._iteration == []
+    assert prompt.iteration == []
 
 def test_iterate_method_ignoring_not_recording_record(prompt):
     '''
@@ -88,20 +99,46 @@ def test_iterate_method_ignoring_not_recording_record(prompt):
     # Execute iteration record
     prompt.iterate(role,None,'Dummy Record',True)
     # Validate record value
-    assert prompt._iteration == [{'role': 'assistant', 'content': 'Dummy Record'}]
+    assert prompt.iteration == [{'role': 'assistant', 'content': 'Dummy Record'}]
     # Clear former iteration
-    prompt._iteration = []
+    prompt.iterate(None,None,None,False)
     # Execute iteration record
     prompt.iterate(role,'Dummy Record',None,True)
     # Validate record value
-    assert prompt._iteration == [{'role': 'user', 'content': 'Dummy Record'}]
+    assert prompt.iteration == [{'role': 'user', 'content': 'Dummy Record'}]
+
+## ============================ `empty` Property Test ============================= ##
+def test_empty_property(prompt):
+    '''Test whether the property discriminates empty iteration record
+    regardless of additional prompt and pending input.'''
+    role = Role('system','user','assistant')
+    assert prompt.empty
+    prompt.chat(role=role,content='hello,there!',addition='This is for test.')
+    assert prompt.empty
+    prompt.iterate(role,'hello,there!','Greeting!',True)
+    assert not prompt.empty
+    prompt.iterate(None,None,None,False)
+    assert prompt.empty
+
+## ============================= `hold()` Method Test ============================= ##
+def test_hold_method(prompt):
+    '''Test whether the method holds the chat across threads,
+    and raises when the holding thread holds it again.'''
+    with prompt.hold():
+        assert prompt.lock.locked()
+        with pytest.raises(RuntimeError,match='unfinished iteration'):
+            with prompt.hold():
+                pass
+    assert not prompt.lock.locked()
+    with prompt.hold():
+        pass
 
 ## ============================= `call()` Method Test ============================= ##
 def test_call_method(prompt):
     '''Test whether the method can make prompt for single call inference properly.'''
     output = prompt.call('Hello, there!')
     assert output == 'Hello, there!'
-    assert prompt._iteration == []
+    assert prompt.iteration == []
 
 def test_call_method_with_iteration(iterated_prompt):
     '''
@@ -110,7 +147,7 @@ def test_call_method_with_iteration(iterated_prompt):
     '''
     output = iterated_prompt.call('Hello, there!')
     assert output == 'Hello, there!'
-    assert iterated_prompt._iteration == [
+    assert iterated_prompt.iteration == [
         {'role': 'user', 'content': 'Hello, there!'},
         {'role': 'assistant', 'content': 'Greeting, how can I assistant you today?'},
         ]
@@ -128,7 +165,7 @@ def test_chat_method_without_iteration_and_addition(prompt):
     assert output == [
         {'role': 'user', 'content': 'hello,there!'}
         ]
-    assert prompt._iteration == []
+    assert prompt.iteration == []
 
 def test_chat_method_without_iteration_and_with_addition(prompt):
     '''
@@ -143,7 +180,7 @@ def test_chat_method_without_iteration_and_with_addition(prompt):
         {'role': 'system','content': 'This is for test.'},
         {'role': 'user', 'content': 'hello,there!'}
         ]
-    assert prompt._iteration == []
+    assert prompt.iteration == []
 
 def test_chat_method_with_iteration_and_without_addition(iterated_prompt):
     '''
@@ -159,7 +196,7 @@ def test_chat_method_with_iteration_and_without_addition(iterated_prompt):
          'content': 'Greeting, how can I assistant you today?'},
         {'role': 'user', 'content': 'hello,there!'}
         ]
-    assert iterated_prompt._iteration == [
+    assert iterated_prompt.iteration == [
         {'role': 'user', 'content': 'Hello, there!'},
         {'role': 'assistant', 'content': 'Greeting, how can I assistant you today?'},
         ]
@@ -180,7 +217,117 @@ def test_chat_method_with_iteration_and_addition(iterated_prompt):
          'content': 'Greeting, how can I assistant you today?'},
         {'role': 'user', 'content': 'hello,there!'}
         ]
-    assert iterated_prompt._iteration == [
+    assert iterated_prompt.iteration == [
         {'role': 'user', 'content': 'Hello, there!'},
         {'role': 'assistant', 'content': 'Greeting, how can I assistant you today?'},
+        ]
+
+def test_chat_method_committing_pending_input(prompt):
+    '''
+    Test whether the method and `iterate()` method can commit pending input
+    without duplicating it in the iteration history.
+    '''
+    role = Role('system','user','assistant')
+    prompt.chat(role=role,content='hello,there!',addition='This is for test.')
+    prompt.iterate(role,'hello,there!','Greeting!',True)
+    output = prompt.chat(role=role,content='Again!',addition='This is for test.')
+    assert output == [
+        {'role': 'system', 'content': 'This is for test.'},
+        {'role': 'user', 'content': 'hello,there!'},
+        {'role': 'assistant', 'content': 'Greeting!'},
+        {'role': 'user', 'content': 'Again!'}
+        ]
+    assert prompt.iteration == [
+        {'role': 'user', 'content': 'hello,there!'},
+        {'role': 'assistant', 'content': 'Greeting!'},
+        ]
+
+def test_chat_method_discarding_unfinished_input(iterated_prompt):
+    '''
+    Test whether the method can discard input of unfinished iteration
+    and follow changed addition properly.
+    '''
+    role = Role('system','user','assistant')
+    iterated_prompt.chat(role=role,content='Failed!',addition='This is for test.')
+    output = iterated_prompt.chat(role=role,content='hello,there!',addition=None)
+    assert output == [
+        {'role': 'user', 'content': 'Hello, there!'},
+        {'role': 'assistant', 
+         'content': 'Greeting, how can I assistant you today?'},
+        {'role': 'user', 'content': 'hello,there!'}
+        ]
+
+def test_chat_method_reusing_buffer_per_turn(prompt):
+    '''
+    Test whether the method extends the same buffer each iteration,
+    without copying records of iteration history as it grows.
+    '''
+    role = Role('system','user','assistant')
+    buffer = prompt.chat(role=role,content='Hello!',addition='This is for test.')
+    prompt.iterate(role,'Hello!','Greeting!',True)
+    records = list(buffer)
+    for _ in range(100):
+        output = prompt.chat(role=role,content='Hello!',addition='This is for test.')
+        # Validate former records are kept in place and one input is appended
+        assert output is buffer
+        assert len(output) == len(records) + 1
+        assert all(new is old for new, old in zip(output,records))
+        prompt.iterate(role,'Hello!','Greeting!',True)
+        records = list(buffer)
+    assert len(prompt.iteration) == 101 * 2
+
+def test_chat_method_with_window_context(prompt):
+    '''Test whether the method drops oldest iterations beyond token budget.'''
+    role = Role('system','user','assistant')
+    counter = lambda text: len(text.split())
+    context = Context(budget=8)
+    for turn in range(3):
+        prompt.chat(role,f'input {turn}','be brief',context,counter)
+        prompt.iterate(role,f'input {turn}',f'output {turn}',True)
+    output = prompt.chat(role,'input 3','be brief',context,counter)
+    assert output == [
+        {'role': 'system', 'content': 'be brief'},
+        {'role': 'user', 'content': 'input 2'},
+        {'role': 'assistant', 'content': 'output 2'},
+        {'role': 'user', 'content': 'input 3'}
+        ]
+    assert prompt.size == len('input 2output 2')
+
+def test_chat_method_with_last_context(prompt):
+    '''Test whether the method keeps only last iterations.'''
+    role = Role('system','user','assistant')
+    counter = lambda text: len(text.split())
+    context = Context(policy='last',last=1)
+    for turn in range(3):
+        prompt.chat(role,f'input {turn}',None,context,counter)
+        prompt.iterate(role,f'input {turn}',f'output {turn}',True)
+    output = prompt.chat(role,'input 3',None,context,counter)
+    assert output == [
+        {'role': 'user', 'content': 'input 2'},
+        {'role': 'assistant', 'content': 'output 2'},
+        {'role': 'user', 'content': 'input 3'}
+        ]
+
+def test_chat_method_with_summary_context(prompt):
+    '''Test whether the method replaces dropped iterations with their summary.'''
+    role = Role('system','user','assistant')
+    counter = lambda text: len(text.split())
+    context = Context(budget=12,policy='summary')
+    summaries = []
+    def summarize(messages):
+        summaries.append(messages)
+        return 'greeted'
+    for turn in range(3):
+        prompt.chat(role,f'input {turn}',None,context,counter,summarize)
+        prompt.iterate(role,f'input {turn}',f'output {turn}',True)
+    output = prompt.chat(role,'input 3',None,context,counter,summarize)
+    assert len(summaries) == 1
+    assert output == [
+        {'role': 'system',
+         'content': 'Summary of earlier conversation: greeted'},
+        {'role': 'user', 'content': 'input 1'},
+        {'role': 'assistant', 'content': 'output 1'},
+        {'role': 'user', 'content': 'input 2'},
+        {'role': 'assistant', 'content': 'output 2'},
+        {'role': 'user', 'content': 'input 3'}
         ]
\ No newline at end of file
@@ -0,0 +1,86 @@
+import pytest
+from llyra.components import Session, Prompt
+from llyra.components.utils import Role
+
+@pytest.fixture
+def session():
+    session = Session(capacity=3)
+    return session
+
+@pytest.fixture
+def role():
+    role = Role('system','user','assistant')
+    return role
+
+## =========================== `__init__()` Method Test =========================== ##
+def test_initialize_method(session):
+    '''Test whether the class can be initialized properly.'''
+    assert session.capacity == 3
+    assert session.ttl == 0
+    assert session.memory == 0
+    assert session.size == 0
+    assert len(session) == 0
+
+## ============================== `get()` Method Test ============================== ##
+def test_get_method(session):
+    '''Test whether the method can create and return independent session properly.'''
+    first = session.get('first')
+    second = session.get('second')
+    assert isinstance(first,Prompt)
+    assert first is not second
+    assert session.get('first') is first
+    assert len(session) == 2
+
+def test_get_method_evicting_least_recently_used_session(session):
+    '''Test whether the method evict least recently used session 
+    beyond capacity properly.'''
+    for id in ['a','b','c']:
+        session.get(id)
+    # Use the oldest session again
+    session.get('a')
+    # Execute session creation beyond capacity
+    session.get('d')
+    # Validate kept sessions
+    assert 'b' not in session
+    assert 'a' in session
+    assert len(session) == 3
+
+def test_get_method_evicting_expired_session(monkeypatch):
+    '''Test whether the method evict sessions idle longer than ttl properly.'''
+    now = [0.0]
+    monkeypatch.setattr('llyra.components.sessions.definition.monotonic',
+                        lambda: now[0])
+    session = Session(ttl=10)
+    session.get('old')
+    now[0] = 5.0
+    session.get('new')
+    now[0] = 12.0
+    session.get('new')
+    # Validate kept sessions
+    assert 'old' not in session
+    assert 'new' in session
+
+## ============================= `touch()` Method Test ============================= ##
+def test_touch_method_evicting_beyond_memory(role):
+    '''Test whether the method evict least recently used sessions 
+    beyond memory cap properly.'''
+    released = []
+    session = Session(memory=20,release=released.append)
+    session.get('a').iterate(role,'0123456789','',True)
+    session.touch('a')
+    session.get('b').iterate(role,'0123456789','0123456789',True)
+    session.touch('b')
+    # Validate kept sessions
+    assert 'a' not in session
+    assert session.size == 20
+    assert released == ['a']
+
+## ============================= `drop()` Method Test ============================= ##
+def test_drop_method(session,role):
+    '''Test whether the method can drop session properly.'''
+    session.get('a').iterate(role,'Hello, there!',None,True)
+    session.touch('a')
+    session.drop('a')
+    session.drop('unknown')
+    assert 'a' not in session
+    assert session.size == 0
@@ -1,8 +1,8 @@
 import pytest
 from llyra.components import Strategy
-from llyra.components.strategys.utils import Call, Chat
+from llyra.components.strategys.utils import Call, Chat, Context
 from llyra.components.utils import Role
-from llyra.errors.strategys import StrategySectionMissingError, StrategyParameterMissingError
+from llyra.errors.strategys import StrategySectionMissingError, StrategyParameterMissingError, StrategyParameterInvalidError
 from pathlib import Path
 from re import escape
 
@@ -570,4 +570,168 @@ def test_update_chat_method_forbidding_prompt_role_empty_with_addition(loaded_st
     error = "`prompt` parameter of `chat.role` setting can't be empty "
     error += "when `addition` parameter of `chat` setting isn't empty. "
     with pytest.raises(ValueError,match=error):
-        loaded_strategy.update_chat(None,'',None,None,None,None)
\ No newline at end of file
+        loaded_strategy.update_chat(None,'',None,None,None,None)
+
+def test_load_method_with_chat_context(strategy,tmp_path):
+    '''Test whether method can load and read `chat.context` section properly.'''
+    # Set test strategy file
+    content = f'''
+    [call]
+    stop = "<test-call-stop-token>"
+    temperature = 0.7
+    [chat]
+    stop = "<test-chat-stop-token>"
+    temperature = 0.8
+    [chat.role]
+    input = "test-input"
+    output = "test-output"
+    [chat.context]
+    budget = 2048
+    policy = "last"
+    last = 4
+    '''
+    test_strategy = tmp_path / 'test.toml'
+    test_strategy.write_text(content)
+    # Load test strategy content
+    strategy.load(test_strategy)
+    # Validate loaded value
+    assert strategy.chat.context == Context(2048,'last',4)
+
+def test_load_method_with_invalid_context_policy(strategy,tmp_path):
+    '''Test whether method raise exception properly 
+    with unknown `policy` parameter in `chat.context` section.'''
+    # Set test strategy file
+    content = f'''
+    [call]
+    stop = "<test-call-stop-token>"
+    temperature = 0.7
+    [chat]
+    stop = "<test-chat-stop-token>"
+    temperature = 0.8
+    [chat.role]
+    input = "test-input"
+    output = "test-output"
+    [chat.context]
+    policy = "forget"
+    '''
+    test_strategy = tmp_path / 'test.toml'
+    test_strategy.write_text(content)
+    # Load test strategy content
+    with pytest.raises(StrategyParameterInvalidError,match='policy'):
+        strategy.load(test_strategy)
+
+def test_load_method_with_ollama_options(strategy,tmp_path):
+    '''Test whether method can load and read `call.options`
+    and `chat.options` sections properly.'''
+    # Set test strategy file
+    content = f'''
+    [call]
+    stop = "<test-call-stop-token>"
+    temperature = 0.7
+    [call.options]
+    num_predict = 64
+    keep_alive = "30m"
+    [chat]
+    stop = "<test-chat-stop-token>"
+    temperature = 0.8
+    [chat.role]
+    input = "test-input"
+    output = "test-output"
+    [chat.options]
+    num_ctx = 8192
+    top_p = 1
+    '''
+    test_strategy = tmp_path / 'test.toml'
+    test_strategy.write_text(content)
+    # Load test strategy content
+    strategy.load(test_strategy)
+    # Validate loaded value
+    assert strategy.call.options == {'num_predict': 64,'keep_alive': '30m'}
+    assert strategy.chat.options == {'num_ctx': 8192,'top_p': 1}
+
+@pytest.mark.parametrize('option,expectation',[('num_gpus = 1','a supported Ollama option'),
+                                               ('num_ctx = "big"','`int`'),
+                                               ('stop = "<EOF>"','a supported Ollama option')])
+def test_load_method_with_invalid_ollama_option(strategy,tmp_path,option,expectation):
+    '''Test whether method raise exception properly
+    with unknown or mistyped option in `call.options` section.'''
+    # Set test strategy file
+    content = f'''
+    [call]
+    stop = "<test-call-stop-token>"
+    temperature = 0.7
+    [call.options]
+    {option}
+    [chat]
+    stop = "<test-chat-stop-token>"
+    temperature = 0.8
+    [chat.role]
+    input = "test-input"
+    output = "test-output"
+    '''
+    test_strategy = tmp_path / 'test.toml'
+    test_strategy.write_text(content)
+    # Execute strategy load
+    name = option.split(' ')[0]
+    with pytest.raises(StrategyParameterInvalidError,
+        match=escape(f'Invalid `{name}` parameter of `call.options` section '
+                     f'in `strategy.toml`, expect {expectation}.')):
+        strategy.load(test_strategy)
+
+def test_update_call_method_with_ollama_options(loaded_strategy):
+    '''Test whether method can update, drop and validate Ollama options properly.'''
+    # Execute call strategy update
+    loaded_strategy.update_call(None,None,{'num_ctx': 4096,'seed': 7})
+    loaded_strategy.update_call(None,None,{'seed': None,'num_thread': 8})
+    # Validate update value
+    assert loaded_strategy.call.options == {'num_ctx': 4096,'num_thread': 8}
+    with pytest.raises(ValueError,match='Invalid `num_ctx` option'):
+        loaded_strategy.update_call(None,None,{'num_ctx': 4096.5})
+    assert loaded_strategy.call.options == {'num_ctx': 4096,'num_thread': 8}
+
+def test_update_chat_method_with_ollama_options(loaded_strategy):
+    '''Test whether method can update Ollama options of chat properly.'''
+    # Execute chat strategy update
+    loaded_strategy.update_chat(None,None,None,None,None,None,{'keep_alive': -1})
+    # Validate update value
+    assert loaded_strategy.chat.options == {'keep_alive': -1}
+    assert loaded_strategy.call.options == {}
+
+def test_load_method_with_max_tokens(strategy,tmp_path):
+    '''Test whether method can load and validate `max_tokens` parameters properly.'''
+    # Set test strategy file
+    content = '''
+    [call]
+    stop = "<test-call-stop-token>"
+    temperature = 0.7
+    max_tokens = 256
+    [chat]
+    stop = "<test-chat-stop-token>"
+    temperature = 0.8
+    [chat.role]
+    input = "test-input"
+    output = "test-output"
+    '''
+    test_strategy = tmp_path / 'test.toml'
+    test_strategy.write_text(content)
+    # Load test strategy content
+    strategy.load(test_strategy)
+    # Validate loaded value
+    assert strategy.call.max_tokens == 256
+    assert strategy.chat.max_tokens == 0
+    # Validate invalid value
+    test_strategy.write_text(content.replace('max_tokens = 256','max_tokens = -1'))
+    with pytest.raises(StrategyParameterInvalidError,match='max_tokens'):
+        strategy.load(test_strategy)
+
+def test_update_methods_with_max_tokens(loaded_strategy):
+    '''Test whether methods can update and validate `max_tokens` properly.'''
+    # Execute strategy update
+    loaded_strategy.update_call(None,None,None,128)
+    loaded_strategy.update_chat(None,None,None,None,None,None,None,512)
+    # Validate update value
+    assert loaded_strategy.call.max_tokens == 128
+    assert loaded_strategy.chat.max_tokens == 512
+    with pytest.raises(ValueError,match='max_tokens'):
+        loaded_strategy.update_call(None,None,None,'many')
+    assert loaded_strategy.call.max_tokens == 128
\ No newline at end of file
@@ -0,0 +1,142 @@
+import pytest
+import json
+from urllib.request import urlopen
+from urllib.error import HTTPError
+from llyra.components import Tracer, make_tracer
+from llyra.components.tracers import Span, JsonlTracer, PrometheusTracer
+from llyra.components.tracers.basic import NULL_SPAN
+from llyra.components.configs.utils import Traces
+
+class RecordingTracer(Tracer):
+    '''The class is defined for collecting ended spans in memory.'''
+    enabled = True
+
+    def __init__(self) -> None:
+        self.spans = []
+
+    def export(self,span:Span) -> None:
+        self.spans.append(span)
+
+def trace_chat(tracer:Tracer) -> None:
+    '''The function is defined for trace stages of a chat inference.'''
+    span = tracer.start('chat',session='a')
+    with span.stage('trim'):
+        pass
+    with span.stage('infer',model='model'):
+        pass
+    span.set(cached=False)
+    span.end()
+
+## ============================= Disabled Tracer Test ============================= ##
+def test_disabled_tracer_handing_out_null_span():
+    '''Test whether disabled tracer measures and exports nothing.'''
+    tracer = Tracer()
+    span = tracer.start('chat')
+    # Validate shared span doing nothing
+    assert span is NULL_SPAN
+    assert span.stage('infer') is NULL_SPAN
+    with span.stage('infer') as stage:
+        assert stage is NULL_SPAN
+    span.set(cached=True)
+    span.end()
+
+## ============================== Custom Tracer Test ============================== ##
+def test_custom_tracer_receiving_spans_of_stages():
+    '''Test whether enabled tracer exports spans of stages and the inference.'''
+    tracer = RecordingTracer()
+    trace_chat(tracer)
+    # Validate spans exported in ending order
+    trim, infer, chat = tracer.spans
+    assert [trim.name,infer.name,chat.name] == ['trim','infer','chat']
+    assert trim.kind == infer.kind == chat.kind == 'chat'
+    assert trim.trace == infer.trace == chat.trace
+    assert trim.parent == infer.parent == chat.id
+    assert chat.parent == None
+    assert chat.attributes == {'session': 'a','cached': False}
+    assert infer.attributes == {'model': 'model'}
+    assert chat.duration >= infer.duration >= 0
+
+def test_custom_tracer_recording_interrupted_stage():
+    '''Test whether span records the error interrupting the stage once.'''
+    tracer = RecordingTracer()
+    span = tracer.start('call')
+    with pytest.raises(ValueError):
+        with span.stage('infer'):
+            raise ValueError('dummy')
+    span.end()
+    span.end()
+    # Validate recorded error
+    infer, call = tracer.spans
+    assert infer.error == 'ValueError'
+    assert call.error == None
+    assert len(tracer.spans) == 2
+
+## =============================== JSONL Tracer Test =============================== ##
+def test_jsonl_tracer_dumping_spans(tmp_path):
+    '''Test whether JSONL tracer appends span records after buffer is flushed.'''
+    tracer = JsonlTracer(tmp_path,buffer=16)
+    trace_chat(tracer)
+    file = tmp_path / 'spans.jsonl'
+    assert file.read_text(encoding='utf-8') == ''
+    tracer.flush()
+    records = [json.loads(line) for line in file.read_text(encoding='utf-8').splitlines()]
+    # Validate dumped records
+    assert [record['name'] for record in records] == ['trim','infer','chat']
+    assert records[0]['parent'] == records[2]['span']
+    assert records[2]['attributes'] == {'session': 'a','cached': False}
+    tracer.close()
+
+def test_jsonl_tracer_writing_full_buffer(tmp_path):
+    '''Test whether JSONL tracer writes spans once buffer is full.'''
+    tracer = JsonlTracer(tmp_path,buffer=3)
+    trace_chat(tracer)
+    lines = (tmp_path / 'spans.jsonl').read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 3
+    tracer.close()
+
+## ============================ Prometheus Tracer Test ============================ ##
+def test_prometheus_tracer_rendering_histograms():
+    '''Test whether Prometheus tracer renders cumulative histograms of stages.'''
+    tracer = PrometheusTracer(serve=False)
+    trace_chat(tracer)
+    trace_chat(tracer)
+    text = tracer.render()
+    # Validate exposition of stages and the whole inference
+    assert '# TYPE llyra_stage_duration_seconds histogram' in text
+    assert 'llyra_stage_duration_seconds_count{inference="chat",stage="infer"} 2' in text
+    assert 'llyra_stage_duration_seconds_count{inference="chat",stage="total"} 2' in text
+    assert 'llyra_stage_duration_seconds_bucket{inference="chat",stage="trim",le="60.0"} 2' in text
+    assert 'llyra_stage_duration_seconds_bucket{inference="chat",stage="trim",le="+Inf"} 2' in text
+
+def test_prometheus_tracer_counting_errors():
+    '''Test whether Prometheus tracer counts interrupted stages.'''
+    tracer = PrometheusTracer(serve=False)
+    span = tracer.start('call')
+    with pytest.raises(ValueError):
+        with span.stage('infer'):
+            raise ValueError('dummy')
+    assert 'llyra_stage_errors_total{inference="call",stage="infer"} 1' in tracer.render()
+
+def test_prometheus_tracer_serving_metrics_endpoint():
+    '''Test whether Prometheus tracer serves rendered metrics on `/metrics`.'''
+    tracer = PrometheusTracer(port=0)
+    trace_chat(tracer)
+    try:
+        with urlopen(f'http://127.0.0.1:{tracer.port}/metrics') as response:
+            assert response.headers['Content-Type'].startswith('text/plain')
+            assert response.read().decode('utf-8') == tracer.render()
+        with pytest.raises(HTTPError):
+            urlopen(f'http://127.0.0.1:{tracer.port}/')
+    finally:
+        tracer.close()
+
+## ========================== `make_tracer()` Function Test ========================== ##
+def test_make_tracer_function(tmp_path):
+    '''Test whether function makes tracer of configured exporter.'''
+    assert type(make_tracer(Traces())) == Tracer
+    tracer = make_tracer(Traces('jsonl',str(tmp_path)))
+    assert type(tracer) == JsonlTracer
+    tracer.close()
+    tracer = make_tracer(Traces('prometheus',port=0))
+    assert type(tracer) == PrometheusTracer
+    tracer.close()
\ No newline at end of file